@@ -20,6 +20,7 @@ import aiohttp_cors
 import jwt
 from marshmallow import fields
 
+from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..core.event_bus import Event, EventBus
 from ..core.plugin_registry import PluginRegistry
@@ -78,6 +79,10 @@ class AdminStatusSchema(OpenAPISchema):
     label = fields.Str(description="Default label", allow_none=True)
     timing = fields.Dict(description="Timing results", required=False)
     conductor = fields.Dict(description="Conductor statistics", required=False)
+    cache = fields.Dict(description="Cache statistics", required=False)
+    event_bus = fields.Dict(
+        description="Event subscriber queue statistics", required=False
+    )
 
 
 class AdminResetSchema(OpenAPISchema):
@@ -663,6 +668,12 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
+        cache = self.context.inject_or(BaseCache)
+        if cache and cache.stats is not None:
+            status["cache"] = dict(cache.stats)
+        event_bus = self.context.inject_or(EventBus)
+        if event_bus and event_bus.queued:
+            status["event_bus"] = event_bus.stats
         return web.json_response(status)
 
     @docs(tags=["server"], summary="Reset statistics")
@@ -7,6 +7,8 @@ from async_case import IsolatedAsyncioTestCase
 from aiohttp import ClientSession, DummyCookieJar, TCPConnector, web
 from aiohttp.test_utils import unused_port
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.default_context import DefaultContextBuilder
 from ...config.injection_context import InjectionContext
 from ...core.event_bus import Event
@@ -334,6 +336,22 @@ class TestAdminServer(IsolatedAsyncioTestCase):
 
         await server.stop()
 
+    async def test_status_cache_stats(self):
+        context = InjectionContext()
+        context.injector.bind_instance(BaseCache, InMemoryCache(max_size=10))
+        server = self.get_admin_server({"admin.admin_insecure_mode": True}, context)
+        await server.start()
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            assert response.status == 200
+            result = await response.json()
+            assert result["cache"]["max_size"] == 10
+            assert result["cache"]["size"] == 0
+
+        await server.stop()
+
     async def test_visit_secure_mode(self):
         settings = {
             "admin.admin_insecure_mode": False,
@@ -2,7 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Sequence, Text, Union
+from typing import Any, Mapping, Optional, Sequence, Text, Union
 
 from ..core.error import BaseError
 
@@ -57,6 +57,14 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    @property
+    def stats(self) -> Optional[Mapping[str, int]]:
+        """Accessor for cache statistics, if tracked by the implementation."""
+        return None
+
+    async def close(self):
+        """Release any resources held by the cache."""
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
@@ -1,29 +1,78 @@
 """Basic in-memory cache implementation."""
 
+import heapq
 import time
-from typing import Any, Sequence, Text, Union
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence, Text, Union
 
 from .base import BaseCache
 
 
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """
+    Basic in-memory cache class.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    Entries are kept in least-recently-used order and expire lazily: a heap of
+    expiry times lets each call drop only the entries that are actually due,
+    and the oldest entries are evicted once `max_size` is reached.
+    """
+
+    def __init__(self, max_size: int = None):
+        """
+        Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_size: the maximum number of keys to retain, or None for no limit
+
+        """
         super().__init__()
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self._cache = OrderedDict()
+        # entries look like (<epoch timestamp>, "key"), possibly superseded
+        self._expiry = []
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def max_size(self) -> int:
+        """Accessor for the maximum number of keys retained."""
+        return self._max_size
+
+    @property
+    def stats(self) -> Mapping[str, int]:
+        """Accessor for cache statistics."""
+        return {
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
 
     def _remove_expired_cache_items(self):
-        """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
+        """Remove expired items from cache, visiting only those due to expire."""
+        now = time.perf_counter()
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires, key = heapq.heappop(expiry)
+            item = self._cache.get(key)
+            # skip heap entries superseded by a later set or clear
+            if item and item["expires"] == expires:
                 del self._cache[key]
+                self._expirations += 1
+
+        # drop superseded heap entries once they dominate the heap
+        if len(expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (item["expires"], key)
+                for key, item in self._cache.items()
+                if item["expires"] is not None
+            ]
+            heapq.heapify(self._expiry)
 
     async def get(self, key: Text):
         """
@@ -37,7 +86,13 @@ class InMemoryCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        item = self._cache.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return item["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
@@ -55,6 +110,13 @@ class InMemoryCache(BaseCache):
         expires_ts = time.perf_counter() + ttl if ttl else None
         for key in [keys] if isinstance(keys, Text) else keys:
             self._cache[key] = {"expires": expires_ts, "value": value}
+            self._cache.move_to_end(key)
+            if expires_ts is not None:
+                heapq.heappush(self._expiry, (expires_ts, key))
+        if self._max_size:
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
 
     async def clear(self, key: Text):
         """
@@ -70,4 +132,5 @@ class InMemoryCache(BaseCache):
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry = []
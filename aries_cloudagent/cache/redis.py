@@ -0,0 +1,281 @@
+"""Shared cache implementation backed by a Redis-protocol key-value server."""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Mapping, Sequence, Text, Union
+
+import aioredis
+
+from .base import BaseCache, CacheError, CacheKeyLock
+from .in_memory import InMemoryCache
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RedisCache(BaseCache):
+    """
+    Cache shared between agent instances through an external key-value server.
+
+    Values are stored as JSON under a key prefix on any server speaking the
+    Redis protocol, using a pool of connections. A small local near-cache holds
+    recently read values for `near_ttl` seconds, so an entry cleared by another
+    instance may be served from the near-cache until it expires there.
+    Server errors are logged and treated as cache misses.
+    """
+
+    LOCK_POLL_INTERVAL = 0.05
+    # delete a lock only while it is still held under the given token
+    UNLOCK_SCRIPT = (
+        'if redis.call("get", KEYS[1]) == ARGV[1] then '
+        'return redis.call("del", KEYS[1]) end return 0'
+    )
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        key_prefix: str = "acapy::cache::",
+        near_ttl: float = 5,
+        near_max_size: int = 10000,
+        max_connections: int = 10,
+        lock_timeout: float = 30,
+        client: aioredis.Redis = None,
+    ):
+        """
+        Initialize a `RedisCache` instance.
+
+        Args:
+            url: the server URL, such as redis://localhost:6379/0
+            key_prefix: the prefix applied to every key on the server
+            near_ttl: seconds to keep values in the local near-cache, 0 to disable
+            near_max_size: the maximum number of keys kept in the near-cache
+            max_connections: the size of the server connection pool
+            lock_timeout: seconds for which a distributed key lock is held
+            client: an existing client instance to use in place of the URL
+
+        """
+        super().__init__()
+        self._client = client or aioredis.from_url(
+            url, max_connections=max_connections, decode_responses=True
+        )
+        self._key_prefix = key_prefix
+        self._near_ttl = near_ttl
+        self._near = InMemoryCache(near_max_size) if near_ttl else None
+        self._lock_timeout = lock_timeout
+        self._hits = 0
+        self._near_hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._lock_waits = 0
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """Accessor for the server client instance."""
+        return self._client
+
+    @property
+    def stats(self) -> Mapping[str, int]:
+        """Accessor for cache statistics."""
+        return {
+            "hits": self._hits,
+            "near_hits": self._near_hits,
+            "misses": self._misses,
+            "errors": self._errors,
+            "lock_waits": self._lock_waits,
+            "near_size": self._near.stats["size"] if self._near else 0,
+        }
+
+    def _server_key(self, key: Text) -> str:
+        """Get the key under which an entry is stored on the server."""
+        return f"{self._key_prefix}{key}"
+
+    def _lock_key(self, key: Text) -> str:
+        """Get the key under which a distributed key lock is stored."""
+        return f"{self._key_prefix}lock::{key}"
+
+    def _server_error(self, err: aioredis.RedisError, op: str):
+        """Log and count a server error."""
+        self._errors += 1
+        LOGGER.warning("Shared cache %s failed: %s", op, err)
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        if self._near:
+            found = await self._near.get(key)
+            if found is not None:
+                self._near_hits += 1
+                return found
+        try:
+            raw = await self._client.get(self._server_key(key))
+        except aioredis.RedisError as err:
+            self._server_error(err, "get")
+            return None
+        if raw is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        value = json.loads(raw)
+        if self._near:
+            await self._near.set(key, value, self._near_ttl)
+        return value
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        keys = [keys] if isinstance(keys, Text) else keys
+        try:
+            raw = json.dumps(value)
+        except TypeError as err:
+            raise CacheError("Cache value is not JSON serializable") from err
+        px = max(int(ttl * 1000), 1) if ttl else None
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(self._server_key(key), raw, px=px)
+                await pipe.execute()
+        except aioredis.RedisError as err:
+            self._server_error(err, "set")
+        if self._near:
+            near_ttl = min(ttl, self._near_ttl) if ttl else self._near_ttl
+            await self._near.set(keys, value, near_ttl)
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        if self._near:
+            await self._near.clear(key)
+        try:
+            await self._client.delete(self._server_key(key))
+        except aioredis.RedisError as err:
+            self._server_error(err, "clear")
+
+    async def flush(self):
+        """Remove all items under the key prefix from the cache."""
+        if self._near:
+            await self._near.flush()
+        try:
+            batch = []
+            async for key in self._client.scan_iter(
+                match=f"{self._key_prefix}*", count=500
+            ):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._client.delete(*batch)
+                    batch = []
+            if batch:
+                await self._client.delete(*batch)
+        except aioredis.RedisError as err:
+            self._server_error(err, "flush")
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key, shared with other instances."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def lock_remote(self, key: Text) -> str:
+        """
+        Take the distributed lock for a key, waiting for another holder.
+
+        Returns:
+            The lock token if the lock was taken, or None if a value was
+            produced by another instance or the server is unavailable
+
+        """
+        token = str(uuid.uuid4())
+        deadline = time.perf_counter() + self._lock_timeout
+        waited = False
+        while True:
+            try:
+                if await self._client.set(
+                    self._lock_key(key),
+                    token,
+                    px=int(self._lock_timeout * 1000),
+                    nx=True,
+                ):
+                    return token
+            except aioredis.RedisError as err:
+                self._server_error(err, "lock")
+                return None
+            if not waited:
+                self._lock_waits += 1
+                waited = True
+            if time.perf_counter() >= deadline:
+                LOGGER.warning("Timed out waiting for shared cache lock: %s", key)
+                return None
+            await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+            try:
+                raw = await self._client.get(self._server_key(key))
+            except aioredis.RedisError as err:
+                self._server_error(err, "get")
+                return None
+            if raw is not None:
+                return None
+
+    async def unlock_remote(self, key: Text, token: str):
+        """Release the distributed lock for a key if still held under a token."""
+        try:
+            await self._client.eval(self.UNLOCK_SCRIPT, 1, self._lock_key(key), token)
+        except aioredis.RedisError as err:
+            self._server_error(err, "unlock")
+
+    async def close(self):
+        """Close the server connection pool."""
+        await self._client.close()
+        await self._client.connection_pool.disconnect()
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """A lock on a cache key, shared with other instances through the server."""
+
+    def __init__(self, cache: RedisCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if not self.done:
+            self._token = await self.cache.lock_remote(self.key)
+            if not self._token:
+                # another instance may have produced the value meanwhile
+                found = await self.cache.get(self.key)
+                if found:
+                    self._future.set_result(found)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the distributed lock if held."""
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self._token:
+            await self.cache.unlock_remote(self.key, self._token)
+            self._token = None
@@ -67,6 +67,50 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_expire_reset_ttl(self, cache):
+        await cache.set("key", "short", 0.05)
+        await cache.set("key", "long", 10)
+        await sleep(0.05)
+        assert await cache.get("key") == "long"
+        assert cache.stats["expirations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expire_heap_compaction(self, cache):
+        for i in range(200):
+            await cache.set("key", i, 10)
+        assert len(cache._expiry) <= 2 * len(cache._cache) + 65
+        assert await cache.get("key") == 199
+
+    @pytest.mark.asyncio
+    async def test_max_size_lru(self):
+        cache = InMemoryCache(max_size=3)
+        await cache.set(["key0", "key1", "key2"], "value")
+        assert await cache.get("key0") == "value"  # now most recently used
+        await cache.set("key3", "value")
+        assert await cache.get("key1") is None
+        for key in ("key0", "key2", "key3"):
+            assert await cache.get(key) == "value"
+        assert cache.max_size == 3
+        assert cache.stats["size"] == 3
+        assert cache.stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache):
+        await cache.get("valid key")
+        await cache.get("doesn't exist")
+        await cache.set("key", "value", 0.01)
+        await sleep(0.02)
+        await cache.get("key")
+        assert cache.stats == {
+            "size": 1,
+            "max_size": None,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 0,
+            "expirations": 1,
+        }
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
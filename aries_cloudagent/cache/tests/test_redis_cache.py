@@ -0,0 +1,262 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from asyncio import ensure_future, sleep, wait_for
+
+from ..base import CacheError
+from ..redis import RedisCache
+
+
+class StandInServer:
+    """Minimal in-process server speaking the Redis protocol, for testing."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.server = None
+        self.port = None
+        self.fail = False
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def _live(self, key):
+        expires = self.expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    async def _read_command(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        assert line[:1] == b"*"
+        args = []
+        for _ in range(int(line[1:])):
+            size = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(size + 2))[:-2].decode())
+        return args
+
+    async def handle(self, reader, writer):
+        while True:
+            args = await self._read_command(reader)
+            if args is None:
+                break
+            writer.write(self.execute(args))
+            await writer.drain()
+        writer.close()
+
+    def execute(self, args):
+        cmd = args[0].upper()
+        if self.fail:
+            return b"-ERR stand-in failure\r\n"
+        if cmd == "PING":
+            return b"+PONG\r\n"
+        if cmd == "GET":
+            if not self._live(args[1]):
+                return b"$-1\r\n"
+            value = self.data[args[1]].encode()
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if cmd == "SET":
+            key, value, opts = args[1], args[2], [a.upper() for a in args[3:]]
+            if "NX" in opts and self._live(key):
+                return b"$-1\r\n"
+            self.data[key] = value
+            self.expires.pop(key, None)
+            if "PX" in opts:
+                ms = int(args[3 + opts.index("PX") + 1])
+                self.expires[key] = time.monotonic() + ms / 1000
+            return b"+OK\r\n"
+        if cmd == "DEL":
+            count = 0
+            for key in args[1:]:
+                if self._live(key):
+                    del self.data[key]
+                    count += 1
+            return b":%d\r\n" % count
+        if cmd == "EVAL":
+            # only the compare-and-delete script used to release locks
+            assert args[1] == RedisCache.UNLOCK_SCRIPT and args[2] == "1"
+            key, token = args[3], args[4]
+            if self._live(key) and self.data[key] == token:
+                del self.data[key]
+                return b":1\r\n"
+            return b":0\r\n"
+        if cmd == "SCAN":
+            match = args[args.index("MATCH") + 1] if "MATCH" in args else "*"
+            keys = [k for k in list(self.data) if self._live(k)]
+            keys = [k.encode() for k in keys if fnmatch.fnmatchcase(k, match)]
+            out = b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys)
+            for k in keys:
+                out += b"$%d\r\n%s\r\n" % (len(k), k)
+            return out
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture()
+async def server():
+    server = StandInServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(server.url, near_ttl=0)
+    await cache.set("valid key", "value")
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    @pytest.mark.asyncio
+    async def test_get_none(self, cache):
+        assert await cache.get("doesn't exist") is None
+
+    @pytest.mark.asyncio
+    async def test_get_valid(self, cache, server):
+        assert await cache.get("valid key") == "value"
+        assert server.data["acapy::cache::valid key"] == '"value"'
+
+    @pytest.mark.asyncio
+    async def test_set_multi_expires(self, cache):
+        keys = [f"key{i}" for i in range(4)]
+        await cache.set(keys, {"dictkey": "dval"}, 0.05)
+        for key in keys:
+            assert await cache.get(key) == {"dictkey": "dval"}
+        await sleep(0.06)
+        for key in keys:
+            assert await cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_set_not_serializable(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", object())
+
+    @pytest.mark.asyncio
+    async def test_clear_flush(self, cache, server):
+        server.data["other"] = "untouched"
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.flush()
+        assert await cache.get("valid key") is None
+        assert server.data == {"other": "untouched"}
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, cache, server):
+        other = RedisCache(server.url, near_ttl=0)
+        await other.set("key", [1, 2])
+        assert await cache.get("key") == [1, 2]
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_near_cache(self, server):
+        cache = RedisCache(server.url, near_ttl=10)
+        await cache.set("key", "value")
+        server.data.clear()
+        assert await cache.get("key") == "value"
+        assert cache.stats["near_hits"] == 1
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        assert cache.stats["misses"] == 1
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_miss(self, cache, server):
+        server.fail = True
+        assert await cache.get("valid key") is None
+        await cache.set("key", "value")
+        await cache.clear("key")
+        await cache.flush()
+        assert cache.stats["errors"] == 4
+
+    @pytest.mark.asyncio
+    async def test_acquire_release(self, cache, server):
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+            assert "acapy::cache::lock::key" in server.data
+            await entry.set_result("result")
+        assert "acapy::cache::lock::key" not in server.data
+        assert "key" not in cache._key_locks
+        assert await cache.get("key") == "result"
+
+    @pytest.mark.asyncio
+    async def test_acquire_populated(self, cache):
+        async with cache.acquire("valid key") as entry:
+            assert entry.done
+            assert entry.result == "value"
+
+    @pytest.mark.asyncio
+    async def test_acquire_distributed(self, cache, server):
+        other = RedisCache(server.url, near_ttl=0)
+        other.LOCK_POLL_INTERVAL = 0.01
+
+        lock = cache.acquire("key")
+        await lock.__aenter__()
+
+        async def wait_other():
+            async with other.acquire("key") as entry:
+                return entry.result
+
+        waiter = ensure_future(wait_other())
+        await sleep(0.05)
+        assert not waiter.done()
+        await lock.set_result("result")
+        await lock.__aexit__(None, None, None)
+
+        assert await wait_for(waiter, 1) == "result"
+        assert other.stats["lock_waits"] == 1
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_distributed_no_result(self, cache, server):
+        other = RedisCache(server.url, near_ttl=0)
+        other.LOCK_POLL_INTERVAL = 0.01
+
+        lock = cache.acquire("key")
+        await lock.__aenter__()
+
+        async def wait_other():
+            async with other.acquire("key") as entry:
+                assert not entry.done
+                return "acapy::cache::lock::key" in server.data
+
+        waiter = ensure_future(wait_other())
+        await sleep(0.05)
+        await lock.__aexit__(None, None, None)
+
+        assert await wait_for(waiter, 1)  # lock passed to the other instance
+        assert "acapy::cache::lock::key" not in server.data
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_unlock_held_elsewhere(self, cache, server):
+        token = await cache.lock_remote("key")
+        # the lock expired and was taken by another instance
+        server.data["acapy::cache::lock::key"] = "held elsewhere"
+        await cache.unlock_remote("key", token)
+        assert server.data["acapy::cache::lock::key"] == "held elsewhere"
+
+    @pytest.mark.asyncio
+    async def test_acquire_lock_timeout(self, cache, server):
+        server.data["acapy::cache::lock::key"] = "held elsewhere"
+        cache._lock_timeout = 0.05
+        cache.LOCK_POLL_INTERVAL = 0.01
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+            assert entry._token is None
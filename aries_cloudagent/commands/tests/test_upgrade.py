@@ -1,10 +1,12 @@
 import asyncio
+import json
 
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
 from ...core.in_memory import InMemoryProfile
 from ...config.error import ArgsParseError
 from ...connections.models.conn_record import ConnRecord
+from ...protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
 from ...storage.base import BaseStorage
 from ...storage.record import StorageRecord
 from ...version import __version__
@@ -174,6 +176,85 @@ class TestUpgrade(AsyncTestCase):
                 }
             )
 
+    async def test_upgrade_retags_exchange_records(self):
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            await storage.add_record(
+                StorageRecord(
+                    V20CredExRecord.RECORD_TYPE,
+                    json.dumps({"state": V20CredExRecord.STATE_DONE}),
+                    {},
+                    "cred-ex-id",
+                )
+            )
+            assert await V20CredExRecord.query(
+                session, post_filter_positive={"state": V20CredExRecord.STATE_DONE}
+            )
+            assert not await storage.find_all_records(
+                V20CredExRecord.RECORD_TYPE, {"state": V20CredExRecord.STATE_DONE}
+            )
+
+        with async_mock.patch.object(
+            test_module,
+            "wallet_config",
+            async_mock.CoroutineMock(
+                return_value=(
+                    self.profile,
+                    async_mock.CoroutineMock(did="public DID", verkey="verkey"),
+                )
+            ),
+        ), async_mock.patch.object(self.profile, "close", async_mock.CoroutineMock()):
+            await test_module.upgrade(
+                {
+                    "upgrade.config_path": "./aries_cloudagent/commands/default_version_upgrade_config.yml",
+                    "upgrade.from_version": "v0.7.3",
+                }
+            )
+
+        async with self.profile.session() as session:
+            assert await V20CredExRecord.records_tagged(session)
+            records = await session.inject(BaseStorage).find_all_records(
+                V20CredExRecord.RECORD_TYPE, {"state": V20CredExRecord.STATE_DONE}
+            )
+        assert [record.id for record in records] == ["cred-ex-id"]
+
+    async def test_upgrade_same_version_retags_records(self):
+        version_storage_record = await self.storage.find_record(
+            type_filter="acapy_version", tag_query={}
+        )
+        await self.storage.update_record(version_storage_record, f"v{__version__}", {})
+        await self.storage.add_record(
+            StorageRecord(
+                V20CredExRecord.RECORD_TYPE,
+                json.dumps({"state": V20CredExRecord.STATE_DONE}),
+                {},
+                "cred-ex-id",
+            )
+        )
+
+        with async_mock.patch.object(
+            test_module,
+            "wallet_config",
+            async_mock.CoroutineMock(
+                return_value=(
+                    self.profile_storage,
+                    async_mock.CoroutineMock(did="public DID", verkey="verkey"),
+                )
+            ),
+        ), async_mock.patch.object(
+            self.profile_storage, "close", async_mock.CoroutineMock()
+        ):
+            await test_module.upgrade(
+                {
+                    "upgrade.config_path": "./aries_cloudagent/commands/default_version_upgrade_config.yml",
+                }
+            )
+
+        records = await self.storage.find_all_records(
+            V20CredExRecord.RECORD_TYPE, {"state": V20CredExRecord.STATE_DONE}
+        )
+        assert [record.id for record in records] == ["cred-ex-id"]
+
     async def test_upgrade_x_callable_not_set(self):
         with async_mock.patch.object(
             test_module,
@@ -5,7 +5,7 @@ import yaml
 
 from configargparse import ArgumentParser
 from packaging import version as package_version
-from typing import Callable, Sequence, Optional
+from typing import Callable, Optional, Sequence, Type
 
 from ..core.profile import Profile
 from ..config import argparse as arg
@@ -137,11 +137,28 @@ async def upgrade(settings: dict):
                         "the config."
                     )
         if upgrade_from_version == upgrade_to_version:
-            raise UpgradeError(
-                f"Version {upgrade_from_version} to upgrade from and "
-                f"current version to upgrade to {upgrade_to_version} "
-                "are same."
-            )
+            # records saved before their added tags were introduced are re-tagged
+            # even when the stored version is current
+            untagged_record_types = []
+            for upgrade_config in upgrade_configs.values():
+                for record_path in upgrade_config.get("resave_records", []):
+                    record_type = load_record_type(record_path)
+                    if record_type in untagged_record_types:
+                        continue
+                    async with root_profile.session() as session:
+                        if not await record_type.records_tagged(session):
+                            untagged_record_types.append(record_type)
+            if not untagged_record_types:
+                raise UpgradeError(
+                    f"Version {upgrade_from_version} to upgrade from and "
+                    f"current version to upgrade to {upgrade_to_version} "
+                    "are same."
+                )
+            print(f"Re-tagging records for {upgrade_to_version}")
+            for record_type in untagged_record_types:
+                await resave_records(root_profile, record_type)
+            await root_profile.close()
+            return
         if upgrade_from_version not in sorted_versions_found_in_config:
             raise UpgradeError(
                 f"No upgrade configuration found for {upgrade_from_version}"
@@ -158,29 +175,7 @@ async def upgrade(settings: dict):
             if "resave_records" in upgrade_config:
                 resave_record_paths = upgrade_config.get("resave_records")
                 for record_path in resave_record_paths:
-                    try:
-                        record_type = ClassLoader.load_class(record_path)
-                    except ClassNotFoundError as err:
-                        raise UpgradeError(
-                            f"Unknown Record type {record_path}"
-                        ) from err
-                    if not issubclass(record_type, BaseRecord):
-                        raise UpgradeError(
-                            f"Only BaseRecord can be resaved, found: {str(record_type)}"
-                        )
-                    async with root_profile.session() as session:
-                        all_records = await record_type.query(session)
-                        for record in all_records:
-                            await record.save(
-                                session,
-                                reason="re-saving record during ACA-Py upgrade process",
-                            )
-                        if len(all_records) == 0:
-                            print(f"No records of {str(record_type)} found")
-                        else:
-                            print(
-                                f"All records of {str(record_type)} successfully re-saved"
-                            )
+                    await resave_records(root_profile, load_record_type(record_path))
             # Step 2 Update existing records, if required
             if (
                 "update_existing_records" in upgrade_config
@@ -216,6 +211,40 @@ async def upgrade(settings: dict):
         raise UpgradeError(f"Error during upgrade: {e}")
 
 
+def load_record_type(record_path: str) -> Type[BaseRecord]:
+    """Load a record type to re-save from its class path."""
+    try:
+        record_type = ClassLoader.load_class(record_path)
+    except ClassNotFoundError as err:
+        raise UpgradeError(f"Unknown Record type {record_path}") from err
+    if not issubclass(record_type, BaseRecord):
+        raise UpgradeError(f"Only BaseRecord can be resaved, found: {str(record_type)}")
+    return record_type
+
+
+async def resave_records(profile: Profile, record_type: Type[BaseRecord]):
+    """
+    Re-save all records of a type, updating their stored tags.
+
+    Args:
+        profile: Root profile
+        record_type: The record type to re-save
+
+    """
+    async with profile.session() as session:
+        all_records = await record_type.query(session)
+        for record in all_records:
+            await record.save(
+                session,
+                reason="re-saving record during ACA-Py upgrade process",
+            )
+        await record_type.mark_records_tagged(session)
+        if len(all_records) == 0:
+            print(f"No records of {str(record_type)} found")
+        else:
+            print(f"All records of {str(record_type)} successfully re-saved")
+
+
 async def update_existing_records(profile: Profile):
     """
     Update existing records.
@@ -220,6 +220,174 @@ class AdminGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class CacheGroup(ArgumentGroup):
+    """Cache settings."""
+
+    GROUP_NAME = "Cache"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add cache-specific command line arguments to the parser."""
+        parser.add_argument(
+            "--cache-max-size",
+            type=BoundedInt(min=1),
+            env_var="ACAPY_CACHE_MAX_SIZE",
+            help=(
+                "Maximum number of entries retained in the shared in-memory cache; "
+                "least recently used entries are evicted beyond this size. "
+                "Default: no limit."
+            ),
+        )
+
+        parser.add_argument(
+            "--cache-url",
+            type=str,
+            metavar="<cache-url>",
+            env_var="ACAPY_CACHE_URL",
+            help=(
+                "URL of a Redis-protocol key-value server to use as a cache shared "
+                "between agent instances, for example redis://localhost:6379/0. "
+                "Default: the cache is kept in memory."
+            ),
+        )
+        parser.add_argument(
+            "--cache-key-prefix",
+            type=str,
+            metavar="<prefix>",
+            env_var="ACAPY_CACHE_KEY_PREFIX",
+            help=(
+                "Prefix for keys stored on the shared cache server. "
+                "Default: 'acapy::cache::'."
+            ),
+        )
+        parser.add_argument(
+            "--cache-near-ttl",
+            type=BoundedInt(min=0),
+            env_var="ACAPY_CACHE_NEAR_TTL",
+            help=(
+                "Seconds to keep values read from the shared cache server in a "
+                "local near-cache, or 0 to disable it. Default: 5."
+            ),
+        )
+
+    def get_settings(self, args: Namespace):
+        """Extract cache settings."""
+        settings = {}
+        if args.cache_max_size:
+            settings["cache.max_size"] = args.cache_max_size
+        if args.cache_url:
+            settings["cache.url"] = args.cache_url
+        if args.cache_key_prefix:
+            settings["cache.key_prefix"] = args.cache_key_prefix
+        if args.cache_near_ttl is not None:
+            settings["cache.near_ttl"] = args.cache_near_ttl
+        return settings
+
+
+@group(CAT_START)
+class CryptoPoolGroup(ArgumentGroup):
+    """Crypto worker pool settings."""
+
+    GROUP_NAME = "Crypto worker pool"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add crypto worker pool command line arguments to the parser."""
+        parser.add_argument(
+            "--crypto-pool-workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_POOL_WORKERS",
+            help=(
+                "Number of worker threads running CPU-bound anoncreds operations, "
+                "such as credential and presentation creation and verification. "
+                "Default: the number of CPUs."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-pool-max-pending",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_POOL_MAX_PENDING",
+            help=(
+                "Maximum number of anoncreds operations waiting for a worker. "
+                "Further operations wait for admission. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-pool-admission-timeout",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_CRYPTO_POOL_ADMISSION_TIMEOUT",
+            help=(
+                "Seconds an anoncreds operation waits for admission to a full "
+                "crypto worker pool before it is rejected, 0 to reject at once. "
+                "Default: wait indefinitely."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract crypto worker pool settings."""
+        settings = {}
+        if args.crypto_pool_workers:
+            settings["crypto_pool.max_workers"] = args.crypto_pool_workers
+        if args.crypto_pool_max_pending is not None:
+            settings["crypto_pool.max_pending"] = args.crypto_pool_max_pending
+        if args.crypto_pool_admission_timeout is not None:
+            if args.crypto_pool_max_pending is None:
+                raise ArgsParseError(
+                    "--crypto-pool-admission-timeout cannot be used without "
+                    "--crypto-pool-max-pending"
+                )
+            settings[
+                "crypto_pool.admission_timeout"
+            ] = args.crypto_pool_admission_timeout
+        return settings
+
+
+@group(CAT_START)
+class JsonLdGroup(ArgumentGroup):
+    """JSON-LD document loading settings."""
+
+    GROUP_NAME = "JSON-LD"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add JSON-LD command line arguments to the parser."""
+        parser.add_argument(
+            "--jsonld-context-dir",
+            dest="jsonld_context_dirs",
+            type=str,
+            action="append",
+            metavar="<directory>",
+            env_var="ACAPY_JSONLD_CONTEXT_DIR",
+            help=(
+                "Serve the JSON-LD contexts in <directory> without network access, "
+                "in addition to the contexts bundled with the agent. The directory "
+                "must contain an 'index.json' file mapping each context URL to the "
+                "name of its file. Multiple instances of this parameter can be "
+                "specified."
+            ),
+        )
+        parser.add_argument(
+            "--jsonld-offline",
+            action="store_true",
+            env_var="ACAPY_JSONLD_OFFLINE",
+            help=(
+                "Never load JSON-LD documents over the network. Only bundled "
+                "contexts, contexts from '--jsonld-context-dir' and DID documents "
+                "are available. Default: false."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract JSON-LD settings."""
+        settings = {}
+        if args.jsonld_context_dirs:
+            settings["jsonld.context_dirs"] = args.jsonld_context_dirs
+        if args.jsonld_offline:
+            settings["jsonld.offline"] = True
+        return settings
+
+
 @group(CAT_START)
 class DebugGroup(ArgumentGroup):
     """Debug settings."""
@@ -506,6 +674,50 @@ class DiscoverFeaturesGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class EventBusGroup(ArgumentGroup):
+    """Event bus settings."""
+
+    GROUP_NAME = "Event Bus"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add event bus command line arguments to the parser."""
+        parser.add_argument(
+            "--event-queue-size",
+            type=BoundedInt(min=1),
+            env_var="ACAPY_EVENT_QUEUE_SIZE",
+            help=(
+                "Deliver events to each subscriber through its own queue of this "
+                "size, so that event notifiers do not wait on subscribers. "
+                "Default: subscribers are called in turn by the notifier."
+            ),
+        )
+        parser.add_argument(
+            "--event-queue-overflow",
+            type=str,
+            choices=("block", "drop_newest", "drop_oldest"),
+            env_var="ACAPY_EVENT_QUEUE_OVERFLOW",
+            help=(
+                "Policy applied when a subscriber's event queue is full: wait for "
+                "space, or drop the newest or oldest event. Default: block."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract event bus settings."""
+        settings = {}
+        if args.event_queue_size:
+            settings["event_bus.queue_size"] = args.event_queue_size
+        if args.event_queue_overflow:
+            if not args.event_queue_size:
+                raise ArgsParseError(
+                    "--event-queue-overflow cannot be used without "
+                    "--event-queue-size"
+                )
+            settings["event_bus.overflow"] = args.event_queue_overflow
+        return settings
+
+
 @group(CAT_PROVISION, CAT_START)
 class GeneralGroup(ArgumentGroup):
     """General settings."""
@@ -642,6 +854,39 @@ class GeneralGroup(ArgumentGroup):
                 "resolver instance."
             ),
         )
+        parser.add_argument(
+            "--resolver-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_RESOLVER_CACHE_TTL",
+            help=(
+                "Number of seconds for which resolved DID documents are cached. "
+                "Set to 0 to disable caching. Default: 300."
+            ),
+        )
+        parser.add_argument(
+            "--resolver-cache-method-ttl",
+            type=str,
+            nargs=2,
+            action="append",
+            metavar=("<method>", "<seconds>"),
+            env_var="ACAPY_RESOLVER_CACHE_METHOD_TTL",
+            help=(
+                "Number of seconds for which DID documents for a DID method are "
+                "cached, overriding --resolver-cache-ttl. May be repeated, for "
+                "example: --resolver-cache-method-ttl web 60."
+            ),
+        )
+        parser.add_argument(
+            "--resolver-negative-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_RESOLVER_NEGATIVE_CACHE_TTL",
+            help=(
+                "Number of seconds for which DIDs which could not be found are "
+                "cached. Set to 0 to disable. Default: 30."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -693,6 +938,23 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_regex:
             settings["resolver.universal.supported"] = args.universal_resolver_regex
 
+        if args.resolver_cache_ttl is not None:
+            settings["resolver.cache_ttl"] = args.resolver_cache_ttl
+        if args.resolver_cache_method_ttl:
+            method_ttls = {}
+            for method, ttl in args.resolver_cache_method_ttl:
+                try:
+                    method_ttls[method] = int(ttl)
+                except ValueError:
+                    raise ArgsParseError(
+                        f"Invalid TTL for DID method {method}: {ttl}"
+                    ) from None
+                if method_ttls[method] < 0:
+                    raise ArgsParseError(f"Invalid TTL for DID method {method}: {ttl}")
+            settings["resolver.cache_method_ttls"] = method_ttls
+        if args.resolver_negative_cache_ttl is not None:
+            settings["resolver.negative_cache_ttl"] = args.resolver_negative_cache_ttl
+
         return settings
 
 
@@ -721,6 +983,30 @@ class RevocationGroup(ArgumentGroup):
                 "tails server base url."
             ),
         )
+        parser.add_argument(
+            "--tails-cache-max-size",
+            type=ByteSize(min=1),
+            metavar="<size>",
+            env_var="ACAPY_TAILS_CACHE_MAX_SIZE",
+            help=(
+                "Maximum total size of the tails files downloaded from tails "
+                "servers, such as '512M'. The least recently used files are removed "
+                "to stay under the limit. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-index-block-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_INDEX_BLOCK_SIZE",
+            help=(
+                "Number of revocation registry indices an issuer process reserves "
+                "at a time, so that concurrent issuance against one registry does "
+                "not contend on its metadata. Indices reserved but never used are "
+                "reclaimed after the reservation expires. Applies to askar "
+                "wallets. Default: 1."
+            ),
+        )
         parser.add_argument(
             "--notify-revocation",
             action="store_true",
@@ -748,6 +1034,10 @@ class RevocationGroup(ArgumentGroup):
             settings["tails_server_upload_url"] = args.tails_server_base_url
         if args.tails_server_upload_url:
             settings["tails_server_upload_url"] = args.tails_server_upload_url
+        if args.tails_cache_max_size:
+            settings["tails_cache.max_size"] = args.tails_cache_max_size
+        if args.revocation_index_block_size:
+            settings["revocation.index_block_size"] = args.revocation_index_block_size
         if args.notify_revocation:
             settings["revocation.notify"] = args.notify_revocation
         if args.monitor_revocation_notification:
@@ -853,6 +1143,42 @@ class LedgerGroup(ArgumentGroup):
                 " HyperLedger Indy ledgers."
             ),
         )
+        parser.add_argument(
+            "--ledger-request-timeout",
+            default=10,
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_LEDGER_REQUEST_TIMEOUT",
+            help=(
+                "With multiple ledgers configured, specifies how many seconds to "
+                "wait for each ledger to respond when looking up the ledger of a "
+                "DID. Default: 10."
+            ),
+        )
+        parser.add_argument(
+            "--ledger-negative-cache-ttl",
+            default=60,
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_LEDGER_NEGATIVE_CACHE_TTL",
+            help=(
+                "With multiple ledgers configured, specifies how many seconds to "
+                "remember DIDs not found on any ledger, or 0 to disable. "
+                "Default: 60."
+            ),
+        )
+        parser.add_argument(
+            "--ledger-hedge-delay",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_LEDGER_HEDGE_DELAY",
+            help=(
+                "With multiple ledgers configured, specifies how many seconds to "
+                "wait for the fastest ledgers to respond when looking up the "
+                "ledger of a DID before also querying the next ledger, or 0 to "
+                "query all ledgers at once. Default: 0.5."
+            ),
+        )
         parser.add_argument(
             "--accept-taa",
             type=str,
@@ -903,6 +1229,12 @@ class LedgerGroup(ArgumentGroup):
                 settings["ledger.keepalive"] = args.ledger_keepalive
             if args.ledger_socks_proxy:
                 settings["ledger.socks_proxy"] = args.ledger_socks_proxy
+            if args.ledger_request_timeout:
+                settings["ledger.request_timeout"] = args.ledger_request_timeout
+            if args.ledger_negative_cache_ttl is not None:
+                settings["ledger.negative_cache_ttl"] = args.ledger_negative_cache_ttl
+            if args.ledger_hedge_delay is not None:
+                settings["ledger.hedge_delay"] = args.ledger_hedge_delay
             if args.accept_taa:
                 settings["ledger.taa_acceptance_mechanism"] = args.accept_taa[0]
                 settings["ledger.taa_acceptance_version"] = args.accept_taa[1]
@@ -1260,6 +1592,46 @@ class TransportGroup(ArgumentGroup):
                 "option will require additional memory to store messages in the queue."
             ),
         )
+        parser.add_argument(
+            "--persist-undelivered-queue",
+            action="store_true",
+            env_var="ACAPY_PERSIST_UNDELIVERED_QUEUE",
+            help=(
+                "Save messages held in the undelivered queue to the wallet storage, "
+                "so that they survive a restart of the agent."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-ttl",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_TTL",
+            help=(
+                "Number of seconds to hold messages in the undelivered queue. "
+                "Default: 604800 (one week)."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-max-per-key",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_MAX_PER_KEY",
+            help=(
+                "Maximum number of messages held in the undelivered queue for any "
+                "single recipient key. The oldest messages for the key are dropped "
+                "to make room. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-max-messages",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_MAX_MESSAGES",
+            help=(
+                "Maximum number of messages held in the undelivered queue. The "
+                "oldest messages are dropped to make room. Default: no limit."
+            ),
+        )
         parser.add_argument(
             "--max-outbound-retry",
             default=4,
@@ -1271,6 +1643,69 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--persist-outbound-queue",
+            action="store_true",
+            env_var="ACAPY_PERSIST_OUTBOUND_QUEUE",
+            help=(
+                "Save encoded outbound messages pending delivery to the wallet "
+                "storage, so that delivery resumes after the agent restarts. "
+                "Writes are batched; see --outbound-queue-flush-interval."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-queue-flush-interval",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_QUEUE_FLUSH_INTERVAL",
+            help=(
+                "Maximum number of seconds for which changes to the persistent "
+                "outbound queue are buffered before being written. Default: 0.25."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-queue-max-per-endpoint",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_QUEUE_MAX_PER_ENDPOINT",
+            help=(
+                "Maximum number of outbound messages and webhooks queued for any "
+                "single endpoint. Further messages for the endpoint are handled "
+                "as undeliverable until the queue drains. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-breaker-threshold",
+            default=0,
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_BREAKER_THRESHOLD",
+            help=(
+                "Number of consecutive delivery failures after which messages "
+                "for an endpoint are held until a probe message succeeds. Each "
+                "failed probe counts against the retries of the held messages. "
+                "Default: 0, retrying each message independently."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-breaker-backoff",
+            default=10,
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_BREAKER_BACKOFF",
+            help=(
+                "Seconds to wait before probing a failing endpoint. The wait "
+                "doubles after each failed probe. Default: 10."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-breaker-max-backoff",
+            default=600,
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_BREAKER_MAX_BACKOFF",
+            help="Maximum seconds to wait before probing a failing endpoint.",
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1306,6 +1741,18 @@ class TransportGroup(ArgumentGroup):
         else:
             raise ArgsParseError("-ot/--outbound-transport is required")
         settings["transport.enable_undelivered_queue"] = args.enable_undelivered_queue
+        if args.persist_undelivered_queue:
+            settings["transport.undelivered_queue_persist"] = True
+        if args.undelivered_queue_ttl:
+            settings["transport.undelivered_queue_ttl"] = args.undelivered_queue_ttl
+        if args.undelivered_queue_max_per_key:
+            settings[
+                "transport.undelivered_queue_max_per_key"
+            ] = args.undelivered_queue_max_per_key
+        if args.undelivered_queue_max_messages:
+            settings[
+                "transport.undelivered_queue_max_messages"
+            ] = args.undelivered_queue_max_messages
 
         if args.label:
             settings["default_label"] = args.label
@@ -1315,6 +1762,37 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.persist_outbound_queue:
+            settings["transport.outbound_queue_persist"] = True
+        if args.outbound_queue_flush_interval is not None:
+            if args.outbound_queue_flush_interval < 0:
+                raise ArgsParseError(
+                    "--outbound-queue-flush-interval must not be negative"
+                )
+            settings[
+                "transport.outbound_queue_flush_interval"
+            ] = args.outbound_queue_flush_interval
+        if args.outbound_queue_max_per_endpoint:
+            settings[
+                "transport.outbound_queue_max_per_endpoint"
+            ] = args.outbound_queue_max_per_endpoint
+        if args.outbound_breaker_threshold is not None:
+            settings[
+                "transport.outbound_breaker_threshold"
+            ] = args.outbound_breaker_threshold
+        if args.outbound_breaker_backoff:
+            settings[
+                "transport.outbound_breaker_backoff"
+            ] = args.outbound_breaker_backoff
+        if args.outbound_breaker_max_backoff:
+            if args.outbound_breaker_max_backoff < (args.outbound_breaker_backoff or 0):
+                raise ArgsParseError(
+                    "--outbound-breaker-max-backoff must not be less than "
+                    "--outbound-breaker-backoff"
+                )
+            settings[
+                "transport.outbound_breaker_max_backoff"
+            ] = args.outbound_breaker_max_backoff
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
@@ -1663,8 +2141,13 @@ class MultitenantGroup(ArgumentGroup):
                 "Specify multitenancy configuration in key=value pairs. "
                 'For example: "wallet_type=askar-profile wallet_name=askar-profile-name" '
                 "Possible values: wallet_name, wallet_key, cache_size, "
+                "token_cache_size, token_cache_ttl, route_index_shared_cache, "
                 'key_derivation_method. "wallet_name" is only used when '
-                '"wallet_type" is "askar-profile"'
+                '"wallet_type" is "askar-profile". "token_cache_size" and '
+                '"token_cache_ttl" set the number of verified auth tokens kept '
+                "and for how many seconds (default 1000 and 60, 0 to disable). "
+                '"route_index_shared_cache" also keeps the routes of recipient '
+                "keys to subwallets in the shared cache"
             ),
         )
         parser.add_argument(
@@ -1718,6 +2201,14 @@ class MultitenantGroup(ArgumentGroup):
                             "cache_size"
                         )
 
+                    for key in (
+                        "token_cache_size",
+                        "token_cache_ttl",
+                        "route_index_shared_cache",
+                    ):
+                        if multitenancy_config.get(key) is not None:
+                            settings[f"multitenant.{key}"] = multitenancy_config[key]
+
                     if multitenancy_config.get("key_derivation_method"):
                         settings[
                             "multitenant.key_derivation_method"
@@ -14,6 +14,7 @@ from ..core.goal_code_registry import GoalCodeRegistry
 from ..resolver.did_resolver import DIDResolver
 from ..resolver.did_resolver_registry import DIDResolverRegistry
 from ..tails.base import BaseTailsServer
+from ..tails.cache import TailsCache
 
 from ..protocols.actionmenu.v1_0.base_service import BaseMenuService
 from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
@@ -22,6 +23,8 @@ from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
+from ..utils.worker_pool import WorkerPool
+from ..vc.ld_proofs.context_store import ContextStore
 from ..utils.dependencies import is_indy_sdk_module_installed
 
 
@@ -38,17 +41,64 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache
+        if context.settings.get("cache.url"):
+            from ..cache.redis import RedisCache
+
+            cache_args = {
+                "key_prefix": context.settings.get("cache.key_prefix"),
+                "near_ttl": context.settings.get("cache.near_ttl"),
+                "near_max_size": context.settings.get("cache.max_size"),
+            }
+            cache = RedisCache(
+                context.settings["cache.url"],
+                **{k: v for (k, v) in cache_args.items() if v is not None},
+            )
+        else:
+            cache = InMemoryCache(context.settings.get("cache.max_size"))
+        context.injector.bind_instance(BaseCache, cache)
+
+        # Shared cache of downloaded tails files
+        context.injector.bind_instance(
+            TailsCache,
+            TailsCache(
+                max_size=context.settings.get("tails_cache.max_size"),
+                collector=context.inject_or(Collector),
+            ),
+        )
+
+        # Worker pool for CPU-bound cryptographic operations
+        context.injector.bind_instance(
+            WorkerPool,
+            WorkerPool(
+                max_workers=context.settings.get("crypto_pool.max_workers"),
+                max_pending=context.settings.get("crypto_pool.max_pending"),
+                admission_timeout=context.settings.get("crypto_pool.admission_timeout"),
+                collector=context.inject_or(Collector),
+            ),
+        )
+
+        # JSON-LD contexts served without network access
+        context.injector.bind_instance(
+            ContextStore, ContextStore(context.settings.get("jsonld.context_dirs"))
+        )
 
         # Global protocol registry
-        context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
+        context.injector.bind_instance(
+            ProtocolRegistry, ProtocolRegistry(collector=context.inject_or(Collector))
+        )
 
         # Global goal code registry
         context.injector.bind_instance(GoalCodeRegistry, GoalCodeRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                context.settings.get("event_bus.queue_size"),
+                context.settings.get("event_bus.overflow"),
+            ),
+        )
 
         # Global did resolver registry
         did_resolver_registry = DIDResolverRegistry()
@@ -53,6 +53,234 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
 
+    async def test_outbound_queue_settings(self):
+        """Test outbound queue argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+        result = parser.parse_args(
+            base_args
+            + [
+                "--persist-outbound-queue",
+                "--outbound-queue-flush-interval",
+                "0.5",
+                "--outbound-queue-max-per-endpoint",
+                "100",
+            ]
+        )
+        settings = group.get_settings(result)
+
+        assert settings["transport.outbound_queue_persist"] is True
+        assert settings["transport.outbound_queue_flush_interval"] == 0.5
+        assert settings["transport.outbound_queue_max_per_endpoint"] == 100
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "transport.outbound_queue_persist" not in settings
+        assert "transport.outbound_queue_max_per_endpoint" not in settings
+
+        result = parser.parse_args(
+            base_args + ["--outbound-queue-flush-interval", "-1"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_undelivered_queue_settings(self):
+        """Test undelivered queue argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+        result = parser.parse_args(
+            base_args
+            + [
+                "--enable-undelivered-queue",
+                "--persist-undelivered-queue",
+                "--undelivered-queue-ttl",
+                "3600",
+                "--undelivered-queue-max-per-key",
+                "50",
+                "--undelivered-queue-max-messages",
+                "10000",
+            ]
+        )
+        settings = group.get_settings(result)
+
+        assert settings["transport.enable_undelivered_queue"] is True
+        assert settings["transport.undelivered_queue_persist"] is True
+        assert settings["transport.undelivered_queue_ttl"] == 3600
+        assert settings["transport.undelivered_queue_max_per_key"] == 50
+        assert settings["transport.undelivered_queue_max_messages"] == 10000
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "transport.undelivered_queue_persist" not in settings
+        assert "transport.undelivered_queue_max_per_key" not in settings
+
+    async def test_tails_cache_settings(self):
+        """Test tails cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.RevocationGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--tails-cache-max-size", "512M"])
+        settings = group.get_settings(result)
+        assert settings["tails_cache.max_size"] == 512 << 20
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "tails_cache.max_size" not in settings
+
+    async def test_revocation_index_block_size(self):
+        """Test revocation index block size argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.RevocationGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--revocation-index-block-size", "50"])
+        settings = group.get_settings(result)
+        assert settings["revocation.index_block_size"] == 50
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "revocation.index_block_size" not in settings
+
+    async def test_outbound_breaker_settings(self):
+        """Test outbound circuit breaker argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+        settings = group.get_settings(parser.parse_args(base_args))
+        assert settings["transport.outbound_breaker_threshold"] == 0
+        assert settings["transport.outbound_breaker_backoff"] == 10
+        assert settings["transport.outbound_breaker_max_backoff"] == 600
+
+        settings = group.get_settings(
+            parser.parse_args(
+                base_args
+                + [
+                    "--outbound-breaker-threshold",
+                    "3",
+                    "--outbound-breaker-backoff",
+                    "30",
+                    "--outbound-breaker-max-backoff",
+                    "60",
+                ]
+            )
+        )
+        assert settings["transport.outbound_breaker_threshold"] == 3
+        assert settings["transport.outbound_breaker_backoff"] == 30
+        assert settings["transport.outbound_breaker_max_backoff"] == 60
+
+        result = parser.parse_args(base_args + ["--outbound-breaker-max-backoff", "5"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_cache_settings(self):
+        """Test cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.CacheGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--cache-max-size",
+                "1000",
+                "--cache-url",
+                "redis://localhost:6379/0",
+                "--cache-key-prefix",
+                "agent::",
+                "--cache-near-ttl",
+                "0",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_size") == 1000
+        assert settings.get("cache.url") == "redis://localhost:6379/0"
+        assert settings.get("cache.key_prefix") == "agent::"
+        assert settings.get("cache.near_ttl") == 0
+
+        assert group.get_settings(parser.parse_args([])) == {}
+
+    async def test_event_bus_settings(self):
+        """Test event bus argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.EventBusGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            ["--event-queue-size", "100", "--event-queue-overflow", "drop_oldest"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("event_bus.queue_size") == 100
+        assert settings.get("event_bus.overflow") == "drop_oldest"
+
+        result = parser.parse_args(["--event-queue-overflow", "drop_oldest"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_crypto_pool_settings(self):
+        """Test crypto worker pool argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.CryptoPoolGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--crypto-pool-workers",
+                "4",
+                "--crypto-pool-max-pending",
+                "0",
+                "--crypto-pool-admission-timeout",
+                "2.5",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["crypto_pool.max_workers"] == 4
+        assert settings["crypto_pool.max_pending"] == 0
+        assert settings["crypto_pool.admission_timeout"] == 2.5
+
+        result = parser.parse_args(["--crypto-pool-admission-timeout", "0"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_jsonld_settings(self):
+        """Test JSON-LD argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.JsonLdGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--jsonld-context-dir",
+                "/contexts/a",
+                "--jsonld-context-dir",
+                "/contexts/b",
+                "--jsonld-offline",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["jsonld.context_dirs"] == ["/contexts/a", "/contexts/b"]
+        assert settings["jsonld.offline"] is True
+
+        settings = group.get_settings(parser.parse_args([]))
+        assert "jsonld.context_dirs" not in settings
+        assert "jsonld.offline" not in settings
+
     async def test_get_genesis_transactions_list_with_ledger_selection(self):
         """Test multiple ledger support related argument parsing."""
 
@@ -93,6 +321,26 @@ class TestArgParse(AsyncTestCase):
                 "genesis_url": "http://localhost:9000/genesis",
             }
         ) in settings.get("ledger.ledger_config_list")
+        assert settings["ledger.request_timeout"] == 10
+        assert settings["ledger.negative_cache_ttl"] == 60
+        assert "ledger.hedge_delay" not in settings
+
+        result = parser.parse_args(
+            [
+                "--genesis-transactions-list",
+                "./aries_cloudagent/config/tests/test-ledger-args.yaml",
+                "--ledger-request-timeout",
+                "3",
+                "--ledger-negative-cache-ttl",
+                "0",
+                "--ledger-hedge-delay",
+                "0.2",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["ledger.request_timeout"] == 3
+        assert settings["ledger.negative_cache_ttl"] == 0
+        assert settings["ledger.hedge_delay"] == 0.2
 
     async def test_upgrade_config(self):
         """Test upgrade command related argument parsing."""
@@ -231,7 +479,9 @@ class TestArgParse(AsyncTestCase):
                 "--jwt-secret",
                 "secret",
                 "--multitenancy-config",
-                '{"wallet_type":"askar","wallet_name":"test", "cache_size": 10}',
+                '{"wallet_type":"askar","wallet_name":"test", "cache_size": 10, '
+                '"token_cache_size": 50, "token_cache_ttl": 0, '
+                '"route_index_shared_cache": true}',
                 "--base-wallet-routes",
                 "/my_route",
             ]
@@ -244,6 +494,9 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("multitenant.wallet_type") == "askar"
         assert settings.get("multitenant.wallet_name") == "test"
         assert settings.get("multitenant.base_wallet_routes") == ["/my_route"]
+        assert settings.get("multitenant.token_cache_size") == 50
+        assert settings.get("multitenant.token_cache_ttl") == 0
+        assert settings.get("multitenant.route_index_shared_cache") is True
 
         result = parser.parse_args(
             [
@@ -254,6 +507,9 @@ class TestArgParse(AsyncTestCase):
                 "wallet_type=askar",
                 "wallet_name=test",
                 "cache_size=10",
+                "token_cache_size=50",
+                "token_cache_ttl=30",
+                "route_index_shared_cache=true",
                 "--base-wallet-routes",
                 "/my_route",
             ]
@@ -266,6 +522,9 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("multitenant.wallet_type") == "askar"
         assert settings.get("multitenant.wallet_name") == "test"
         assert settings.get("multitenant.base_wallet_routes") == ["/my_route"]
+        assert settings.get("multitenant.token_cache_size") == 50
+        assert settings.get("multitenant.token_cache_ttl") == 30
+        assert settings.get("multitenant.route_index_shared_cache") is True
 
     async def test_endorser_settings(self):
         """Test required argument parsing."""
@@ -513,3 +772,41 @@ class TestArgParse(AsyncTestCase):
         )
         with self.assertRaises(argparse.ArgsParseError):
             group.get_settings(result)
+
+    def test_resolver_cache(self):
+        """Test resolver cache flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["-e", "test"])
+        settings = group.get_settings(result)
+        assert "resolver.cache_ttl" not in settings
+        assert "resolver.cache_method_ttls" not in settings
+
+        result = parser.parse_args(
+            [
+                "-e",
+                "test",
+                "--resolver-cache-ttl",
+                "0",
+                "--resolver-cache-method-ttl",
+                "web",
+                "60",
+                "--resolver-cache-method-ttl",
+                "sov",
+                "3600",
+                "--resolver-negative-cache-ttl",
+                "5",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["resolver.cache_ttl"] == 0
+        assert settings["resolver.cache_method_ttls"] == {"web": 60, "sov": 3600}
+        assert settings["resolver.negative_cache_ttl"] == 5
+
+        result = parser.parse_args(
+            ["-e", "test", "--resolver-cache-method-ttl", "web", "soon"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
@@ -3,6 +3,7 @@ from tempfile import NamedTemporaryFile
 from asynctest import TestCase as AsyncTestCase
 
 from ...cache.base import BaseCache
+from ...cache.redis import RedisCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
 from ...transport.wire_format import BaseWireFormat
@@ -36,3 +37,14 @@ class TestDefaultContext(AsyncTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_shared_cache(self):
+        """Test context init with a shared cache server."""
+
+        builder = DefaultContextBuilder(
+            settings={"cache.url": "redis://localhost:6379/0", "cache.near_ttl": 0}
+        )
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, RedisCache)
+        assert cache.stats["near_size"] == 0
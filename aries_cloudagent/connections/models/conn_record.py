@@ -175,7 +175,9 @@ class ConnRecord(BaseRecord):
         "their_public_did",
         "invitation_msg_id",
         "their_role",
+        "state",
     }
+    ADDED_TAG_NAMES = ("state",)
 
     RECORD_TYPE = "connection"
     RECORD_TYPE_INVITATION = "connection_invitation"
@@ -8,6 +8,7 @@ wallet.
 
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -16,6 +17,7 @@ from qrcode import QRCode
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import (
@@ -54,21 +56,25 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..protocols.routing.v1_0.route_index import WalletRouteIndex
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
+from ..tails.cache import TailsCache
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
-from ..transport.outbound.base import OutboundDeliveryError
+from ..transport.outbound.base import OutboundDeliveryError, OutboundQueueFullError
 from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
+from ..utils.worker_pool import WorkerPool
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
+from .event_bus import EventBus
 from .oob_processor import OobMessageProcessor
 from .util import SHUTDOWN_EVENT_TOPIC, STARTUP_EVENT_TOPIC
 
@@ -208,6 +214,15 @@ class Conductor:
                 BaseMultitenantManager, MultitenantManagerProvider(self.root_profile)
             )
 
+            # Index of recipient keys routed to subwallets for inbound relay
+            route_index = WalletRouteIndex(
+                context.inject_or(BaseCache)
+                if context.settings.get("multitenant.route_index_shared_cache")
+                else None
+            )
+            await route_index.warm(self.root_profile)
+            context.injector.bind_instance(WalletRouteIndex, route_index)
+
         # Bind route manager provider
         context.injector.bind_provider(
             RouteManager, RouteManagerProvider(self.root_profile)
@@ -500,11 +515,30 @@ class Conductor:
             for profile in multitenant_mgr.open_profiles:
                 shutdown.run(profile.close())
 
-        if self.root_profile:
-            shutdown.run(self.root_profile.close())
+        event_bus = self.context.inject_or(EventBus)
+        if event_bus:
+            shutdown.run(event_bus.close())
 
         await shutdown.complete(timeout)
 
+        # close the root profile last, once pending outbound messages are saved
+        if self.root_profile:
+            try:
+                await asyncio.wait_for(self.root_profile.close(), timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning("Timed out closing the root profile")
+
+        cache = self.context.inject_or(BaseCache)
+        if cache:
+            try:
+                await asyncio.wait_for(cache.close(), timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning("Timed out closing the cache")
+
+        worker_pool = self.context.inject_or(WorkerPool)
+        if worker_pool:
+            worker_pool.shutdown()
+
     def inbound_message_router(
         self,
         profile: Profile,
@@ -583,6 +617,15 @@ class Conductor:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
                 stats["out_deliver"] += 1
+        endpoint_states = self.outbound_transport_manager.endpoint_states()
+        if endpoint_states:
+            stats["out_endpoints"] = endpoint_states
+        tails_cache = self.root_profile and self.root_profile.inject_or(TailsCache)
+        if tails_cache:
+            stats["tails_cache"] = dict(tails_cache.stats)
+        worker_pool = self.root_profile and self.root_profile.inject_or(WorkerPool)
+        if worker_pool:
+            stats["crypto_pool"] = worker_pool.stats
         return stats
 
     async def outbound_message_router(
@@ -691,6 +734,9 @@ class Conductor:
         try:
             await self.outbound_transport_manager.enqueue_message(profile, outbound)
             return OutboundSendStatus.QUEUED_FOR_DELIVERY
+        except OutboundQueueFullError as e:
+            LOGGER.warning("Cannot queue message for delivery: %s", str(e))
+            return self.handle_not_delivered(profile, outbound)
         except OutboundDeliveryError:
             LOGGER.warning("Cannot queue message for delivery, no supported transport")
             return self.handle_not_delivered(profile, outbound)
@@ -728,6 +774,8 @@ class Conductor:
             self.outbound_transport_manager.enqueue_webhook(
                 topic, payload, endpoint, max_attempts, metadata
             )
+        except OutboundQueueFullError as e:
+            LOGGER.warning("Cannot queue message webhook for delivery: %s", str(e))
         except OutboundDeliveryError:
             LOGGER.warning(
                 "Cannot queue message webhook for delivery, no supported transport"
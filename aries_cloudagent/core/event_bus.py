@@ -3,6 +3,8 @@
 import asyncio
 from contextlib import contextmanager
 import logging
+import re
+import sys
 from typing import (
     Any,
     Awaitable,
@@ -79,12 +81,212 @@ class EventWithMetadata(Event):
         return self._metadata
 
 
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def literal_prefix(pattern: Pattern) -> str:
+    """
+    Determine a literal prefix that any topic matched by a pattern must start with.
+
+    Args:
+        pattern (Pattern): compiled regular expression for matching topics
+
+    Returns:
+        The literal prefix, empty if none can be determined
+
+    """
+    source = pattern.pattern
+    if (
+        not isinstance(source, str)
+        or "|" in source
+        or pattern.flags & (re.IGNORECASE | re.VERBOSE)
+    ):
+        return ""
+    if source.startswith("^"):
+        source = source[1:]
+    prefix = []
+    for char in source:
+        if char in _REGEX_SPECIAL:
+            # a quantifier may make the preceding character optional
+            if char in "*?{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    """Return the task currently running on the event loop."""
+    if sys.version_info.major == 3 and sys.version_info.minor > 6:
+        return asyncio.current_task()
+    return asyncio.Task.current_task()
+
+
+class EventSubscriberQueue:
+    """A bounded queue delivering events to a single subscriber in order."""
+
+    OVERFLOW_BLOCK = "block"
+    OVERFLOW_DROP_NEWEST = "drop_newest"
+    OVERFLOW_DROP_OLDEST = "drop_oldest"
+    OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST)
+
+    def __init__(self, processor: Callable, max_size: int, overflow: str):
+        """Initialize the subscriber queue."""
+        self.processor = processor
+        self.overflow = overflow
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self._max_size = max_size
+        self._queue: asyncio.Queue = None
+        self._task: asyncio.Task = None
+
+    @property
+    def lag(self) -> int:
+        """Accessor for the number of events waiting for delivery."""
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the delivery statistics of this subscriber."""
+        return {
+            "lag": self.lag,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    async def put(self, profile: "Profile", event: Event):
+        """Queue an event for delivery, applying the overflow policy when full."""
+        if not self._queue:
+            self._queue = asyncio.Queue(self._max_size)
+            self._task = asyncio.get_event_loop().create_task(self._run())
+        if self._queue.full():
+            if self.overflow == self.OVERFLOW_DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.overflow == self.OVERFLOW_DROP_OLDEST:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+            elif _current_task() is self._task:
+                # the subscriber emitting into its own full queue would wait
+                # on itself, as the only consumer
+                LOGGER.warning("Subscriber event queue full, dropping own event")
+                self.dropped += 1
+                return
+        await self._queue.put((profile, event))
+
+    async def _run(self):
+        """Deliver queued events to the subscriber until closed."""
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    break
+                await self.processor(*item)
+                self.delivered += 1
+            except Exception:
+                self.failed += 1
+                LOGGER.exception("Error occurred while processing event")
+            finally:
+                self._queue.task_done()
+
+    async def join(self):
+        """Wait until all queued events have been delivered."""
+        if self._queue:
+            await self._queue.join()
+
+    def close(self):
+        """
+        Stop delivering events once those already queued are delivered.
+
+        When the queue is full, delivery is cancelled instead and the queued
+        events are discarded.
+        """
+        if self._task and not self._task.done():
+            try:
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                self._task.cancel()
+
+    async def wait_closed(self):
+        """Wait for the delivery task to finish after closing."""
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
 class EventBus:
-    """A simple event bus implementation."""
+    """
+    A simple event bus implementation.
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    Subscriptions are indexed by the literal prefix of their topic pattern,
+    so each event only runs the patterns that can match its topic. By default
+    subscribers are awaited one after another by the notifier. When a queue
+    size is given, each subscriber instead receives events in order through
+    its own bounded queue and `notify` returns once the event is queued.
+    """
+
+    def __init__(self, queue_size: int = None, overflow: str = None):
+        """
+        Initialize Event Bus.
+
+        Args:
+            queue_size: per-subscriber queue size, to deliver events asynchronously
+            overflow: the policy for a full subscriber queue: block (the
+                default), drop_newest or drop_oldest
+
+        """
+        overflow = overflow or EventSubscriberQueue.OVERFLOW_BLOCK
+        if overflow not in EventSubscriberQueue.OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported event queue overflow policy: {overflow}")
         self.topic_patterns_to_subscribers: Dict[Pattern, List[Callable]] = {}
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self._prefix_index: Dict[str, List[Pattern]] = {}
+        self._prefix_lengths: List[int] = []
+        self._queues: Dict[Tuple[Pattern, Callable], EventSubscriberQueue] = {}
+
+    @property
+    def queued(self) -> bool:
+        """Accessor for whether subscribers receive events through queues."""
+        return bool(self.queue_size)
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for per-subscriber delivery statistics, when queued."""
+        return {
+            f"{pattern.pattern} {getattr(processor, '__qualname__', processor)}": (
+                queue.stats
+            )
+            for (pattern, processor), queue in self._queues.items()
+        }
+
+    def _index_pattern(self, pattern: Pattern):
+        """Add a pattern to the topic prefix index."""
+        prefix = literal_prefix(pattern)
+        self._prefix_index.setdefault(prefix, []).append(pattern)
+        self._prefix_lengths = sorted({len(p) for p in self._prefix_index})
+
+    def _unindex_pattern(self, pattern: Pattern):
+        """Remove a pattern from the topic prefix index."""
+        prefix = literal_prefix(pattern)
+        patterns = self._prefix_index.get(prefix)
+        if patterns and pattern in patterns:
+            patterns.remove(pattern)
+            if not patterns:
+                del self._prefix_index[prefix]
+                self._prefix_lengths = sorted({len(p) for p in self._prefix_index})
+
+    def _matching_patterns(self, topic: str) -> Iterator[Tuple[Pattern, Match[str]]]:
+        """Find the subscribed patterns matching a topic, with their matches."""
+        for length in self._prefix_lengths:
+            if length > len(topic):
+                break
+            for pattern in self._prefix_index.get(topic[:length], ()):
+                match = pattern.match(topic)
+                if match:
+                    yield pattern, match
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
@@ -94,27 +296,22 @@ class EventBus:
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
 
         partials = []
-        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
-            match = pattern.match(event.topic)
-
-            if not match:
-                continue
-
-            for subscriber in subscribers:
-                partials.append(
-                    partial(
-                        subscriber,
-                        profile,
-                        event.with_metadata(EventMetadata(pattern, match)),
-                    )
-                )
+        for pattern, match in list(self._matching_patterns(event.topic)):
+            event_with_metadata = event.with_metadata(EventMetadata(pattern, match))
+            for subscriber in list(self.topic_patterns_to_subscribers.get(pattern, ())):
+                if self.queued:
+                    queue = self._queues.get((pattern, subscriber))
+                    if not queue:
+                        queue = EventSubscriberQueue(
+                            subscriber, self.queue_size, self.overflow
+                        )
+                        self._queues[(pattern, subscriber)] = queue
+                    await queue.put(profile, event_with_metadata)
+                else:
+                    partials.append(partial(subscriber, profile, event_with_metadata))
 
         for processor in partials:
             try:
@@ -122,6 +319,20 @@ class EventBus:
             except Exception:
                 LOGGER.exception("Error occurred while processing event")
 
+    async def join(self):
+        """Wait until all queued events have been delivered to subscribers."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self):
+        """Stop delivering queued events."""
+        queues = list(self._queues.values())
+        self._queues = {}
+        for queue in queues:
+            queue.close()
+        for queue in queues:
+            await queue.wait_closed()
+
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
 
@@ -133,6 +344,7 @@ class EventBus:
         LOGGER.debug("Subscribed: topic %s, processor %s", pattern, processor)
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
+            self._index_pattern(pattern)
         self.topic_patterns_to_subscribers[pattern].append(processor)
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
@@ -152,8 +364,13 @@ class EventBus:
             except ValueError:
                 return
             del self.topic_patterns_to_subscribers[pattern][index]
+            if processor not in self.topic_patterns_to_subscribers[pattern]:
+                queue = self._queues.pop((pattern, processor), None)
+                if queue:
+                    queue.close()
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+                self._unindex_pattern(pattern)
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
     @contextmanager
@@ -1,25 +1,39 @@
 """Handle registration and publication of supported protocols."""
 
 import logging
+import time
 
-from typing import Mapping, Sequence
+from typing import Dict, Mapping, Optional, Sequence
 
 from ..config.injection_context import InjectionContext
 from ..utils.classloader import ClassLoader
+from ..utils.stats import Collector
 
 from .error import ProtocolMinorVersionNotSupported
 
 LOGGER = logging.getLogger(__name__)
 
+# maximum number of message types with a memoized resolved message class
+RESOLVED_CACHE_SIZE = 4096
+
 
 class ProtocolRegistry:
     """Protocol registry for indexing message families."""
 
-    def __init__(self):
-        """Initialize a `ProtocolRegistry` instance."""
+    def __init__(self, collector: Collector = None):
+        """
+        Initialize a `ProtocolRegistry` instance.
+
+        Args:
+            collector: optional collector for message class resolution statistics
+
+        """
         self._controllers = {}
         self._typemap = {}
         self._versionmap = {}
+        self._versionroutes = {}
+        self._resolved: Dict[str, Optional[type]] = {}
+        self.collector = collector
 
     @property
     def protocols(self) -> Sequence[str]:
@@ -87,6 +101,7 @@ class ProtocolRegistry:
         # Maintain support for versionless protocol modules
         for typeset in typesets:
             self._typemap.update(typeset)
+        self._resolved.clear()
 
         # Track versioned modules for version routing
         if version_definition:
@@ -97,12 +112,21 @@ class ProtocolRegistry:
                     if version_definition["major_version"] not in self._versionmap:
                         self._versionmap[version_definition["major_version"]] = []
 
-                    self._versionmap[version_definition["major_version"]].append(
-                        {
-                            "parsed_type_string": parsed_type_string,
-                            "version_definition": version_definition,
-                            "message_module": module_path,
-                        }
+                    proto = {
+                        "parsed_type_string": parsed_type_string,
+                        "version_definition": version_definition,
+                        "message_module": module_path,
+                    }
+                    self._versionmap[version_definition["major_version"]].append(proto)
+
+                    # The first registered module of a message routes its versions
+                    self._versionroutes.setdefault(
+                        (
+                            version_definition["major_version"],
+                            parsed_type_string["protocol_name"],
+                            parsed_type_string["message_name"],
+                        ),
+                        proto,
                     )
 
     def register_controllers(self, *controller_sets, version_definition=None):
@@ -122,6 +146,8 @@ class ProtocolRegistry:
 
         Given a message type identifier, this method
         returns the corresponding registered message class.
+        Resolved classes are memoized by message type, including unsupported
+        message types and message types resolved by minor version routing.
 
         Args:
             message_type: Message type to resolve
@@ -129,7 +155,31 @@ class ProtocolRegistry:
         Returns:
             The resolved message class
 
+        Raises:
+            ProtocolMinorVersionNotSupported: If the minor version of the message
+                type is below the minimum supported minor version
+
         """
+        start = self.collector and time.perf_counter()
+        if message_type in self._resolved:
+            msg_cls = self._resolved[message_type]
+            outcome = "hit"
+        else:
+            msg_cls = self._load_message_class(message_type)
+            if len(self._resolved) >= RESOLVED_CACHE_SIZE:
+                del self._resolved[next(iter(self._resolved))]
+            self._resolved[message_type] = msg_cls
+            outcome = "miss"
+        if self.collector:
+            self.collector.log(
+                f"ProtocolRegistry.resolve_message_class.{outcome}",
+                time.perf_counter() - start,
+                start,
+            )
+        return msg_cls
+
+    def _load_message_class(self, message_type: str) -> Optional[type]:
+        """Load the message class of a message type, with minor version routing."""
 
         # Try and retrieve from direct mapping
         msg_cls = self._typemap.get(message_type)
@@ -141,37 +191,35 @@ class ProtocolRegistry:
             return msg_cls
 
         # Try and route via min/maj version matching
-        if not msg_cls:
+        try:
             parsed_type_string = self.parse_type_string(message_type)
-            major_version = parsed_type_string["major_version"]
-
-            version_supported_protos = self._versionmap.get(major_version)
-            if not version_supported_protos:
-                return None
-
-            for proto in version_supported_protos:
-                if (
-                    proto["parsed_type_string"]["protocol_name"]
-                    == parsed_type_string["protocol_name"]
-                    and proto["parsed_type_string"]["message_name"]
-                    == parsed_type_string["message_name"]
-                ):
-                    if (
-                        parsed_type_string["minor_version"]
-                        < proto["version_definition"]["minimum_minor_version"]
-                    ):
-                        raise ProtocolMinorVersionNotSupported(
-                            "Minimum supported minor version is "
-                            + f"{proto['version_definition']['minimum_minor_version']}."
-                            + f" Received {parsed_type_string['minor_version']}."
-                        )
-
-                    if isinstance(proto["message_module"], str):
-                        return ClassLoader.load_class(msg_cls)
-                    elif proto["message_module"]:
-                        return proto["message_module"]
-
-        return None
+        except (AssertionError, IndexError, ValueError):
+            LOGGER.debug("Unable to parse message type %s", message_type)
+            return None
+
+        proto = self._versionroutes.get(
+            (
+                parsed_type_string["major_version"],
+                parsed_type_string["protocol_name"],
+                parsed_type_string["message_name"],
+            )
+        )
+        if not proto:
+            return None
+
+        if (
+            parsed_type_string["minor_version"]
+            < proto["version_definition"]["minimum_minor_version"]
+        ):
+            raise ProtocolMinorVersionNotSupported(
+                "Minimum supported minor version is "
+                + f"{proto['version_definition']['minimum_minor_version']}."
+                + f" Received {parsed_type_string['minor_version']}."
+            )
+
+        if isinstance(proto["message_module"], str):
+            return ClassLoader.load_class(proto["message_module"])
+        return proto["message_module"] or None
 
     async def prepare_disclosed(
         self, context: InjectionContext, protocols: Sequence[str]
@@ -4,6 +4,7 @@ import mock as async_mock
 from async_case import IsolatedAsyncioTestCase
 
 from ...admin.base_server import BaseAdminServer
+from ...cache.base import BaseCache
 from ...config.base_context import ContextBuilder
 from ...config.injection_context import InjectionContext
 from ...connections.models.conn_record import ConnRecord
@@ -24,6 +25,7 @@ from ...protocols.coordinate_mediation.mediation_invite_store import (
 from ...protocols.coordinate_mediation.v1_0.models.mediation_record import (
     MediationRecord,
 )
+from ...protocols.routing.v1_0.route_index import WalletRouteIndex
 from ...resolver.did_resolver import DIDResolver, DIDResolverRegistry
 from ...multitenant.base import BaseMultitenantManager
 from ...multitenant.manager import MultitenantManager
@@ -235,10 +237,14 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             mock_outbound_mgr.return_value.registered_transports = {
                 "test": async_mock.MagicMock(schemes=["http"])
             }
+            mock_outbound_mgr.return_value.endpoint_states.return_value = {
+                "http://example": {"state": "open"}
+            }
 
             await conductor.setup()
 
             stats = await conductor.get_stats()
+            assert stats["out_endpoints"] == {"http://example": {"state": "open"}}
             assert all(
                 x in stats
                 for x in [
@@ -496,6 +502,17 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                 await conductor.queue_outbound(conductor.root_profile, message)
                 mock_run_task.assert_called_once()
 
+                mock_outbound_mgr.return_value.enqueue_message.side_effect = (
+                    test_module.OutboundQueueFullError("Outbound queue is full")
+                )
+                with async_mock.patch.object(
+                    test_module.LOGGER, "warning", async_mock.MagicMock()
+                ) as mock_warning:
+                    await conductor.queue_outbound(conductor.root_profile, message)
+                mock_warning.assert_called_once_with(
+                    "Cannot queue message for delivery: %s", "Outbound queue is full"
+                )
+
     async def test_handle_outbound_queue(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         conductor = test_module.Conductor(builder)
@@ -1057,6 +1074,7 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             await conductor.setup()
             multitenant_mgr = conductor.context.inject(BaseMultitenantManager)
             assert isinstance(multitenant_mgr, MultitenantManager)
+            assert conductor.context.inject(WalletRouteIndex)
 
             multitenant_mgr._profiles.put(
                 "test1",
@@ -1072,6 +1090,28 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             multitenant_mgr._profiles.profiles["test1"].close.assert_called_once_with()
             multitenant_mgr._profiles.profiles["test2"].close.assert_called_once_with()
 
+    async def test_shutdown_closes_cache(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        with async_mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, async_mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr, async_mock.patch.object(
+            test_module, "LoggingConfigurator", autospec=True
+        ) as mock_logger:
+            mock_outbound_mgr.return_value.registered_transports = {
+                "test": async_mock.MagicMock(schemes=["http"])
+            }
+            await conductor.setup()
+            mock_cache = async_mock.MagicMock(close=async_mock.AsyncMock())
+            conductor.context.injector.bind_instance(BaseCache, mock_cache)
+
+            await conductor.stop()
+
+            mock_cache.close.assert_awaited_once_with()
+
 
 def get_invite_store_mock(
     invite_string: str, invite_already_used: bool = False
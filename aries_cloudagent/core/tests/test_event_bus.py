@@ -1,5 +1,6 @@
 """Test Event Bus."""
 
+import asyncio
 import pytest
 import re
 
@@ -205,3 +206,153 @@ async def test_wait_for_event_condition(event_bus: EventBus, profile, event):
         await event_bus.notify(profile, event)
         assert returned_event.done()
         assert await returned_event == event
+
+
+@pytest.mark.parametrize(
+    "pattern, prefix",
+    [
+        ("acapy::record::.*", "acapy::record::"),
+        ("^acapy::webhook::(.*)$", "acapy::webhook::"),
+        ("test", "test"),
+        ("tests?", "test"),
+        ("ab+c", "ab"),
+        ("a{0,2}b", ""),
+        ("one|two", ""),
+        (r"acapy\:\:x", "acapy"),
+        (".*", ""),
+    ],
+)
+def test_literal_prefix(pattern, prefix):
+    assert test_module.literal_prefix(re.compile(pattern)) == prefix
+    assert test_module.literal_prefix(re.compile(pattern, re.IGNORECASE)) == ""
+
+
+@pytest.mark.asyncio
+async def test_sub_notify_prefix_index(event_bus: EventBus, profile):
+    """Test only patterns sharing the topic prefix are evaluated."""
+    processor = MockProcessor()
+    other = MockProcessor()
+    event_bus.subscribe(re.compile("acapy::record::.*"), processor)
+    event_bus.subscribe(re.compile("acapy::webhook::.*"), other)
+    event = Event("acapy::record::connections::active")
+    await event_bus.notify(profile, event)
+    assert processor.event == event
+    assert other.event is None
+
+    event_bus.unsubscribe(re.compile("acapy::record::.*"), processor)
+    assert "acapy::record::" not in event_bus._prefix_index
+    assert "acapy::webhook::" in event_bus._prefix_index
+
+
+@pytest.mark.asyncio
+async def test_queued_notify_does_not_wait(profile, event):
+    """Test queued delivery returns before a slow subscriber completes."""
+    event_bus = EventBus(queue_size=10)
+    assert event_bus.queued
+    release = asyncio.Event()
+    received = []
+
+    async def slow_processor(profile, event):
+        await release.wait()
+        received.append(event)
+
+    event_bus.subscribe(re.compile(".*"), slow_processor)
+    await asyncio.wait_for(event_bus.notify(profile, event), 1)
+    await event_bus.notify(profile, event)
+    assert not received
+    (stats,) = event_bus.stats.values()
+    assert stats["lag"] >= 1
+
+    release.set()
+    await asyncio.wait_for(event_bus.join(), 1)
+    assert received == [event, event]
+    (stats,) = event_bus.stats.values()
+    assert stats == {"lag": 0, "delivered": 2, "dropped": 0, "failed": 0}
+    await event_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_queued_notify_error_counted(profile, event):
+    event_bus = EventBus(queue_size=10)
+
+    async def bad_processor(profile, event):
+        raise Exception()
+
+    event_bus.subscribe(re.compile(".*"), bad_processor)
+    with async_mock.patch.object(
+        test_module.LOGGER, "exception", async_mock.MagicMock()
+    ) as mock_log_exc:
+        await event_bus.notify(profile, event)
+        await asyncio.wait_for(event_bus.join(), 1)
+    mock_log_exc.assert_called_once()
+    (stats,) = event_bus.stats.values()
+    assert stats["failed"] == 1
+    await event_bus.close()
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [("drop_newest", [0, 1]), ("drop_oldest", [0, 2])],
+)
+@pytest.mark.asyncio
+async def test_queued_overflow(profile, overflow, expected):
+    event_bus = EventBus(queue_size=1, overflow=overflow)
+    release = asyncio.Event()
+    received = []
+
+    async def slow_processor(profile, event):
+        await release.wait()
+        received.append(event.payload)
+
+    event_bus.subscribe(re.compile(".*"), slow_processor)
+    await event_bus.notify(profile, Event("topic", 0))
+    await asyncio.sleep(0)  # first event taken by the subscriber
+    for payload in (1, 2):
+        await event_bus.notify(profile, Event("topic", payload))
+    release.set()
+    await asyncio.wait_for(event_bus.join(), 1)
+    assert received == expected
+    (stats,) = event_bus.stats.values()
+    assert stats["dropped"] == 1
+    await event_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_queued_overflow_block_own_event(profile):
+    event_bus = EventBus(queue_size=1)
+    release = asyncio.Event()
+    received = []
+
+    async def echo_processor(profile, event):
+        received.append(event.payload)
+        if event.payload == 0:
+            await release.wait()
+            # the queue is full: emitting must not wait on this subscriber
+            await event_bus.notify(profile, Event("topic", 2))
+
+    event_bus.subscribe(re.compile(".*"), echo_processor)
+    await event_bus.notify(profile, Event("topic", 0))
+    await asyncio.sleep(0)  # first event taken by the subscriber
+    await event_bus.notify(profile, Event("topic", 1))
+    release.set()
+    await asyncio.wait_for(event_bus.join(), 1)
+    assert received == [0, 1]
+    (stats,) = event_bus.stats.values()
+    assert stats["dropped"] == 1
+    await event_bus.close()
+
+
+def test_queued_overflow_x():
+    with pytest.raises(ValueError):
+        EventBus(queue_size=1, overflow="explode")
+
+
+@pytest.mark.asyncio
+async def test_queued_wait_for_event(profile, event):
+    event_bus = EventBus(queue_size=10)
+    with event_bus.wait_for_event(profile, re.compile(".*")) as returned_event:
+        await event_bus.notify(profile, event)
+        assert await asyncio.wait_for(returned_event, 1) == event
+    await asyncio.sleep(0)
+    assert not event_bus.topic_patterns_to_subscribers
+    assert not event_bus.stats
@@ -2,7 +2,10 @@ from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from ...config.injection_context import InjectionContext
 from ...utils.classloader import ClassLoader
+from ...utils.stats import Collector
 
+from .. import protocol_registry as test_module
+from ..error import ProtocolMinorVersionNotSupported
 from ..protocol_registry import ProtocolRegistry
 
 
@@ -119,6 +122,7 @@ class TestProtocolRegistry(AsyncTestCase):
             load_class.side_effect = [mock_class, mock_class]
             result = self.registry.resolve_message_class("proto/1.1/aaa")
             assert result == mock_class
+            load_class.assert_called_once_with(self.test_message_handler)
 
     def test_resolve_message_load_class_none(self):
         message_type_a = "proto/1.2/aaa"
@@ -139,5 +143,63 @@ class TestProtocolRegistry(AsyncTestCase):
             result = self.registry.resolve_message_class("proto/1.2/bbb")
             assert result is None
 
+    def test_resolve_message_class_minor_version_not_supported(self):
+        self.registry.register_message_types(
+            {"proto/1.2/aaa": self.test_message_handler},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 1,
+                "current_minor_version": 2,
+                "path": "v1_2",
+            },
+        )
+        with self.assertRaises(ProtocolMinorVersionNotSupported):
+            self.registry.resolve_message_class("proto/1.0/aaa")
+
+    def test_resolve_message_class_unparsable(self):
+        for message_type in ("hello", "proto/1/hello", "proto/a.b/hello"):
+            assert self.registry.resolve_message_class(message_type) is None
+
+    def test_resolve_message_class_memoized(self):
+        collector = Collector()
+        self.registry = ProtocolRegistry(collector=collector)
+        self.registry.register_message_types(
+            {"proto/1.2/aaa": self.test_message_handler},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 0,
+                "current_minor_version": 2,
+                "path": "v1_2",
+            },
+        )
+        mock_class = async_mock.MagicMock()
+        with async_mock.patch.object(
+            ClassLoader, "load_class", async_mock.MagicMock()
+        ) as load_class:
+            load_class.return_value = mock_class
+            for _ in range(3):
+                assert self.registry.resolve_message_class("proto/1.2/aaa") is (
+                    mock_class
+                )
+                assert self.registry.resolve_message_class("proto/1.1/aaa") is (
+                    mock_class
+                )
+                assert self.registry.resolve_message_class("proto/1.2/bbb") is None
+            assert load_class.call_count == 2
+
+            self.registry.register_message_types({"proto/1.2/bbb": "other"})
+            assert self.registry.resolve_message_class("proto/1.2/bbb") is (mock_class)
+            load_class.assert_called_with("other")
+
+        counts = collector.extract()["count"]
+        assert counts["ProtocolRegistry.resolve_message_class.hit"] == 6
+        assert counts["ProtocolRegistry.resolve_message_class.miss"] == 4
+
+    def test_resolve_message_class_cache_size(self):
+        with async_mock.patch.object(test_module, "RESOLVED_CACHE_SIZE", 2):
+            for message_type in ("proto/1.0/a", "proto/1.0/b", "proto/1.0/c"):
+                self.registry.resolve_message_class(message_type)
+        assert list(self.registry._resolved) == ["proto/1.0/b", "proto/1.0/c"]
+
     def test_repr(self):
         assert type(repr(self.registry)) is str
@@ -1,6 +1,5 @@
 """Indy holder implementation."""
 
-import asyncio
 import json
 import logging
 import re
@@ -21,6 +20,7 @@ from indy_credx import (
 
 from ...askar.profile import AskarProfile
 from ...ledger.base import BaseLedger
+from ...utils.worker_pool import run_in_worker_pool
 from ...wallet.error import WalletNotFoundError
 
 from ..holder import IndyHolder, IndyHolderError
@@ -121,11 +121,9 @@ class IndyCredxHolder(IndyHolder):
         """
         try:
             secret = await self.get_master_secret()
-            (
-                cred_req,
-                cred_req_metadata,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            (cred_req, cred_req_metadata,) = await run_in_worker_pool(
+                self._profile,
+                "CredentialRequest.create",
                 CredentialRequest.create,
                 holder_did,
                 credential_definition,
@@ -178,8 +176,9 @@ class IndyCredxHolder(IndyHolder):
         try:
             secret = await self.get_master_secret()
             cred = Credential.load(credential_data)
-            cred_recvd = await asyncio.get_event_loop().run_in_executor(
-                None,
+            cred_recvd = await run_in_worker_pool(
+                self._profile,
+                "Credential.process",
                 cred.process,
                 credential_request_metadata,
                 secret,
@@ -524,8 +523,9 @@ class IndyCredxHolder(IndyHolder):
 
         try:
             secret = await self.get_master_secret()
-            presentation = await asyncio.get_event_loop().run_in_executor(
-                None,
+            presentation = await run_in_worker_pool(
+                self._profile,
+                "Presentation.create",
                 Presentation.create,
                 presentation_request,
                 present_creds,
@@ -562,8 +562,9 @@ class IndyCredxHolder(IndyHolder):
         """
 
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
+            rev_state = await run_in_worker_pool(
+                self._profile,
+                "CredentialRevocationState.create",
                 CredentialRevocationState.create,
                 rev_reg_def,
                 rev_reg_delta,
@@ -574,3 +575,46 @@ class IndyCredxHolder(IndyHolder):
         except CredxError as err:
             raise IndyHolderError("Error creating revocation state") from err
         return rev_state.to_json()
+
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+        rev_state: str,
+    ) -> str:
+        """
+        Update a previously created revocation state for a received credential.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_reg_delta: revocation delta since the timestamp of the state
+            timestamp: delta timestamp
+            tails_file_path: path to the tails file
+            rev_state: the revocation state to update
+
+        Returns:
+            the updated revocation state
+
+        """
+
+        def _update() -> str:
+            state = CredentialRevocationState.load(rev_state)
+            state.update(
+                rev_reg_def,
+                rev_reg_delta,
+                int(cred_rev_id),
+                timestamp,
+                tails_file_path,
+            )
+            return state.to_json()
+
+        try:
+            return await run_in_worker_pool(
+                self._profile, "CredentialRevocationState.update", _update
+            )
+        except CredxError as err:
+            raise IndyHolderError("Error updating revocation state") from err
@@ -2,8 +2,12 @@
 
 import asyncio
 import logging
+import time
 
-from typing import Sequence, Tuple
+from collections import deque
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from aries_askar import AskarError
 
@@ -29,6 +33,8 @@ from ..issuer import (
     DEFAULT_SIGNATURE_TYPE,
 )
 from ...revocation.models.issuer_cred_rev_record import IssuerCredRevRecord
+from ...storage.error import StorageError
+from ...utils.worker_pool import run_in_worker_pool
 
 
 LOGGER = logging.getLogger(__name__)
@@ -42,6 +48,185 @@ CATEGORY_REV_REG_INFO = "revocation_reg_info"
 CATEGORY_REV_REG_DEF = "revocation_reg_def"
 CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
+CATEGORY_REV_REG_RESERVATION = "revocation_reg_reservation"
+
+RESERVATION_LEASE = 600
+RESERVATION_LEASE_MARGIN = 30
+
+# opened store -> (profile id, rev reg id) -> block reserved by this process
+_BLOCKS: "WeakKeyDictionary[object, Dict[Tuple[str, str], RevRegIndexBlock]]" = (
+    WeakKeyDictionary()
+)
+_LOCKS: "WeakKeyDictionary[object, Dict[Tuple[str, str], asyncio.Lock]]" = (
+    WeakKeyDictionary()
+)
+
+
+class RevRegIndexBlock:
+    """Revocation registry indices reserved for issuance by this process."""
+
+    def __init__(self, reservation_id: str, ids: Iterable[int], expires: float):
+        """Initialize a `RevRegIndexBlock` instance."""
+        self.reservation_id = reservation_id
+        self.ids = deque(ids)
+        self.expires = expires
+
+    def take(self) -> Optional[int]:
+        """Take the next index, unless the block is exhausted or about to expire."""
+        if self.ids and time.time() < self.expires - RESERVATION_LEASE_MARGIN:
+            return self.ids.popleft()
+        return None
+
+
+class RevRegIndexAllocator:
+    """
+    Allocator of revocation registry indices from reserved blocks.
+
+    Each process reserves a block of indices at a time under the lock on the
+    registry metadata, then issues from it without touching shared state. A
+    reservation is persisted with a lease: once it expires, the indices of the
+    block with no issuer credential revocation record were never used, and the
+    next reservation reclaims them.
+    """
+
+    def __init__(
+        self, profile: AskarProfile, block_size: int, *, lease: int = RESERVATION_LEASE
+    ):
+        """
+        Initialize a `RevRegIndexAllocator` instance.
+
+        Args:
+            profile: the issuer profile
+            block_size: the number of indices to reserve at a time
+            lease: the number of seconds for which a reservation is valid
+
+        """
+        self._profile = profile
+        self._block_size = block_size
+        self._lease = lease
+
+    async def next_index(self, rev_reg_id: str, max_cred_num: int) -> int:
+        """
+        Allocate the next revocation registry index for issuance.
+
+        Args:
+            rev_reg_id: the revocation registry identifier
+            max_cred_num: the capacity of the revocation registry
+
+        Returns:
+            The revocation registry index
+
+        """
+        key = (self._profile.profile_id, rev_reg_id)
+        blocks = _BLOCKS.setdefault(self._profile.opened, {})
+        block = blocks.get(key)
+        index = block.take() if block else None
+        if index is not None:
+            return index
+
+        locks = _LOCKS.setdefault(self._profile.opened, {})
+        if key not in locks:
+            locks[key] = asyncio.Lock()
+        async with locks[key]:
+            # another issuance may have reserved a block while waiting
+            block = blocks.get(key)
+            index = block.take() if block else None
+            if index is None:
+                if block:
+                    await self._release(block)
+                block = await self._reserve(rev_reg_id, max_cred_num)
+                blocks[key] = block
+                index = block.take()
+        return index
+
+    async def _reserve(self, rev_reg_id: str, max_cred_num: int) -> RevRegIndexBlock:
+        """Reserve a block of indices, reclaiming those of expired reservations."""
+        try:
+            async with self._profile.transaction() as txn:
+                rev_reg_info = await txn.handle.fetch(
+                    CATEGORY_REV_REG_INFO, rev_reg_id, for_update=True
+                )
+                if not rev_reg_info:
+                    raise IndyIssuerError("Revocation registry metadata not found")
+                rev_info = rev_reg_info.value_json
+                free_ids = set(rev_info.get("free_ids") or [])
+
+                now = time.time()
+                expired = [
+                    entry
+                    for entry in await txn.handle.fetch_all(
+                        CATEGORY_REV_REG_RESERVATION, {"rev_reg_id": rev_reg_id}
+                    )
+                    if entry.value_json["expires"] <= now
+                ]
+                if expired:
+                    reserved = {
+                        str(cred_rev_id)
+                        for entry in expired
+                        for cred_rev_id in entry.value_json["ids"]
+                    }
+                    issued = {
+                        int(rec.cred_rev_id)
+                        for rec in await IssuerCredRevRecord.query(
+                            txn,
+                            {
+                                "rev_reg_id": rev_reg_id,
+                                "cred_rev_id": {"$in": sorted(reserved)},
+                            },
+                        )
+                    }
+                    for entry in expired:
+                        free_ids.update(set(entry.value_json["ids"]) - issued)
+                        await txn.handle.remove(
+                            CATEGORY_REV_REG_RESERVATION, entry.name
+                        )
+
+                ids = sorted(free_ids)[: self._block_size]
+                free_ids.difference_update(ids)
+                curr_id = rev_info["curr_id"]
+                end = min(curr_id + self._block_size - len(ids), max_cred_num)
+                ids.extend(range(curr_id + 1, end + 1))
+                if not ids:
+                    raise IndyIssuerRevocationRegistryFullError(
+                        "Revocation registry is full"
+                    )
+                rev_info["curr_id"] = max(curr_id, end)
+                rev_info["free_ids"] = sorted(free_ids)
+                await txn.handle.replace(
+                    CATEGORY_REV_REG_INFO, rev_reg_id, value_json=rev_info
+                )
+
+                block = RevRegIndexBlock(str(uuid4()), ids, now + self._lease)
+                await txn.handle.insert(
+                    CATEGORY_REV_REG_RESERVATION,
+                    block.reservation_id,
+                    value_json={
+                        "rev_reg_id": rev_reg_id,
+                        "ids": ids,
+                        "expires": block.expires,
+                    },
+                    tags={"rev_reg_id": rev_reg_id},
+                )
+                await txn.commit()
+        except AskarError as err:
+            raise IndyIssuerError(
+                "Error reserving revocation registry indices"
+            ) from err
+        return block
+
+    async def _release(self, block: RevRegIndexBlock):
+        """Remove the reservation of a block with every index used."""
+        if block.ids:
+            # unused indices are reclaimed once the reservation expires
+            return
+        try:
+            async with self._profile.session() as session:
+                await session.handle.remove(
+                    CATEGORY_REV_REG_RESERVATION, block.reservation_id
+                )
+        except AskarError as err:
+            # an expired reservation with every index used is removed on reclaim
+            LOGGER.warning("Error releasing revocation registry indices: %s", err)
 
 
 class IndyCredxIssuer(IndyIssuer):
@@ -138,12 +323,9 @@ class IndyCredxIssuer(IndyIssuer):
 
         """
         try:
-            (
-                cred_def,
-                cred_def_private,
-                key_proof,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            (cred_def, cred_def_private, key_proof,) = await run_in_worker_pool(
+                self._profile,
+                "CredentialDefinition.create",
                 lambda: CredentialDefinition.create(
                     origin_did,
                     schema,
@@ -276,7 +458,16 @@ class IndyCredxIssuer(IndyIssuer):
 
             raw_values[attribute] = str(credential_value)
 
-        if revoc_reg_id:
+        block_size = self._profile.settings.get("revocation.index_block_size") or 1
+        if revoc_reg_id and block_size > 1:
+            (
+                rev_reg,
+                rev_info,
+                rev_reg_def,
+                rev_key,
+                rev_reg_index,
+            ) = await self._allocate_rev_reg_index(revoc_reg_id, cred_ex_id, block_size)
+        elif revoc_reg_id:
             try:
                 async with self._profile.transaction() as txn:
                     rev_reg = await txn.handle.fetch(CATEGORY_REV_REG, revoc_reg_id)
@@ -344,6 +535,7 @@ class IndyCredxIssuer(IndyIssuer):
                     "Error updating revocation registry index"
                 ) from err
 
+        if revoc_reg_id:
             revoc = CredentialRevocationConfig(
                 rev_reg_def,
                 rev_key.raw_value,
@@ -358,12 +550,9 @@ class IndyCredxIssuer(IndyIssuer):
             credential_revocation_id = None
 
         try:
-            (
-                credential,
-                _upd_rev_reg,
-                _delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            (credential, _upd_rev_reg, _delta,) = await run_in_worker_pool(
+                self._profile,
+                "Credential.create",
                 Credential.create,
                 cred_def.raw_value,
                 cred_def_private.raw_value,
@@ -378,6 +567,64 @@ class IndyCredxIssuer(IndyIssuer):
 
         return credential.to_json(), credential_revocation_id
 
+    async def _allocate_rev_reg_index(
+        self, revoc_reg_id: str, cred_ex_id: str, block_size: int
+    ) -> tuple:
+        """Allocate a revocation registry index from a block reserved for issuance."""
+        try:
+            async with self._profile.session() as session:
+                rev_reg = await session.handle.fetch(CATEGORY_REV_REG, revoc_reg_id)
+                rev_reg_info = await session.handle.fetch(
+                    CATEGORY_REV_REG_INFO, revoc_reg_id
+                )
+                rev_reg_def = await session.handle.fetch(
+                    CATEGORY_REV_REG_DEF, revoc_reg_id
+                )
+                rev_key = await session.handle.fetch(
+                    CATEGORY_REV_REG_DEF_PRIVATE, revoc_reg_id
+                )
+        except AskarError as err:
+            raise IndyIssuerError("Error retrieving revocation registry") from err
+        if not rev_reg:
+            raise IndyIssuerError("Revocation registry not found")
+        if not rev_reg_info:
+            raise IndyIssuerError("Revocation registry metadata not found")
+        if not rev_reg_def:
+            raise IndyIssuerError("Revocation registry definition not found")
+        if not rev_key:
+            raise IndyIssuerError(
+                "Revocation registry definition private data not found"
+            )
+        try:
+            rev_reg_def = RevocationRegistryDefinition.load(rev_reg_def.raw_value)
+        except CredxError as err:
+            raise IndyIssuerError(
+                "Error loading revocation registry definition"
+            ) from err
+
+        rev_reg_index = await RevRegIndexAllocator(
+            self._profile, block_size
+        ).next_index(revoc_reg_id, rev_reg_def.max_cred_num)
+        try:
+            async with self._profile.session() as session:
+                issuer_cr_rec = IssuerCredRevRecord(
+                    state=IssuerCredRevRecord.STATE_ISSUED,
+                    cred_ex_id=cred_ex_id,
+                    rev_reg_id=revoc_reg_id,
+                    cred_rev_id=str(rev_reg_index),
+                )
+                await issuer_cr_rec.save(
+                    session,
+                    reason=(
+                        "Created issuer cred rev record for "
+                        f"rev reg id {revoc_reg_id}, {rev_reg_index}"
+                    ),
+                )
+        except AskarError as err:
+            raise IndyIssuerError("Error saving issuer cred rev record") from err
+
+        return (rev_reg, rev_reg_info.value_json, rev_reg_def, rev_key, rev_reg_index)
+
     async def revoke_credentials(
         self,
         revoc_reg_id: str,
@@ -466,6 +713,37 @@ class IndyCredxIssuer(IndyIssuer):
                 else:
                     rev_crids.add(rev_id)
 
+            if rev_crids:
+                # indices up to curr_id may be reserved or free without being
+                # issued: only revoke those with an issuer cred rev record
+                try:
+                    async with self._profile.session() as session:
+                        issued = {
+                            int(rec.cred_rev_id)
+                            for rec in await IssuerCredRevRecord.query(
+                                session,
+                                {
+                                    "rev_reg_id": revoc_reg_id,
+                                    "cred_rev_id": {
+                                        "$in": [str(rev_id) for rev_id in rev_crids]
+                                    },
+                                },
+                            )
+                        }
+                except StorageError as err:
+                    raise IndyIssuerError(
+                        "Error retrieving issuer cred rev records"
+                    ) from err
+                for rev_id in sorted(rev_crids - issued):
+                    LOGGER.warn(
+                        "Skipping requested credential revocation"
+                        "on rev reg id %s, cred rev id=%s not issued",
+                        revoc_reg_id,
+                        rev_id,
+                    )
+                    failed_crids.add(rev_id)
+                rev_crids &= issued
+
             if not rev_crids:
                 break
 
@@ -475,8 +753,9 @@ class IndyCredxIssuer(IndyIssuer):
                 raise IndyIssuerError("Error loading revocation registry") from err
 
             try:
-                delta = await asyncio.get_event_loop().run_in_executor(
-                    None,
+                delta = await run_in_worker_pool(
+                    self._profile,
+                    "RevocationRegistry.update",
                     lambda: rev_reg.update(
                         rev_reg_def,
                         None,  # issued
@@ -549,8 +828,12 @@ class IndyCredxIssuer(IndyIssuer):
                     "Error merging revocation registry deltas"
                 ) from err
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, update, fro_delta, to_delta
+        return await run_in_worker_pool(
+            self._profile,
+            "RevocationRegistryDelta.update_with",
+            update,
+            fro_delta,
+            to_delta,
         )
 
     async def create_and_store_revocation_registry(
@@ -594,8 +877,9 @@ class IndyCredxIssuer(IndyIssuer):
                 rev_reg_def_private,
                 rev_reg,
                 _rev_reg_delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await run_in_worker_pool(
+                self._profile,
+                "RevocationRegistryDefinition.create",
                 lambda: RevocationRegistryDefinition.create(
                     origin_did,
                     cred_def.raw_value,
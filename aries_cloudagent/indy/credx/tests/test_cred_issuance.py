@@ -341,3 +341,82 @@ class TestIndyCredxIssuance(AsyncTestCase):
         )
 
         await self.holder.delete_credential(cred_id)
+
+    async def test_issue_rev_index_blocks(self):
+        self.issuer_profile.settings["revocation.index_block_size"] = 3
+        (_, schema_json) = await self.issuer.create_schema(
+            TEST_DID,
+            SCHEMA_NAME,
+            SCHEMA_VERSION,
+            ["name", "moniker"],
+        )
+        schema = json.loads(schema_json)
+        schema["seqNo"] = SCHEMA_TXN
+        (
+            cd_id,
+            cred_def_json,
+        ) = await self.issuer.create_and_store_credential_definition(
+            TEST_DID, schema, support_revocation=True
+        )
+        cred_def = json.loads(cred_def_json)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (
+                reg_id,
+                reg_def_json,
+                _,
+            ) = await self.issuer.create_and_store_revocation_registry(
+                TEST_DID, cd_id, "CL_ACCUM", "0", 4, tmp_path
+            )
+            tails_path = json.loads(reg_def_json)["value"]["tailsLocation"]
+            cred_offer = json.loads(await self.issuer.create_credential_offer(cd_id))
+            (cred_req_json, _) = await self.holder.create_credential_request(
+                cred_offer, cred_def, TEST_DID
+            )
+
+            async def issue(cred_ex_id: str):
+                (_, cred_rev_id) = await self.issuer.create_credential(
+                    schema,
+                    cred_offer,
+                    json.loads(cred_req_json),
+                    {"name": "NAME", "moniker": "MONIKER"},
+                    cred_ex_id=cred_ex_id,
+                    revoc_reg_id=reg_id,
+                    tails_file_path=tails_path,
+                )
+                return cred_rev_id
+
+            assert await issue("cred_ex_1") == "1"
+            async with self.issuer_profile.session() as session:
+                rev_info = await session.handle.fetch(
+                    issuer.CATEGORY_REV_REG_INFO, reg_id
+                )
+                assert rev_info.value_json["curr_id"] == 3
+
+            # reserved indices not yet issued are not revoked
+            (_, skipped_ids) = await self.issuer.revoke_credentials(
+                reg_id, tails_path, ("2",)
+            )
+            assert skipped_ids == ["2"]
+
+            # the rest of the block is reclaimed once its reservation expires
+            for block in issuer._BLOCKS[self.issuer_profile.opened].values():
+                block.expires = 0
+            async with self.issuer_profile.transaction() as txn:
+                for entry in await txn.handle.fetch_all(
+                    issuer.CATEGORY_REV_REG_RESERVATION
+                ):
+                    await txn.handle.replace(
+                        issuer.CATEGORY_REV_REG_RESERVATION,
+                        entry.name,
+                        value_json={**entry.value_json, "expires": 0},
+                        tags=entry.tags,
+                    )
+                await txn.commit()
+            assert [await issue(f"cred_ex_{n}") for n in range(2, 5)] == [
+                "2",
+                "3",
+                "4",
+            ]
+            with self.assertRaises(issuer.IndyIssuerRevocationRegistryFullError):
+                await issue("cred_ex_5")
@@ -1,11 +1,11 @@
 """Indy-Credx verifier implementation."""
 
-import asyncio
 import logging
 
 from indy_credx import CredxError, Presentation
 
 from ...core.profile import Profile
+from ...utils.worker_pool import run_in_worker_pool
 
 from ..verifier import IndyVerifier
 
@@ -59,8 +59,9 @@ class IndyCredxVerifier(IndyVerifier):
 
         try:
             presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
+            verified = await run_in_worker_pool(
+                self.profile,
+                "Presentation.verify",
                 presentation.verify,
                 pres_req,
                 schemas.values(),
@@ -162,3 +162,32 @@ class IndyHolder(ABC, metaclass=ABCMeta):
             the revocation state
 
         """
+
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+        rev_state: str,
+    ) -> str:
+        """
+        Update a previously created revocation state for a received credential.
+
+        Only the changes to the registry are applied, which is much cheaper than
+        creating the revocation state again.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_reg_delta: revocation delta since the timestamp of the state
+            timestamp: delta timestamp
+            tails_file_path: path to the tails file
+            rev_state: the revocation state to update
+
+        Returns:
+            the updated revocation state
+
+        """
+        raise IndyHolderError("Updating revocation states is not supported")
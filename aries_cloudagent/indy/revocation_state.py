@@ -0,0 +1,134 @@
+"""Cache of revocation states created by the holder."""
+
+import asyncio
+import json
+import logging
+
+from ..cache.base import BaseCache
+from ..core.profile import Profile
+from ..ledger.base import BaseLedger
+from ..ledger.error import LedgerError
+
+from .holder import IndyHolder, IndyHolderError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RevocationStateCache:
+    """
+    Cache of the revocation states a holder uses to prove non-revocation.
+
+    The revocation state of a credential at a given registry timestamp never
+    changes, so states are cached by registry, credential revocation ID and
+    timestamp. The most recent state of each credential is also kept, so that a
+    state for a later timestamp can be derived from it by applying only the
+    registry changes since, instead of being created from the full delta.
+    """
+
+    DEFAULT_TTL = 86400
+
+    def __init__(self, profile: Profile, *, ttl: int = None):
+        """
+        Initialize a `RevocationStateCache` instance.
+
+        Args:
+            profile: the profile providing the holder and the shared cache
+            ttl: the number of seconds to keep cached revocation states
+
+        """
+        self._profile = profile
+        self._ttl = ttl or self.DEFAULT_TTL
+
+    async def get_revocation_state(
+        self,
+        ledger: BaseLedger,
+        rev_reg_def: dict,
+        cred_rev_id: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+    ) -> dict:
+        """
+        Get the revocation state of a credential at a registry timestamp.
+
+        Args:
+            ledger: the ledger holding the revocation registry
+            rev_reg_def: revocation registry definition
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_delta: revocation delta up to the timestamp, used when the
+                state cannot be derived from a cached state
+            timestamp: delta timestamp
+            tails_file_path: path to the tails file
+
+        Returns:
+            the revocation state
+
+        """
+        holder = self._profile.inject(IndyHolder)
+        cache = self._profile.inject_or(BaseCache)
+        if not cache:
+            return json.loads(
+                await holder.create_revocation_state(
+                    cred_rev_id, rev_reg_def, rev_reg_delta, timestamp, tails_file_path
+                )
+            )
+
+        rev_reg_id = rev_reg_def["id"]
+        cache_key = f"revocation_state::{rev_reg_id}::{cred_rev_id}"
+        async with cache.acquire(f"{cache_key}::{timestamp}") as entry:
+            if entry.result:
+                LOGGER.debug("Using cached revocation state for %s", cache_key)
+                return entry.result
+
+            rev_state = None
+            update_delta = None
+            latest = await cache.get(f"{cache_key}::latest")
+            if latest and latest["timestamp"] < timestamp:
+                try:
+                    async with ledger:
+                        (update_delta, _) = await ledger.get_revoc_reg_delta(
+                            rev_reg_id, latest["timestamp"], timestamp
+                        )
+                except (LedgerError, asyncio.TimeoutError) as err:
+                    # the full delta is already in hand: create the state from it
+                    LOGGER.info(
+                        "Creating revocation state, could not fetch update delta: %s",
+                        str(err) or err.__class__.__name__,
+                    )
+            if update_delta:
+                try:
+                    rev_state = json.loads(
+                        await holder.update_revocation_state(
+                            cred_rev_id,
+                            rev_reg_def,
+                            update_delta,
+                            timestamp,
+                            tails_file_path,
+                            json.dumps(latest["rev_state"]),
+                        )
+                    )
+                    LOGGER.debug("Updated cached revocation state for %s", cache_key)
+                except IndyHolderError as err:
+                    LOGGER.info(
+                        "Creating revocation state, could not update cached state: %s",
+                        err.message,
+                    )
+            if not rev_state:
+                rev_state = json.loads(
+                    await holder.create_revocation_state(
+                        cred_rev_id,
+                        rev_reg_def,
+                        rev_reg_delta,
+                        timestamp,
+                        tails_file_path,
+                    )
+                )
+
+            await entry.set_result(rev_state, self._ttl)
+            if not latest or latest["timestamp"] < timestamp:
+                await cache.set(
+                    f"{cache_key}::latest",
+                    {"timestamp": timestamp, "rev_state": rev_state},
+                    self._ttl,
+                )
+            return rev_state
@@ -602,3 +602,31 @@ class TestIndySdkHolder(AsyncTestCase):
                 rev_reg_delta_json=json.dumps(rev_reg_delta),
                 timestamp=timestamp,
             )
+
+    async def test_update_revocation_state(self):
+        rr_state = {
+            "witness": {"omega": "2 ..."},
+            "rev_reg": {"accum": "22 ..."},
+            "timestamp": 1234567899,
+        }
+
+        with async_mock.patch.object(
+            test_module, "create_tails_reader", async_mock.CoroutineMock()
+        ) as mock_create_tails_reader, async_mock.patch.object(
+            indy.anoncreds, "update_revocation_state", async_mock.CoroutineMock()
+        ) as mock_update_rr_state:
+            mock_update_rr_state.return_value = json.dumps(rr_state)
+
+            result = await self.holder.update_revocation_state(
+                "1", {"def": 1}, {"delta": 2}, 1234567899, "/tmp/some.tails", "{}"
+            )
+            assert json.loads(result) == rr_state
+
+            mock_update_rr_state.assert_awaited_once_with(
+                mock_create_tails_reader.return_value,
+                rev_state_json="{}",
+                rev_reg_def_json=json.dumps({"def": 1}),
+                rev_reg_delta_json=json.dumps({"delta": 2}),
+                timestamp=1234567899,
+                cred_rev_id="1",
+            )
@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
+from ...ledger.error import LedgerError
+
+from ..holder import IndyHolder, IndyHolderError
+from ..revocation_state import RevocationStateCache
+
+REV_REG_ID = "LjgpST2rjsoxYegQDRm7EL:4:LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag:CL_ACCUM:0"
+REV_REG_DEF = {"id": REV_REG_ID, "value": {"tailsHash": "hash"}}
+DELTA = {"value": {"accum": "accum"}}
+UPDATE_DELTA = {"value": {"accum": "updated"}}
+
+
+class TestRevocationStateCache(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.holder = async_mock.MagicMock(
+            create_revocation_state=async_mock.CoroutineMock(
+                side_effect=lambda *args: json.dumps({"created": args[3]})
+            ),
+            update_revocation_state=async_mock.CoroutineMock(
+                side_effect=lambda *args: json.dumps({"updated": args[3]})
+            ),
+        )
+        self.profile.context.injector.bind_instance(IndyHolder, self.holder)
+        self.profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+        self.ledger = async_mock.MagicMock(
+            __aenter__=async_mock.CoroutineMock(),
+            __aexit__=async_mock.CoroutineMock(),
+            get_revoc_reg_delta=async_mock.CoroutineMock(
+                return_value=(UPDATE_DELTA, 2000)
+            ),
+        )
+        self.cache = RevocationStateCache(self.profile)
+
+    async def get_state(self, timestamp: int):
+        return await self.cache.get_revocation_state(
+            self.ledger, REV_REG_DEF, "1", DELTA, timestamp, "/tmp/tails"
+        )
+
+    async def test_cached(self):
+        assert await self.get_state(1000) == {"created": 1000}
+        assert await self.get_state(1000) == {"created": 1000}
+        self.holder.create_revocation_state.assert_awaited_once_with(
+            "1", REV_REG_DEF, DELTA, 1000, "/tmp/tails"
+        )
+        self.ledger.get_revoc_reg_delta.assert_not_called()
+
+    async def test_incremental_update(self):
+        await self.get_state(1000)
+        assert await self.get_state(2000) == {"updated": 2000}
+        self.ledger.get_revoc_reg_delta.assert_awaited_once_with(REV_REG_ID, 1000, 2000)
+        self.holder.update_revocation_state.assert_awaited_once_with(
+            "1",
+            REV_REG_DEF,
+            UPDATE_DELTA,
+            2000,
+            "/tmp/tails",
+            json.dumps({"created": 1000}),
+        )
+        self.holder.create_revocation_state.assert_awaited_once()
+
+        # an earlier state is never derived from a later one
+        assert await self.get_state(500) == {"created": 500}
+        assert self.holder.update_revocation_state.await_count == 1
+
+    async def test_update_not_supported(self):
+        self.holder.update_revocation_state.side_effect = IndyHolderError(
+            "Updating revocation states is not supported"
+        )
+        await self.get_state(1000)
+        assert await self.get_state(2000) == {"created": 2000}
+        assert self.holder.create_revocation_state.await_count == 2
+
+    async def test_update_delta_ledger_error(self):
+        await self.get_state(1000)
+        self.ledger.get_revoc_reg_delta.side_effect = LedgerError("Ledger down")
+        assert await self.get_state(2000) == {"created": 2000}
+
+        self.ledger.get_revoc_reg_delta.side_effect = asyncio.TimeoutError()
+        assert await self.get_state(3000) == {"created": 3000}
+        self.holder.update_revocation_state.assert_not_called()
+        assert self.holder.create_revocation_state.await_count == 3
+
+    async def test_no_cache(self):
+        self.profile.context.injector.clear_binding(BaseCache)
+        await self.get_state(1000)
+        await self.get_state(1000)
+        assert self.holder.create_revocation_state.await_count == 2
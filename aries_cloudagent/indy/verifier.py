@@ -7,12 +7,8 @@ from time import time
 from typing import Mapping
 
 from ..core.profile import Profile
-from ..ledger.multiple_ledger.ledger_requests_executor import (
-    GET_CRED_DEF,
-    IndyLedgerRequestsExecutor,
-)
+from ..ledger.multiple_ledger.ledger_artifacts import IndyLedgerArtifacts
 from ..messaging.util import canon, encode
-from ..multitenant.base import BaseMultitenantManager
 
 from .models.xform import indy_proof_req2non_revoc_intervals
 
@@ -110,23 +106,15 @@ class IndyVerifier(ABC, metaclass=ABCMeta):
         non_revoc_intervals = indy_proof_req2non_revoc_intervals(pres_req)
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
         # timestamp for irrevocable credential
+        artifacts = IndyLedgerArtifacts(profile)
+        for ident in pres["identifiers"]:
+            artifacts.add_cred_def(ident["cred_def_id"])
+        await artifacts.fetch()
         cred_defs = []
         for (index, ident) in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            multitenant_mgr = profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(profile)
-            else:
-                ledger_exec_inst = profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    cred_def_id,
-                    txn_record_type=GET_CRED_DEF,
-                )
-            )[1]
-            async with ledger:
-                cred_def = await ledger.get_credential_definition(cred_def_id)
+            cred_def = artifacts.cred_defs[cred_def_id]
             cred_defs.append(cred_def)
             if ident.get("timestamp"):
                 if not cred_def["value"].get("revocation"):
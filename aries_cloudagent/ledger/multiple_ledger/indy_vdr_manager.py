@@ -1,11 +1,11 @@
 """Multiple IndyVdrLedger Manager."""
 import asyncio
-import concurrent.futures
 import logging
 import json
+import time
 
-from collections import OrderedDict
-from typing import Optional, Tuple, Mapping
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Sequence, Tuple, Mapping
 
 from ...cache.base import BaseCache
 from ...core.profile import Profile
@@ -27,6 +27,9 @@ LOGGER = logging.getLogger(__name__)
 class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
     """Multiple Indy VDR Ledger Manager."""
 
+    # weight of the latest request in the per-ledger average latency
+    LATENCY_WEIGHT = 0.3
+
     def __init__(
         self,
         profile: Profile,
@@ -34,6 +37,9 @@ class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
         non_production_ledgers: OrderedDict = OrderedDict(),
         write_ledger_info: Tuple[str, IndyVdrLedger] = None,
         cache_ttl: int = None,
+        negative_cache_ttl: int = 60,
+        request_timeout: float = 10,
+        hedge_delay: float = 0.5,
     ):
         """Initialize MultiIndyLedgerManager.
 
@@ -42,14 +48,25 @@ class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
             production_ledgers: production IndyVDRLedger mapping
             non_production_ledgers: non_production IndyVDRLedger mapping
             cache_ttl: Time in sec to persist did_ledger_id_resolver cache keys
+            negative_cache_ttl: Time in sec to remember DIDs not found on any
+                ledger, or 0 to disable
+            request_timeout: Time in sec to wait for each ledger to respond
+            hedge_delay: Time in sec to wait for the ledgers already queried
+                before also querying the next one, or 0 to query all at once
 
         """
         self.profile = profile
         self.production_ledgers = production_ledgers
         self.non_production_ledgers = non_production_ledgers
         self.write_ledger_info = write_ledger_info
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
         self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self.request_timeout = request_timeout
+        self.hedge_delay = hedge_delay
+        # average response time in seconds by ledger ID
+        self.latency: Dict[str, float] = {}
+        # lookups in progress by DID and whether the result is cached
+        self._lookups: Dict[Tuple[str, bool], asyncio.Future] = {}
 
     async def get_write_ledger(self) -> Optional[Tuple[str, IndyVdrLedger]]:
         """Return the write IndyVdrLedger instance."""
@@ -92,7 +109,8 @@ class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
                     None, did
                 )
                 response_json = await asyncio.wait_for(
-                    indy_vdr_ledger.submit_get_nym_request(request), 10
+                    indy_vdr_ledger.submit_get_nym_request(request),
+                    self.request_timeout,
                 )
                 if isinstance(response_json, dict):
                     response = response_json
@@ -122,7 +140,8 @@ class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
         except asyncio.TimeoutError:
             LOGGER.exception(
                 f"get-nym request timedout for Did {did} and "
-                f"ledger {ledger_id}, reply not received within 10 sec"
+                f"ledger {ledger_id}, reply not received within "
+                f"{self.request_timeout} sec"
             )
             return None
         except LedgerError as err:
@@ -132,119 +151,149 @@ class MultiIndyVDRLedgerManager(BaseMultipleLedgerManager):
             )
             return None
 
-    async def lookup_did_in_configured_ledgers(
-        self, did: str, cache_did: bool = True
-    ) -> Tuple[str, IndyVdrLedger]:
-        """Lookup given DID in configured ledgers in parallel."""
-        self.cache = self.profile.inject_or(BaseCache)
-        cache_key = f"did_ledger_id_resolver::{did}"
-        if bool(cache_did and self.cache and await self.cache.get(cache_key)):
-            cached_ledger_id = await self.cache.get(cache_key)
-            if cached_ledger_id in self.production_ledgers:
-                return (cached_ledger_id, self.production_ledgers.get(cached_ledger_id))
-            elif cached_ledger_id in self.non_production_ledgers:
-                return (
-                    cached_ledger_id,
-                    self.non_production_ledgers.get(cached_ledger_id),
-                )
-            else:
-                raise MultipleLedgerManagerError(
-                    f"cached ledger_id {cached_ledger_id} not found in either "
-                    "production_ledgers or non_production_ledgers"
-                )
-        applicable_prod_ledgers = {"self_certified": {}, "non_self_certified": {}}
-        applicable_non_prod_ledgers = {"self_certified": {}, "non_self_certified": {}}
-        ledger_ids = list(self.production_ledgers.keys()) + list(
-            self.non_production_ledgers.keys()
+    def _record_latency(self, ledger_id: str, elapsed: float):
+        """Update the average response time of a ledger."""
+        prev = self.latency.get(ledger_id)
+        self.latency[ledger_id] = (
+            elapsed if prev is None else prev + self.LATENCY_WEIGHT * (elapsed - prev)
         )
-        coro_futures = {
-            self.executor.submit(self._get_ledger_by_did, ledger_id, did): ledger_id
-            for ledger_id in ledger_ids
-        }
-        for coro_future in concurrent.futures.as_completed(coro_futures):
-            result = await coro_future.result()
-            if result:
-                applicable_ledger_id = result[0]
-                applicable_ledger_inst = result[1]
-                is_self_certified = result[2]
-                if applicable_ledger_id in self.production_ledgers:
-                    insert_key = list(self.production_ledgers).index(
-                        applicable_ledger_id
+
+    async def _timed_get_ledger_by_did(
+        self, ledger_id: str, did: str
+    ) -> Optional[Tuple[str, IndyVdrLedger, bool]]:
+        """Look up a DID on one ledger, recording the response time."""
+        start = time.perf_counter()
+        # requests cancelled after a faster ledger won are not counted
+        result = await self._get_ledger_by_did(ledger_id, did)
+        self._record_latency(ledger_id, time.perf_counter() - start)
+        return result
+
+    def _get_ledger_by_id(self, ledger_id: str) -> Optional[IndyVdrLedger]:
+        """Get a configured ledger instance by ledger ID."""
+        if ledger_id in self.production_ledgers:
+            return self.production_ledgers[ledger_id]
+        return self.non_production_ledgers.get(ledger_id)
+
+    def _query_order(self) -> Sequence[str]:
+        """Get the ledger IDs in the order to query, fastest ledgers first."""
+        ledger_ids = list(self.production_ledgers) + list(self.non_production_ledgers)
+        # ledgers without statistics keep their configured position at the front
+        return sorted(ledger_ids, key=lambda ledger_id: self.latency.get(ledger_id, 0))
+
+    def _result_rank(self, ledger_id: str, is_self_certified: bool) -> Tuple[int, int]:
+        """Rank a ledger response by preference, lower being preferred."""
+        if ledger_id in self.production_ledgers:
+            tier = 0 if is_self_certified else 2
+            index = list(self.production_ledgers).index(ledger_id)
+        else:
+            tier = 1 if is_self_certified else 3
+            index = list(self.non_production_ledgers).index(ledger_id)
+        return (tier, index)
+
+    async def _race_ledgers(self, did: str) -> Optional[Tuple[str, IndyVdrLedger]]:
+        """
+        Query the configured ledgers for a DID, fastest ledgers first.
+
+        The next ledger is only queried when those already queried have not
+        answered within the hedge delay, or answered without ending the lookup.
+        The first production ledger to return a self-certified DID wins and the
+        remaining requests are cancelled. Otherwise the best response is
+        returned once no pending ledger could provide a preferred one:
+        self-certified before non self-certified, production before
+        non-production, and then in configured order.
+        """
+        order = deque(self._query_order())
+        finished = asyncio.Queue()
+        tasks: Dict[asyncio.Future, str] = {}
+        running = 0
+        pending_prod = set(self.production_ledgers)
+        best = None
+        try:
+            while order or running:
+                if order:
+                    ledger_id = order.popleft()
+                    task = asyncio.ensure_future(
+                        self._timed_get_ledger_by_did(ledger_id, did)
                     )
-                    if is_self_certified:
-                        applicable_prod_ledgers["self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                    else:
-                        applicable_prod_ledgers["non_self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                else:
-                    insert_key = list(self.non_production_ledgers).index(
-                        applicable_ledger_id
+                    task.add_done_callback(finished.put_nowait)
+                    tasks[task] = ledger_id
+                    running += 1
+                try:
+                    task = await asyncio.wait_for(
+                        finished.get(), self.hedge_delay if order else None
                     )
-                    if is_self_certified:
-                        applicable_non_prod_ledgers["self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                    else:
-                        applicable_non_prod_ledgers["non_self_certified"][
-                            insert_key
-                        ] = (applicable_ledger_id, applicable_ledger_inst)
-        applicable_prod_ledgers["self_certified"] = OrderedDict(
-            sorted(applicable_prod_ledgers.get("self_certified").items())
-        )
-        applicable_prod_ledgers["non_self_certified"] = OrderedDict(
-            sorted(applicable_prod_ledgers.get("non_self_certified").items())
-        )
-        applicable_non_prod_ledgers["self_certified"] = OrderedDict(
-            sorted(applicable_non_prod_ledgers.get("self_certified").items())
-        )
-        applicable_non_prod_ledgers["non_self_certified"] = OrderedDict(
-            sorted(applicable_non_prod_ledgers.get("non_self_certified").items())
-        )
-        if len(applicable_prod_ledgers.get("self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_prod_ledgers.get("self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_non_prod_ledgers.get("self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_non_prod_ledgers.get("self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_prod_ledgers.get("non_self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_prod_ledgers.get("non_self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_non_prod_ledgers.get("non_self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_non_prod_ledgers.get("non_self_certified").values()
-            )[0]
-            if cache_did and self.cache:
+                except asyncio.TimeoutError:
+                    continue  # no answer yet: query the next ledger as well
+                running -= 1
+                result = task.result()
+                if result:
+                    rank = self._result_rank(result[0], result[2])
+                    if not best or rank < best[0]:
+                        best = (rank, (result[0], result[1]))
+                    if rank[0] == 0:
+                        break
+                pending_prod.discard(tasks[task])
+                if best and best[0][0] == 1 and not pending_prod:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        return best and best[1]
+
+    async def _lookup_did(self, did: str, cache_did: bool) -> Tuple[str, IndyVdrLedger]:
+        """Look up a DID in the configured ledgers and update the cache."""
+        cache_key = f"did_ledger_id_resolver::{did}"
+        result = await self._race_ledgers(did)
+        if not result:
+            if cache_did and self.cache and self.negative_cache_ttl:
                 await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
+                    cache_key, {"not_found": True}, self.negative_cache_ttl
                 )
-            return successful_ledger_inst
-        else:
             raise MultipleLedgerManagerError(
                 f"DID {did} not found in any of the ledgers total: "
                 f"(production: {len(self.production_ledgers)}, "
                 f"non_production: {len(self.non_production_ledgers)})"
             )
+        if cache_did and self.cache:
+            await self.cache.set(cache_key, result[0], self.cache_ttl)
+        return result
+
+    async def lookup_did_in_configured_ledgers(
+        self, did: str, cache_did: bool = True
+    ) -> Tuple[str, IndyVdrLedger]:
+        """
+        Lookup given DID in configured ledgers in parallel.
+
+        Concurrent lookups of the same DID, with the same `cache_did` flag,
+        share one set of ledger requests.
+        """
+        self.cache = self.profile.inject_or(BaseCache)
+        cache_key = f"did_ledger_id_resolver::{did}"
+        cached = None
+        if cache_did and self.cache:
+            cached = await self.cache.get(cache_key)
+        if isinstance(cached, dict) and cached.get("not_found"):
+            raise MultipleLedgerManagerError(
+                f"DID {did} not found in any of the ledgers total: "
+                f"(production: {len(self.production_ledgers)}, "
+                f"non_production: {len(self.non_production_ledgers)})"
+            )
+        if cached:
+            ledger = self._get_ledger_by_id(cached)
+            if not ledger:
+                raise MultipleLedgerManagerError(
+                    f"cached ledger_id {cached} not found in either "
+                    "production_ledgers or non_production_ledgers"
+                )
+            return (cached, ledger)
+
+        # only share a lookup with callers making the same choice about caching
+        lookup_key = (did, bool(cache_did))
+        lookup = self._lookups.get(lookup_key)
+        if not lookup:
+            lookup = asyncio.ensure_future(self._lookup_did(did, cache_did))
+            self._lookups[lookup_key] = lookup
+            lookup.add_done_callback(lambda _: self._lookups.pop(lookup_key, None))
+        # a waiter being cancelled does not cancel the shared lookup
+        return await asyncio.shield(lookup)
@@ -0,0 +1,155 @@
+"""Concurrent retrieval of the ledger artifacts used by Indy presentations."""
+
+import asyncio
+import logging
+from typing import Callable, Dict, Tuple
+
+from ...core.profile import Profile
+from ...multitenant.base import BaseMultitenantManager
+
+from ..base import BaseLedger
+from ..error import LedgerError
+
+from .ledger_requests_executor import (
+    GET_CRED_DEF,
+    GET_REVOC_REG_DEF,
+    GET_REVOC_REG_DELTA,
+    GET_REVOC_REG_ENTRY,
+    GET_SCHEMA,
+    IndyLedgerRequestsExecutor,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IndyLedgerArtifacts:
+    """
+    Schemas, credential definitions and revocation registry data from the ledger.
+
+    Identifiers are collected first, then every distinct artifact is fetched
+    concurrently from the ledger holding it, with a bound on the number of
+    requests in progress on each ledger.
+    """
+
+    DEFAULT_CONCURRENCY = 8
+
+    def __init__(self, profile: Profile, *, max_concurrency: int = None):
+        """
+        Initialize an `IndyLedgerArtifacts` instance.
+
+        Args:
+            profile: the profile used to select ledgers
+            max_concurrency: the maximum number of requests in progress per ledger
+
+        """
+        self._profile = profile
+        self._max_concurrency = max_concurrency or self.DEFAULT_CONCURRENCY
+        self.schemas: Dict[str, dict] = {}
+        self.cred_defs: Dict[str, dict] = {}
+        self.rev_reg_defs: Dict[str, dict] = {}
+        # rev reg id -> requested timestamp -> (entry, timestamp)
+        self.rev_reg_entries: Dict[str, Dict[int, Tuple[dict, int]]] = {}
+        # (rev reg id, from, to) -> (delta, timestamp)
+        self.rev_reg_deltas: Dict[Tuple[str, int, int], Tuple[dict, int]] = {}
+        # identifier -> ledger holding it
+        self.ledgers: Dict[str, BaseLedger] = {}
+        self._requests: Dict[tuple, Tuple[str, int, Callable]] = {}
+
+    def add_schema(self, schema_id: str):
+        """Request a schema."""
+        if schema_id not in self.schemas:
+            self._requests[("schema", schema_id)] = (
+                schema_id,
+                GET_SCHEMA,
+                lambda ledger: ledger.get_schema(schema_id),
+            )
+
+    def add_cred_def(self, cred_def_id: str):
+        """Request a credential definition."""
+        if cred_def_id not in self.cred_defs:
+            self._requests[("cred_def", cred_def_id)] = (
+                cred_def_id,
+                GET_CRED_DEF,
+                lambda ledger: ledger.get_credential_definition(cred_def_id),
+            )
+
+    def add_rev_reg_def(self, rev_reg_id: str):
+        """Request a revocation registry definition."""
+        if rev_reg_id not in self.rev_reg_defs:
+            self._requests[("rev_reg_def", rev_reg_id)] = (
+                rev_reg_id,
+                GET_REVOC_REG_DEF,
+                lambda ledger: ledger.get_revoc_reg_def(rev_reg_id),
+            )
+
+    def add_rev_reg_entry(self, rev_reg_id: str, timestamp: int):
+        """Request the revocation registry entry in effect at a timestamp."""
+        if timestamp not in self.rev_reg_entries.get(rev_reg_id, {}):
+            self._requests[("rev_reg_entry", rev_reg_id, timestamp)] = (
+                rev_reg_id,
+                GET_REVOC_REG_ENTRY,
+                lambda ledger: ledger.get_revoc_reg_entry(rev_reg_id, timestamp),
+            )
+
+    def add_rev_reg_delta(self, rev_reg_id: str, fro: int, to: int):
+        """Request the revocation registry delta for an interval."""
+        if (rev_reg_id, fro, to) not in self.rev_reg_deltas:
+            self._requests[("rev_reg_delta", rev_reg_id, fro, to)] = (
+                rev_reg_id,
+                GET_REVOC_REG_DELTA,
+                lambda ledger: ledger.get_revoc_reg_delta(rev_reg_id, fro, to),
+            )
+
+    async def fetch(self):
+        """Fetch all requested artifacts not yet retrieved."""
+        requests, self._requests = self._requests, {}
+        if not requests:
+            return
+
+        if self._profile.inject_or(BaseMultitenantManager):
+            ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
+        else:
+            ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
+        limits: Dict[BaseLedger, asyncio.Semaphore] = {}
+
+        async def fetch_one(key: tuple, identifier: str, txn_record_type: int, get):
+            ledger = (
+                await ledger_exec_inst.get_ledger_for_identifier(
+                    identifier, txn_record_type=txn_record_type
+                )
+            )[1]
+            if not ledger:
+                raise LedgerError(f"No ledger available to retrieve {identifier}")
+            self.ledgers[identifier] = ledger
+            if ledger not in limits:
+                limits[ledger] = asyncio.Semaphore(self._max_concurrency)
+            async with limits[ledger]:
+                async with ledger:
+                    result = await get(ledger)
+            self._store(key, result)
+
+        LOGGER.debug("Fetching %d ledger artifacts", len(requests))
+        tasks = [
+            asyncio.ensure_future(fetch_one(key, *request))
+            for key, request in requests.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _store(self, key: tuple, result):
+        """Store a fetched artifact."""
+        kind = key[0]
+        if kind == "schema":
+            self.schemas[key[1]] = result
+        elif kind == "cred_def":
+            self.cred_defs[key[1]] = result
+        elif kind == "rev_reg_def":
+            self.rev_reg_defs[key[1]] = result
+        elif kind == "rev_reg_entry":
+            self.rev_reg_entries.setdefault(key[1], {})[key[2]] = result
+        else:
+            self.rev_reg_deltas[key[1:]] = result
@@ -159,11 +159,22 @@ class MultiIndyLedgerManagerProvider(BaseProvider):
                             indy_vdr_production_ledgers.move_to_end(
                                 ledger_id, last=False
                             )
+                    lookup_options = {}
+                    request_timeout = settings.get("ledger.request_timeout")
+                    if request_timeout is not None:
+                        lookup_options["request_timeout"] = request_timeout
+                    negative_cache_ttl = settings.get("ledger.negative_cache_ttl")
+                    if negative_cache_ttl is not None:
+                        lookup_options["negative_cache_ttl"] = negative_cache_ttl
+                    hedge_delay = settings.get("ledger.hedge_delay")
+                    if hedge_delay is not None:
+                        lookup_options["hedge_delay"] = hedge_delay
                     self._inst[manager_type] = manager_class(
                         self.root_profile,
                         production_ledgers=indy_vdr_production_ledgers,
                         non_production_ledgers=indy_vdr_non_production_ledgers,
                         write_ledger_info=write_ledger_info,
+                        **lookup_options,
                     )
             except ClassNotFoundError as err:
                 raise InjectionError(
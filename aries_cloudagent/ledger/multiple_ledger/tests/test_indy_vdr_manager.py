@@ -471,6 +471,180 @@ class TestMultiIndyVDRLedgerManager(AsyncTestCase):
             )
             assert "cached ledger_id invalid_id not found in either" in cm
 
+    def mock_ledger_responses(self, responses):
+        calls = []
+        cancelled = []
+
+        async def get_ledger_by_did(ledger_id, did):
+            calls.append(ledger_id)
+            delay, self_certified = responses[ledger_id]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(ledger_id)
+                raise
+            if self_certified is None:
+                return None
+            ledger = self.production_ledger.get(
+                ledger_id
+            ) or self.non_production_ledger.get(ledger_id)
+            return (ledger_id, ledger, self_certified)
+
+        self.manager._get_ledger_by_did = get_ledger_by_did
+        return calls, cancelled
+
+    async def test_lookup_did_first_self_cert_prod_wins(self):
+        calls, cancelled = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.5, True),
+                "test_prod_2": (0.01, True),
+                "test_non_prod_1": (0, True),
+                "test_non_prod_2": (0.5, None),
+            }
+        )
+        # query all ledgers at once
+        self.manager.hedge_delay = 0
+        (ledger_id, ledger_inst) = await self.manager.lookup_did_in_configured_ledgers(
+            "Av63wJYM7xYR4AiygYq4c3"
+        )
+        assert ledger_id == "test_prod_2"
+        assert ledger_inst.pool.name == "test_prod_2"
+        assert sorted(cancelled) == ["test_non_prod_2", "test_prod_1"]
+        assert set(self.manager.latency) == {"test_prod_2", "test_non_prod_1"}
+        # the faster ledgers are queried first
+        assert self.manager._query_order()[:2] == ["test_prod_1", "test_non_prod_2"]
+
+    async def test_lookup_did_hedged_in_latency_order(self):
+        calls, cancelled = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.01, True),
+                "test_prod_2": (1, True),
+                "test_non_prod_1": (0.01, None),
+                "test_non_prod_2": (1, False),
+            }
+        )
+        self.manager.hedge_delay = 0.1
+        self.manager.latency = {
+            "test_prod_1": 0.5,
+            "test_prod_2": 0.01,
+            "test_non_prod_1": 0.02,
+            "test_non_prod_2": 0.03,
+        }
+        (ledger_id, _) = await self.manager.lookup_did_in_configured_ledgers(
+            "Av63wJYM7xYR4AiygYq4c3"
+        )
+        assert ledger_id == "test_prod_1"
+        # the next ledger is queried after the hedge delay, or at once when
+        # a ledger answers without a result
+        assert calls == [
+            "test_prod_2",
+            "test_non_prod_1",
+            "test_non_prod_2",
+            "test_prod_1",
+        ]
+        assert sorted(cancelled) == ["test_non_prod_2", "test_prod_2"]
+
+    async def test_lookup_did_ranked_responses(self):
+        calls, cancelled = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.02, None),
+                "test_prod_2": (0.03, False),
+                "test_non_prod_1": (0, False),
+                "test_non_prod_2": (0.01, True),
+            }
+        )
+        (ledger_id, _) = await self.manager.lookup_did_in_configured_ledgers(
+            "Av63wJYM7xYR4AiygYq4c3"
+        )
+        assert ledger_id == "test_non_prod_2"
+        assert not cancelled
+
+        calls, cancelled = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.02, None),
+                "test_prod_2": (0.03, False),
+                "test_non_prod_1": (0, False),
+                "test_non_prod_2": (0.01, None),
+            }
+        )
+        (ledger_id, _) = await self.manager.lookup_did_in_configured_ledgers(
+            "4fUDR9R7fjwELRvH9JT6HH"
+        )
+        assert ledger_id == "test_prod_2"
+
+    async def test_lookup_did_coalesced(self):
+        calls, _ = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.01, True),
+                "test_prod_2": (0.01, None),
+                "test_non_prod_1": (0.01, None),
+                "test_non_prod_2": (0.01, None),
+            }
+        )
+        results = await asyncio.gather(
+            *[
+                self.manager.lookup_did_in_configured_ledgers("Av63wJYM7xYR4AiygYq4c3")
+                for _ in range(5)
+            ]
+        )
+        assert {ledger_id for (ledger_id, _) in results} == {"test_prod_1"}
+        assert calls == ["test_prod_1"]
+        assert not self.manager._lookups
+
+        await self.manager.lookup_did_in_configured_ledgers("Av63wJYM7xYR4AiygYq4c3")
+        assert calls == ["test_prod_1"]
+
+    async def test_lookup_did_coalesced_respects_cache_did(self):
+        calls, _ = self.mock_ledger_responses(
+            {
+                "test_prod_1": (0.01, True),
+                "test_prod_2": (0.01, None),
+                "test_non_prod_1": (0.01, None),
+                "test_non_prod_2": (0.01, None),
+            }
+        )
+        results = await asyncio.gather(
+            self.manager.lookup_did_in_configured_ledgers(
+                "Av63wJYM7xYR4AiygYq4c3", cache_did=False
+            ),
+            self.manager.lookup_did_in_configured_ledgers(
+                "Av63wJYM7xYR4AiygYq4c3", cache_did=False
+            ),
+            self.manager.lookup_did_in_configured_ledgers(
+                "Av63wJYM7xYR4AiygYq4c3", cache_did=True
+            ),
+        )
+        assert {ledger_id for (ledger_id, _) in results} == {"test_prod_1"}
+        # one shared lookup for each choice about caching
+        assert calls == ["test_prod_1", "test_prod_1"]
+        assert not self.manager._lookups
+        cached = await self.manager.cache.get(
+            "did_ledger_id_resolver::Av63wJYM7xYR4AiygYq4c3"
+        )
+        assert cached == "test_prod_1"
+
+    async def test_lookup_did_not_found_cached(self):
+        calls, _ = self.mock_ledger_responses(
+            {ledger_id: (0, None) for ledger_id in self.manager._query_order()}
+        )
+        for _ in range(2):
+            with self.assertRaises(MultipleLedgerManagerError):
+                await self.manager.lookup_did_in_configured_ledgers(
+                    "Av63wJYM7xYR4AiygYq4c3"
+                )
+        assert len(calls) == 4
+
+        self.manager.negative_cache_ttl = 0
+        with self.assertRaises(MultipleLedgerManagerError):
+            await self.manager.lookup_did_in_configured_ledgers(
+                "4fUDR9R7fjwELRvH9JT6HH"
+            )
+        with self.assertRaises(MultipleLedgerManagerError):
+            await self.manager.lookup_did_in_configured_ledgers(
+                "4fUDR9R7fjwELRvH9JT6HH"
+            )
+        assert len(calls) == 12
+
     async def test_get_production_ledgers(self):
         assert len(await self.manager.get_prod_ledgers()) == 2
 
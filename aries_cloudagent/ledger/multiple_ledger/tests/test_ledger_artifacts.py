@@ -0,0 +1,112 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ....core.in_memory import InMemoryProfile
+
+from ...error import LedgerError
+
+from ..ledger_artifacts import IndyLedgerArtifacts
+from ..ledger_requests_executor import (
+    GET_CRED_DEF,
+    GET_REVOC_REG_DELTA,
+    GET_SCHEMA,
+    IndyLedgerRequestsExecutor,
+)
+
+SCHEMA_ID = "LjgpST2rjsoxYegQDRm7EL:2:bc-reg:1.0"
+CRED_DEF_ID = "LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag"
+REV_REG_ID = "LjgpST2rjsoxYegQDRm7EL:4:LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag:CL_ACCUM:0"
+
+
+class TestIndyLedgerArtifacts(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self.ledger = async_mock.MagicMock(
+            __aenter__=async_mock.CoroutineMock(),
+            __aexit__=async_mock.CoroutineMock(),
+            get_schema=async_mock.CoroutineMock(side_effect=self.ledger_response),
+            get_credential_definition=async_mock.CoroutineMock(
+                side_effect=self.ledger_response
+            ),
+            get_revoc_reg_def=async_mock.CoroutineMock(
+                side_effect=self.ledger_response
+            ),
+            get_revoc_reg_entry=async_mock.CoroutineMock(
+                side_effect=lambda *args: (args, 1234)
+            ),
+            get_revoc_reg_delta=async_mock.CoroutineMock(
+                side_effect=lambda *args: (args, 1234)
+            ),
+        )
+        self.ledger_exec = async_mock.MagicMock(
+            get_ledger_for_identifier=async_mock.CoroutineMock(
+                return_value=("test_ledger", self.ledger)
+            )
+        )
+        self.profile.context.injector.bind_instance(
+            IndyLedgerRequestsExecutor, self.ledger_exec
+        )
+
+    async def ledger_response(self, identifier):
+        self.in_progress += 1
+        self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        await asyncio.sleep(0.01)
+        self.in_progress -= 1
+        return {"id": identifier}
+
+    async def test_fetch(self):
+        artifacts = IndyLedgerArtifacts(self.profile)
+        for _ in range(2):
+            artifacts.add_schema(SCHEMA_ID)
+            artifacts.add_cred_def(CRED_DEF_ID)
+            artifacts.add_rev_reg_def(REV_REG_ID)
+            artifacts.add_rev_reg_entry(REV_REG_ID, 1000)
+            artifacts.add_rev_reg_delta(REV_REG_ID, 0, 1000)
+        await artifacts.fetch()
+
+        assert artifacts.schemas == {SCHEMA_ID: {"id": SCHEMA_ID}}
+        assert artifacts.cred_defs == {CRED_DEF_ID: {"id": CRED_DEF_ID}}
+        assert artifacts.rev_reg_defs == {REV_REG_ID: {"id": REV_REG_ID}}
+        assert artifacts.rev_reg_entries == {
+            REV_REG_ID: {1000: ((REV_REG_ID, 1000), 1234)}
+        }
+        assert artifacts.rev_reg_deltas == {
+            (REV_REG_ID, 0, 1000): ((REV_REG_ID, 0, 1000), 1234)
+        }
+        assert artifacts.ledgers[REV_REG_ID] is self.ledger
+        # requests run concurrently
+        assert self.max_in_progress == 3
+        assert self.ledger_exec.get_ledger_for_identifier.await_count == 5
+        self.ledger_exec.get_ledger_for_identifier.assert_any_await(
+            SCHEMA_ID, txn_record_type=GET_SCHEMA
+        )
+        self.ledger_exec.get_ledger_for_identifier.assert_any_await(
+            CRED_DEF_ID, txn_record_type=GET_CRED_DEF
+        )
+        self.ledger_exec.get_ledger_for_identifier.assert_any_await(
+            REV_REG_ID, txn_record_type=GET_REVOC_REG_DELTA
+        )
+
+        # artifacts already fetched are not requested again
+        artifacts.add_schema(SCHEMA_ID)
+        await artifacts.fetch()
+        assert self.ledger.get_schema.await_count == 1
+
+    async def test_fetch_concurrency_limit(self):
+        artifacts = IndyLedgerArtifacts(self.profile, max_concurrency=2)
+        for index in range(6):
+            artifacts.add_schema(f"{SCHEMA_ID}.{index}")
+        await artifacts.fetch()
+        assert len(artifacts.schemas) == 6
+        assert self.max_in_progress == 2
+
+    async def test_fetch_no_ledger(self):
+        self.ledger_exec.get_ledger_for_identifier.return_value = (None, None)
+        artifacts = IndyLedgerArtifacts(self.profile)
+        artifacts.add_schema(SCHEMA_ID)
+        with self.assertRaises(LedgerError):
+            await artifacts.fetch()
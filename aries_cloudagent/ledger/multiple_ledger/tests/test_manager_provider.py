@@ -106,7 +106,11 @@ class TestMultiIndyLedgerManagerProvider(AsyncTestCase):
         provider = MultiIndyLedgerManagerProvider(profile)
         context.settings["ledger.ledger_config_list"] = LEDGER_CONFIG
         context.settings["ledger.genesis_transactions"] = TEST_GENESIS_TXN
-        self.assertEqual(
-            provider.provide(context.settings, context.injector).__class__.__name__,
-            "MultiIndyVDRLedgerManager",
-        )
+        context.settings["ledger.request_timeout"] = 3
+        context.settings["ledger.negative_cache_ttl"] = 0
+        context.settings["ledger.hedge_delay"] = 0.2
+        manager = provider.provide(context.settings, context.injector)
+        self.assertEqual(manager.__class__.__name__, "MultiIndyVDRLedgerManager")
+        assert manager.request_timeout == 3
+        assert manager.negative_cache_ttl == 0
+        assert manager.hedge_delay == 0.2
@@ -2,7 +2,7 @@
 
 from aiohttp import web
 from aiohttp_apispec import docs, request_schema, response_schema
-from marshmallow import INCLUDE, Schema, fields
+from marshmallow import INCLUDE, Schema, fields, validate
 from pydid.verification_method import (
     Ed25519VerificationKey2018,
     KnownVerificationMethods,
@@ -12,16 +12,20 @@ from ...admin.request_context import AdminRequestContext
 from ...config.base import InjectionError
 from ...resolver.base import ResolverError
 from ...resolver.did_resolver import DIDResolver
+from ...vc.vc_ld.verify import run_batch
 from ...wallet.error import WalletError
 from ..models.openapi import OpenAPISchema
 from .credential import sign_credential, verify_credential
 from .error import (
     BaseJSONLDMessagingError,
+    InvalidVerificationMethod,
 )
 
 
 SUPPORTED_VERIFICATION_METHOD_TYPES = (Ed25519VerificationKey2018,)
 
+MAX_VERIFY_BATCH_SIZE = 100
+
 
 class SignatureOptionsSchema(Schema):
     """Schema for LD signature options."""
@@ -145,17 +149,12 @@ async def verify(request: web.BaseRequest):
         async with context.session() as session:
             if verkey is None:
                 resolver = session.inject(DIDResolver)
-                vmethod = await resolver.dereference(
-                    profile,
-                    doc["proof"]["verificationMethod"],
-                    cls=KnownVerificationMethods,
-                )
-
-                if not isinstance(vmethod, SUPPORTED_VERIFICATION_METHOD_TYPES):
-                    raise web.HTTPBadRequest(
-                        reason="{} is not supported".format(vmethod.type)
+                try:
+                    verkey = await _resolve_verkey(
+                        profile, resolver, doc["proof"]["verificationMethod"]
                     )
-                verkey = vmethod.material
+                except InvalidVerificationMethod as err:
+                    raise web.HTTPBadRequest(reason=err.roll_up)
 
             valid = await verify_credential(session, doc, verkey)
 
@@ -167,10 +166,129 @@ async def verify(request: web.BaseRequest):
     return web.json_response(response)
 
 
+class VerifyBatchRequestSchema(OpenAPISchema):
+    """Request schema for verifying a batch of jsonld docs."""
+
+    verkey = fields.Str(
+        required=False, description="Verkey to use for verification of every doc"
+    )
+    docs = fields.List(
+        fields.Nested(SignedDocSchema),
+        required=True,
+        validate=validate.Length(max=MAX_VERIFY_BATCH_SIZE),
+        description=f"Signed documents, at most {MAX_VERIFY_BATCH_SIZE}",
+    )
+
+
+class VerifyBatchResultSchema(OpenAPISchema):
+    """Verification result of a doc in a batch."""
+
+    valid = fields.Bool(required=True)
+    error = fields.Str(description="Error text", required=False)
+
+
+class VerifyBatchResponseSchema(OpenAPISchema):
+    """Response schema for batch verification results."""
+
+    results = fields.List(
+        fields.Nested(VerifyBatchResultSchema),
+        description="Verification result of each doc, in request order",
+    )
+
+
+async def _resolve_verkey(profile, resolver: DIDResolver, verification_method: str):
+    """Dereference a verification method to its verkey."""
+    vmethod = await resolver.dereference(
+        profile, verification_method, cls=KnownVerificationMethods
+    )
+    if not isinstance(vmethod, SUPPORTED_VERIFICATION_METHOD_TYPES):
+        raise InvalidVerificationMethod("{} is not supported".format(vmethod.type))
+    return vmethod.material
+
+
+@docs(tags=["jsonld"], summary="Verify a batch of JSON-LD structures.")
+@request_schema(VerifyBatchRequestSchema())
+@response_schema(VerifyBatchResponseSchema(), 200, description="")
+async def verify_batch(request: web.BaseRequest):
+    """
+    Request handler for verifying a batch of jsonld docs.
+
+    Each verification method is dereferenced once for the whole batch, then the
+    docs are verified concurrently, with bounded concurrency. A doc that fails
+    verification does not fail the batch: its result holds the error.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    context: AdminRequestContext = request["context"]
+    profile = context.profile
+    body = await request.json()
+    verkey = body.get("verkey")
+    docs = body.get("docs") or []
+    if len(docs) > MAX_VERIFY_BATCH_SIZE:
+        raise web.HTTPBadRequest(
+            reason=f"At most {MAX_VERIFY_BATCH_SIZE} documents can be verified at once"
+        )
+
+    def verification_method(doc: dict) -> str:
+        try:
+            return doc["proof"]["verificationMethod"]
+        except (KeyError, TypeError):
+            raise InvalidVerificationMethod("Document has no verification method")
+
+    try:
+        async with context.session() as session:
+            verkeys = {}
+            if verkey is None:
+                resolver = session.inject(DIDResolver)
+                methods = set()
+                for doc in docs:
+                    try:
+                        methods.add(verification_method(doc))
+                    except InvalidVerificationMethod:
+                        pass
+                methods = list(methods)
+
+                async def resolve_verkey(index: int):
+                    try:
+                        return await _resolve_verkey(profile, resolver, methods[index])
+                    except Exception as error:
+                        return error
+
+                resolved = await run_batch(resolve_verkey, len(methods), None)
+                verkeys = dict(zip(methods, resolved))
+
+            async def verify_doc(index: int) -> dict:
+                doc = docs[index]
+                try:
+                    doc_verkey = verkey or verkeys[verification_method(doc)]
+                    if isinstance(doc_verkey, Exception):
+                        raise doc_verkey
+                    valid = await verify_credential(session, doc, doc_verkey)
+                    return {"valid": valid}
+                except (WalletError, InjectionError):
+                    raise
+                except Exception as error:
+                    # one bad doc does not fail the batch
+                    return {"valid": False, "error": str(error)}
+
+            results = await run_batch(verify_doc, len(docs), None)
+    except (WalletError, InjectionError):
+        raise web.HTTPForbidden(reason="No wallet available")
+    return web.json_response({"results": results})
+
+
 async def register(app: web.Application):
     """Register routes."""
 
-    app.add_routes([web.post("/jsonld/sign", sign), web.post("/jsonld/verify", verify)])
+    app.add_routes(
+        [
+            web.post("/jsonld/sign", sign),
+            web.post("/jsonld/verify", verify),
+            web.post("/jsonld/verify-batch", verify_batch),
+        ]
+    )
 
 
 def post_process_routes(app: web.Application):
@@ -254,6 +254,73 @@ async def test_verify_bad_vmethod_unsupported(
         await test_module.verify(mock_verify_request(request_body))
 
 
+@pytest.mark.asyncio
+async def test_verify_batch(
+    mock_resolver, mock_verify_request, mock_verify_credential, mock_response
+):
+    signed = {
+        "proof": {
+            "type": "Ed25519Signature2018",
+            "proofPurpose": "authentication",
+            "verificationMethod": "did:example:1234abcd#key-1",
+        }
+    }
+    unsupported = deepcopy(signed)
+    unsupported["proof"]["verificationMethod"] = "did:example:1234abcd#key-2"
+    await test_module.verify_batch(
+        mock_verify_request({"docs": [signed, signed, {}, unsupported]})
+    )
+
+    results = mock_response.call_args[0][0]["results"]
+    assert results[0] == results[1] == {"valid": "fake_verify"}
+    assert results[2]["valid"] is False and "verification method" in results[2]["error"]
+    assert results[3]["valid"] is False and "not supported" in results[3]["error"]
+    # each verification method dereferenced once
+    assert mock_resolver.resolve.await_count == 2
+    assert mock_verify_credential.await_count == 2
+    assert mock_verify_credential.call_args[0][2] == "12345"
+
+
+@pytest.mark.asyncio
+async def test_verify_batch_verkey(
+    mock_resolver, mock_verify_request, mock_verify_credential, mock_response
+):
+    mock_verify_credential.side_effect = [True, BadJWSHeaderError("bad header")]
+    await test_module.verify_batch(
+        mock_verify_request({"verkey": "fake_verkey", "docs": [{}, {}]})
+    )
+
+    assert mock_response.call_args[0][0] == {
+        "results": [{"valid": True}, {"valid": False, "error": "bad header"}]
+    }
+    mock_resolver.resolve.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verify_batch_x_too_many(
+    mock_resolver, mock_verify_request, mock_verify_credential, mock_response
+):
+    with pytest.raises(web.HTTPBadRequest):
+        await test_module.verify_batch(
+            mock_verify_request(
+                {"docs": [{}] * (test_module.MAX_VERIFY_BATCH_SIZE + 1)}
+            )
+        )
+    mock_resolver.resolve.assert_not_called()
+    mock_verify_credential.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verify_batch_x_wallet(
+    mock_verify_request, mock_verify_credential, mock_response
+):
+    mock_verify_credential.side_effect = WalletError()
+    with pytest.raises(web.HTTPForbidden):
+        await test_module.verify_batch(
+            mock_verify_request({"verkey": "fake_verkey", "docs": [{}]})
+        )
+
+
 @pytest.mark.asyncio
 async def test_register():
     mock_app = async_mock.MagicMock()
@@ -2,12 +2,24 @@
 
 import logging
 import json
+import threading
 
 from abc import ABC
 from collections import namedtuple
-from typing import Mapping, Union
-
-from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
+from contextlib import contextmanager
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from marshmallow import (
+    Schema,
+    fields,
+    missing,
+    post_dump,
+    pre_load,
+    post_load,
+    ValidationError,
+    EXCLUDE,
+)
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
 
 from ...core.error import BaseError
 from ...utils.classloader import ClassLoader
@@ -16,6 +28,12 @@ LOGGER = logging.getLogger(__name__)
 
 SerDe = namedtuple("SerDe", "ser de")
 
+# resolved schema and model classes, by declaring class and declared class
+_RESOLVED_CLASSES: Dict[Tuple[type, object], type] = {}
+
+# schema instances of the current thread, by schema class and unknown mode
+_SCHEMAS = threading.local()
+
 
 def resolve_class(the_cls, relative_cls: type = None):
     """
@@ -41,6 +59,115 @@ def resolve_class(the_cls, relative_cls: type = None):
     return resolved
 
 
+def _resolve_class_cached(the_cls, relative_cls: type) -> type:
+    """Resolve a class declared in the Meta of another class, caching the result."""
+    key = (relative_cls, the_cls)
+    resolved = _RESOLVED_CLASSES.get(key)
+    if not resolved:
+        resolved = resolve_class(the_cls, relative_cls)
+        if resolved:
+            _RESOLVED_CLASSES[key] = resolved
+    return resolved
+
+
+@contextmanager
+def _cached_schema(schema_class: type, unknown: str = None):
+    """
+    Borrow a schema instance from the cache of the current thread.
+
+    The instance is removed from the cache while in use, so a nested use of the
+    same schema class creates its own instance instead of sharing its state.
+
+    Args:
+        schema_class: The schema class
+        unknown: Behaviour for unknown attributes
+
+    """
+    schemas = getattr(_SCHEMAS, "schemas", None)
+    if schemas is None:
+        schemas = _SCHEMAS.schemas = {}
+    key = (schema_class, unknown)
+    schema = schemas.pop(key, None)
+    if schema is None:
+        schema = schema_class(unknown=unknown)
+    try:
+        yield schema
+    finally:
+        schemas[key] = schema
+
+
+def _get_dump_plan(model_class: type, schema: Schema) -> Optional[tuple]:
+    """
+    Get the dump plan of a model for a borrowed schema instance.
+
+    A plan holds the field objects of the schema instance it was made from, so
+    it is kept with that instance rather than shared between threads.
+
+    """
+    if not isinstance(schema, BaseModelSchema):
+        return None
+    plans = getattr(schema, "_dump_plans", None)
+    if not isinstance(plans, dict):
+        plans = schema._dump_plans = {}
+    if model_class not in plans:
+        plans[model_class] = _make_dump_plan(model_class, schema)
+    return plans[model_class]
+
+
+def _make_dump_plan(model_class: type, schema: Schema) -> Optional[tuple]:
+    """
+    Precompile the serialization of a model with a schema instance.
+
+    A plan is only made for schemas without dump hooks other than the removal
+    of skipped values, whose fields read plain attributes of the model.
+
+    Returns:
+        A tuple of the (attribute, field name, key, field, default) of each field
+        and the values to skip, or None if the model must be dumped by the schema
+
+    """
+    if not isinstance(schema, BaseModelSchema) or hasattr(model_class, "__getitem__"):
+        return None
+    schema_class = type(schema)
+    hooks = [
+        name
+        for tag in (PRE_DUMP, POST_DUMP)
+        for many in (False, True)
+        for name in schema_class._hooks[(tag, many)]
+    ]
+    if (
+        hooks != ["remove_skipped_values"]
+        or schema_class.remove_skipped_values
+        is not BaseModelSchema.remove_skipped_values
+        or schema_class.dump is not Schema.dump
+        or schema_class._serialize is not Schema._serialize
+        or schema_class.get_attribute is not Schema.get_attribute
+    ):
+        return None
+
+    plan = []
+    for field_name, field_obj in schema.dump_fields.items():
+        attribute = field_obj.attribute or field_name
+        field_class = type(field_obj)
+        if (
+            not field_obj._CHECK_ATTRIBUTE
+            or "." in attribute
+            or field_class.serialize is not fields.Field.serialize
+            or field_class.get_value is not fields.Field.get_value
+        ):
+            return None
+        plan.append(
+            (
+                attribute,
+                field_name,
+                field_obj.data_key if field_obj.data_key is not None else field_name,
+                field_obj,
+                getattr(field_obj, "default", missing),
+            )
+        )
+    return (tuple(plan), resolve_meta_property(schema, "skip_values", []))
+
+
 def resolve_meta_property(obj, prop_name: str, defval=None):
     """
     Resolve a meta property.
@@ -102,7 +229,7 @@ class BaseModel(ABC):
             The resolved schema class
 
         """
-        return resolve_class(cls.Meta.schema_class, cls)
+        return _resolve_class_cached(cls.Meta.schema_class, cls)
 
     @property
     def Schema(self) -> type:
@@ -132,9 +259,9 @@ class BaseModel(ABC):
         if obj is None and none2none:
             return None
 
-        schema = cls._get_schema_class()(unknown=unknown or EXCLUDE)
         try:
-            return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
+            with _cached_schema(cls._get_schema_class(), unknown or EXCLUDE) as schema:
+                return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from err
@@ -154,19 +281,55 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema = self.Schema(unknown=unknown or EXCLUDE)
+        schema_class = self.Schema
         try:
-            return (
-                schema.dumps(self, separators=(",", ":"))
-                if as_string
-                else schema.dump(self)
-            )
+            with _cached_schema(schema_class, unknown or EXCLUDE) as schema:
+                plan = _get_dump_plan(self.__class__, schema)
+                if not plan:
+                    return (
+                        schema.dumps(self, separators=(",", ":"))
+                        if as_string
+                        else schema.dump(self)
+                    )
+                data = self._dump_with_plan(plan)
+                return (
+                    schema.opts.render_module.dumps(data, separators=(",", ":"))
+                    if as_string
+                    else data
+                )
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{self.__class__.__name__} message serialization error:")
             raise BaseModelError(
                 f"{self.__class__.__name__} schema validation failed"
             ) from err
 
+    def _dump_with_plan(self, plan: Tuple[Sequence[tuple], Sequence]) -> dict:
+        """
+        Serialize the model instance with a precompiled dump plan.
+
+        The result is the same as that of the schema dump, without the overhead
+        of running the schema processors for each field and hook.
+
+        Args:
+            plan: The dump plan of the model
+
+        Returns:
+            A dict representation of this model
+
+        """
+        (field_plans, skip_values) = plan
+        data = {}
+        for (attribute, field_name, key, field_obj, default) in field_plans:
+            value = getattr(self, attribute, missing)
+            if value is missing:
+                if default is missing:
+                    continue
+                value = default() if callable(default) else default
+            value = field_obj._serialize(value, field_name, self)
+            if value is not missing and value not in skip_values:
+                data[key] = value
+        return data
+
     @classmethod
     def serde(cls, obj: Union["BaseModel", Mapping]) -> SerDe:
         """Return serialized, deserialized representations of input object."""
@@ -181,8 +344,9 @@ class BaseModel(ABC):
 
     def validate(self, unknown: str = None):
         """Validate a constructed model."""
-        schema = self.Schema(unknown=unknown)
-        errors = schema.validate(self.serialize())
+        serialized = self.serialize()
+        with _cached_schema(self.Schema, unknown) as schema:
+            errors = schema.validate(serialized)
         if errors:
             raise ValidationError(errors)
         return self
@@ -272,7 +436,7 @@ class BaseModelSchema(Schema):
             The model class
 
         """
-        return resolve_class(cls.Meta.model_class, cls)
+        return _resolve_class_cached(cls.Meta.model_class, cls)
 
     @property
     def Model(self) -> type:
@@ -3,17 +3,35 @@
 import json
 import logging
 import sys
+import time
 import uuid
 
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
+from typing import (
+    Any,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
-from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...core.profile import Profile, ProfileSession
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
 
 from ..util import datetime_to_str, time_now
@@ -26,6 +44,16 @@ LOGGER = logging.getLogger(__name__)
 
 RecordType = TypeVar("RecordType", bound="BaseRecord")
 
+# marks a record type as having every record saved with its added tags
+RECORD_TYPE_TAGGED = "acapy_record_tags"
+
+# record types known to have every record tagged, by profile: True, or the
+# time to check again for record types not yet tagged
+_TAGGED_TYPES: "WeakKeyDictionary[Profile, dict]" = WeakKeyDictionary()
+
+# seconds before checking again whether a record type has been re-tagged
+TAGGED_RECHECK_INTERVAL = 300
+
 
 def match_post_filter(
     record: dict,
@@ -74,6 +102,8 @@ class BaseRecord(BaseModel):
     class Meta:
         """BaseRecord metadata."""
 
+        repr_exclude = ("_stored_value", "_save_payload")
+
     DEFAULT_CACHE_TTL = 60
     RECORD_ID_NAME = "id"
     RECORD_TYPE = None
@@ -81,6 +111,9 @@ class BaseRecord(BaseModel):
     EVENT_NAMESPACE: str = "acapy::record"
     LOG_STATE_FLAG = None
     TAG_NAMES = {"state"}
+    # tags added after records of the type were first stored, which records
+    # saved by earlier versions lack until re-saved by the upgrade command
+    ADDED_TAG_NAMES: Sequence[str] = ()
 
     def __init__(
         self,
@@ -101,6 +134,10 @@ class BaseRecord(BaseModel):
         self._id = id
         self._last_state = state
         self._new_with_id = new_with_id
+        # stored JSON value when the record was last loaded or saved, if known
+        self._stored_value: Optional[str] = None
+        # serialized record shared by the log and event of a save
+        self._save_payload: Optional[dict] = None
         self.state = state
         self.created_at = datetime_to_str(created_at)
         self.updated_at = datetime_to_str(updated_at)
@@ -131,8 +168,9 @@ class BaseRecord(BaseModel):
     def storage_record(self) -> StorageRecord:
         """Accessor for a `StorageRecord` representing this record."""
 
+        tags = self.tags
         return StorageRecord(
-            self.RECORD_TYPE, json.dumps(self.value), self.tags, self._id
+            self.RECORD_TYPE, json.dumps(self._value_for_tags(tags)), tags, self._id
         )
 
     @property
@@ -145,7 +183,12 @@ class BaseRecord(BaseModel):
     def value(self) -> dict:
         """Accessor for the JSON record value generated for this record."""
 
-        ret = self.strip_tag_prefix(self.tags)
+        return self._value_for_tags(self.tags)
+
+    def _value_for_tags(self, tags: dict) -> dict:
+        """Build the JSON record value from already generated record tags."""
+
+        ret = self.strip_tag_prefix(tags)
         ret.update({"created_at": self.created_at, "updated_at": self.updated_at})
         ret.update(self.record_value)
         return ret
@@ -239,7 +282,9 @@ class BaseRecord(BaseModel):
             cls.RECORD_TYPE, record_id, {"forUpdate": for_update, "retrieveTags": False}
         )
         vals = json.loads(result.value)
-        return cls.from_storage(record_id, vals)
+        record = cls.from_storage(record_id, vals)
+        record._stored_value = result.value
+        return record
 
     @classmethod
     async def retrieve_by_tag_filter(
@@ -279,6 +324,7 @@ class BaseRecord(BaseModel):
                         )
                     )
                 found = cls.from_storage(record.id, vals)
+                found._stored_value = record.value
         if not found:
             raise StorageNotFoundError(
                 "{} record not found for {}{}".format(
@@ -287,12 +333,129 @@ class BaseRecord(BaseModel):
             )
         return found
 
+    @classmethod
+    async def records_tagged(cls, session: ProfileSession) -> bool:
+        """
+        Check whether every stored record of this type has the added tags.
+
+        The upgrade command marks a record type as tagged once its records are
+        re-saved, and a record type with no stored records is marked when
+        first checked. The result is kept for the profile, and a record type
+        not yet tagged is checked again periodically, to pick up an upgrade run
+        while the agent is running.
+
+        Args:
+            session: The profile session to use
+
+        """
+        if not cls.ADDED_TAG_NAMES:
+            return True
+        known = _TAGGED_TYPES.setdefault(session.profile, {})
+        tagged = known.get(cls.RECORD_TYPE)
+        if tagged is True:
+            return True
+        if tagged and time.monotonic() < tagged:
+            return False
+
+        storage = session.inject(BaseStorage)
+        try:
+            await storage.get_record(
+                RECORD_TYPE_TAGGED, f"{RECORD_TYPE_TAGGED}::{cls.RECORD_TYPE}"
+            )
+        except StorageNotFoundError:
+            if not await storage.find_paginated_records(
+                cls.RECORD_TYPE, {}, limit=1, offset=0
+            ):
+                await cls.mark_records_tagged(session)
+                return True
+            if not tagged:
+                LOGGER.warning(
+                    "Stored %s records may lack the %s tags, run the aca-py upgrade "
+                    "command to re-tag them; queries on these tags load every record",
+                    cls.RECORD_TYPE,
+                    ", ".join(sorted(cls.ADDED_TAG_NAMES)),
+                )
+            known[cls.RECORD_TYPE] = time.monotonic() + TAGGED_RECHECK_INTERVAL
+            return False
+        known[cls.RECORD_TYPE] = True
+        return True
+
+    @classmethod
+    async def mark_records_tagged(cls, session: ProfileSession):
+        """
+        Mark every stored record of this type as having the added tags.
+
+        Args:
+            session: The profile session to use
+
+        """
+        storage = session.inject(BaseStorage)
+        try:
+            await storage.add_record(
+                StorageRecord(
+                    RECORD_TYPE_TAGGED,
+                    cls.RECORD_TYPE,
+                    id=f"{RECORD_TYPE_TAGGED}::{cls.RECORD_TYPE}",
+                )
+            )
+        except StorageDuplicateError:
+            pass
+        _TAGGED_TYPES.setdefault(session.profile, {})[cls.RECORD_TYPE] = True
+
+    @classmethod
+    def promote_post_filter(
+        cls,
+        tag_filter: dict,
+        post_filter: dict,
+        alt: bool = False,
+        promote_added: bool = True,
+    ) -> Tuple[dict, dict]:
+        """
+        Move positive post-filter clauses on tagged properties into the tag filter.
+
+        Clauses that storage can evaluate against record tags need not be
+        matched after loading and deserializing every record value.
+
+        Args:
+            tag_filter: The tag filter dictionary
+            post_filter: Value filters to apply matching positively
+            alt: set to match any value in post_filter sequence values
+            promote_added: whether to move clauses on the added tags, which
+                records saved by earlier versions may lack
+
+        Returns:
+            A tuple of the combined tag filter and the remaining post-filter
+
+        """
+        if not post_filter:
+            return tag_filter, post_filter
+
+        tag_map = cls.get_tag_map()
+        tag_filter = dict(tag_filter or {})
+        remaining = {}
+        for k, v in post_filter.items():
+            if (
+                k not in tag_map
+                or k in tag_filter
+                or (k in cls.ADDED_TAG_NAMES and not promote_added)
+            ):
+                remaining[k] = v
+            elif alt and isinstance(v, (list, tuple)) and v:
+                tag_filter[k] = {"$in": list(v)}
+            elif not alt and isinstance(v, str):
+                tag_filter[k] = v
+            else:
+                remaining[k] = v
+        return tag_filter, remaining
+
     @classmethod
     async def query(
         cls: Type[RecordType],
         session: ProfileSession,
         tag_filter: dict = None,
         *,
+        limit: int = None,
+        offset: int = None,
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
@@ -303,6 +466,8 @@ class BaseRecord(BaseModel):
         Args:
             session: The profile session to use
             tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return, for a paginated query
+            offset: The number of matching records to skip, for a paginated query
             post_filter_positive: Additional value filters to apply matching positively
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
@@ -310,12 +475,101 @@ class BaseRecord(BaseModel):
         """
 
         storage = session.inject(BaseStorage)
-        rows = await storage.find_all_records(
-            cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
-            options={"retrieveTags": False},
+        promote_added = False
+        if post_filter_positive and any(
+            k in cls.ADDED_TAG_NAMES for k in post_filter_positive
+        ):
+            promote_added = await cls.records_tagged(session)
+        tag_filter, post_filter_positive = cls.promote_post_filter(
+            tag_filter, post_filter_positive, alt, promote_added
+        )
+        tag_query = cls.prefix_tag_filter(tag_filter)
+
+        if limit is None and offset is None:
+            rows = await storage.find_all_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                options={"retrieveTags": False},
+            )
+            return [
+                cls._from_storage_row(record, vals)
+                for (record, vals) in cls._load_rows(
+                    rows, post_filter_positive, post_filter_negative, alt
+                )
+            ]
+
+        limit = DEFAULT_PAGE_SIZE if limit is None else limit
+        offset = offset or 0
+        if not (post_filter_positive or post_filter_negative):
+            rows = await storage.find_paginated_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                limit=limit,
+                offset=offset,
+                options={"retrieveTags": False},
+            )
+            return [
+                cls._from_storage_row(record, json.loads(record.value))
+                for record in rows
+            ]
+
+        # remaining post-filters: scan storage page by page in bounded memory,
+        # keeping one search open across pages unless in a transaction, whose
+        # uncommitted writes only the session sees
+        search = (
+            None if session.is_transaction else session.inject_or(BaseStorageSearch)
+        )
+        scan = (
+            search.search_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                DEFAULT_PAGE_SIZE,
+                {"retrieveTags": False},
+            )
+            if search
+            else None
         )
         result = []
+        scan_offset = 0
+        try:
+            while len(result) < limit:
+                if scan:
+                    rows = await scan.fetch(DEFAULT_PAGE_SIZE)
+                else:
+                    rows = await storage.find_paginated_records(
+                        cls.RECORD_TYPE,
+                        tag_query,
+                        limit=DEFAULT_PAGE_SIZE,
+                        offset=scan_offset,
+                        options={"retrieveTags": False},
+                    )
+                scan_offset += len(rows)
+                for (record, vals) in cls._load_rows(
+                    rows, post_filter_positive, post_filter_negative, alt
+                ):
+                    if offset:
+                        offset -= 1
+                        continue
+                    result.append(cls._from_storage_row(record, vals))
+                    if len(result) >= limit:
+                        break
+                if len(rows) < DEFAULT_PAGE_SIZE:
+                    break
+        finally:
+            if scan:
+                await scan.close()
+        return result
+
+    @classmethod
+    def _load_rows(
+        cls,
+        rows: Sequence[StorageRecord],
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> Iterator[Tuple[StorageRecord, dict]]:
+        """Yield storage records and their values matching the post-filters."""
+
         for record in rows:
             vals = json.loads(record.value)
             if match_post_filter(
@@ -329,11 +583,18 @@ class BaseRecord(BaseModel):
                 positive=False,
                 alt=alt,
             ):
-                try:
-                    result.append(cls.from_storage(record.id, vals))
-                except BaseModelError as err:
-                    raise BaseModelError(f"{err}, for record id {record.id}")
-        return result
+                yield record, vals
+
+    @classmethod
+    def _from_storage_row(
+        cls: Type[RecordType], record: StorageRecord, vals: dict
+    ) -> RecordType:
+        """Initialize a record from a storage search result."""
+
+        try:
+            return cls.from_storage(record.id, vals)
+        except BaseModelError as err:
+            raise BaseModelError(f"{err}, for record id {record.id}")
 
     async def save(
         self,
@@ -347,6 +608,8 @@ class BaseRecord(BaseModel):
         """
         Persist the record to storage.
 
+        A record unchanged since it was retrieved or last saved is not written.
+
         Args:
             session: The profile session to use
             reason: A reason to add to the log
@@ -356,32 +619,58 @@ class BaseRecord(BaseModel):
         """
 
         new_record = None
+        self._save_payload = None
         log_reason = reason or ("Updated record" if self._id else "Created record")
         try:
-            self.updated_at = time_now()
             storage = session.inject(BaseStorage)
             if self._id and not self._new_with_id:
-                record = self.storage_record
-                await storage.update_record(record, record.value, record.tags)
-                new_record = False
+                tags = self.tags
+                value = self._value_for_tags(tags)
+                if (
+                    self._stored_value is not None
+                    and json.loads(self._stored_value) == value
+                ):
+                    # unchanged since loaded or saved: skip the write. Compare
+                    # the parsed values, as key order is not stable between
+                    # processes
+                    new_record = False
+                else:
+                    self.updated_at = time_now()
+                    value["updated_at"] = self.updated_at
+                    record = StorageRecord(
+                        self.RECORD_TYPE, json.dumps(value), tags, self._id
+                    )
+                    await storage.update_record(record, record.value, record.tags)
+                    self._stored_value = record.value
+                    new_record = False
             else:
                 if not self._id:
                     self._id = str(uuid.uuid4())
+                if self.ADDED_TAG_NAMES:
+                    # an empty record type is tagged from its first record
+                    await self.records_tagged(session)
+                self.updated_at = time_now()
                 self.created_at = self.updated_at
-                await storage.add_record(self.storage_record)
+                record = self.storage_record
+                await storage.add_record(record)
+                self._stored_value = record.value
                 new_record = True
                 self._new_with_id = False
         finally:
-            params = {self.RECORD_TYPE: self.serialize()}
-            if log_params:
-                params.update(log_params)
-            if new_record is None:
-                log_reason = f"FAILED: {log_reason}"
-            self.log_state(
-                log_reason, params, override=log_override, settings=session.settings
-            )
+            if self.log_state_enabled(session.settings, log_override):
+                params = {self.RECORD_TYPE: self._serialized_for_save()}
+                if log_params:
+                    params.update(log_params)
+                if new_record is None:
+                    log_reason = f"FAILED: {log_reason}"
+                self.log_state(
+                    log_reason, params, override=log_override, settings=session.settings
+                )
 
-        await self.post_save(session, new_record, self._last_state, event)
+        try:
+            await self.post_save(session, new_record, self._last_state, event)
+        finally:
+            self._save_payload = None
         self._last_state = self.state
 
         return self._id
@@ -406,7 +695,14 @@ class BaseRecord(BaseModel):
         if event is None:
             event = new_record or (last_state != self.state)
         if event:
-            await self.emit_event(session, self.serialize())
+            await self.emit_event(session, self._serialized_for_save())
+
+    def _serialized_for_save(self) -> dict:
+        """Serialize the record once per save, for both the state log and event."""
+
+        if self._save_payload is None:
+            self._save_payload = self.serialize()
+        return self._save_payload
 
     async def delete_record(self, session: ProfileSession):
         """
@@ -443,6 +739,17 @@ class BaseRecord(BaseModel):
 
         await session.profile.notify(topic, payload)
 
+    @classmethod
+    def log_state_enabled(
+        cls, settings: BaseSettings = None, override: bool = False
+    ) -> bool:
+        """Check whether state messages are printed, before building them."""
+
+        return bool(
+            override
+            or (cls.LOG_STATE_FLAG and settings and settings.get(cls.LOG_STATE_FLAG))
+        )
+
     @classmethod
     def log_state(
         cls,
@@ -453,9 +760,7 @@ class BaseRecord(BaseModel):
     ):
         """Print a message with increased visibility (for testing)."""
 
-        if override or (
-            cls.LOG_STATE_FLAG and settings and settings.get(cls.LOG_STATE_FLAG)
-        ):
+        if cls.log_state_enabled(settings, override):
             out = msg + "\n"
             if params:
                 for k, v in params.items():
@@ -0,0 +1,57 @@
+"""Class for paginated query parameters."""
+
+from typing import Optional, Tuple
+
+from aiohttp import web
+from marshmallow import fields, validate
+
+from ...storage.base import DEFAULT_PAGE_SIZE
+
+from .openapi import OpenAPISchema
+
+MAXIMUM_PAGE_SIZE = 10000
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated record list request query string."""
+
+    limit = fields.Int(
+        required=False,
+        description=(
+            "Number of results to return, if paginating "
+            f"(default {DEFAULT_PAGE_SIZE} when offset is given)"
+        ),
+        validate=validate.Range(min=1, max=MAXIMUM_PAGE_SIZE),
+        example=DEFAULT_PAGE_SIZE,
+    )
+    offset = fields.Int(
+        required=False,
+        description="Number of matching results to skip, if paginating",
+        validate=validate.Range(min=0),
+        example=0,
+    )
+
+
+def get_limit_offset(
+    request: web.BaseRequest,
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Read pagination parameters from a request query string.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        A tuple of limit and offset, each None if not specified
+
+    """
+    limit = request.query.get("limit")
+    offset = request.query.get("offset")
+    try:
+        limit = min(int(limit), MAXIMUM_PAGE_SIZE) if limit else None
+        offset = int(offset) if offset else None
+    except ValueError as err:
+        raise web.HTTPBadRequest(reason="Invalid pagination parameters") from err
+    if (limit is not None and limit < 1) or (offset is not None and offset < 0):
+        raise web.HTTPBadRequest(reason="Invalid pagination parameters")
+    return limit, offset
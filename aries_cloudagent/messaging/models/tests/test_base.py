@@ -11,7 +11,14 @@ from ....storage.base import BaseStorage, StorageRecord
 from ...responder import BaseResponder, MockResponder
 from ...util import time_now
 
-from ..base import BaseModel, BaseModelError, BaseModelSchema
+from ..base import (
+    BaseModel,
+    BaseModelError,
+    BaseModelSchema,
+    _cached_schema,
+    _get_dump_plan,
+    _make_dump_plan,
+)
 
 
 class ModelImpl(BaseModel):
@@ -35,6 +42,22 @@ class SchemaImpl(BaseModelSchema):
             raise ValidationError("")
 
 
+class ConstantModelImpl(BaseModel):
+    class Meta:
+        schema_class = "ConstantSchemaImpl"
+
+    def __init__(self, *, attr=None):
+        self.attr = attr
+
+
+class ConstantSchemaImpl(BaseModelSchema):
+    class Meta:
+        model_class = ConstantModelImpl
+
+    attr = fields.Str()
+    constant = fields.Constant("fixed")
+
+
 class TestBase(AsyncTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -63,3 +86,73 @@ class TestBase(AsyncTestCase):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
             ModelImpl.from_json(data)
+
+    def test_schema_cached(self):
+        with _cached_schema(SchemaImpl, EXCLUDE) as schema:
+            with _cached_schema(SchemaImpl, EXCLUDE) as nested:
+                assert nested is not schema
+        with _cached_schema(SchemaImpl, EXCLUDE) as cached:
+            assert cached in (schema, nested)
+        with _cached_schema(SchemaImpl, None) as other:
+            assert other is not cached
+
+        model = ModelImpl(attr="succeeds")
+        assert model.serialize() == {"attr": "succeeds"}
+        assert ModelImpl.deserialize({"attr": "succeeds"}).attr == "succeeds"
+
+    def test_dump_plan(self):
+        with _cached_schema(SchemaImpl, EXCLUDE) as schema:
+            (field_plans, skip_values) = _make_dump_plan(ModelImpl, schema)
+        assert [plan[2] for plan in field_plans] == ["attr"]
+        assert skip_values == [None]
+
+        with _cached_schema(ConstantSchemaImpl, EXCLUDE) as schema:
+            assert _make_dump_plan(ConstantModelImpl, schema) is None
+        assert ConstantModelImpl(attr="a").serialize() == {
+            "attr": "a",
+            "constant": "fixed",
+        }
+
+    def test_dump_plan_per_schema(self):
+        with _cached_schema(SchemaImpl, EXCLUDE) as schema:
+            plan = _get_dump_plan(ModelImpl, schema)
+            assert _get_dump_plan(ModelImpl, schema) is plan
+            # a nested use, as in another thread, has its own schema and plan
+            with _cached_schema(SchemaImpl, EXCLUDE) as other:
+                other_plan = _get_dump_plan(ModelImpl, other)
+        assert other_plan is not plan
+        assert other_plan[0][0][3] is other.fields["attr"]
+        assert plan[0][0][3] is schema.fields["attr"]
+
+    def test_dump_plan_serialize(self):
+        class PlainModel(BaseModel):
+            class Meta:
+                schema_class = "PlainSchema"
+
+            def __init__(self, *, attr=None, count=None, flag=None):
+                self.attr = attr
+                self.flag = flag
+                if count is not None:
+                    self.count = count
+
+        class PlainSchema(BaseModelSchema):
+            class Meta:
+                model_class = PlainModel
+
+            attr = fields.Str(data_key="@attr")
+            count = fields.Int(default=1)
+            flag = fields.Bool()
+
+        PlainModel.Meta.schema_class = PlainSchema
+        for model in (
+            PlainModel(),
+            PlainModel(attr="a", count=3, flag=False),
+            PlainModel(attr=5, count="7"),
+        ):
+            with _cached_schema(PlainSchema, EXCLUDE) as schema:
+                assert _make_dump_plan(PlainModel, schema)
+                expected = schema.dump(model)
+            assert model.serialize() == expected
+            assert json.loads(model.serialize(as_string=True)) == expected
+        assert PlainModel(count="7").serialize() == {"count": 7}
+        assert PlainModel().serialize() == {"count": 1}
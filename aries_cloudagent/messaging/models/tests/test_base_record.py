@@ -8,15 +8,18 @@ from ....core.event_bus import EventBus, MockEventBus, Event
 from ....core.in_memory import InMemoryProfile
 from ....storage.base import (
     BaseStorage,
+    BaseStorageSearch,
     StorageDuplicateError,
     StorageError,
     StorageRecord,
 )
+from ....storage.in_memory import InMemoryStorage
 from ....messaging.models.base import BaseModelError
 
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema, LOGGER
+from .. import base_record as test_module
+from ..base_record import RECORD_TYPE_TAGGED, BaseRecord, BaseRecordSchema, LOGGER
 
 
 class BaseRecordImpl(BaseRecord):
@@ -62,6 +65,15 @@ class ARecordImplSchema(BaseRecordSchema):
     code = fields.Str()
 
 
+class AddedTagRecordImpl(ARecordImpl):
+    RECORD_TYPE = "added-tag-record"
+    ADDED_TAG_NAMES = ("code",)
+
+    @property
+    def record_value(self) -> dict:
+        return {"a": self.a, "b": self.b, "code": self.code}
+
+
 class UnencTestImpl(BaseRecord):
     TAG_NAMES = {"~a", "~b", "c"}
 
@@ -157,6 +169,113 @@ class TestBaseRecord(AsyncTestCase):
             with self.assertRaises(ZeroDivisionError):
                 await rec.save(session)
 
+    async def test_save_unchanged(self):
+        session = InMemoryProfile.test_session()
+        storage = session.inject(BaseStorage)
+        rec = ARecordImpl(a="1", b="0", code="one")
+        await rec.save(session)
+
+        with async_mock.patch.object(
+            storage, "update_record", async_mock.CoroutineMock()
+        ) as mock_update:
+            updated_at = rec.updated_at
+            await rec.save(session)
+            mock_update.assert_not_called()
+            assert rec.updated_at == updated_at
+
+            for loaded in (
+                await ARecordImpl.retrieve_by_id(session, rec._id),
+                await ARecordImpl.retrieve_by_tag_filter(session, {"code": "one"}),
+            ):
+                await loaded.save(session)
+                mock_update.assert_not_called()
+
+        loaded.b = "1"
+        await loaded.save(session)
+        assert (await ARecordImpl.retrieve_by_id(session, rec._id)).b == "1"
+        assert loaded.updated_at != updated_at
+
+        # changes not made by assignment are written too
+        loaded.b = {"c": "1"}
+        await loaded.save(session)
+        loaded.b["c"] = "2"
+        await loaded.save(session)
+        assert (await ARecordImpl.retrieve_by_id(session, rec._id)).b == {"c": "2"}
+
+    async def test_save_unchanged_key_order(self):
+        session = InMemoryProfile.test_session()
+        storage = session.inject(BaseStorage)
+        rec = ARecordImpl(a="1", b="0", code="one")
+        await rec.save(session)
+
+        # written by another process, with a different key order
+        stored = json.loads(rec._stored_value)
+        await storage.update_record(
+            rec.storage_record,
+            json.dumps(dict(reversed(list(stored.items())))),
+            rec.tags,
+        )
+        loaded = await ARecordImpl.retrieve_by_id(session, rec._id)
+        assert loaded._stored_value != rec._stored_value
+        with async_mock.patch.object(
+            storage, "update_record", async_mock.CoroutineMock()
+        ) as mock_update:
+            await loaded.save(session)
+            mock_update.assert_not_called()
+
+    async def test_save_unchanged_event(self):
+        session = InMemoryProfile.test_session()
+        mock_event_bus = MockEventBus()
+        session.profile.context.injector.bind_instance(EventBus, mock_event_bus)
+        rec = ARecordImpl(a="1", b="0", code="one")
+        rec.RECORD_TOPIC = "topic"
+        await rec.save(session)
+        await rec.save(session)
+        await rec.save(session, event=True)
+        assert len(mock_event_bus.events) == 2
+
+    async def test_save_serialize_once(self):
+        session = InMemoryProfile.test_session()
+        mock_event_bus = MockEventBus()
+        session.profile.context.injector.bind_instance(EventBus, mock_event_bus)
+        rec = ARecordImpl(a="1", b="0", code="one")
+        rec.RECORD_TOPIC = "topic"
+        with async_mock.patch.object(
+            rec, "serialize", async_mock.MagicMock(return_value={"a": "1"})
+        ) as mock_serialize, async_mock.patch.object(
+            rec, "log_state", async_mock.MagicMock()
+        ) as mock_log_state:
+            await rec.save(session, event=False)
+            mock_serialize.assert_not_called()
+            mock_log_state.assert_not_called()
+
+            await rec.save(session, event=True)
+            mock_serialize.assert_called_once()
+
+            mock_serialize.reset_mock()
+            await rec.save(session, log_override=True, event=True)
+            mock_serialize.assert_called_once()
+            mock_log_state.assert_called_once()
+        assert [event.payload for (_, event) in mock_event_bus.events] == [
+            {"a": "1"},
+            {"a": "1"},
+        ]
+        assert rec._save_payload is None
+
+    async def test_save_changed_value_once(self):
+        session = InMemoryProfile.test_session()
+        rec = ARecordImpl(a="1", b="0", code="one")
+        await rec.save(session)
+        rec.b = "1"
+        with async_mock.patch.object(
+            rec, "_value_for_tags", async_mock.MagicMock(wraps=rec._value_for_tags)
+        ) as mock_value:
+            await rec.save(session)
+            mock_value.assert_called_once()
+        loaded = await ARecordImpl.retrieve_by_id(session, rec._id)
+        assert loaded.b == "1"
+        assert loaded.updated_at == rec.updated_at
+
     async def test_neq(self):
         a_rec = ARecordImpl(a="1", b="0", code="one")
         b_rec = BaseRecordImpl()
@@ -260,6 +379,135 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    async def test_query_promote_post_filter(self):
+        session = InMemoryProfile.test_session()
+        mock_storage = async_mock.MagicMock(BaseStorage, autospec=True)
+        session.context.injector.bind_instance(BaseStorage, mock_storage)
+        mock_storage.find_all_records.return_value = []
+
+        await ARecordImpl.query(
+            session, {"ident": "x"}, post_filter_positive={"code": "red", "a": "one"}
+        )
+        mock_storage.find_all_records.assert_awaited_once_with(
+            ARecordImpl.RECORD_TYPE,
+            {"ident": "x", "code": "red"},
+            options={"retrieveTags": False},
+        )
+
+        assert ARecordImpl.promote_post_filter(
+            None, {"code": ["red", "blue"], "a": ["one"]}, alt=True
+        ) == ({"code": {"$in": ["red", "blue"]}}, {"a": ["one"]})
+        assert ARecordImpl.promote_post_filter({"code": "red"}, {"code": "blue"}) == (
+            {"code": "red"},
+            {"code": "blue"},
+        )
+
+    async def test_query_added_tags(self):
+        session = InMemoryProfile.test_session()
+        storage = session.inject(BaseStorage)
+        await storage.add_record(
+            StorageRecord(
+                AddedTagRecordImpl.RECORD_TYPE,
+                json.dumps({"a": "one", "b": "two", "code": "red"}),
+                {},
+                "untagged",
+            )
+        )
+
+        # records saved without the added tag are still matched by value
+        result = await AddedTagRecordImpl.query(
+            session, post_filter_positive={"code": "red"}
+        )
+        assert [r._id for r in result] == ["untagged"]
+        assert not await AddedTagRecordImpl.records_tagged(session)
+
+        # once marked as tagged, the clause is matched by storage
+        await AddedTagRecordImpl.mark_records_tagged(session)
+        assert await AddedTagRecordImpl.records_tagged(session)
+        assert not await AddedTagRecordImpl.query(
+            session, post_filter_positive={"code": "red"}
+        )
+
+    async def test_records_tagged_recheck(self):
+        session = InMemoryProfile.test_session()
+        storage = session.inject(BaseStorage)
+        await storage.add_record(
+            StorageRecord(
+                AddedTagRecordImpl.RECORD_TYPE,
+                json.dumps({"a": "one", "b": "two", "code": "red"}),
+                {},
+                "untagged",
+            )
+        )
+        with async_mock.patch.object(test_module, "TAGGED_RECHECK_INTERVAL", 0):
+            assert not await AddedTagRecordImpl.records_tagged(session)
+
+        # re-tagged by the upgrade command in another process
+        await storage.add_record(
+            StorageRecord(
+                RECORD_TYPE_TAGGED,
+                "{}",
+                {},
+                f"{RECORD_TYPE_TAGGED}::{AddedTagRecordImpl.RECORD_TYPE}",
+            )
+        )
+        # checked again once the recheck interval has passed
+        assert await AddedTagRecordImpl.records_tagged(session)
+
+    async def test_save_added_tags_new_type(self):
+        session = InMemoryProfile.test_session()
+        record = AddedTagRecordImpl(a="one", b="two", code="red")
+        await record.save(session)
+
+        assert await AddedTagRecordImpl.records_tagged(session)
+        result = await AddedTagRecordImpl.query(
+            session, post_filter_positive={"code": "red"}
+        )
+        assert [r._id for r in result] == [record._id]
+
+    async def test_query_paginated(self):
+        session = InMemoryProfile.test_session()
+        for i in range(12):
+            await ARecordImpl(
+                a=str(i), b="even" if i % 2 == 0 else "odd", code=str(i % 3)
+            ).save(session)
+
+        page = await ARecordImpl.query(session, limit=5)
+        assert len(page) == 5
+        page_next = await ARecordImpl.query(session, limit=5, offset=5)
+        assert len(page_next) == 5
+        assert not {r._id for r in page} & {r._id for r in page_next}
+        assert len(await ARecordImpl.query(session, offset=10)) == 2
+
+        # tag filter pushed down to storage
+        page = await ARecordImpl.query(
+            session, limit=10, post_filter_positive={"code": "0"}
+        )
+        assert len(page) == 4 and all(r.code == "0" for r in page)
+
+        # remaining value post-filter applied while paging through storage
+        page = await ARecordImpl.query(
+            session, limit=2, offset=1, post_filter_positive={"b": "odd"}
+        )
+        assert [r.a for r in page] == ["3", "5"]
+        page = await ARecordImpl.query(
+            session, limit=2, offset=2, post_filter_negative={"b": "odd"}
+        )
+        assert [r.a for r in page] == ["4", "6"]
+
+        # one search kept open across pages where the profile provides one
+        session.context.injector.bind_instance(
+            BaseStorageSearch, session.inject(BaseStorage)
+        )
+        with async_mock.patch.object(
+            InMemoryStorage, "find_paginated_records", async_mock.CoroutineMock()
+        ) as mock_find:
+            page = await ARecordImpl.query(
+                session, limit=2, offset=1, post_filter_positive={"b": "odd"}
+            )
+            mock_find.assert_not_called()
+        assert [r.a for r in page] == ["3", "5"]
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
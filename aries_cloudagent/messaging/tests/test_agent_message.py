@@ -267,3 +267,23 @@ class TestAgentMessageSchema(AsyncTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_decorators_not_shared(self):
+        class ThreadedAgentMessage(AgentMessage):
+            class Meta:
+                schema_class = "ThreadedAgentMessageSchema"
+                message_type = "threaded-message"
+
+        class ThreadedAgentMessageSchema(AgentMessageSchema):
+            class Meta:
+                model_class = ThreadedAgentMessage
+
+        ThreadedAgentMessage.Meta.schema_class = ThreadedAgentMessageSchema
+        first = ThreadedAgentMessage.deserialize(
+            {"@type": "threaded-message", "~thread": {"thid": "thread-1"}}
+        )
+        second = ThreadedAgentMessage.deserialize({"@type": "threaded-message"})
+        assert first._decorators is not second._decorators
+        assert first._thread_id == "thread-1"
+        assert second._thread_id == second._id
+        assert "~thread" not in second.serialize()
@@ -1,5 +1,7 @@
 """Manager for askar profile multitenancy mode."""
 
+import hashlib
+import json
 from typing import Iterable, Optional, cast
 from ..core.profile import (
     Profile,
@@ -9,6 +11,7 @@ from ..config.injection_context import InjectionContext
 from ..wallet.models.wallet_record import WalletRecord
 from ..askar.profile import AskarProfile
 from ..multitenant.base import BaseMultitenantManager
+from .cache import ProfileCache
 
 
 class AskarProfileMultitenantManager(BaseMultitenantManager):
@@ -24,6 +27,9 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
         """
         super().__init__(profile)
         self._multitenant_profile: Optional[AskarProfile] = multitenant_profile
+        self._profiles = ProfileCache(
+            profile.settings.get_int("multitenant.cache_size") or 100
+        )
 
     @property
     def open_profiles(self) -> Iterable[Profile]:
@@ -83,8 +89,6 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             profile, _ = await wallet_config(context, provision=False)
             self._multitenant_profile = cast(AskarProfile, profile)
 
-        profile_context = self._multitenant_profile.context.copy()
-
         if provision:
             await self._multitenant_profile.store.create_profile(
                 wallet_record.wallet_id
@@ -95,17 +99,53 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             "wallet.askar_profile": wallet_record.wallet_id,
         }
 
+        # profiles are reused until the settings of the wallet change
+        settings_digest = hashlib.sha256(
+            json.dumps(
+                [wallet_record.settings, extra_settings], sort_keys=True, default=str
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_key = f"{wallet_record.wallet_id}:{settings_digest}"
+        profile = self._profiles.get(cache_key)
+        if profile:
+            return profile
+
+        profile_context = self._multitenant_profile.context.copy()
         profile_context.settings = profile_context.settings.extend(
             wallet_record.settings
         ).extend(extra_settings)
 
         assert self._multitenant_profile.opened
 
-        return AskarProfile(
+        profile = AskarProfile(
             self._multitenant_profile.opened,
             profile_context,
             profile_id=wallet_record.wallet_id,
         )
+        self._remove_cached_profiles(wallet_record.wallet_id)
+        self._profiles.put(cache_key, profile)
+        return profile
+
+    def _remove_cached_profiles(self, wallet_id: str):
+        """Remove the cached profiles of a wallet."""
+        for cache_key in list(self._profiles.profiles.keys()):
+            if cache_key.split(":")[0] == wallet_id:
+                self._profiles.remove(cache_key)
+
+    async def update_wallet(self, wallet_id: str, new_settings: dict) -> WalletRecord:
+        """Update an existing wallet and wallet record.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+            new_settings: The context settings to be updated for this wallet
+
+        Returns:
+            WalletRecord: The updated wallet record
+
+        """
+        wallet_record = await super().update_wallet(wallet_id, new_settings)
+        self._remove_cached_profiles(wallet_id)
+        return wallet_record
 
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -114,4 +154,5 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             profile: The wallet profile instance
 
         """
+        self._remove_cached_profiles(profile.settings.get_str("wallet.askar_profile"))
         await profile.remove()
@@ -2,8 +2,9 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+import hashlib
 import logging
-from typing import Iterable, List, Optional, cast
+from typing import Iterable, List, Optional, Sequence, cast
 
 import jwt
 
@@ -17,14 +18,21 @@ from ..protocols.coordinate_mediation.v1_0.manager import (
 from ..protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
+from ..protocols.routing.v1_0.route_index import WalletRouteIndex
 from ..storage.base import BaseStorage
+from ..storage.error import StorageNotFoundError
 from ..transport.wire_format import BaseWireFormat
 from ..wallet.base import BaseWallet
 from ..wallet.models.wallet_record import WalletRecord
+from .cache import TokenCache
 from .error import WalletKeyMissingError
 
 LOGGER = logging.getLogger(__name__)
 
+# verified auth tokens kept, and seconds before a token is verified again
+DEFAULT_TOKEN_CACHE_SIZE = 1000
+DEFAULT_TOKEN_CACHE_TTL = 60
+
 
 class MultitenantManagerError(BaseError):
     """Generic multitenant error."""
@@ -42,6 +50,12 @@ class BaseMultitenantManager(ABC):
         self._profile = profile
         if not profile:
             raise MultitenantManagerError("Missing profile")
+        token_cache_size = profile.settings.get_int("multitenant.token_cache_size")
+        token_cache_ttl = profile.settings.get_int("multitenant.token_cache_ttl")
+        self._tokens = TokenCache(
+            DEFAULT_TOKEN_CACHE_SIZE if token_cache_size is None else token_cache_size,
+            DEFAULT_TOKEN_CACHE_TTL if token_cache_ttl is None else token_cache_ttl,
+        )
 
     @property
     @abstractmethod
@@ -229,6 +243,8 @@ class BaseMultitenantManager(ABC):
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
 
+        self._tokens.remove_wallet(wallet_id)
+
         return wallet_record
 
     async def remove_wallet(self, wallet_id: str, wallet_key: str = None):
@@ -268,9 +284,14 @@ class BaseMultitenantManager(ABC):
             await storage.delete_all_records(
                 RouteRecord.RECORD_TYPE, {"wallet_id": wallet.wallet_id}
             )
+            route_index = session.inject_or(WalletRouteIndex)
+            if route_index:
+                await route_index.remove_wallet(wallet.wallet_id)
 
             await wallet.delete_record(session)
 
+        self._tokens.remove_wallet(wallet.wallet_id)
+
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -316,6 +337,9 @@ class BaseMultitenantManager(ABC):
         async with self._profile.session() as session:
             await wallet_record.save(session)
 
+        # tokens issued before are no longer valid
+        self._tokens.remove_wallet(wallet_record.wallet_id)
+
         return token
 
     async def get_profile_for_token(
@@ -335,6 +359,12 @@ class BaseMultitenantManager(ABC):
             Profile associated with the token
 
         """
+        token_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._tokens.get(token_key)
+        if cached:
+            (wallet, extra_settings) = cached
+            return await self.get_wallet_profile(context, wallet, dict(extra_settings))
+
         jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
         extra_settings = {}
 
@@ -356,7 +386,9 @@ class BaseMultitenantManager(ABC):
         if wallet.jwt_iat and wallet.jwt_iat != iat:
             raise MultitenantManagerError("Token not valid")
 
-        profile = await self.get_wallet_profile(context, wallet, extra_settings)
+        self._tokens.put(token_key, wallet, extra_settings)
+
+        profile = await self.get_wallet_profile(context, wallet, dict(extra_settings))
 
         return profile
 
@@ -368,18 +400,52 @@ class BaseMultitenantManager(ABC):
         Returns:
             Wallet record associated with the recipient key
         """
-        routing_mgr = RoutingManager(self._profile)
+        wallets = await self._get_wallets_by_keys([recipient_key])
+        return wallets[0] if wallets else None
 
-        try:
-            routing_record = await routing_mgr.get_recipient(recipient_key)
-            async with self._profile.session() as session:
-                wallet = await WalletRecord.retrieve_by_id(
-                    session, routing_record.wallet_id
-                )
+    async def _get_wallets_by_keys(
+        self, recipient_keys: Sequence[str]
+    ) -> List[WalletRecord]:
+        """Get the wallet records associated with recipient keys.
 
-            return wallet
-        except (RouteNotFoundError):
-            pass
+        The wallets are found in the route index when one is bound, with the
+        keys missing from the index looked up together.
+
+        Args:
+            recipient_keys: The recipient keys
+        Returns:
+            Wallet records associated with the recipient keys, in order
+        """
+        route_index = self._profile.inject_or(WalletRouteIndex)
+        if not route_index:
+            routing_mgr = RoutingManager(self._profile)
+            wallet_ids = {}
+            for recipient_key in recipient_keys:
+                try:
+                    routing_record = await routing_mgr.get_recipient(recipient_key)
+                except RouteNotFoundError:
+                    continue
+                wallet_ids[recipient_key] = routing_record.wallet_id
+
+        wallets = []
+        async with self._profile.session() as session:
+            if route_index:
+                wallet_ids = await route_index.get_wallet_ids(session, recipient_keys)
+            for recipient_key in recipient_keys:
+                wallet_id = wallet_ids.get(recipient_key)
+                if not wallet_id:
+                    continue
+                try:
+                    wallets.append(
+                        await WalletRecord.retrieve_by_id(session, wallet_id)
+                    )
+                except StorageNotFoundError:
+                    if not route_index:
+                        raise
+                    # the wallet was removed by another agent instance
+                    await route_index.remove(recipient_key)
+
+        return wallets
 
     async def get_wallets_by_message(
         self, message_body, wire_format: BaseWireFormat = None
@@ -397,12 +463,5 @@ class BaseMultitenantManager(ABC):
         wire_format = wire_format or self._profile.inject(BaseWireFormat)
 
         recipient_keys = wire_format.get_recipient_keys(message_body)
-        wallets = []
-
-        for key in recipient_keys:
-            wallet = await self._get_wallet_by_key(key)
 
-            if wallet:
-                wallets.append(wallet)
-
-        return wallets
+        return await self._get_wallets_by_keys(recipient_keys)
@@ -1,11 +1,13 @@
 """Cache for multitenancy profiles."""
 
 import logging
+import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Optional, Tuple
 from weakref import WeakValueDictionary
 
 from ..core.profile import Profile
+from ..wallet.models.wallet_record import WalletRecord
 
 LOGGER = logging.getLogger(__name__)
 
@@ -109,5 +111,83 @@ class ProfileCache:
         Args:
             key (str): The key to remove from the cache.
         """
-        del self.profiles[key]
-        del self._cache[key]
+        self.profiles.pop(key, None)
+        self._cache.pop(key, None)
+
+
+class TokenCache:
+    """
+    Cache of verified auth tokens that caches based on LRU strategy.
+
+    Each entry holds the wallet record and extra settings resolved from a
+    token, keyed by a digest of the token, and expires after a time to live.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        """Initialize TokenCache.
+
+        Args:
+            capacity: The capacity of the cache. If capacity is exceeded
+                      least recently used tokens are evicted.
+            ttl: The number of seconds a verified token is kept
+        """
+        self._cache: OrderedDict[str, Tuple[float, WalletRecord, dict]] = OrderedDict()
+        self.capacity = capacity
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[Tuple[WalletRecord, dict]]:
+        """Get the wallet record and extra settings for a token digest.
+
+        Args:
+            key (str): the digest of the token
+
+        Returns:
+            Optional[Tuple[WalletRecord, dict]]: The wallet record and extra
+                settings if found in cache and not expired.
+
+        """
+        entry = self._cache.get(key)
+        if not entry:
+            return None
+        (expires, wallet_record, extra_settings) = entry
+        if expires <= time.perf_counter():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return (wallet_record, dict(extra_settings))
+
+    def put(self, key: str, wallet_record: WalletRecord, extra_settings: dict):
+        """Add a verified token to the cache.
+
+        Args:
+            key (str): the digest of the token
+            wallet_record (WalletRecord): the wallet record of the token
+            extra_settings (dict): the settings extracted from the token
+        """
+        if self.capacity <= 0 or self.ttl <= 0:
+            return
+        self._cache[key] = (
+            time.perf_counter() + self.ttl,
+            wallet_record,
+            dict(extra_settings),
+        )
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def remove_wallet(self, wallet_id: str):
+        """Remove all tokens for a wallet from the cache.
+
+        Args:
+            wallet_id (str): the wallet id of the tokens to remove
+        """
+        for key in [
+            key
+            for (key, (_, wallet_record, _)) in self._cache.items()
+            if wallet_record.wallet_id == wallet_id
+        ]:
+            del self._cache[key]
+
+    def clear(self):
+        """Remove all tokens from the cache."""
+        self._cache.clear()
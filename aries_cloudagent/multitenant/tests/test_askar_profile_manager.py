@@ -8,6 +8,7 @@ from ...core.in_memory import InMemoryProfile
 from ...messaging.responder import BaseResponder
 from ...wallet.models.wallet_record import WalletRecord
 from ..askar_profile_manager import AskarProfileMultitenantManager
+from ..base import BaseMultitenantManager
 
 
 class TestAskarProfileMultitenantManager(AsyncTestCase):
@@ -151,6 +152,41 @@ class TestAskarProfileMultitenantManager(AsyncTestCase):
                     == multitenant_sub_wallet_name
                 )
 
+    async def test_get_wallet_profile_cached(self):
+        wallet_record = WalletRecord(wallet_id="test", settings={})
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.askar_profile_manager.AskarProfile"
+        ) as AskarProfile:
+            sub_wallet_profile = AskarProfile(None, None)
+            sub_wallet_profile.context.copy.return_value = InjectionContext()
+            self.manager._multitenant_profile = sub_wallet_profile
+            AskarProfile.reset_mock()
+
+            profile = await self.manager.get_wallet_profile(
+                self.profile.context, wallet_record
+            )
+            assert (
+                await self.manager.get_wallet_profile(
+                    self.profile.context, wallet_record
+                )
+                is profile
+            )
+            AskarProfile.assert_called_once()
+
+            # changed wallet settings create a new profile
+            wallet_record.update_settings({"wallet.dispatch_type": "both"})
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            assert AskarProfile.call_count == 2
+
+            with async_mock.patch.object(
+                BaseMultitenantManager,
+                "update_wallet",
+                async_mock.CoroutineMock(return_value=wallet_record),
+            ):
+                await self.manager.update_wallet("test", {})
+            assert not self.manager._profiles.profiles
+
     async def test_remove_wallet_profile(self):
         test_profile = InMemoryProfile.test_profile({"wallet.id": "test"})
 
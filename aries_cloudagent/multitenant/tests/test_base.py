@@ -15,6 +15,7 @@ from ...protocols.coordinate_mediation.v1_0.manager import (
 from ...protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from ...protocols.routing.v1_0.manager import RoutingManager
 from ...protocols.routing.v1_0.models.route_record import RouteRecord
+from ...protocols.routing.v1_0.route_index import WalletRouteIndex
 from ...storage.error import StorageNotFoundError
 from ...storage.in_memory import InMemoryStorage
 from ...wallet.did_info import DIDInfo
@@ -586,6 +587,86 @@ class TestBaseMultitenantManager(AsyncTestCase):
 
             assert profile == mock_profile
 
+    async def test_get_profile_for_token_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_UNMANAGED,
+            settings={"wallet.type": "indy"},
+        )
+
+        session = await self.profile.session()
+        await wallet_record.save(session)
+
+        token = jwt.encode(
+            {"wallet_id": wallet_record.wallet_id, "wallet_key": "wallet_key"},
+            "very_secret_jwt",
+            algorithm="HS256",
+        )
+
+        with async_mock.patch.object(
+            self.manager, "get_wallet_profile"
+        ) as get_wallet_profile, async_mock.patch.object(
+            WalletRecord, "retrieve_by_id", async_mock.CoroutineMock()
+        ) as retrieve_by_id:
+            retrieve_by_id.return_value = wallet_record
+            mock_profile = InMemoryProfile.test_profile()
+            get_wallet_profile.return_value = mock_profile
+
+            def add_webhook_urls(context, wallet, extra_settings):
+                assert "admin.webhook_urls" not in extra_settings
+                extra_settings["admin.webhook_urls"] = ["http://localhost"]
+                return mock_profile
+
+            get_wallet_profile.side_effect = add_webhook_urls
+
+            for _ in range(3):
+                profile = await self.manager.get_profile_for_token(
+                    self.profile.context, token
+                )
+                assert profile == mock_profile
+                get_wallet_profile.assert_called_with(
+                    self.profile.context,
+                    wallet_record,
+                    {
+                        "wallet.key": "wallet_key",
+                        "admin.webhook_urls": ["http://localhost"],
+                    },
+                )
+            retrieve_by_id.assert_called_once()
+
+            # issuing a new token revokes the cached one
+            await self.manager.create_auth_token(wallet_record, "wallet_key")
+            with self.assertRaises(MultitenantManagerError):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            assert retrieve_by_id.call_count == 2
+
+    async def test_get_profile_for_token_cache_removed_on_update(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+
+        session = await self.profile.session()
+        await wallet_record.save(session)
+
+        token = jwt.encode(
+            {"wallet_id": wallet_record.wallet_id}, "very_secret_jwt", algorithm="HS256"
+        )
+
+        with async_mock.patch.object(self.manager, "get_wallet_profile"):
+            await self.manager.get_profile_for_token(self.profile.context, token)
+            assert self.manager._tokens.get(
+                test_module.hashlib.sha256(token.encode()).hexdigest()
+            )
+
+            await self.manager.update_wallet(
+                wallet_record.wallet_id, {"wallet.webhook_urls": ["new-webhook-url"]}
+            )
+            assert not self.manager._tokens.get(
+                test_module.hashlib.sha256(token.encode()).hexdigest()
+            )
+
     async def test_get_wallets_by_message_missing_wire_format_raises(self):
         with self.assertRaises(
             InjectionError,
@@ -600,23 +681,51 @@ class TestBaseMultitenantManager(AsyncTestCase):
             get_recipient_keys=lambda mesage_body: recipient_keys
         )
 
-        return_wallets = [
-            WalletRecord(settings={}),
-            None,
-            None,
-            WalletRecord(settings={}),
-        ]
+        wallet_records = []
+        async with self.profile.session() as session:
+            for recipient_key in ("1", "4"):
+                wallet_record = WalletRecord(settings={})
+                await wallet_record.save(session)
+                wallet_records.append(wallet_record)
+                await RouteRecord(
+                    wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+                ).save(session)
+
+        wallets = await self.manager.get_wallets_by_message(
+            message_body, mock_wire_format
+        )
 
-        with async_mock.patch.object(
-            self.manager, "_get_wallet_by_key"
-        ) as get_wallet_by_key:
-            get_wallet_by_key.side_effect = return_wallets
+        assert wallets == wallet_records
 
+    async def test_get_wallets_by_message_route_index(self):
+        message_body = async_mock.MagicMock()
+        recipient_keys = ["1", "2", "3"]
+        mock_wire_format = async_mock.MagicMock(
+            get_recipient_keys=lambda mesage_body: recipient_keys
+        )
+        route_index = WalletRouteIndex()
+        self.profile.context.injector.bind_instance(WalletRouteIndex, route_index)
+
+        async with self.profile.session() as session:
+            wallet_record = WalletRecord(settings={})
+            await wallet_record.save(session)
+            await RouteRecord(
+                wallet_id=wallet_record.wallet_id, recipient_key="1"
+            ).save(session)
+            # wallet removed by another instance
+            await RouteRecord(wallet_id="removed", recipient_key="3").save(session)
+
+        with async_mock.patch.object(RoutingManager, "get_recipient") as get_recipient:
             wallets = await self.manager.get_wallets_by_message(
                 message_body, mock_wire_format
             )
+            get_recipient.assert_not_called()
 
-            assert len(wallets) == 2
-            assert wallets[0] == return_wallets[0]
-            assert wallets[1] == return_wallets[3]
-            assert get_wallet_by_key.call_count == 4
+        assert wallets == [wallet_record]
+        assert route_index._wallet_ids == {"1": wallet_record.wallet_id}
+
+        with async_mock.patch.object(
+            self.manager, "get_wallet_profile"
+        ), async_mock.patch.object(self.manager, "remove_wallet_profile"):
+            await self.manager.remove_wallet(wallet_record.wallet_id, "wallet_key")
+        assert route_index.size == 0
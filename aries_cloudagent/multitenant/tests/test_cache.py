@@ -1,6 +1,10 @@
+from asynctest import mock as async_mock
+
 from ...core.profile import Profile
+from ...wallet.models.wallet_record import WalletRecord
 
-from ..cache import ProfileCache
+from .. import cache as test_module
+from ..cache import ProfileCache, TokenCache
 
 
 class MockProfile(Profile):
@@ -105,3 +109,65 @@ def test_rescue_open_profile():
     assert cache.get("2") is None
     assert cache.get("3")
     assert cache.get("4")
+
+
+def test_token_cache_put_get():
+    cache = TokenCache(2, 60)
+    wallet_record = WalletRecord(wallet_id="wallet")
+
+    assert cache.get("1") is None
+    cache.put("1", wallet_record, {"wallet.key": "key"})
+    (cached_record, extra_settings) = cache.get("1")
+    assert cached_record is wallet_record
+    assert extra_settings == {"wallet.key": "key"}
+
+    # callers get their own copy of the extra settings
+    extra_settings["other"] = "value"
+    assert cache.get("1")[1] == {"wallet.key": "key"}
+
+
+def test_token_cache_lru():
+    cache = TokenCache(2, 60)
+
+    cache.put("1", WalletRecord(wallet_id="1"), {})
+    cache.put("2", WalletRecord(wallet_id="2"), {})
+    cache.get("1")
+    cache.put("3", WalletRecord(wallet_id="3"), {})
+
+    assert cache.get("1")
+    assert cache.get("2") is None
+    assert cache.get("3")
+
+
+def test_token_cache_expiry():
+    cache = TokenCache(2, 60)
+
+    with async_mock.patch.object(test_module.time, "perf_counter") as perf_counter:
+        perf_counter.return_value = 100
+        cache.put("1", WalletRecord(wallet_id="1"), {})
+        perf_counter.return_value = 159
+        assert cache.get("1")
+        perf_counter.return_value = 160
+        assert cache.get("1") is None
+
+
+def test_token_cache_remove_wallet():
+    cache = TokenCache(3, 60)
+
+    cache.put("1", WalletRecord(wallet_id="1"), {})
+    cache.put("2", WalletRecord(wallet_id="1"), {})
+    cache.put("3", WalletRecord(wallet_id="2"), {})
+    cache.remove_wallet("1")
+
+    assert cache.get("1") is None
+    assert cache.get("2") is None
+    assert cache.get("3")
+
+    cache.clear()
+    assert cache.get("3") is None
+
+
+def test_token_cache_disabled():
+    for cache in (TokenCache(0, 60), TokenCache(10, 0)):
+        cache.put("1", WalletRecord(wallet_id="1"), {})
+        assert cache.get("1") is None
@@ -17,6 +17,10 @@ from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_limit_offset,
+)
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
@@ -166,7 +170,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -324,6 +328,9 @@ async def connections_list(request: web.BaseRequest):
     """
     Request handler for searching connection records.
 
+    Unpaginated results are sorted by state and creation time; pages are
+    returned in storage order.
+
     Args:
         request: aiohttp request object
 
@@ -360,14 +367,24 @@ async def connections_list(request: web.BaseRequest):
     if request.query.get("connection_protocol"):
         post_filter["connection_protocol"] = request.query["connection_protocol"]
 
+    limit, offset = get_limit_offset(request)
+
     profile = context.profile
     try:
         async with profile.session() as session:
             records = await ConnRecord.query(
-                session, tag_filter, post_filter_positive=post_filter, alt=True
+                session,
+                tag_filter,
+                limit=limit,
+                offset=offset,
+                post_filter_positive=post_filter,
+                alt=True,
             )
         results = [record.serialize() for record in records]
-        results.sort(key=connection_sort_key)
+        if limit is None and offset is None:
+            # pages follow storage order: sorting each page alone would not
+            # give a stable order across pages
+            results.sort(key=connection_sort_key)
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
@@ -97,6 +97,8 @@ class TestConnectionRoutes(AsyncTestCase):
                         "their_public_did": "a_public_did",
                         "invitation_msg_id": "dummy_msg",
                     },
+                    limit=None,
+                    offset=None,
                     post_filter_positive={
                         "their_role": [v for v in ConnRecord.Role.REQUESTER.value],
                         "connection_protocol": ConnRecord.Protocol.RFC_0160.aries_protocol,
@@ -115,6 +117,44 @@ class TestConnectionRoutes(AsyncTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "2", "offset": "1"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec:
+            mock_conn_rec.query = async_mock.CoroutineMock()
+            conns = [
+                async_mock.MagicMock(
+                    serialize=async_mock.MagicMock(
+                        return_value={
+                            "state": state.rfc23,
+                            "created_at": "1234567890",
+                        }
+                    )
+                )
+                for state in (ConnRecord.State.ABANDONED, ConnRecord.State.COMPLETED)
+            ]
+            mock_conn_rec.query.return_value = conns
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.connections_list(self.request)
+                mock_conn_rec.query.assert_called_once_with(
+                    ANY,
+                    {},
+                    limit=2,
+                    offset=1,
+                    post_filter_positive={},
+                    alt=True,
+                )
+                mock_response.assert_called_once_with(
+                    {
+                        "results": [c.serialize.return_value for c in conns]
+                    }  # storage order
+                )
+
     async def test_connections_list_x(self):
         self.request.query = {
             "their_role": ConnRecord.Role.REQUESTER.rfc160,
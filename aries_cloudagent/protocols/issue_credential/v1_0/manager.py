@@ -627,7 +627,7 @@ class CredentialManager:
                     rev_reg = await active_rev_reg_rec.get_registry()
                     rev_reg_id = rev_reg.registry_id
                     tails_path = rev_reg.tails_local_path
-                    await rev_reg.get_or_fetch_local_tails_path()
+                    await rev_reg.get_or_fetch_local_tails_path(self._profile)
 
                 except StorageNotFoundError:
                     async with self._profile.session() as session:
@@ -685,6 +685,7 @@ class CredentialManager:
                 )
             )
             issuer = self._profile.inject(IndyIssuer)
+            index_blocks = IssuerRevRegRecord.uses_index_blocks(self._profile)
             try:
                 (credential_json, cred_rev_id) = await issuer.create_credential(
                     schema,
@@ -698,7 +699,11 @@ class CredentialManager:
                 credential_ser = json.loads(credential_json)
 
                 # If the rev reg is now full
-                if rev_reg and rev_reg.max_creds == int(cred_rev_id):
+                if (
+                    rev_reg
+                    and not index_blocks
+                    and rev_reg.max_creds == int(cred_rev_id)
+                ):
                     async with self._profile.session() as session:
                         await active_rev_reg_rec.set_state(
                             session,
@@ -716,11 +721,12 @@ class CredentialManager:
                     )
 
             except IndyIssuerRevocationRegistryFullError:
-                # unlucky: duelling instance issued last cred near same time as us
-                async with self._profile.session() as session:
-                    await active_rev_reg_rec.set_state(
-                        session,
-                        IssuerRevRegRecord.STATE_FULL,
+                if await active_rev_reg_rec.mark_exhausted(self._profile):
+                    await notify_revocation_reg_event(
+                        self.profile,
+                        cred_ex_record.credential_definition_id,
+                        active_rev_reg_rec.max_cred_num,
+                        auto_create_rev_reg=True,
                     )
 
                 if retries > 0:
@@ -873,7 +879,7 @@ class CredentialManager:
 
         if revoc_reg_def:
             revoc_reg = RevocationRegistry.from_definition(revoc_reg_def, True)
-            await revoc_reg.get_or_fetch_local_tails_path()
+            await revoc_reg.get_or_fetch_local_tails_path(self._profile)
         try:
             credential_id = await holder.store_credential(
                 credential_definition,
@@ -34,7 +34,13 @@ class V10CredentialExchange(BaseExchangeRecord):
     RECORD_TYPE = "credential_exchange_v10"
     RECORD_ID_NAME = "credential_exchange_id"
     RECORD_TOPIC = "issue_credential"
-    TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    TAG_NAMES = {
+        "~thread_id" if UNENCRYPTED_TAGS else "thread_id",
+        "connection_id",
+        "role",
+        "state",
+    }
+    ADDED_TAG_NAMES = ("connection_id", "role", "state")
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
@@ -366,7 +366,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
                 rev_reg_id = active_rev_reg_rec.revoc_reg_id
 
                 tails_path = rev_reg.tails_local_path
-                await rev_reg.get_or_fetch_local_tails_path()
+                await rev_reg.get_or_fetch_local_tails_path(self.profile)
 
             except StorageNotFoundError:
                 async with self.profile.session() as session:
@@ -415,6 +415,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
             decode=False
         )
         issuer = self.profile.inject(IndyIssuer)
+        index_blocks = IssuerRevRegRecord.uses_index_blocks(self.profile)
         try:
             (cred_json, cred_rev_id,) = await issuer.create_credential(
                 schema,
@@ -433,7 +434,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
             )
 
             # If the rev reg is now full
-            if rev_reg and rev_reg.max_creds == int(cred_rev_id):
+            if rev_reg and not index_blocks and rev_reg.max_creds == int(cred_rev_id):
                 async with self.profile.session() as session:
                     await active_rev_reg_rec.set_state(
                         session,
@@ -450,11 +451,12 @@ class IndyCredFormatHandler(V20CredFormatHandler):
                 await detail_record.save(session, reason="v2.0 issue credential")
 
         except IndyIssuerRevocationRegistryFullError:
-            # unlucky: duelling instance issued last cred near same time as us
-            async with self.profile.session() as session:
-                await active_rev_reg_rec.set_state(
-                    session,
-                    IssuerRevRegRecord.STATE_FULL,
+            if await active_rev_reg_rec.mark_exhausted(self.profile):
+                await notify_revocation_reg_event(
+                    self.profile,
+                    cred_def_id,
+                    active_rev_reg_rec.max_cred_num,
+                    auto_create_rev_reg=True,
                 )
 
             if retries > 0:
@@ -512,7 +514,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
 
         if rev_reg_def:
             rev_reg = RevocationRegistry.from_definition(rev_reg_def, True)
-            await rev_reg.get_or_fetch_local_tails_path()
+            await rev_reg.get_or_fetch_local_tails_path(self.profile)
         try:
             detail_record = await self.get_detail_record(cred_ex_record.cred_ex_id)
             if detail_record is None:
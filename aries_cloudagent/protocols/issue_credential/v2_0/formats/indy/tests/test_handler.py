@@ -1175,7 +1175,7 @@ class TestV20IndyCredFormatHandler(AsyncTestCase):
                 async_mock.CoroutineMock(
                     return_value=async_mock.MagicMock(  # active_rev_reg_rec
                         revoc_reg_id=REV_REG_ID,
-                        set_state=async_mock.CoroutineMock(),
+                        mark_exhausted=async_mock.CoroutineMock(return_value=False),
                         get_registry=async_mock.CoroutineMock(
                             return_value=async_mock.MagicMock(  # rev_reg
                                 tails_local_path="dummy-path",
@@ -1191,6 +1191,22 @@ class TestV20IndyCredFormatHandler(AsyncTestCase):
             with self.assertRaises(test_module.IndyIssuerRevocationRegistryFullError):
                 await self.handler.issue_credential(cred_ex_record, retries=1)
 
+            # the first issuance to find the registry full sends the next one
+            active_rev_reg_rec = (
+                revoc.return_value.get_active_issuer_rev_reg_record.return_value
+            )
+            active_rev_reg_rec.mark_exhausted = async_mock.CoroutineMock(
+                side_effect=[True, False]
+            )
+            with async_mock.patch.object(
+                test_module, "notify_revocation_reg_event", async_mock.CoroutineMock()
+            ) as mock_notify, self.assertRaises(
+                test_module.IndyIssuerRevocationRegistryFullError
+            ):
+                await self.handler.issue_credential(cred_ex_record, retries=1)
+            assert active_rev_reg_rec.mark_exhausted.await_count == 2
+            mock_notify.assert_called_once()
+
     async def test_receive_credential(self):
         cred_ex_record = async_mock.MagicMock()
         cred_issue_message = async_mock.MagicMock()
@@ -32,6 +32,7 @@ from ....vc.ld_proofs import (
     BbsBlsSignatureProof2020,
     WalletKeyPair,
     DocumentLoader,
+    run_jsonld,
 )
 from ....vc.ld_proofs.constants import (
     SECURITY_CONTEXT_BBS_URL,
@@ -421,7 +422,7 @@ class DIFPresExchHandler:
                         suite=derive_suite,
                         document_loader=document_loader,
                     )
-                    credential = self.create_vcrecord(signed_new_credential_dict)
+                    credential = await self.create_vcrecord(signed_new_credential_dict)
             result.append(credential)
         return result
 
@@ -451,7 +452,7 @@ class DIFPresExchHandler:
             except (WalletError, WalletNotFoundError):
                 return False
 
-    def create_vcrecord(self, cred_dict: dict) -> VCRecord:
+    async def create_vcrecord(self, cred_dict: dict) -> VCRecord:
         """Return VCRecord from a credential dict."""
         proofs = cred_dict.get("proof") or []
         proof_types = None
@@ -494,7 +495,13 @@ class DIFPresExchHandler:
         if type(schemas) is dict:
             schemas = [schemas]
         schema_ids = [schema.get("id") for schema in schemas]
-        expanded = jsonld.expand(cred_dict)
+        document_loader = self.profile.inject(DocumentLoader)
+        expanded = await run_jsonld(
+            document_loader,
+            jsonld.expand,
+            cred_dict,
+            {"documentLoader": document_loader},
+        )
         types = JsonLdProcessor.get_values(
             expanded[0],
             "@type",
@@ -1409,7 +1416,7 @@ class DIFPresExchHandler:
                     not len(
                         await self.filter_schema(
                             credentials=[
-                                self.create_vcrecord(cred_dict=match_item.value)
+                                await self.create_vcrecord(cred_dict=match_item.value)
                             ],
                             schemas=schema_filter,
                         )
@@ -1439,7 +1446,7 @@ class DIFPresExchHandler:
         """Evaluate constraint from the request against received credential."""
         fields = constraint._fields
         field_paths = []
-        credential = self.create_vcrecord(cred_dict)
+        credential = await self.create_vcrecord(cred_dict)
         is_limit_disclosure = constraint.limit_disclosure == "required"
         for field in fields:
             if is_limit_disclosure:
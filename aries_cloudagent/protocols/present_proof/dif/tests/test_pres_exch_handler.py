@@ -1740,7 +1740,8 @@ class TestPresExchHandler:
         assert dif_pres_exch_handler.is_len_applicable(tmp_req_b, 2) is False
         assert dif_pres_exch_handler.is_len_applicable(tmp_req_c, 6) is False
 
-    def test_create_vcrecord(self, profile):
+    @pytest.mark.asyncio
+    async def test_create_vcrecord(self, profile):
         dif_pres_exch_handler = DIFPresExchHandler(profile)
         test_cred_dict = {
             "@context": [
@@ -1763,7 +1764,7 @@ class TestPresExchHandler:
                 "type": "JsonSchemaValidator2018",
             },
         }
-        test_vcrecord = dif_pres_exch_handler.create_vcrecord(test_cred_dict)
+        test_vcrecord = await dif_pres_exch_handler.create_vcrecord(test_cred_dict)
         assert isinstance(test_vcrecord, VCRecord)
 
     @pytest.mark.asyncio
@@ -1900,7 +1901,8 @@ class TestPresExchHandler:
         )
         assert len(tmp_vp.get("verifiableCredential")) == 6
 
-    def test_create_vc_record_with_graph_struct(self, profile):
+    @pytest.mark.asyncio
+    async def test_create_vc_record_with_graph_struct(self, profile):
         dif_pres_exch_handler = DIFPresExchHandler(profile)
         test_credential_dict_a = {
             "@context": [
@@ -1969,10 +1971,12 @@ class TestPresExchHandler:
             },
         }
         assert isinstance(
-            dif_pres_exch_handler.create_vcrecord(test_credential_dict_a), VCRecord
+            await dif_pres_exch_handler.create_vcrecord(test_credential_dict_a),
+            VCRecord,
         )
         assert isinstance(
-            dif_pres_exch_handler.create_vcrecord(test_credential_dict_b), VCRecord
+            await dif_pres_exch_handler.create_vcrecord(test_credential_dict_b),
+            VCRecord,
         )
 
     @pytest.mark.asyncio
@@ -3608,7 +3612,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_1
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize(
                 {
                     "path": ["$.credentialSubject.Patient[0].address[0].city"],
@@ -3633,7 +3637,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_2
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize(
                 {
                     "path": ["$.credentialSubject.lprNumber"],
@@ -3654,7 +3658,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_2
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize(
                 {
                     "path": ["$.credentialSubject.testDate"],
@@ -3676,7 +3680,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_2
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize(
                 {
                     "path": ["$.credentialSubject.testFlag"],
@@ -3693,7 +3697,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_2
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize(
                 {"path": ["$.credentialSubject.testDouble"], "filter": {"const": 10.2}}
             )
@@ -3709,7 +3713,7 @@ class TestPresExchHandler:
             test_module.jsonld, "expand", async_mock.MagicMock()
         ) as mock_jsonld_expand:
             mock_jsonld_expand.return_value = EXPANDED_CRED_FHIR_TYPE_2
-            vc_record_cred = dif_pres_exch_handler.create_vcrecord(cred_dict)
+            vc_record_cred = await dif_pres_exch_handler.create_vcrecord(cred_dict)
             field = DIFField.deserialize({"path": ["$.credentialSubject.test"]})
             assert await dif_pres_exch_handler.filter_by_field(field, vc_record_cred)
 
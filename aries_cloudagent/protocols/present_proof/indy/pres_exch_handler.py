@@ -9,12 +9,8 @@ from ....core.error import BaseError
 from ....core.profile import Profile
 from ....indy.holder import IndyHolder, IndyHolderError
 from ....indy.models.xform import indy_proof_req2non_revoc_intervals
-from ....ledger.multiple_ledger.ledger_requests_executor import (
-    GET_SCHEMA,
-    GET_REVOC_REG_DELTA,
-    IndyLedgerRequestsExecutor,
-)
-from ....multitenant.base import BaseMultitenantManager
+from ....indy.revocation_state import RevocationStateCache
+from ....ledger.multiple_ledger.ledger_artifacts import IndyLedgerArtifacts
 from ....revocation.models.revocation_registry import RevocationRegistry
 
 from ..v1_0.models.presentation_exchange import V10PresentationExchange
@@ -87,88 +83,56 @@ class IndyPresExchHandler:
                         f"Removed superfluous timestamp from requested_credentials {r} "
                         f"{reft} for non-revocable credential {req_item['cred_id']}"
                     )
-        # Get all schemas, credential definitions, and revocation registries in use
-        schemas = {}
-        cred_defs = {}
-        revocation_registries = {}
-
-        for credential in credentials.values():
-            schema_id = credential["schema_id"]
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    schema_id,
-                    txn_record_type=GET_SCHEMA,
-                )
-            )[1]
-            async with ledger:
-                if schema_id not in schemas:
-                    schemas[schema_id] = await ledger.get_schema(schema_id)
-                cred_def_id = credential["cred_def_id"]
-                if cred_def_id not in cred_defs:
-                    cred_defs[cred_def_id] = await ledger.get_credential_definition(
-                        cred_def_id
-                    )
-                if credential.get("rev_reg_id"):
-                    revocation_registry_id = credential["rev_reg_id"]
-                    if revocation_registry_id not in revocation_registries:
-                        revocation_registries[
-                            revocation_registry_id
-                        ] = RevocationRegistry.from_definition(
-                            await ledger.get_revoc_reg_def(revocation_registry_id), True
-                        )
-        # Get delta with non-revocation interval defined in "non_revoked"
+        # Get all schemas, credential definitions, and revocation registries in use,
+        # and deltas with non-revocation interval defined in "non_revoked"
         # of the presentation request or attributes
+        artifacts = IndyLedgerArtifacts(self._profile)
+        for credential in credentials.values():
+            artifacts.add_schema(credential["schema_id"])
+            artifacts.add_cred_def(credential["cred_def_id"])
+            if credential.get("rev_reg_id"):
+                artifacts.add_rev_reg_def(credential["rev_reg_id"])
         epoch_now = int(time.time())
-        revoc_reg_deltas = {}
-        for precis in requested_referents.values():  # cred_id, non-revoc interval
+        intervals = {}  # credential id -> (rev reg id, from, to)
+        for precis in requested_referents.values():
             credential_id = precis["cred_id"]
-            if not credentials[credential_id].get("rev_reg_id"):
-                continue
-            if "timestamp" in precis:
+            rev_reg_id = credentials[credential_id].get("rev_reg_id")
+            if not rev_reg_id or "timestamp" in precis or credential_id in intervals:
                 continue
-            rev_reg_id = credentials[credential_id]["rev_reg_id"]
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
+            reft_non_revoc_interval = precis.get("non_revoked")
+            if reft_non_revoc_interval:
+                intervals[credential_id] = (
                     rev_reg_id,
-                    txn_record_type=GET_REVOC_REG_DELTA,
+                    reft_non_revoc_interval.get("from", 0),
+                    reft_non_revoc_interval.get("to", epoch_now),
                 )
-            )[1]
-            async with ledger:
-                reft_non_revoc_interval = precis.get("non_revoked")
-                if reft_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_"
-                        f"{reft_non_revoc_interval.get('from', 0)}_"
-                        f"{reft_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            reft_non_revoc_interval.get("from", 0),
-                            reft_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
+                artifacts.add_rev_reg_delta(*intervals[credential_id])
+        await artifacts.fetch()
+
+        schemas = artifacts.schemas
+        cred_defs = artifacts.cred_defs
+        revocation_registries = {
+            rev_reg_id: RevocationRegistry.from_definition(rev_reg_def, True)
+            for (rev_reg_id, rev_reg_def) in artifacts.rev_reg_defs.items()
+        }
+        revoc_reg_deltas = {}
+        for (credential_id, interval) in intervals.items():
+            rev_reg_id = interval[0]
+            if interval not in revoc_reg_deltas:
+                (delta, delta_timestamp) = artifacts.rev_reg_deltas[interval]
+                revoc_reg_deltas[interval] = (
+                    rev_reg_id,
+                    credential_id,
+                    delta,
+                    delta_timestamp,
+                )
+            for stamp_me in requested_referents.values():
+                # often one cred satisfies many requested attrs/preds
+                if stamp_me["cred_id"] == credential_id:
+                    stamp_me["timestamp"] = revoc_reg_deltas[interval][3]
         # Get revocation states to prove non-revoked
         revocation_states = {}
+        revocation_state_cache = RevocationStateCache(self._profile)
         for (
             rev_reg_id,
             credential_id,
@@ -178,22 +142,27 @@ class IndyPresExchHandler:
             if rev_reg_id not in revocation_states:
                 revocation_states[rev_reg_id] = {}
             rev_reg = revocation_registries[rev_reg_id]
-            tails_local_path = await rev_reg.get_or_fetch_local_tails_path()
-            try:
-                revocation_states[rev_reg_id][delta_timestamp] = json.loads(
-                    await holder.create_revocation_state(
-                        credentials[credential_id]["cred_rev_id"],
+            with rev_reg.lease_local_tails_path(self._profile):
+                tails_local_path = await rev_reg.get_or_fetch_local_tails_path(
+                    self._profile
+                )
+                try:
+                    revocation_states[rev_reg_id][
+                        delta_timestamp
+                    ] = await revocation_state_cache.get_revocation_state(
+                        artifacts.ledgers[rev_reg_id],
                         rev_reg.reg_def,
+                        credentials[credential_id]["cred_rev_id"],
                         delta,
                         delta_timestamp,
                         tails_local_path,
                     )
-                )
-            except IndyHolderError as e:
-                LOGGER.error(
-                    f"Failed to create revocation state: {e.error_code}, {e.message}"
-                )
-                raise e
+                except IndyHolderError as e:
+                    LOGGER.error(
+                        "Failed to create revocation state: "
+                        f"{e.error_code}, {e.message}"
+                    )
+                    raise e
         for (referent, precis) in requested_referents.items():
             if "timestamp" not in precis:
                 continue
@@ -220,67 +189,30 @@ class IndyPresExchHandler:
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
         """Return schemas, cred_defs, rev_reg_defs, rev_reg_entries."""
-        schema_ids = []
-        cred_def_ids = []
-
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_reg_entries = {}
-
+        artifacts = IndyLedgerArtifacts(self._profile)
         for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    identifier["schema_id"],
-                    txn_record_type=GET_SCHEMA,
-                )
-            )[1]
-            async with ledger:
-                # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
+            artifacts.add_schema(identifier["schema_id"])
+            artifacts.add_cred_def(identifier["cred_def_id"])
+            if identifier.get("rev_reg_id"):
+                artifacts.add_rev_reg_def(identifier["rev_reg_id"])
+                if identifier.get("timestamp"):
+                    artifacts.add_rev_reg_entry(
+                        identifier["rev_reg_id"], identifier["timestamp"]
                     )
+        await artifacts.fetch()
 
-                if identifier["cred_def_id"] not in cred_defs:
-                    cred_defs[
-                        identifier["cred_def_id"]
-                    ] = await ledger.get_credential_definition(
-                        identifier["cred_def_id"]
-                    )
-
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[
-                            identifier["rev_reg_id"]
-                        ] = await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
-
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
-
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+        rev_reg_entries = {
+            rev_reg_id: {
+                timestamp: found_rev_reg_entry
+                for (timestamp, (found_rev_reg_entry, _found_timestamp)) in (
+                    entries.items()
+                )
+            }
+            for (rev_reg_id, entries) in artifacts.rev_reg_entries.items()
+        }
         return (
-            schemas,
-            cred_defs,
-            rev_reg_defs,
+            artifacts.schemas,
+            artifacts.cred_defs,
+            artifacts.rev_reg_defs,
             rev_reg_entries,
         )
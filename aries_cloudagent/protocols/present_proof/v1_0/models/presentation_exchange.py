@@ -38,7 +38,13 @@ class V10PresentationExchange(BaseExchangeRecord):
     RECORD_TYPE = "presentation_exchange_v10"
     RECORD_ID_NAME = "presentation_exchange_id"
     RECORD_TOPIC = "present_proof"
-    TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    TAG_NAMES = {
+        "~thread_id" if UNENCRYPTED_TAGS else "thread_id",
+        "connection_id",
+        "role",
+        "state",
+    }
+    ADDED_TAG_NAMES = ("connection_id", "role", "state")
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
@@ -32,7 +32,13 @@ class V20PresExRecord(BaseExchangeRecord):
     RECORD_TYPE = "pres_ex_v20"
     RECORD_ID_NAME = "pres_ex_id"
     RECORD_TOPIC = "present_proof_v2_0"
-    TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    TAG_NAMES = {
+        "~thread_id" if UNENCRYPTED_TAGS else "thread_id",
+        "connection_id",
+        "role",
+        "state",
+    }
+    ADDED_TAG_NAMES = ("connection_id", "role", "state")
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
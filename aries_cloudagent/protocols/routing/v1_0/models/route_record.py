@@ -5,6 +5,8 @@ from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
 from .....core.profile import ProfileSession
 from .....messaging.models.base_record import BaseRecord, BaseRecordSchema
 
+from ..route_index import WalletRouteIndex
+
 
 class RouteRecord(BaseRecord):
     """Class representing stored route information."""
@@ -95,6 +97,32 @@ class RouteRecord(BaseRecord):
         tag_filter = {"connection_id": connection_id}
         return await cls.retrieve_by_tag_filter(session, tag_filter)
 
+    async def post_save(self, session: ProfileSession, *args, **kwargs):
+        """Perform post-save actions.
+
+        Args:
+            session: The active profile session
+        """
+        await super().post_save(session, *args, **kwargs)
+
+        # keep the index of routes to wallets up to date
+        route_index = session.inject_or(WalletRouteIndex)
+        if route_index and self.wallet_id:
+            await route_index.add(self.recipient_key, self.wallet_id)
+
+    async def delete_record(self, session: ProfileSession):
+        """Perform route record deletion actions.
+
+        Args:
+            session (ProfileSession): session
+
+        """
+        await super().delete_record(session)
+
+        route_index = session.inject_or(WalletRouteIndex)
+        if route_index and self.wallet_id:
+            await route_index.remove(self.recipient_key)
+
     @property
     def record_value(self) -> dict:
         """Accessor for JSON record value."""
@@ -0,0 +1,149 @@
+"""Index of the wallets that recipient keys are routed to."""
+
+import logging
+import time
+
+from typing import Dict, Sequence
+
+from ....cache.base import BaseCache
+from ....core.profile import Profile, ProfileSession
+from ....storage.base import BaseStorage
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WalletRouteIndex:
+    """
+    In-memory index from recipient key to wallet id for multitenant relay.
+
+    The index holds the route records which route a recipient key to a wallet.
+    It is warmed from storage at startup and updated as route records are
+    saved and deleted. Keys not found in the index are looked up in storage,
+    so routes added by other agent instances sharing the storage are found.
+
+    Routes changed by other agent instances are not seen in the index, so
+    index entries are confirmed against the route records in storage once
+    they are older than `confirm_ttl`. When a shared cache is set, it is kept
+    current by all the agent instances and is consulted instead of the index.
+    """
+
+    RECORD_TYPE = "forward_route"
+    CACHE_PREFIX = "wallet_route::"
+    CONFIRM_TTL = 60
+
+    def __init__(
+        self, cache: BaseCache = None, cache_ttl: int = None, confirm_ttl: float = None
+    ):
+        """
+        Initialize a `WalletRouteIndex` instance.
+
+        Args:
+            cache: optional cache shared with other agent instances
+            cache_ttl: the number of seconds entries are kept in the shared cache
+            confirm_ttl: the number of seconds after which index entries are
+                confirmed against storage
+
+        """
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.confirm_ttl = self.CONFIRM_TTL if confirm_ttl is None else confirm_ttl
+        self._wallet_ids: Dict[str, str] = {}
+        self._expires: Dict[str, float] = {}
+
+    @property
+    def size(self) -> int:
+        """Accessor for the number of recipient keys in the index."""
+        return len(self._wallet_ids)
+
+    def _index(self, recipient_key: str, wallet_id: str):
+        """Add or refresh an entry in the in-memory index."""
+        self._wallet_ids[recipient_key] = wallet_id
+        self._expires[recipient_key] = time.perf_counter() + self.confirm_ttl
+
+    def _unindex(self, recipient_key: str):
+        """Remove an entry from the in-memory index."""
+        self._wallet_ids.pop(recipient_key, None)
+        self._expires.pop(recipient_key, None)
+
+    async def warm(self, profile: Profile):
+        """Load the routes to wallets from storage."""
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            records = await storage.find_all_records(self.RECORD_TYPE)
+        for record in records:
+            wallet_id = record.tags.get("wallet_id")
+            if wallet_id:
+                self._index(record.tags["recipient_key"], wallet_id)
+        LOGGER.debug("Loaded %d wallet routes", len(self._wallet_ids))
+
+    async def add(self, recipient_key: str, wallet_id: str):
+        """Add the route of a recipient key to a wallet."""
+        self._index(recipient_key, wallet_id)
+        if self.cache:
+            await self.cache.set(
+                self.CACHE_PREFIX + recipient_key, wallet_id, self.cache_ttl
+            )
+
+    async def remove(self, recipient_key: str):
+        """Remove the route of a recipient key."""
+        self._unindex(recipient_key)
+        if self.cache:
+            await self.cache.clear(self.CACHE_PREFIX + recipient_key)
+
+    async def remove_wallet(self, wallet_id: str):
+        """Remove the routes of all recipient keys to a wallet."""
+        for recipient_key in [
+            key for (key, value) in self._wallet_ids.items() if value == wallet_id
+        ]:
+            await self.remove(recipient_key)
+
+    async def get_wallet_ids(
+        self, session: ProfileSession, recipient_keys: Sequence[str]
+    ) -> Dict[str, str]:
+        """
+        Look up the wallets that recipient keys are routed to.
+
+        Keys missing from the index or the shared cache, and index entries due
+        to be confirmed, are looked up together in a single query. Keys no
+        longer routed in storage are removed from the index.
+
+        Args:
+            session: the root profile session, for storage access
+            recipient_keys: the recipient keys to look up
+
+        Returns:
+            A dictionary of the wallet ids of the routed recipient keys
+
+        """
+        wallet_ids = {}
+        missing = []
+        now = time.perf_counter()
+        for recipient_key in recipient_keys:
+            if self.cache:
+                wallet_id = await self.cache.get(self.CACHE_PREFIX + recipient_key)
+                if wallet_id:
+                    self._index(recipient_key, wallet_id)
+            else:
+                wallet_id = self._wallet_ids.get(recipient_key)
+                if wallet_id and self._expires[recipient_key] <= now:
+                    wallet_id = None
+            if wallet_id:
+                wallet_ids[recipient_key] = wallet_id
+            else:
+                missing.append(recipient_key)
+
+        if missing:
+            storage = session.inject(BaseStorage)
+            records = await storage.find_all_records(
+                self.RECORD_TYPE, {"recipient_key": {"$in": missing}}
+            )
+            for record in records:
+                wallet_id = record.tags.get("wallet_id")
+                if wallet_id:
+                    await self.add(record.tags["recipient_key"], wallet_id)
+                    wallet_ids[record.tags["recipient_key"]] = wallet_id
+            for recipient_key in missing:
+                if recipient_key not in wallet_ids:
+                    self._unindex(recipient_key)
+
+        return wallet_ids
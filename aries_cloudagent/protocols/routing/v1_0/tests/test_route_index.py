@@ -0,0 +1,119 @@
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from .....cache.in_memory import InMemoryCache
+from .....core.in_memory import InMemoryProfile
+from .....storage.base import BaseStorage
+from ..models.route_record import RouteRecord
+from ..route_index import WalletRouteIndex
+
+
+class TestWalletRouteIndex(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        async with self.profile.session() as session:
+            await RouteRecord(wallet_id="wallet-1", recipient_key="key-1").save(session)
+            await RouteRecord(wallet_id="wallet-2", recipient_key="key-2").save(session)
+            await RouteRecord(connection_id="conn", recipient_key="key-3").save(session)
+
+    async def test_warm(self):
+        route_index = WalletRouteIndex()
+        await route_index.warm(self.profile)
+        assert route_index.size == 2
+
+        async with self.profile.session() as session:
+            with async_mock.patch.object(
+                session.inject(BaseStorage), "find_all_records"
+            ) as find_all_records:
+                assert await route_index.get_wallet_ids(
+                    session, ["key-1", "key-2"]
+                ) == {"key-1": "wallet-1", "key-2": "wallet-2"}
+                find_all_records.assert_not_called()
+
+    async def test_get_wallet_ids_batch_lookup(self):
+        route_index = WalletRouteIndex()
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            with async_mock.patch.object(
+                storage, "find_all_records", wraps=storage.find_all_records
+            ) as find_all_records:
+                assert await route_index.get_wallet_ids(
+                    session, ["key-1", "key-2", "key-3", "key-4"]
+                ) == {"key-1": "wallet-1", "key-2": "wallet-2"}
+                find_all_records.assert_called_once()
+
+                # found keys are kept in the index
+                await route_index.get_wallet_ids(session, ["key-1", "key-2"])
+                find_all_records.assert_called_once()
+
+    async def test_record_save_delete(self):
+        route_index = WalletRouteIndex()
+        self.profile.context.injector.bind_instance(WalletRouteIndex, route_index)
+
+        async with self.profile.session() as session:
+            record = RouteRecord(wallet_id="wallet-5", recipient_key="key-5")
+            await record.save(session)
+            assert route_index._wallet_ids == {"key-5": "wallet-5"}
+
+            await RouteRecord(connection_id="conn", recipient_key="key-6").save(session)
+            assert route_index.size == 1
+
+            await record.delete_record(session)
+            assert route_index.size == 0
+
+    async def test_remove_wallet(self):
+        route_index = WalletRouteIndex()
+        await route_index.warm(self.profile)
+        await route_index.add("key-5", "wallet-1")
+
+        await route_index.remove_wallet("wallet-1")
+        assert route_index._wallet_ids == {"key-2": "wallet-2"}
+
+    async def test_shared_cache(self):
+        cache = InMemoryCache()
+        route_index = WalletRouteIndex(cache)
+        await route_index.add("key-5", "wallet-5")
+        assert await cache.get("wallet_route::key-5") == "wallet-5"
+
+        # another instance finds the route in the shared cache
+        other_index = WalletRouteIndex(cache)
+        async with self.profile.session() as session:
+            with async_mock.patch.object(
+                session.inject(BaseStorage), "find_all_records"
+            ) as find_all_records:
+                assert await other_index.get_wallet_ids(session, ["key-5"]) == {
+                    "key-5": "wallet-5"
+                }
+                find_all_records.assert_not_called()
+
+        await route_index.remove("key-5")
+        assert await cache.get("wallet_route::key-5") is None
+
+    async def test_confirm_expired_entries(self):
+        route_index = WalletRouteIndex(confirm_ttl=0)
+        await route_index.warm(self.profile)
+
+        # the route is deleted by another agent instance
+        async with self.profile.session() as session:
+            record = await RouteRecord.retrieve_by_recipient_key(session, "key-1")
+            await record.delete_record(session)
+
+            assert await route_index.get_wallet_ids(session, ["key-1", "key-2"]) == {
+                "key-2": "wallet-2"
+            }
+        assert route_index._wallet_ids == {"key-2": "wallet-2"}
+
+    async def test_shared_cache_consulted_first(self):
+        cache = InMemoryCache()
+        route_index = WalletRouteIndex(cache)
+        await route_index.add("key-1", "wallet-1")
+
+        # the route is deleted by another agent instance
+        other_index = WalletRouteIndex(cache)
+        self.profile.context.injector.bind_instance(WalletRouteIndex, other_index)
+        async with self.profile.session() as session:
+            record = await RouteRecord.retrieve_by_recipient_key(session, "key-1")
+            await record.delete_record(session)
+
+            assert await route_index.get_wallet_ids(session, ["key-1"]) == {}
+        assert route_index.size == 0
@@ -40,6 +40,7 @@ class ResolutionMetadata(NamedTuple):
     resolver: str
     retrieved_time: str
     duration: int
+    cache_hit: bool = False
 
     def serialize(self) -> dict:
         """Return serialized resolution metadata."""
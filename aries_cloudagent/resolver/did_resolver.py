@@ -5,15 +5,18 @@ responsible for keeping track of all resolvers. more importantly
 retrieving did's from different sources provided by the method type.
 """
 
+from copy import deepcopy
 from datetime import datetime
 from itertools import chain
 import logging
-from typing import Sequence, Tuple, Type, TypeVar, Union
+from typing import Mapping, Sequence, Type, TypeVar, Union
 
 from pydid import DID, DIDError, DIDUrl, Resource, NonconformantDocument
 from pydid.doc.doc import IDNotFoundError
 
+from ..cache.base import BaseCache
 from ..core.profile import Profile
+from ..ledger.base import BaseLedger
 from .base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -21,6 +24,7 @@ from .base import (
     ResolutionMetadata,
     ResolutionResult,
     ResolverError,
+    ResolverType,
 )
 from .did_resolver_registry import DIDResolverRegistry
 
@@ -33,19 +37,44 @@ ResourceType = TypeVar("ResourceType", bound=Resource)
 class DIDResolver:
     """did resolver singleton."""
 
+    DEFAULT_CACHE_TTL = 300
+    DEFAULT_NEGATIVE_CACHE_TTL = 30
+
     def __init__(self, registry: DIDResolverRegistry):
         """Create DID Resolver."""
         self.did_resolver_registry = registry
 
-    async def _resolve(
-        self, profile: Profile, did: Union[str, DID]
-    ) -> Tuple[BaseDIDResolver, dict]:
-        """Retrieve doc and return with resolver."""
-        # TODO Cache results
-        if isinstance(did, DID):
-            did = str(did)
-        else:
-            DID.validate(did)
+    @classmethod
+    def _cache_ttls(cls, profile: Profile, did: str) -> Sequence[int]:
+        """Get the cache TTLs for resolved and not found results for a DID."""
+        method = did.split(":", 2)[1]
+        ttl = (profile.settings.get("resolver.cache_method_ttls") or {}).get(method)
+        if ttl is None:
+            ttl = profile.settings.get("resolver.cache_ttl", cls.DEFAULT_CACHE_TTL)
+        negative_ttl = profile.settings.get(
+            "resolver.negative_cache_ttl", cls.DEFAULT_NEGATIVE_CACHE_TTL
+        )
+        return ttl, negative_ttl
+
+    @classmethod
+    def _cache_scope(cls, profile: Profile) -> str:
+        """
+        Get the scope of cached results for a profile.
+
+        Profiles resolving against different ledgers do not share results.
+        """
+        ledger = profile.inject_or(BaseLedger)
+        pool_name = getattr(ledger, "pool_name", None) or profile.settings.get(
+            "ledger.pool_name"
+        )
+        ledger_ids = sorted(
+            str(config.get("id"))
+            for config in profile.settings.get("ledger.ledger_config_list") or []
+        )
+        return ",".join([pool_name or ""] + ledger_ids)
+
+    async def _resolve_uncached(self, profile: Profile, did: str) -> Mapping:
+        """Retrieve doc and return with details of the resolver."""
         for resolver in await self._match_did_to_resolver(profile, did):
             try:
                 LOGGER.debug("Resolving DID %s with %s", did, resolver)
@@ -53,16 +82,58 @@ class DIDResolver:
                     profile,
                     did,
                 )
-                return resolver, document
+                return {
+                    "did_document": document,
+                    "resolver_type": resolver.type.value,
+                    "resolver": type(resolver).__qualname__,
+                    "retrieved_time": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
             except DIDNotFound:
                 LOGGER.debug("DID %s not found by resolver %s", did, resolver)
 
         raise DIDNotFound(f"DID {did} could not be resolved")
 
+    async def _resolve(self, profile: Profile, did: Union[str, DID]) -> Mapping:
+        """
+        Retrieve doc and return with details of the resolver, using the cache.
+
+        Concurrent requests for the same DID are coalesced, and DIDs which
+        could not be found are also cached, for a shorter period. Callers
+        receive a copy of the cached result, so may modify it.
+        """
+        if isinstance(did, DID):
+            did = str(did)
+        else:
+            DID.validate(did)
+
+        cache = profile.inject_or(BaseCache)
+        ttl, negative_ttl = self._cache_ttls(profile, did)
+        if not cache or not (ttl or negative_ttl):
+            return {**await self._resolve_uncached(profile, did), "cache_hit": False}
+
+        cache_key = f"did_resolver::{self._cache_scope(profile)}::{did}"
+        async with cache.acquire(cache_key) as entry:
+            if entry.result:
+                result = entry.result
+                cache_hit = True
+            else:
+                try:
+                    result = await self._resolve_uncached(profile, did)
+                except DIDNotFound:
+                    if negative_ttl:
+                        await entry.set_result({"not_found": True}, negative_ttl)
+                    raise
+                if ttl:
+                    await entry.set_result(result, ttl)
+                cache_hit = False
+        if result.get("not_found"):
+            raise DIDNotFound(f"DID {did} could not be resolved")
+        return {**deepcopy(result), "cache_hit": cache_hit}
+
     async def resolve(self, profile: Profile, did: Union[str, DID]) -> dict:
         """Resolve a DID."""
-        _, doc = await self._resolve(profile, did)
-        return doc
+        result = await self._resolve(profile, did)
+        return result["did_document"]
 
     async def resolve_with_metadata(
         self, profile: Profile, did: Union[str, DID]
@@ -70,15 +141,18 @@ class DIDResolver:
         """Resolve a DID and return the ResolutionResult."""
         resolution_start_time = datetime.utcnow()
 
-        resolver, doc = await self._resolve(profile, did)
+        result = await self._resolve(profile, did)
 
         time_now = datetime.utcnow()
         duration = int((time_now - resolution_start_time).total_seconds() * 1000)
-        retrieved_time = time_now.strftime("%Y-%m-%dT%H:%M:%SZ")
         resolver_metadata = ResolutionMetadata(
-            resolver.type, type(resolver).__qualname__, retrieved_time, duration
+            ResolverType(result["resolver_type"]),
+            result["resolver"],
+            result["retrieved_time"],
+            duration,
+            result["cache_hit"],
         )
-        return ResolutionResult(doc, resolver_metadata)
+        return ResolutionResult(result["did_document"], resolver_metadata)
 
     async def _match_did_to_resolver(
         self, profile: Profile, did: str
@@ -106,7 +180,6 @@ class DIDResolver:
         self, profile: Profile, did_url: str, *, cls: Type[ResourceType] = Resource
     ) -> ResourceType:
         """Dereference a DID URL to its corresponding DID Doc object."""
-        # TODO Use cached DID Docs when possible
         try:
             parsed = DIDUrl.parse(did_url)
             if not parsed.did:
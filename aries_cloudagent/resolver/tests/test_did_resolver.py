@@ -1,5 +1,9 @@
 """Test did resolver registry."""
 
+import asyncio
+
+from copy import deepcopy
+
 from typing import Pattern
 
 import re
@@ -9,6 +13,9 @@ import pytest
 from asynctest import mock as async_mock
 from pydid import DID, DIDDocument, VerificationMethod
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
 from ..base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -97,7 +104,12 @@ def resolver():
 
 @pytest.fixture
 def profile():
-    yield async_mock.MagicMock()
+    yield InMemoryProfile.test_profile()
+
+
+@pytest.fixture
+def cached_profile():
+    yield InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
 
 
 def test_create_resolver(resolver):
@@ -205,3 +217,106 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver(registry)
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+class CountingResolver(MockResolver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    async def _resolve(self, profile, did):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return await super()._resolve(profile, did)
+
+
+def counting_resolver(resolved):
+    registry = DIDResolverRegistry()
+    counting = CountingResolver(["sov", "web", "example"], resolved)
+    registry.register(counting)
+    return DIDResolver(registry), counting
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached(cached_profile):
+    resolver, counting = counting_resolver(DIDDocument.deserialize(DOC))
+    first = await resolver.resolve_with_metadata(cached_profile, "did:example:1234abcd")
+    assert not first.metadata.cache_hit
+    second = await resolver.resolve_with_metadata(
+        cached_profile, "did:example:1234abcd"
+    )
+    assert second.metadata.cache_hit
+    assert second.metadata.retrieved_time == first.metadata.retrieved_time
+    assert second.metadata.resolver == "CountingResolver"
+    assert second.serialize()["metadata"]["cache_hit"] is True
+    assert second.did_document == first.did_document
+    await resolver.dereference(cached_profile, "did:example:1234abcd#4")
+    assert counting.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached_copy(cached_profile):
+    resolver, counting = counting_resolver(DIDDocument.deserialize(DOC))
+    first = await resolver.resolve(cached_profile, "did:example:1234abcd")
+    expected = deepcopy(first)
+    first["id"] = "did:example:changed"
+    first["verificationMethod"].clear()
+    second = await resolver.resolve(cached_profile, "did:example:1234abcd")
+    assert second == expected
+    assert counting.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_scoped_to_ledger():
+    cache = InMemoryCache()
+    profiles = [
+        InMemoryProfile.test_profile(
+            {"ledger.pool_name": pool_name}, bind={BaseCache: cache}
+        )
+        for pool_name in ("pool1", "pool2", "pool1")
+    ]
+    resolver, counting = counting_resolver(DIDDocument.deserialize(DOC))
+    for profile in profiles:
+        await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_coalesced(cached_profile):
+    resolver, counting = counting_resolver(DIDDocument.deserialize(DOC))
+    docs = await asyncio.gather(
+        *(resolver.resolve(cached_profile, TEST_DID0) for _ in range(5))
+    )
+    assert all(doc == docs[0] for doc in docs)
+    assert counting.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_not_found(cached_profile):
+    resolver, counting = counting_resolver(DIDNotFound())
+    for _ in range(2):
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(cached_profile, TEST_DID0)
+    assert counting.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_method_ttl():
+    profile = InMemoryProfile.test_profile(
+        {
+            "resolver.cache_method_ttls": {"web": 0},
+            "resolver.negative_cache_ttl": 0,
+        },
+        bind={BaseCache: InMemoryCache()},
+    )
+    resolver, counting = counting_resolver(DIDDocument.deserialize(DOC))
+    for _ in range(2):
+        await resolver.resolve(profile, "did:web:example.com")
+        await resolver.resolve(profile, TEST_DID0)
+    assert counting.calls == 3
+
+    counting.resolved = DIDNotFound()
+    for _ in range(2):
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(profile, "did:sov:WgWxqztrNooG92RXvxSTWv")
+    assert counting.calls == 5
@@ -401,6 +401,55 @@ class IssuerRevRegRecord(BaseRecord):
             session, reason=f"Marked rev reg {self.revoc_reg_id} as {self.state}"
         )
 
+    async def mark_full(self, profile: Profile) -> bool:
+        """
+        Mark the registry full, unless another issuance already has.
+
+        Returns:
+            Whether this call changed the registry state to full
+
+        """
+        async with profile.transaction() as txn:
+            rec = await IssuerRevRegRecord.retrieve_by_id(
+                txn, self.record_id, for_update=True
+            )
+            if rec.state == IssuerRevRegRecord.STATE_FULL:
+                return False
+            await rec.set_state(txn, IssuerRevRegRecord.STATE_FULL)
+            await txn.commit()
+        self.state = rec.state
+        return True
+
+    @staticmethod
+    def uses_index_blocks(profile: Profile) -> bool:
+        """
+        Check whether credential indices are reserved in blocks.
+
+        Indices reserved in blocks are issued out of order, so the registry is
+        only known to be full once the issuer reports none left to reserve.
+
+        """
+        return (profile.settings.get("revocation.index_block_size") or 1) > 1
+
+    async def mark_exhausted(self, profile: Profile) -> bool:
+        """
+        Mark the registry full after the issuer reported it has no index left.
+
+        With indices reserved in blocks, only the first issuance to find the
+        registry full is told to send the next one. Otherwise the state is set
+        regardless: another instance may have issued the last credential at
+        near the same time, and has sent the next registry.
+
+        Returns:
+            Whether the caller should send the next registry
+
+        """
+        if self.uses_index_blocks(profile):
+            return await self.mark_full(profile)
+        async with profile.session() as session:
+            await self.set_state(session, IssuerRevRegRecord.STATE_FULL)
+        return False
+
     def __eq__(self, other: Any) -> bool:
         """Comparison between records."""
         return super().__eq__(other)
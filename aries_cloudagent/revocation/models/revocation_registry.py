@@ -1,23 +1,22 @@
 """Classes for managing a revocation registry."""
-import http
 import logging
-import os
 import re
 
 from os.path import join
 from pathlib import Path
 
-from requests import Session
-from requests.exceptions import RequestException
-
+from ...core.profile import Profile
 from ...indy.util import indy_client_dir
+from ...tails.cache import TailsCache
+from ...tails.error import TailsDownloadError
 
 from ..error import RevocationError
-import hashlib
-import base58
 
 LOGGER = logging.getLogger(__name__)
 
+# used when no tails cache is configured in the profile
+DEFAULT_TAILS_CACHE = TailsCache()
+
 
 class RevocationRegistry:
     """Manage a revocation registry and tails file."""
@@ -154,8 +153,13 @@ class RevocationRegistry:
         tails_file_path = Path(self.get_receiving_tails_local_path())
         return tails_file_path.is_file()
 
-    async def retrieve_tails(self):
-        """Fetch the tails file from the public URI."""
+    async def retrieve_tails(self, profile: Profile = None):
+        """
+        Fetch the tails file from the public URI.
+
+        Args:
+            profile: optional profile providing the shared tails cache
+        """
         if not self._tails_public_uri:
             raise RevocationError("Tails file public URI is empty")
 
@@ -163,50 +167,46 @@ class RevocationRegistry:
             "Downloading the tails file for the revocation registry: %s",
             self.registry_id,
         )
-
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        file_hasher = hashlib.sha256()
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    # Should this directly raise an Error?
-                    if resp.status_code != http.HTTPStatus.OK:
-                        LOGGER.warning(
-                            f"Unexpected status code for tails file: {resp.status_code}"
-                        )
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
-
-        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-        if download_tails_hash != self.tails_hash:
-            try:
-                os.remove(tails_file_path)
-                tails_file_dir.rmdir()
-            except OSError as err:
-                LOGGER.warning(f"Could not delete invalid tails file: {err}")
-
-            raise RevocationError(
-                "The hash of the downloaded tails file does not match."
+        try:
+            self.tails_local_path = await self.get_tails_cache(profile).get_tails_file(
+                self.get_receiving_tails_local_path(),
+                self._tails_public_uri,
+                self.tails_hash,
             )
-
-        self.tails_local_path = tails_file_path
+        except TailsDownloadError as err:
+            raise RevocationError(err.message) from err
         return self.tails_local_path
 
-    async def get_or_fetch_local_tails_path(self):
-        """Get the local tails path, retrieving from the remote if necessary."""
+    async def get_or_fetch_local_tails_path(self, profile: Profile = None):
+        """
+        Get the local tails path, retrieving from the remote if necessary.
+
+        Args:
+            profile: optional profile providing the shared tails cache
+        """
         tails_file_path = self.get_receiving_tails_local_path()
         if Path(tails_file_path).is_file():
-            return tails_file_path
-        return await self.retrieve_tails()
+            # go through the cache to record the use of the tails file
+            return await self.get_tails_cache(profile).get_tails_file(
+                tails_file_path, self._tails_public_uri, self.tails_hash
+            )
+        return await self.retrieve_tails(profile)
+
+    def lease_local_tails_path(self, profile: Profile = None):
+        """
+        Protect the local tails file from eviction while it is in use.
+
+        Args:
+            profile: optional profile providing the shared tails cache
+        """
+        return self.get_tails_cache(profile).lease(
+            self.get_receiving_tails_local_path()
+        )
+
+    @staticmethod
+    def get_tails_cache(profile: Profile = None) -> TailsCache:
+        """Accessor for the profile's shared tails cache, or the default one."""
+        return (profile and profile.inject_or(TailsCache)) or DEFAULT_TAILS_CACHE
 
     def __repr__(self) -> str:
         """Return a human readable representation of this class."""
@@ -152,6 +152,46 @@ class TestIssuerRevRegRecord(AsyncTestCase):
         assert isinstance(model_instance, IssuerRevRegRecord)
         assert model_instance == rec
 
+    async def test_mark_full(self):
+        rec = IssuerRevRegRecord(
+            revoc_reg_id=REV_REG_ID,
+            cred_def_id=CRED_DEF_ID,
+            state=IssuerRevRegRecord.STATE_ACTIVE,
+        )
+        async with self.profile.session() as session:
+            await rec.save(session)
+        # another instance of the same record finds it already full
+        other = IssuerRevRegRecord.deserialize(rec.serialize())
+
+        assert await rec.mark_full(self.profile)
+        assert rec.state == IssuerRevRegRecord.STATE_FULL
+        assert not await other.mark_full(self.profile)
+        async with self.profile.session() as session:
+            stored = await IssuerRevRegRecord.retrieve_by_id(session, rec.record_id)
+        assert stored.state == IssuerRevRegRecord.STATE_FULL
+
+    async def test_mark_exhausted(self):
+        rec = IssuerRevRegRecord(
+            revoc_reg_id=REV_REG_ID,
+            cred_def_id=CRED_DEF_ID,
+            state=IssuerRevRegRecord.STATE_ACTIVE,
+        )
+        async with self.profile.session() as session:
+            await rec.save(session)
+        other = IssuerRevRegRecord.deserialize(rec.serialize())
+
+        # set full regardless: the instance issuing the last index sends the next
+        assert not await rec.mark_exhausted(self.profile)
+        assert rec.state == IssuerRevRegRecord.STATE_FULL
+
+        # with index blocks, only the first to find it full sends the next
+        self.profile.settings["revocation.index_block_size"] = 3
+        rec.state = IssuerRevRegRecord.STATE_ACTIVE
+        async with self.profile.session() as session:
+            await rec.save(session)
+        assert await rec.mark_exhausted(self.profile)
+        assert not await other.mark_exhausted(self.profile)
+
     async def test_operate_on_full_record(self):
         rec_full = IssuerRevRegRecord(
             issuer_did=TEST_DID,
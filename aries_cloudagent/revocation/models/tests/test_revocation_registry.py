@@ -7,9 +7,9 @@ from copy import deepcopy
 from pathlib import Path
 from shutil import rmtree
 
-import base58
-
+from ....core.in_memory import InMemoryProfile
 from ....indy.util import indy_client_dir
+from ....tails.cache import TailsCache
 
 from ...error import RevocationError
 
@@ -87,10 +87,23 @@ class TestRevocationRegistry(AsyncTestCase):
         rev_reg_loc = RevocationRegistry.from_definition(REV_REG_DEF, public_def=False)
         assert rev_reg_loc.get_receiving_tails_local_path() == TAILS_LOCAL
 
-        with async_mock.patch.object(Path, "is_file", autospec=True) as mock_is_file:
+        mock_cache = async_mock.MagicMock(
+            get_tails_file=async_mock.CoroutineMock(return_value=TAILS_LOCAL)
+        )
+        with async_mock.patch.object(
+            Path, "is_file", autospec=True
+        ) as mock_is_file, async_mock.patch.object(
+            test_module, "DEFAULT_TAILS_CACHE", mock_cache
+        ):
             mock_is_file.return_value = True
 
+            # a local tails file is still used through the cache
             assert await rev_reg_loc.get_or_fetch_local_tails_path() == TAILS_LOCAL
+            mock_cache.get_tails_file.assert_called_once_with(
+                TAILS_LOCAL, None, TAILS_HASH
+            )
+            rev_reg_loc.lease_local_tails_path()
+            mock_cache.lease.assert_called_once_with(TAILS_LOCAL)
 
         rmtree(TAILS_DIR, ignore_errors=True)
         assert not rev_reg_loc.has_local_tails_file()
@@ -105,69 +118,23 @@ class TestRevocationRegistry(AsyncTestCase):
         rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
         rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
 
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
+        mock_cache = async_mock.MagicMock(
+            get_tails_file=async_mock.CoroutineMock(
+                side_effect=test_module.TailsDownloadError("Not this time")
             )
-            more_magic.get = async_mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = async_mock.MagicMock()
+        )
         with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
-
-            rmtree(TAILS_DIR, ignore_errors=True)
+            test_module, "DEFAULT_TAILS_CACHE", mock_cache
+        ), self.assertRaises(RevocationError) as x_retrieve:
+            await rev_reg.retrieve_tails()
+        assert x_retrieve.exception.message == "Not this time"
 
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, async_mock.patch.object(
-            base58, "b58encode", async_mock.MagicMock()
-        ) as mock_b58enc, async_mock.patch.object(
-            Path, "is_file", autospec=True
-        ) as mock_is_file:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
+        profile = InMemoryProfile.test_profile()
+        mock_cache.get_tails_file = async_mock.CoroutineMock(return_value="local")
+        profile.context.injector.bind_instance(TailsCache, mock_cache)
+        with async_mock.patch.object(Path, "is_file", autospec=True) as mock_is_file:
             mock_is_file.return_value = False
-
-            mock_b58enc.return_value = async_mock.MagicMock(
-                decode=async_mock.MagicMock(return_value=TAILS_HASH)
-            )
-            await rev_reg.get_or_fetch_local_tails_path()
-
-            rmtree(TAILS_DIR, ignore_errors=True)
+            assert await rev_reg.get_or_fetch_local_tails_path(profile) == "local"
+        mock_cache.get_tails_file.assert_called_once_with(
+            TAILS_LOCAL, "http://sample.ca:8088/path", TAILS_HASH
+        )
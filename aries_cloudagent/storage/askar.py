@@ -197,6 +197,48 @@ class AskarStorage(BaseStorage):
             )
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a particular type filter and tag query."""
+        for_update = bool(options and options.get("forUpdate"))
+        try:
+            if for_update or self._session.is_transaction:
+                # Askar sessions have no offset on fetches: fetch up to the end
+                # of the page so uncommitted writes are seen, and skip
+                rows = await self._session.handle.fetch_all(
+                    type_filter, tag_query, limit=offset + limit, for_update=for_update
+                )
+                rows = list(rows)[offset:]
+            else:
+                # the store skips to the page without loading the records before it
+                rows = [
+                    row
+                    async for row in self._session.profile.store.scan(
+                        type_filter,
+                        tag_query,
+                        offset=offset,
+                        limit=limit,
+                        profile=self._session.profile.profile_id,
+                    )
+                ]
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+        return [
+            StorageRecord(
+                type=row.category,
+                id=row.name,
+                value=None if row.value is None else row.value.decode("utf-8"),
+                tags=row.tags,
+            )
+            for row in rows
+        ]
+
     async def delete_all_records(
         self,
         type_filter: str,
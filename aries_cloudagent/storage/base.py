@@ -103,6 +103,30 @@ class BaseStorage(ABC):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
 
+    @abstractmethod
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """
+        Retrieve a page of records matching a particular type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: Maximum number of records to return
+            offset: Number of matching records to skip
+            options: Dictionary of backend-specific options
+
+        Returns:
+            A list of `StorageRecord` instances
+
+        """
+
     @abstractmethod
     async def delete_all_records(
         self,
@@ -121,6 +121,27 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
                 results.append(record)
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a particular type filter and tag query."""
+        results = []
+        skip = offset or 0
+        for record in self.profile.records.values():
+            if limit is not None and len(results) >= limit:
+                break
+            if record.type == type_filter and tag_query_match(record.tags, tag_query):
+                if skip:
+                    skip -= 1
+                else:
+                    results.append(record)
+        return results
+
     async def delete_all_records(
         self,
         type_filter: str,
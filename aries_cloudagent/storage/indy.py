@@ -185,6 +185,32 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
                 break
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a particular type filter and tag query."""
+        results = []
+        skip = offset or 0
+        search = self.search_records(type_filter, tag_query, options=options)
+        try:
+            while limit is None or len(results) < limit:
+                buf = await search.fetch()
+                if not buf:
+                    break
+                if skip >= len(buf):
+                    skip -= len(buf)
+                    continue
+                results.extend(buf[skip:])
+                skip = 0
+        finally:
+            await search.close()
+        return results if limit is None else results[:limit]
+
     async def delete_all_records(
         self,
         type_filter: str,
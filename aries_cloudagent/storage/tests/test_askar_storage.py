@@ -283,6 +283,36 @@ class TestAskarStorage(test_in_memory_storage.TestInMemoryStorage):
                 with pytest.raises(StorageSearchError):
                     await search.close()
 
+    @pytest.mark.asyncio
+    async def test_find_paginated_records(self, store):
+        ids = []
+        for i in range(5):
+            record = test_in_memory_storage.test_record()
+            await store.add_record(record)
+            ids.append(record.id)
+
+        rows = await store.find_paginated_records("TYPE", limit=2, offset=0)
+        rows += await store.find_paginated_records("TYPE", limit=2, offset=2)
+        rows += await store.find_paginated_records("TYPE", limit=2, offset=4)
+        assert sorted(row.id for row in rows) == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_find_paginated_records_transaction(self, store):
+        for i in range(3):
+            await store.add_record(test_in_memory_storage.test_record())
+
+        async with store.session.profile.transaction() as txn:
+            storage = txn.inject(BaseStorage)
+            await storage.add_record(test_in_memory_storage.test_record())
+            rows = await storage.find_paginated_records("TYPE", limit=10, offset=1)
+            assert len(rows) == 3
+            rows = await storage.find_paginated_records("TYPE", limit=2, offset=3)
+            assert len(rows) == 1
+            await txn.rollback()
+
+        rows = await store.find_paginated_records("TYPE", limit=10)
+        assert len(rows) == 3
+
     # TODO get these to run in docker ci/cd
     @pytest.mark.skip
     @pytest.mark.asyncio
@@ -144,6 +144,24 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_find_paginated_records(self, store):
+        for i in range(5):
+            await store.add_record(test_record({"parity": str(i % 2)}))
+        await store.add_record(test_missing_record())
+
+        rows = await store.find_paginated_records("TYPE", {}, limit=2, offset=0)
+        assert len(rows) == 2
+        rows_next = await store.find_paginated_records("TYPE", {}, limit=2, offset=2)
+        assert len(rows_next) == 2
+        assert not {row.id for row in rows} & {row.id for row in rows_next}
+        rows = await store.find_paginated_records("TYPE", {}, limit=10, offset=4)
+        assert len(rows) == 1
+
+        rows = await store.find_paginated_records("TYPE", {"parity": "0"}, limit=10)
+        assert len(rows) == 3
+        assert all(row.tags["parity"] == "0" for row in rows)
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store):
         record = test_record({"tag": "one"})
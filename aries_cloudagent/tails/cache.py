@@ -0,0 +1,294 @@
+"""Shared cache of tails files downloaded from tails servers."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Set
+
+import base58
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from ..indy.util import indy_client_dir
+from ..utils.stats import Collector
+
+from .error import TailsDownloadError
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536  # should be multiple of 32 bytes for sha256
+
+
+class PartialTailsFile:
+    """A tails file being downloaded, and the hash of the content received."""
+
+    def __init__(self, path: str):
+        """Initialize a `PartialTailsFile` instance."""
+        self.path = path
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def load(self):
+        """Hash any content left by an interrupted download."""
+        try:
+            with open(self.path, "rb") as partial:
+                for chunk in iter(lambda: partial.read(CHUNK_SIZE), b""):
+                    self.hasher.update(chunk)
+                    self.size += len(chunk)
+        except FileNotFoundError:
+            pass
+
+    def reset(self):
+        """Discard the content received."""
+        self.open(append=False).close()
+
+    def open(self, append: bool):
+        """Open the file for writing, discarding any content unless appending."""
+        if not append:
+            self.hasher = hashlib.sha256()
+            self.size = 0
+        return open(self.path, "ab" if append else "wb")
+
+    def write(self, file, chunk: bytes):
+        """Write a chunk of content to the file, updating the hash."""
+        file.write(chunk)
+        self.hasher.update(chunk)
+        self.size += len(chunk)
+
+    @property
+    def tails_hash(self) -> str:
+        """Accessor for the tails hash of the content received."""
+        return base58.b58encode(self.hasher.digest()).decode("utf-8")
+
+
+class TailsCache:
+    """
+    Cache of tails files downloaded from tails servers.
+
+    Downloads stream to a partial file, verifying the tails hash as content
+    arrives, and resume with an HTTP range request when interrupted.
+    Concurrent requests for the same tails file share one download. Files
+    downloaded by the cache are marked and, when a maximum size is set, the
+    least recently used files are removed to stay under it. Files leased by
+    an operation in progress, and tails files created by this agent as an
+    issuer, are never removed.
+    """
+
+    MARKER_SUFFIX = ".cached"
+    PARTIAL_SUFFIX = ".part"
+
+    def __init__(
+        self,
+        *,
+        max_size: int = None,
+        max_attempts: int = 3,
+        request_timeout: float = 30.0,
+        tails_dir: str = None,
+        collector: Collector = None,
+    ):
+        """
+        Initialize a `TailsCache` instance.
+
+        Args:
+            max_size: the maximum total size in bytes of downloaded tails files
+            max_attempts: the number of attempts to make for each download
+            request_timeout: the number of seconds to wait for data from the server
+            tails_dir: the directory holding tails files, by registry ID
+            collector: optional collector for download timing statistics
+
+        """
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.request_timeout = request_timeout
+        self.tails_dir = tails_dir or indy_client_dir("tails")
+        self.collector = collector
+        # local path -> download in progress
+        self._downloads: Dict[str, asyncio.Future] = {}
+        # local path -> number of operations reading the file
+        self._leases: Dict[str, int] = {}
+        self.stats = {
+            "hits": 0,
+            "downloads": 0,
+            "download_bytes": 0,
+            "download_time": 0.0,
+            "coalesced": 0,
+            "resumed": 0,
+            "failures": 0,
+            "evicted": 0,
+        }
+
+    async def get_tails_file(self, local_path: str, url: str, tails_hash: str) -> str:
+        """
+        Get a local tails file, downloading it if necessary.
+
+        Args:
+            local_path: the local path of the tails file
+            url: the public URI from which to download the tails file
+            tails_hash: the expected tails hash
+
+        Returns:
+            The local path of the tails file
+
+        """
+        if os.path.isfile(local_path):
+            self.stats["hits"] += 1
+            self._touch(local_path)
+            return local_path
+
+        download = self._downloads.get(local_path)
+        if download:
+            self.stats["coalesced"] += 1
+        else:
+            download = asyncio.ensure_future(
+                self._download(local_path, url, tails_hash)
+            )
+            self._downloads[local_path] = download
+            download.add_done_callback(lambda _: self._downloads.pop(local_path, None))
+        # a waiter being cancelled does not cancel the shared download
+        return await asyncio.shield(download)
+
+    @contextmanager
+    def lease(self, local_path: str):
+        """
+        Protect a tails file from eviction while an operation is reading it.
+
+        Args:
+            local_path: the local path of the tails file
+
+        """
+        self._leases[local_path] = self._leases.get(local_path, 0) + 1
+        try:
+            yield local_path
+        finally:
+            self._leases[local_path] -= 1
+            if not self._leases[local_path]:
+                del self._leases[local_path]
+
+    def _touch(self, local_path: str):
+        """Record the use of a cached tails file."""
+        try:
+            os.utime(local_path + self.MARKER_SUFFIX)
+        except OSError:
+            pass  # not managed by the cache
+
+    async def _download(self, local_path: str, url: str, tails_hash: str) -> str:
+        """Download a tails file, resuming an interrupted download if possible."""
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        partial = PartialTailsFile(local_path + self.PARTIAL_SUFFIX)
+        await loop.run_in_executor(None, partial.load)
+
+        LOGGER.info("Downloading tails file: %s", url)
+        try:
+            async with ClientSession(trust_env=True) as session:
+                for attempt in range(1, self.max_attempts + 1):
+                    if partial.size and partial.tails_hash == tails_hash:
+                        break  # already complete
+                    try:
+                        await self._fetch(session, url, partial)
+                        break
+                    except (ClientError, asyncio.TimeoutError) as err:
+                        LOGGER.warning(
+                            "Error downloading tails file (attempt %d): %s",
+                            attempt,
+                            str(err) or err.__class__.__name__,
+                        )
+                        if attempt == self.max_attempts:
+                            raise TailsDownloadError(
+                                f"Error retrieving tails file: {err}"
+                            ) from err
+
+            if partial.tails_hash != tails_hash:
+                if os.path.exists(partial.path):
+                    os.remove(partial.path)
+                raise TailsDownloadError(
+                    "The hash of the downloaded tails file does not match."
+                )
+        except TailsDownloadError:
+            self.stats["failures"] += 1
+            raise
+
+        os.replace(partial.path, local_path)
+        with open(local_path + self.MARKER_SUFFIX, "w"):
+            pass
+
+        elapsed = time.perf_counter() - start
+        self.stats["downloads"] += 1
+        self.stats["download_time"] += elapsed
+        if self.collector:
+            self.collector.log("TailsCache.download", elapsed)
+        LOGGER.info(
+            "Downloaded tails file in %.2fs (%d bytes): %s",
+            elapsed,
+            partial.size,
+            local_path,
+        )
+
+        if self.max_size:
+            await loop.run_in_executor(None, self._evict, local_path, set(self._leases))
+        return local_path
+
+    async def _fetch(self, session: ClientSession, url: str, partial: PartialTailsFile):
+        """Stream the remainder of a tails file into the partial file."""
+        loop = asyncio.get_event_loop()
+        headers = {"Range": f"bytes={partial.size}-"} if partial.size else None
+        async with session.get(
+            url,
+            headers=headers,
+            timeout=ClientTimeout(total=None, sock_read=self.request_timeout),
+        ) as resp:
+            if resp.status == 416:
+                # partial content cannot be resumed: start over on the next attempt
+                await loop.run_in_executor(None, partial.reset)
+                raise ClientError("Requested range not satisfiable")
+            if resp.status not in (200, 206):
+                raise ClientError(
+                    f"Bad response from server: {resp.status} - {resp.reason}"
+                )
+            append = resp.status == 206 and partial.size > 0
+            if append:
+                self.stats["resumed"] += 1
+            tails_file = await loop.run_in_executor(None, partial.open, append)
+            try:
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    await loop.run_in_executor(None, partial.write, tails_file, chunk)
+                    self.stats["download_bytes"] += len(chunk)
+            finally:
+                await loop.run_in_executor(None, tails_file.close)
+
+    def _evict(self, keep: Optional[str] = None, leased: Set[str] = None):
+        """Remove the least recently used tails files to respect the size limit."""
+        entries = []
+        total = 0
+        for dir_path, _, file_names in os.walk(self.tails_dir):
+            for file_name in file_names:
+                if not file_name.endswith(self.MARKER_SUFFIX):
+                    continue
+                marker = os.path.join(dir_path, file_name)
+                path = marker[: -len(self.MARKER_SUFFIX)]
+                try:
+                    size = os.path.getsize(path)
+                    last_used = os.path.getmtime(marker)
+                except OSError:
+                    continue
+                total += size
+                entries.append((last_used, size, path, marker))
+
+        entries.sort()
+        for _, size, path, marker in entries:
+            if total <= self.max_size:
+                break
+            if path == keep or (leased and path in leased):
+                continue
+            try:
+                os.remove(path)
+                os.remove(marker)
+            except OSError as err:
+                LOGGER.warning("Could not remove cached tails file: %s", err)
+                continue
+            total -= size
+            self.stats["evicted"] += 1
+            LOGGER.info("Removed least recently used tails file: %s", path)
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from shutil import rmtree
+
+import base58
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase
+from asynctest import mock as async_mock
+
+from ...utils.stats import Collector
+
+from ..cache import TailsCache
+from ..error import TailsDownloadError
+
+TAILS_CONTENT = os.urandom(200000)
+TAILS_HASH = base58.b58encode(hashlib.sha256(TAILS_CONTENT).digest()).decode()
+
+
+class TestTailsCache(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.requests = []
+        self.fail_requests = 0
+        self.tails_dir = tempfile.mkdtemp()
+        self.cache = TailsCache(tails_dir=self.tails_dir)
+        await super().setUpAsync()
+
+    async def tearDownAsync(self):
+        rmtree(self.tails_dir, ignore_errors=True)
+        await super().tearDownAsync()
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.get("/tails/{name}", self.tails_route)])
+        return app
+
+    async def tails_route(self, request):
+        self.requests.append(request.headers.get("Range"))
+        if self.fail_requests:
+            self.fail_requests -= 1
+            raise web.HTTPServiceUnavailable()
+        content = TAILS_CONTENT if request.match_info["name"] == "good" else b"bad"
+        if request.http_range.start:
+            return web.Response(
+                status=206, body=content[request.http_range.start :]  # noqa: E203
+            )
+        await asyncio.sleep(0.01)
+        return web.Response(body=content)
+
+    def local_path(self, name: str = "reg") -> str:
+        return os.path.join(self.tails_dir, name, TAILS_HASH)
+
+    async def test_download(self):
+        collector = Collector()
+        self.cache.collector = collector
+        path = await self.cache.get_tails_file(
+            self.local_path(), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        assert path == self.local_path()
+        with open(path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+        assert os.path.isfile(path + TailsCache.MARKER_SUFFIX)
+        assert not os.path.exists(path + TailsCache.PARTIAL_SUFFIX)
+        assert self.cache.stats["downloads"] == 1
+        assert self.cache.stats["download_bytes"] == len(TAILS_CONTENT)
+        assert collector.results["count"]["TailsCache.download"] == 1
+
+        await self.cache.get_tails_file(
+            self.local_path(), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        assert self.cache.stats["hits"] == 1
+        assert len(self.requests) == 1
+
+    async def test_download_coalesced(self):
+        results = await asyncio.gather(
+            *[
+                self.cache.get_tails_file(
+                    self.local_path(), self.server.make_url("/tails/good"), TAILS_HASH
+                )
+                for _ in range(5)
+            ]
+        )
+        assert set(results) == {self.local_path()}
+        assert len(self.requests) == 1
+        assert self.cache.stats["coalesced"] == 4
+
+    async def test_download_resume(self):
+        os.makedirs(os.path.dirname(self.local_path()))
+        with open(self.local_path() + TailsCache.PARTIAL_SUFFIX, "wb") as partial:
+            partial.write(TAILS_CONTENT[:70000])
+        await self.cache.get_tails_file(
+            self.local_path(), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        assert self.requests == ["bytes=70000-"]
+        assert self.cache.stats["resumed"] == 1
+        assert self.cache.stats["download_bytes"] == len(TAILS_CONTENT) - 70000
+        with open(self.local_path(), "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+
+    async def test_download_retry(self):
+        self.fail_requests = 1
+        with async_mock.patch(
+            "aries_cloudagent.tails.cache.LOGGER.warning", async_mock.MagicMock()
+        ):
+            await self.cache.get_tails_file(
+                self.local_path(), self.server.make_url("/tails/good"), TAILS_HASH
+            )
+        assert len(self.requests) == 2
+
+        self.fail_requests = 3
+        with self.assertRaises(TailsDownloadError) as context, async_mock.patch(
+            "aries_cloudagent.tails.cache.LOGGER.warning", async_mock.MagicMock()
+        ):
+            await self.cache.get_tails_file(
+                self.local_path("other"),
+                self.server.make_url("/tails/good"),
+                TAILS_HASH,
+            )
+        assert "Error retrieving tails file" in context.exception.message
+        assert self.cache.stats["failures"] == 1
+
+    async def test_download_hash_mismatch(self):
+        with self.assertRaises(TailsDownloadError) as context:
+            await self.cache.get_tails_file(
+                self.local_path(), self.server.make_url("/tails/bad"), TAILS_HASH
+            )
+        assert "does not match" in context.exception.message
+        assert not os.listdir(os.path.dirname(self.local_path()))
+
+    async def test_evict_least_recently_used(self):
+        self.cache.max_size = len(TAILS_CONTENT) * 2
+        # a tails file created locally by an issuer is never evicted
+        os.makedirs(os.path.join(self.tails_dir, "issuer"))
+        with open(os.path.join(self.tails_dir, "issuer", TAILS_HASH), "wb") as issued:
+            issued.write(TAILS_CONTENT)
+
+        for name in ("reg1", "reg2"):
+            await self.cache.get_tails_file(
+                self.local_path(name), self.server.make_url("/tails/good"), TAILS_HASH
+            )
+        past = os.path.getmtime(self.local_path("reg1")) - 60
+        for name in ("reg1", "reg2"):
+            os.utime(self.local_path(name) + TailsCache.MARKER_SUFFIX, (past, past))
+        # reg1 becomes the most recently used
+        await self.cache.get_tails_file(
+            self.local_path("reg1"), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        await self.cache.get_tails_file(
+            self.local_path("reg3"), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+
+        assert self.cache.stats["evicted"] == 1
+        assert os.path.isfile(self.local_path("reg1"))
+        assert not os.path.exists(self.local_path("reg2"))
+        assert not os.path.exists(self.local_path("reg2") + TailsCache.MARKER_SUFFIX)
+        assert os.path.isfile(self.local_path("reg3"))
+        assert os.path.isfile(os.path.join(self.tails_dir, "issuer", TAILS_HASH))
+
+    async def test_evict_skips_leased(self):
+        self.cache.max_size = len(TAILS_CONTENT)
+        await self.cache.get_tails_file(
+            self.local_path("reg1"), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        with self.cache.lease(self.local_path("reg1")):
+            with self.cache.lease(self.local_path("reg1")):
+                pass
+            # reg1 is still read by an operation in progress
+            await self.cache.get_tails_file(
+                self.local_path("reg2"), self.server.make_url("/tails/good"), TAILS_HASH
+            )
+            assert self.cache.stats["evicted"] == 0
+            assert os.path.isfile(self.local_path("reg1"))
+        assert not self.cache._leases
+
+        await self.cache.get_tails_file(
+            self.local_path("reg3"), self.server.make_url("/tails/good"), TAILS_HASH
+        )
+        assert self.cache.stats["evicted"] == 2
+        assert not os.path.exists(self.local_path("reg1"))
+        assert os.path.isfile(self.local_path("reg3"))
@@ -59,6 +59,7 @@ class BaseInboundTransport(ABC):
         accept_undelivered: bool = False,
         can_respond: bool = False,
         client_info: dict = None,
+        multiple_responses: bool = False,
         wire_format: BaseWireFormat = None,
     ) -> Awaitable[InboundSession]:
         """
@@ -68,12 +69,15 @@ class BaseInboundTransport(ABC):
             accept_undelivered: Flag for accepting undelivered messages
             can_respond: Flag indicating that the transport can send responses
             client_info: Request-specific client information
+            multiple_responses: Flag indicating that the transport can send
+                several responses in turn
             wire_format: Optionally override the session wire format
         """
         return self._create_session(
             accept_undelivered=accept_undelivered,
             can_respond=can_respond,
             client_info=client_info,
+            multiple_responses=multiple_responses,
             wire_format=wire_format or self.wire_format,
             transport_type=self.scheme,
         )
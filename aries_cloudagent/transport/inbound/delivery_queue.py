@@ -5,10 +5,18 @@ The delivery queue holds and manages messages that have not yet
 been delivered to their intended destination.
 
 """
+import logging
 import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Sequence
 
 from ..outbound.message import OutboundMessage
 
+from .delivery_queue_store import DeliveryQueueStore
+
+LOGGER = logging.getLogger(__name__)
+
 
 class QueuedMessage:
     """
@@ -17,14 +25,23 @@ class QueuedMessage:
     Allows tracking Metadata.
     """
 
-    def __init__(self, msg: OutboundMessage):
+    def __init__(
+        self,
+        msg: OutboundMessage,
+        keys: Iterable[str] = None,
+        *,
+        queue_id: str = None,
+        timestamp: float = None,
+    ):
         """
         Create Wrapper for queued message.
 
         Automatically sets timestamp on create.
         """
         self.msg = msg
-        self.timestamp = time.time()
+        self.keys = set(keys or ())
+        self.queue_id = queue_id or str(uuid.uuid4())
+        self.timestamp = time.time() if timestamp is None else timestamp
 
     def older_than(self, compare_timestamp: float) -> bool:
         """
@@ -42,18 +59,60 @@ class DeliveryQueue:
     """
     DeliveryQueue class.
 
-    Manages undelivered messages.
+    Manages undelivered messages. Messages are held in insertion order, both
+    per recipient key and overall, so that adding, taking the next message for
+    a key and expiring old messages do not scan the queue. When a cap is
+    reached the oldest messages are dropped to make room.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 604800,
+        max_per_key: int = None,
+        max_messages: int = None,
+        store: DeliveryQueueStore = None,
+    ) -> None:
         """
         Initialize an instance of DeliveryQueue.
 
-        This uses an in memory structure to queue messages.
-        """
+        Args:
+            ttl_seconds: the time in seconds to hold messages, one week by default
+            max_per_key: the maximum number of messages held per recipient key
+            max_messages: the maximum number of messages held in total
+            store: optional store persisting the queued messages
 
-        self.queue_by_key = {}
-        self.ttl_seconds = 604800  # one week
+        """
+        # recipient key -> queue ID -> QueuedMessage, oldest first
+        self.queue_by_key: Dict[str, Dict[str, QueuedMessage]] = {}
+        # queue ID -> QueuedMessage, oldest first
+        self.messages: Dict[str, QueuedMessage] = OrderedDict()
+        self.ttl_seconds = ttl_seconds
+        self.max_per_key = max_per_key
+        self.max_messages = max_messages
+        self.store = store
+        self.stats = {"expired": 0, "dropped": 0}
+
+    @property
+    def total_messages(self) -> int:
+        """Accessor for the number of messages held in the queue."""
+        return len(self.messages)
+
+    async def restore(self):
+        """Load the messages persisted by a previous run."""
+        if not self.store:
+            return
+        for queue_id, msg, keys, timestamp in await self.store.load():
+            self._insert(
+                QueuedMessage(msg, keys, queue_id=queue_id, timestamp=timestamp)
+            )
+        self.expire_messages()
+        LOGGER.info("Restored %d undelivered messages", self.total_messages)
+
+    async def close(self):
+        """Write any pending changes to the store."""
+        if self.store:
+            await self.store.close()
 
     def expire_messages(self, ttl=None):
         """
@@ -65,10 +124,12 @@ class DeliveryQueue:
 
         ttl_seconds = ttl or self.ttl_seconds
         horizon = time.time() - ttl_seconds
-        for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
+        while self.messages:
+            wrapped_msg = next(iter(self.messages.values()))
+            if not wrapped_msg.older_than(horizon):
+                break
+            self._drop(wrapped_msg)
+            self.stats["expired"] += 1
 
     def add_message(self, msg: OutboundMessage):
         """
@@ -84,11 +145,60 @@ class DeliveryQueue:
             keys.update(msg.target.recipient_keys)
         if msg.reply_to_verkey:
             keys.add(msg.reply_to_verkey)
-        wrapped_msg = QueuedMessage(msg)
+        if not keys:
+            return
+        self.expire_messages()
+        wrapped_msg = QueuedMessage(msg, keys)
+        self._insert(wrapped_msg)
+        if self.store:
+            self.store.save(
+                wrapped_msg.queue_id,
+                msg=msg,
+                keys=keys,
+                timestamp=wrapped_msg.timestamp,
+            )
         for recipient_key in keys:
+            key_queue = self.queue_by_key[recipient_key]
+            while self.max_per_key and len(key_queue) > self.max_per_key:
+                self._remove(recipient_key, next(iter(key_queue)))
+                self.stats["dropped"] += 1
+        while self.max_messages and len(self.messages) > self.max_messages:
+            self._drop(next(iter(self.messages.values())))
+            self.stats["dropped"] += 1
+
+    def _insert(self, wrapped_msg: QueuedMessage):
+        """Add a wrapped message to the queue for each of its keys."""
+        self.messages[wrapped_msg.queue_id] = wrapped_msg
+        for recipient_key in wrapped_msg.keys:
             if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
+                self.queue_by_key[recipient_key] = OrderedDict()
+            self.queue_by_key[recipient_key][wrapped_msg.queue_id] = wrapped_msg
+
+    def _drop(self, wrapped_msg: QueuedMessage):
+        """Remove a wrapped message from the queue for all of its keys."""
+        for recipient_key in list(wrapped_msg.keys):
+            self._remove(recipient_key, wrapped_msg.queue_id)
+
+    def _remove(self, key: str, queue_id: str) -> QueuedMessage:
+        """Remove a wrapped message from the queue for a key."""
+        key_queue = self.queue_by_key[key]
+        wrapped_msg = key_queue.pop(queue_id)
+        if not key_queue:
+            del self.queue_by_key[key]
+        wrapped_msg.keys.discard(key)
+        if wrapped_msg.keys:
+            if self.store:
+                self.store.save(
+                    queue_id,
+                    msg=wrapped_msg.msg,
+                    keys=wrapped_msg.keys,
+                    timestamp=wrapped_msg.timestamp,
+                )
+        else:
+            del self.messages[queue_id]
+            if self.store:
+                self.store.remove(queue_id)
+        return wrapped_msg
 
     def has_message_for_key(self, key: str):
         """
@@ -97,9 +207,7 @@ class DeliveryQueue:
         Args:
             key: The key to use for lookup
         """
-        if key in self.queue_by_key and len(self.queue_by_key[key]):
-            return True
-        return False
+        return key in self.queue_by_key
 
     def message_count_for_key(self, key: str):
         """
@@ -121,7 +229,29 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+            return self._remove(key, next(iter(self.queue_by_key[key]))).msg
+
+    def get_messages_for_key(
+        self, key: str, limit: int = None, select: Callable = None
+    ) -> Sequence[OutboundMessage]:
+        """
+        Remove and return the oldest messages for a key.
+
+        Args:
+            key: The key to use for lookup
+            limit: The maximum number of messages to return, or None for all
+            select: Optional check that a message should be returned
+        """
+        messages = []
+        if key in self.queue_by_key:
+            # copy, allowing messages to be removed while iterating
+            for wrapped_msg in list(self.queue_by_key[key].values()):
+                if limit is not None and len(messages) >= limit:
+                    break
+                if select and not select(wrapped_msg.msg):
+                    continue
+                messages.append(self._remove(key, wrapped_msg.queue_id).msg)
+        return messages
 
     def inspect_all_messages_for_key(self, key: str):
         """
@@ -131,7 +261,8 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
+            # copy, allowing messages to be removed while iterating
+            for wrapped_msg in list(self.queue_by_key[key].values()):
                 yield wrapped_msg.msg
 
     def remove_message_for_key(self, key: str, msg: OutboundMessage):
@@ -143,9 +274,7 @@ class DeliveryQueue:
             msg: The message to remove from the queue
         """
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
+            for wrapped_msg in self.queue_by_key[key].values():
                 if wrapped_msg.msg == msg:
-                    self.queue_by_key[key].remove(wrapped_msg)
-                    if not self.queue_by_key[key]:
-                        del self.queue_by_key[key]
+                    self._remove(key, wrapped_msg.queue_id)
                     break  # exit processing loop
@@ -0,0 +1,108 @@
+"""Persistent storage for messages held in the delivery queue."""
+
+import json
+from typing import Optional, Sequence, Tuple
+
+from ...connections.models.connection_target import ConnectionTarget
+
+from ..outbound.message import OutboundMessage
+from ..outbound.queue_store import BufferedQueueStore
+
+
+class DeliveryQueueStore(BufferedQueueStore):
+    """Store for undelivered messages held for recipients without an endpoint."""
+
+    RECORD_TYPE = "delivery_queue_message"
+
+    def save(
+        self,
+        queue_id: Optional[str],
+        *,
+        msg: OutboundMessage,
+        keys: Sequence[str],
+        timestamp: float,
+    ) -> str:
+        """
+        Add or update a queued message, to be written on the next flush.
+
+        Args:
+            queue_id: the identifier of a previously saved message, or None
+            msg: the undelivered message
+            keys: the recipient keys for which the message is still queued
+            timestamp: the time the message was queued
+
+        Returns:
+            The identifier of the queued message
+
+        """
+        value = {
+            "keys": list(keys),
+            "timestamp": timestamp,
+            "message": self.serialize_message(msg),
+        }
+        return self._put(queue_id, value, {})
+
+    async def load(self) -> Sequence[Tuple[str, OutboundMessage, Sequence[str], float]]:
+        """
+        Load the messages left in storage by a previous run.
+
+        Returns:
+            A list of (queue_id, message, recipient keys, timestamp) tuples,
+            oldest first
+
+        """
+        results = []
+        for record in await self._load_records():
+            value = json.loads(record.value)
+            results.append(
+                (
+                    record.id,
+                    self.deserialize_message(value["message"]),
+                    value["keys"],
+                    value["timestamp"],
+                )
+            )
+        results.sort(key=lambda result: result[3])
+        return results
+
+    @classmethod
+    def serialize_message(cls, msg: OutboundMessage) -> dict:
+        """Convert an outbound message into a JSON-compatible representation."""
+        return {
+            "connection_id": msg.connection_id,
+            "enc_payload": (
+                cls.encode_payload(msg.enc_payload)
+                if msg.enc_payload is not None
+                else None
+            ),
+            "payload": cls.encode_payload(msg.payload),
+            "reply_thread_id": msg.reply_thread_id,
+            "reply_to_verkey": msg.reply_to_verkey,
+            "reply_from_verkey": msg.reply_from_verkey,
+            "target": msg.target.serialize() if msg.target else None,
+            "target_list": [target.serialize() for target in msg.target_list],
+        }
+
+    @classmethod
+    def deserialize_message(cls, value: dict) -> OutboundMessage:
+        """Restore an outbound message from its JSON-compatible representation."""
+        return OutboundMessage(
+            connection_id=value["connection_id"],
+            enc_payload=(
+                cls.decode_payload(value["enc_payload"])
+                if value["enc_payload"]
+                else None
+            ),
+            payload=cls.decode_payload(value["payload"]),
+            reply_thread_id=value["reply_thread_id"],
+            reply_to_verkey=value["reply_to_verkey"],
+            reply_from_verkey=value["reply_from_verkey"],
+            target=(
+                ConnectionTarget.deserialize(value["target"])
+                if value["target"]
+                else None
+            ),
+            target_list=[
+                ConnectionTarget.deserialize(target) for target in value["target_list"]
+            ],
+        )
@@ -18,6 +18,7 @@ from .base import (
     InboundTransportRegistrationError,
 )
 from .delivery_queue import DeliveryQueue
+from .delivery_queue_store import DeliveryQueueStore
 from .message import InboundMessage
 from .session import InboundSession
 
@@ -63,8 +64,19 @@ class InboundTransportManager:
             )
 
         # Setup queue for undelivered messages
-        if self.profile.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+        settings = self.profile.context.settings
+        if settings.get("transport.enable_undelivered_queue"):
+            self.undelivered_queue = DeliveryQueue(
+                ttl_seconds=settings.get("transport.undelivered_queue_ttl") or 604800,
+                max_per_key=settings.get("transport.undelivered_queue_max_per_key"),
+                max_messages=settings.get("transport.undelivered_queue_max_messages"),
+                store=(
+                    DeliveryQueueStore(self.profile)
+                    if settings.get("transport.undelivered_queue_persist")
+                    else None
+                ),
+            )
+            await self.undelivered_queue.restore()
 
     def register(self, config: InboundTransportConfiguration) -> str:
         """
@@ -139,6 +151,8 @@ class InboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue:
+            await self.undelivered_queue.close()
 
     async def create_session(
         self,
@@ -147,6 +161,7 @@ class InboundTransportManager:
         accept_undelivered: bool = False,
         can_respond: bool = False,
         client_info: dict = None,
+        multiple_responses: bool = False,
         wire_format: BaseWireFormat = None,
     ):
         """
@@ -157,6 +172,8 @@ class InboundTransportManager:
             accept_undelivered: Flag for accepting undelivered messages
             can_respond: Flag indicating that the transport can send responses
             client_info: An optional dict describing the client
+            multiple_responses: Flag indicating that the transport can send
+                several responses in turn
             wire_format: Override the wire format for this session
         """
         if not wire_format:
@@ -168,6 +185,7 @@ class InboundTransportManager:
             client_info=client_info,
             close_handler=self.closed_session,
             inbound_handler=self.receive_inbound,
+            multiple_responses=multiple_responses,
             session_id=str(uuid.uuid4()),
             transport_type=transport_type,
             wire_format=wire_format,
@@ -185,13 +203,17 @@ class InboundTransportManager:
         """
         Clean up a closed session.
 
-        Returns an undelivered message to the caller if possible.
+        Returns undelivered messages to the caller if possible.
         """
         if session.session_id in self.sessions:
             del self.sessions[session.session_id]
+        responses = list(session.pending_responses)
+        session.pending_responses.clear()
         if session.response_buffer:
+            responses.insert(0, session.response_buffer)
+        for outbound in responses:
             if self.return_inbound:
-                self.return_inbound(session.profile, session.response_buffer)
+                self.return_inbound(session.profile, outbound)
             else:
                 LOGGER.warning("Message failed return delivery, will not be delivered")
 
@@ -231,18 +253,27 @@ class InboundTransportManager:
         """
         Interact with undelivered queue to find applicable messages.
 
+        A session which can send several responses in turn takes every queued
+        message selected for it, others take the oldest one.
+
         Args:
             session: The inbound session
         """
-        if session and session.can_respond and self.undelivered_queue:
-            for key in session.reply_verkeys:
-                for (
-                    undelivered_message
-                ) in self.undelivered_queue.inspect_all_messages_for_key(key):
-                    if session.accept_response(undelivered_message):
-                        LOGGER.debug(
-                            "Sending previously undelivered message via inbound session"
-                        )
-                        self.undelivered_queue.remove_message_for_key(
-                            key, undelivered_message
-                        )
+        if not (session and session.can_respond and self.undelivered_queue):
+            return
+        if session.response_buffered and not session.multiple_responses:
+            return
+        for key in session.reply_verkeys:
+            messages = self.undelivered_queue.get_messages_for_key(
+                key,
+                None if session.multiple_responses else 1,
+                select=session.select_outbound,
+            )
+            if messages:
+                LOGGER.debug(
+                    "Sending %d previously undelivered messages via inbound session",
+                    len(messages),
+                )
+                session.queue_responses(messages)
+                if not session.multiple_responses:
+                    return
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Callable, Sequence, Union
+from collections import deque
+from typing import Callable, Deque, Sequence, Union
 
 from ...admin.server import AdminResponder
 from ...core.profile import Profile
@@ -46,6 +47,7 @@ class InboundSession:
         can_respond: bool = False,
         client_info: dict = None,
         close_handler: Callable = None,
+        multiple_responses: bool = False,
         reply_mode: str = None,
         reply_thread_ids: Sequence[str] = None,
         reply_verkeys: Sequence[str] = None,
@@ -60,7 +62,10 @@ class InboundSession:
         self.accept_undelivered = accept_undelivered
         self.client_info = client_info
         self.close_handler = close_handler
+        self.multiple_responses = multiple_responses
         self.response_buffer: OutboundMessage = None
+        # responses to send in turn once the buffered response is delivered
+        self.pending_responses: Deque[OutboundMessage] = deque()
         self.response_event = asyncio.Event()
         self.transport_type = transport_type
 
@@ -282,6 +287,17 @@ class InboundSession:
         self.set_response(message)
         return AcceptResult(True)
 
+    def queue_responses(self, messages: Sequence[OutboundMessage]):
+        """
+        Queue outbound messages selected for this session, to send in turn.
+
+        Args:
+            messages: The messages to send, oldest first
+        """
+        self.pending_responses.extend(messages)
+        if not self.response_buffer and self.pending_responses:
+            self.set_response(self.pending_responses.popleft())
+
     def set_response(self, message: OutboundMessage):
         """Set the contents of the response message buffer."""
         self.response_buffer = message
@@ -290,6 +306,8 @@ class InboundSession:
     def clear_response(self):
         """Handle when the buffered response message has been delivered."""
         self.response_buffer = None
+        if self.pending_responses and self.can_respond:
+            self.response_buffer = self.pending_responses.popleft()
         self.response_event.set()
 
     async def wait_response(self) -> Union[str, bytes]:
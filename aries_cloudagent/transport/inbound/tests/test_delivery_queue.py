@@ -7,7 +7,14 @@ from asynctest import mock as async_mock
 from ....connections.models.connection_target import ConnectionTarget
 from ....transport.outbound.message import OutboundMessage
 
+from ....core.in_memory import InMemoryProfile
+
 from ..delivery_queue import DeliveryQueue
+from ..delivery_queue_store import DeliveryQueueStore
+
+TEST_VERKEY = "H3C2AVvLMv6gmMNam3uVAjZpfkcJCwDwnZn6z3wXmqPV"
+TEST_VERKEY_2 = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+TEST_ROUTING_KEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
 
 
 class TestDeliveryQueue(AsyncTestCase):
@@ -64,3 +71,124 @@ class TestDeliveryQueue(AsyncTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_get_one_message_for_key_order(self):
+        queue = DeliveryQueue()
+        msgs = [
+            OutboundMessage(
+                payload=str(i), target=ConnectionTarget(recipient_keys=["aaa"])
+            )
+            for i in range(5)
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert [queue.get_one_message_for_key("aaa") for _ in range(5)] == msgs
+        assert queue.get_one_message_for_key("aaa") is None
+        assert queue.total_messages == 0
+
+    async def test_get_messages_for_key(self):
+        queue = DeliveryQueue()
+        msgs = [
+            OutboundMessage(
+                payload=str(i), target=ConnectionTarget(recipient_keys=["aaa"])
+            )
+            for i in range(6)
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert queue.get_messages_for_key("aaa", 2) == msgs[:2]
+        assert queue.get_messages_for_key(
+            "aaa", select=lambda msg: msg.payload in ("3", "5")
+        ) == [msgs[3], msgs[5]]
+        assert queue.get_messages_for_key("aaa") == [msgs[2], msgs[4]]
+        assert queue.get_messages_for_key("aaa") == []
+        assert queue.total_messages == 0
+
+    async def test_message_multiple_keys(self):
+        queue = DeliveryQueue()
+        msg = OutboundMessage(
+            payload="x",
+            target=ConnectionTarget(recipient_keys=["aaa"]),
+            reply_to_verkey="bbb",
+        )
+        queue.add_message(msg)
+        assert queue.total_messages == 1
+        assert queue.get_one_message_for_key("aaa") == msg
+        assert queue.total_messages == 1
+        assert queue.get_one_message_for_key("bbb") == msg
+        assert queue.total_messages == 0
+
+    async def test_message_no_keys(self):
+        queue = DeliveryQueue()
+        queue.add_message(OutboundMessage(payload="x"))
+        assert queue.total_messages == 0
+
+    async def test_caps(self):
+        queue = DeliveryQueue(max_per_key=2, max_messages=3)
+        msgs = [
+            OutboundMessage(
+                payload=str(i), target=ConnectionTarget(recipient_keys=[key])
+            )
+            for i, key in enumerate(["aaa", "aaa", "aaa", "bbb", "bbb"])
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        # per key cap drops msgs[0], global cap drops msgs[1]
+        assert queue.stats["dropped"] == 2
+        assert queue.total_messages == 3
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [msgs[2]]
+        assert list(queue.inspect_all_messages_for_key("bbb")) == msgs[3:]
+
+    async def test_expire_oldest_first(self):
+        queue = DeliveryQueue(ttl_seconds=60)
+        old = OutboundMessage(
+            payload="x", target=ConnectionTarget(recipient_keys=["aaa"])
+        )
+        queue.add_message(old)
+        next(iter(queue.messages.values())).timestamp -= 120
+        new = OutboundMessage(
+            payload="y", target=ConnectionTarget(recipient_keys=["aaa"])
+        )
+        queue.add_message(new)
+        assert queue.stats["expired"] == 1
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [new]
+
+    async def test_persist_restore(self):
+        profile = InMemoryProfile.test_profile()
+        queue = DeliveryQueue(store=DeliveryQueueStore(profile))
+        target = ConnectionTarget(
+            recipient_keys=[TEST_VERKEY], routing_keys=[TEST_ROUTING_KEY]
+        )
+        queue.add_message(OutboundMessage(payload="x", target=target))
+        queue.add_message(
+            OutboundMessage(
+                payload="y",
+                enc_payload=b"enc",
+                target=target,
+                reply_to_verkey=TEST_VERKEY_2,
+            )
+        )
+        queue.add_message(OutboundMessage(payload="z", target=target))
+        assert queue.get_one_message_for_key(TEST_VERKEY).payload == "x"
+        await queue.close()
+
+        restored = DeliveryQueue(store=DeliveryQueueStore(profile))
+        await restored.restore()
+        assert restored.total_messages == 2
+        assert restored.message_count_for_key(TEST_VERKEY) == 2
+        msg = restored.get_one_message_for_key(TEST_VERKEY)
+        assert msg.payload == "y"
+        assert msg.enc_payload == b"enc"
+        assert msg.target.routing_keys == [TEST_ROUTING_KEY]
+        assert restored.get_one_message_for_key(TEST_VERKEY).payload == "z"
+        await restored.close()
+
+        restored = DeliveryQueue(store=DeliveryQueueStore(profile))
+        await restored.restore()
+        assert restored.total_messages == 1
+        assert restored.get_one_message_for_key(TEST_VERKEY_2).payload == "y"
+        await restored.close()
+
+        restored = DeliveryQueue(store=DeliveryQueueStore(profile))
+        await restored.restore()
+        assert restored.total_messages == 0
@@ -9,6 +9,7 @@ from ...outbound.message import OutboundMessage
 from ...wire_format import BaseWireFormat
 from ..base import InboundTransportConfiguration, InboundTransportRegistrationError
 from ..manager import InboundTransportManager
+from ..receipt import MessageReceipt
 
 
 class TestInboundTransportManager(AsyncTestCase):
@@ -58,6 +59,26 @@ class TestInboundTransportManager(AsyncTestCase):
 
         assert mgr.undelivered_queue
 
+    async def test_setup_undelivered_queue_persist(self):
+        self.profile.context.update_settings(
+            {
+                "transport.enable_undelivered_queue": True,
+                "transport.undelivered_queue_persist": True,
+                "transport.undelivered_queue_max_per_key": 10,
+            }
+        )
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        assert mgr.undelivered_queue.store
+        assert mgr.undelivered_queue.max_per_key == 10
+        test_outbound = OutboundMessage(payload="x", reply_to_verkey="test-verkey")
+        assert mgr.return_undelivered(test_outbound)
+        await mgr.stop()
+
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        assert mgr.undelivered_queue.message_count_for_key("test-verkey") == 1
+
     async def test_start_stop(self):
         transport = async_mock.MagicMock()
         transport.start = async_mock.CoroutineMock()
@@ -180,14 +201,60 @@ class TestInboundTransportManager(AsyncTestCase):
             "http", can_respond=True, wire_format=test_wire_format
         )
         session.add_reply_verkeys(test_verkey)
+        session.reply_mode = MessageReceipt.REPLY_MODE_ALL
 
-        with async_mock.patch.object(
-            session, "accept_response", return_value=True
-        ) as mock_accept:
-            mgr.process_undelivered(session)
-            mock_accept.assert_called_once_with(test_outbound)
+        mgr.process_undelivered(session)
+        assert session.response_buffer is test_outbound
         assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
 
+    async def test_process_undelivered_multiple(self):
+        self.profile.context.update_settings(
+            {"transport.enable_undelivered_queue": True}
+        )
+        test_verkey = "test-verkey"
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+
+        test_outbound = [
+            OutboundMessage(payload=str(i), reply_to_verkey=test_verkey)
+            for i in range(3)
+        ]
+        for outbound in test_outbound:
+            assert mgr.return_undelivered(outbound)
+
+        session = await mgr.create_session(
+            "ws",
+            can_respond=True,
+            multiple_responses=True,
+            wire_format=async_mock.MagicMock(),
+        )
+        session.add_reply_verkeys(test_verkey)
+        session.reply_mode = MessageReceipt.REPLY_MODE_ALL
+
+        # one pickup drains the queue, sending the messages in turn
+        mgr.process_undelivered(session)
+        assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
+        sent = []
+        while session.response_buffer:
+            sent.append(session.response_buffer)
+            session.clear_response()
+        assert sent == test_outbound
+
+    async def test_closed_session_pending(self):
+        mgr = InboundTransportManager(self.profile, None, async_mock.MagicMock())
+        session = await mgr.create_session(
+            "ws",
+            can_respond=True,
+            multiple_responses=True,
+            wire_format=async_mock.MagicMock(),
+        )
+        test_outbound = [OutboundMessage(payload=str(i)) for i in range(2)]
+        session.queue_responses(test_outbound)
+        session.close()
+        assert [
+            call[0][1] for call in mgr.return_inbound.call_args_list
+        ] == test_outbound
+
     async def test_return_undelivered_false(self):
         self.profile.context.update_settings(
             {"transport.enable_undelivered_queue": False}
@@ -361,6 +361,31 @@ class TestInboundSession(TestCase):
             accepted = sess.accept_response(test_msg)
             assert accepted
 
+    async def test_queue_responses(self):
+        sess = InboundSession(
+            profile=self.profile,
+            inbound_handler=None,
+            session_id=None,
+            wire_format=None,
+            can_respond=True,
+            multiple_responses=True,
+        )
+        test_msgs = [OutboundMessage(payload=str(i)) for i in range(3)]
+
+        sess.queue_responses(test_msgs[:2])
+        assert sess.response_buffer is test_msgs[0]
+        sess.queue_responses(test_msgs[2:])
+        assert list(sess.pending_responses) == test_msgs[1:]
+
+        sess.clear_response()
+        assert sess.response_buffer is test_msgs[1]
+
+        # pending responses are held once the session can no longer respond
+        sess.can_respond = False
+        sess.clear_response()
+        assert not sess.response_buffer
+        assert list(sess.pending_responses) == test_msgs[2:]
+
     async def test_context_mgr(self):
         sess = InboundSession(
             profile=self.profile,
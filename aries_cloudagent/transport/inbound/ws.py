@@ -100,7 +100,10 @@ class WsTransport(BaseInboundTransport):
         client_info = {"host": request.host, "remote": request.remote}
 
         session = await self.create_session(
-            accept_undelivered=True, can_respond=True, client_info=client_info
+            accept_undelivered=True,
+            can_respond=True,
+            client_info=client_info,
+            multiple_responses=True,
         )
 
         async with session:
@@ -91,3 +91,7 @@ class OutboundTransportRegistrationError(OutboundTransportError):
 
 class OutboundDeliveryError(OutboundTransportError):
     """Base exception when a message cannot be delivered via an outbound transport."""
+
+
+class OutboundQueueFullError(OutboundDeliveryError):
+    """The outbound queue for an endpoint has reached its limit."""
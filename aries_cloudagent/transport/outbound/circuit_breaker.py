@@ -0,0 +1,109 @@
+"""Circuit breaker tracking the health of an outbound endpoint."""
+
+from collections import deque
+from typing import Mapping
+
+
+class EndpointCircuitBreaker:
+    """
+    Track delivery failures for an endpoint and suspend delivery while it is down.
+
+    The breaker is closed while deliveries succeed. After `threshold`
+    consecutive failures it opens, and messages for the endpoint are parked
+    rather than attempted. Once the backoff period has passed, one message is
+    sent as a probe with the breaker half-open: success closes the breaker and
+    releases the parked messages, while failure opens it again with the backoff
+    doubled, up to `max_backoff`.
+    """
+
+    STATE_CLOSED = "closed"
+    STATE_OPEN = "open"
+    STATE_HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int, backoff: float, max_backoff: float):
+        """
+        Initialize an `EndpointCircuitBreaker` instance.
+
+        Args:
+            threshold: the number of consecutive failures which opens the breaker
+            backoff: the initial number of seconds to wait before a probe
+            max_backoff: the maximum number of seconds to wait before a probe
+
+        """
+        self.threshold = threshold
+        self.initial_backoff = backoff
+        self.max_backoff = max_backoff
+        self.backoff = backoff
+        self.failures = 0
+        self.open_until: float = None
+        self.state = self.STATE_CLOSED
+        self.parked = deque()
+        self.probe_scheduled = False
+
+    @property
+    def closed(self) -> bool:
+        """Accessor for the closed state."""
+        return self.state == self.STATE_CLOSED
+
+    def allow(self, now: float) -> bool:
+        """
+        Check whether a message may be delivered now.
+
+        Once the backoff period has passed, the first message checked is
+        allowed through as the probe and the breaker becomes half-open.
+        """
+        if self.state == self.STATE_CLOSED:
+            return True
+        if self.state == self.STATE_OPEN and now >= self.open_until:
+            self.state = self.STATE_HALF_OPEN
+            self.probe_scheduled = False
+            return True
+        return False
+
+    def record_success(self) -> bool:
+        """
+        Record a successful delivery.
+
+        Returns:
+            True if the breaker state changed
+
+        """
+        self.failures = 0
+        if self.state == self.STATE_CLOSED:
+            return False
+        self.state = self.STATE_CLOSED
+        self.backoff = self.initial_backoff
+        self.open_until = None
+        self.probe_scheduled = False
+        return True
+
+    def record_failure(self, now: float) -> bool:
+        """
+        Record a failed delivery.
+
+        Returns:
+            True if the breaker state changed
+
+        """
+        self.failures += 1
+        if self.state == self.STATE_HALF_OPEN:
+            # the probe failed
+            self.backoff = min(self.backoff * 2, self.max_backoff)
+        elif self.state == self.STATE_OPEN or self.failures < self.threshold:
+            return False
+        self.state = self.STATE_OPEN
+        self.open_until = now + self.backoff
+        return True
+
+    def serialize(self, now: float) -> Mapping:
+        """Get a summary of the breaker state."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "parked": len(self.parked),
+            "probe_in": (
+                round(max(self.open_until - now, 0), 3)
+                if self.state == self.STATE_OPEN
+                else None
+            ),
+        }
@@ -1,10 +1,13 @@
 """Outbound transport manager."""
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import time
 
+from collections import Counter, deque
 from typing import Callable, Type, Union
 from urllib.parse import urlparse
 
@@ -21,12 +24,16 @@ from ..wire_format import BaseWireFormat
 from .base import (
     BaseOutboundTransport,
     OutboundDeliveryError,
+    OutboundQueueFullError,
     OutboundTransportRegistrationError,
 )
+from .circuit_breaker import EndpointCircuitBreaker
 from .message import OutboundMessage
+from .queue_store import OutboundQueueStore
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
+ENDPOINT_STATE_TOPIC = "acapy::webhook::outbound_endpoint_state"
 
 
 class QueuedOutboundMessage:
@@ -37,6 +44,7 @@ class QueuedOutboundMessage:
     STATE_ENCODE = "encode"
     STATE_DELIVER = "deliver"
     STATE_RETRY = "retry"
+    STATE_PARKED = "parked"
     STATE_DONE = "done"
 
     def __init__(
@@ -60,6 +68,7 @@ class QueuedOutboundMessage:
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
+        self.queue_id: str = None
 
 
 class OutboundTransportManager:
@@ -79,9 +88,15 @@ class OutboundTransportManager:
         self.root_profile = profile
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
+        # all messages being processed, and those waiting in each state
+        self.outbound_buffer = set()
         self.outbound_event = asyncio.Event()
         self.outbound_new = []
+        self.outbound_ready = deque()
+        self.outbound_done = deque()
+        # heap of (retry time, sequence, message) for messages awaiting retry
+        self.outbound_retry = []
+        self._retry_seq = itertools.count()
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
@@ -91,6 +106,29 @@ class OutboundTransportManager:
             self.MAX_RETRY_COUNT = self.root_profile.settings[
                 "transport.max_outbound_retry"
             ]
+        self.max_per_endpoint = self.root_profile.settings.get(
+            "transport.outbound_queue_max_per_endpoint"
+        )
+        self.endpoint_counts = Counter()
+        self.queue_store: OutboundQueueStore = None
+        if self.root_profile.settings.get("transport.outbound_queue_persist"):
+            self.queue_store = OutboundQueueStore(
+                self.root_profile,
+                flush_interval=self.root_profile.settings.get(
+                    "transport.outbound_queue_flush_interval", 0.25
+                ),
+            )
+        # circuit breakers for endpoints with recent failures, by origin
+        self.breakers = {}
+        self.breaker_threshold = self.root_profile.settings.get(
+            "transport.outbound_breaker_threshold", 0
+        )
+        self.breaker_backoff = self.root_profile.settings.get(
+            "transport.outbound_breaker_backoff", 10
+        )
+        self.breaker_max_backoff = self.root_profile.settings.get(
+            "transport.outbound_breaker_max_backoff", 600
+        )
 
     async def setup(self):
         """Perform setup operations."""
@@ -186,8 +224,43 @@ class OutboundTransportManager:
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
-        for transport_id in self.registered_transports:
+        starting = [
             self.task_queue.run(self.start_transport(transport_id))
+            for transport_id in self.registered_transports
+        ]
+        if self.queue_store:
+            self.task_queue.run(self.restore_queued(starting))
+
+    async def restore_queued(self, starting=None):
+        """Resume delivery of the messages persisted by a previous run."""
+        if starting:
+            await asyncio.wait(starting)
+        restored = 0
+        for entry in await self.queue_store.load():
+            endpoint = entry["endpoint"]
+            try:
+                transport_id = self.get_running_transport_for_endpoint(endpoint)
+            except OutboundDeliveryError:
+                LOGGER.warning(
+                    "Discarding persisted outbound message, no transport for %s",
+                    endpoint,
+                )
+                self.queue_store.remove(entry["queue_id"])
+                continue
+            queued = QueuedOutboundMessage(self.root_profile, None, None, transport_id)
+            queued.endpoint = endpoint
+            queued.payload = entry["payload"]
+            queued.metadata = entry.get("metadata")
+            queued.api_key = entry.get("api_key")
+            queued.retries = entry.get("retries")
+            queued.queue_id = entry["queue_id"]
+            queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.endpoint_counts[endpoint] += 1
+            self.outbound_new.append(queued)
+            restored += 1
+        if restored:
+            LOGGER.info("Resuming delivery of %d persisted outbound messages", restored)
+            self.process_queued()
 
     async def stop(self, wait: bool = True):
         """Stop all running transports."""
@@ -197,6 +270,9 @@ class OutboundTransportManager:
         for transport in self.running_transports.values():
             await transport.stop()
         self.running_transports = {}
+        if self.queue_store:
+            # messages still pending remain in storage for the next run
+            await self.queue_store.close()
 
     def get_registered_transport_for_scheme(self, scheme: str) -> str:
         """Find the registered transport ID for a given scheme."""
@@ -252,6 +328,48 @@ class OutboundTransportManager:
         """Get an instance of a running transport by ID."""
         return self.running_transports[transport_id]
 
+    def _accept_queued(self, queued: QueuedOutboundMessage):
+        """
+        Add a message to the queue, subject to the per-endpoint limit.
+
+        Raises:
+            OutboundQueueFullError: if the queue for the endpoint is full
+
+        """
+        if (
+            self.max_per_endpoint
+            and self.endpoint_counts[queued.endpoint] >= self.max_per_endpoint
+        ):
+            raise OutboundQueueFullError(
+                f"Outbound queue for endpoint {queued.endpoint} is full"
+            )
+        self.endpoint_counts[queued.endpoint] += 1
+        self.outbound_new.append(queued)
+        self.process_queued()
+
+    def _release_queued(self, queued: QueuedOutboundMessage):
+        """Remove a finished message from the endpoint counts and storage."""
+        count = self.endpoint_counts[queued.endpoint] - 1
+        if count > 0:
+            self.endpoint_counts[queued.endpoint] = count
+        else:
+            del self.endpoint_counts[queued.endpoint]
+        if self.queue_store and queued.queue_id:
+            self.queue_store.remove(queued.queue_id)
+            queued.queue_id = None
+
+    def _persist_queued(self, queued: QueuedOutboundMessage):
+        """Save an encoded message pending delivery, if persistence is enabled."""
+        if self.queue_store:
+            queued.queue_id = self.queue_store.save(
+                queued.queue_id,
+                endpoint=queued.endpoint,
+                payload=queued.payload,
+                retries=queued.retries,
+                metadata=queued.metadata,
+                api_key=queued.api_key,
+            )
+
     async def enqueue_message(self, profile: Profile, outbound: OutboundMessage):
         """
         Add an outbound message to the queue.
@@ -285,8 +403,7 @@ class OutboundTransportManager:
         else:
             queued = QueuedOutboundMessage(profile, outbound, target, transport_id)
             queued.retries = self.MAX_RETRY_COUNT
-            self.outbound_new.append(queued)
-            self.process_queued()
+            self._accept_queued(queued)
 
     async def encode_outbound_message(
         self, profile: Profile, outbound: OutboundMessage, target: ConnectionTarget
@@ -329,6 +446,7 @@ class OutboundTransportManager:
 
         Raises:
             OutboundDeliveryError: if the associated transport is not running
+            OutboundQueueFullError: if the queue for the endpoint is full
 
         """
         transport_id = self.get_running_transport_for_endpoint(endpoint)
@@ -343,8 +461,7 @@ class OutboundTransportManager:
         queued.payload = json.dumps(payload)
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
-        self.outbound_new.append(queued)
-        self.process_queued()
+        self._accept_queued(queued)
 
     def process_queued(self) -> asyncio.Task:
         """
@@ -378,52 +495,28 @@ class OutboundTransportManager:
         while True:
             self.outbound_event.clear()
             loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
-
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
-                    )
 
-                upd_buffer.append(queued)
+            # retries which are now due, in order of their retry time
+            retry_heap = self.outbound_retry
+            while retry_heap and retry_heap[0][0] < loop_time:
+                _, _, queued = heapq.heappop(retry_heap)
+                if queued.state == QueuedOutboundMessage.STATE_RETRY:
+                    queued.retry_at = None
+                    self.outbound_ready.append(queued)
+
+            while self.outbound_done:
+                queued = self.outbound_done.popleft()
+                if queued.error:
+                    LOGGER.exception(
+                        "Outbound message could not be delivered to %s",
+                        queued.endpoint,
+                        exc_info=queued.error,
+                    )
+                    if self.handle_not_delivered and queued.message:
+                        self.handle_not_delivered(queued.profile, queued.message)
+                self._release_queued(queued)
+                self.outbound_buffer.discard(queued)
 
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
 
@@ -432,7 +525,8 @@ class OutboundTransportManager:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self._persist_queued(queued)
+                        self.outbound_ready.append(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
                         p_time = trace_event(
@@ -447,20 +541,48 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
-                else:
-                    new_pending += 1
-
-                upd_buffer.append(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    if not queued.queue_id:
+                        self._persist_queued(queued)
+                    self.outbound_ready.append(queued)
+
+                self.outbound_buffer.add(queued)
+
+            while self.outbound_ready:
+                queued = self.outbound_ready.popleft()
+                breaker = self._get_breaker(queued)
+                if breaker:
+                    was_open = breaker.state == EndpointCircuitBreaker.STATE_OPEN
+                    if not breaker.allow(loop_time):
+                        self._park_queued(queued, breaker)
+                        continue
+                    if was_open:
+                        self._breaker_changed(queued.endpoint, breaker)
+                queued.state = QueuedOutboundMessage.STATE_DELIVER
+                p_time = trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+                )
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            if not self.outbound_buffer:
                 break
+            if not self.outbound_event.is_set():
+                # sleep until notified of a change, or the next retry is due
+                timeout = None
+                if retry_heap:
+                    timeout = max(retry_heap[0][0] - get_timer(), 0) + 0.001
+                try:
+                    await asyncio.wait_for(self.outbound_event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
 
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
@@ -493,8 +615,11 @@ class OutboundTransportManager:
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_done.append(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self._persist_queued(queued)
+            self.outbound_ready.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -513,10 +638,93 @@ class OutboundTransportManager:
         )
         return queued.task
 
+    def _breaker_key(self, endpoint: str) -> str:
+        """Get the key for the circuit breaker which applies to an endpoint."""
+        parsed = urlparse(endpoint)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _get_breaker(
+        self, queued: QueuedOutboundMessage, create: bool = False
+    ) -> EndpointCircuitBreaker:
+        """Look up the circuit breaker for the endpoint of a message."""
+        if not (self.breaker_threshold and queued.endpoint):
+            return None
+        if not (create or self.breakers):
+            return None
+        key = self._breaker_key(queued.endpoint)
+        breaker = self.breakers.get(key)
+        if not breaker and create:
+            breaker = EndpointCircuitBreaker(
+                self.breaker_threshold, self.breaker_backoff, self.breaker_max_backoff
+            )
+            self.breakers[key] = breaker
+        return breaker
+
+    def _breaker_changed(self, endpoint: str, breaker: EndpointCircuitBreaker):
+        """Log and publish a change in the state of an endpoint circuit breaker."""
+        key = self._breaker_key(endpoint)
+        LOGGER.warning("Outbound endpoint %s is now %s", key, breaker.state)
+        payload = {"endpoint": key, **breaker.serialize(get_timer())}
+        asyncio.ensure_future(self.root_profile.notify(ENDPOINT_STATE_TOPIC, payload))
+
+    def _park_queued(self, queued: QueuedOutboundMessage, breaker):
+        """Hold a message until its endpoint recovers."""
+        if breaker.probe_scheduled or breaker.state != breaker.STATE_OPEN:
+            queued.state = QueuedOutboundMessage.STATE_PARKED
+            breaker.parked.append(queued)
+        else:
+            # the first message parked is attempted as the probe
+            queued.state = QueuedOutboundMessage.STATE_RETRY
+            queued.retry_at = breaker.open_until
+            self.schedule_retry(queued)
+            breaker.probe_scheduled = True
+
+    def _unpark_all(self, breaker: EndpointCircuitBreaker):
+        """Release the messages parked for an endpoint for delivery."""
+        while breaker.parked:
+            queued = breaker.parked.popleft()
+            queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_ready.append(queued)
+
+    def _charge_parked(self, breaker: EndpointCircuitBreaker, error):
+        """
+        Count a failed attempt on an endpoint against its parked messages.
+
+        Parked messages without retries remaining are failed, so they are not
+        held indefinitely for an endpoint which does not recover.
+        """
+        parked = breaker.parked
+        for _ in range(len(parked)):
+            queued = parked.popleft()
+            if queued.retries:
+                queued.retries -= 1
+                parked.append(queued)
+                if queued.queue_id:
+                    self._persist_queued(queued)
+            else:
+                queued.error = error
+                queued.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_done.append(queued)
+
+    def endpoint_states(self) -> dict:
+        """Get a summary of the circuit breaker for each failing endpoint."""
+        now = get_timer()
+        return {key: breaker.serialize(now) for key, breaker in self.breakers.items()}
+
+    def schedule_retry(self, queued: QueuedOutboundMessage):
+        """Schedule delivery of a message in the retry state at its retry time."""
+        heapq.heappush(
+            self.outbound_retry, (queued.retry_at, next(self._retry_seq), queued)
+        )
+
     def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message delivery."""
         if completed.exc_info:
             queued.error = completed.exc_info
+            breaker = self._get_breaker(queued, create=True)
+            if breaker and breaker.record_failure(get_timer()):
+                self._breaker_changed(queued.endpoint, breaker)
+                self._charge_parked(breaker, queued.error)
 
             if queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
@@ -540,17 +748,34 @@ class OutboundTransportManager:
                         queued.error,
                     )
                 queued.retries -= 1
-                queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                if breaker and not breaker.closed:
+                    # share the backoff of the endpoint
+                    self._park_queued(queued, breaker)
+                else:
+                    queued.state = QueuedOutboundMessage.STATE_RETRY
+                    queued.retry_at = time.perf_counter() + 10
+                    self.schedule_retry(queued)
+                if queued.queue_id:
+                    self._persist_queued(queued)
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
                 queued.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_done.append(queued)
+            if breaker and breaker.parked and not breaker.probe_scheduled:
+                self._park_queued(breaker.parked.popleft(), breaker)
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_done.append(queued)
+            breaker = self._get_breaker(queued)
+            if breaker:
+                if breaker.record_success():
+                    self._breaker_changed(queued.endpoint, breaker)
+                self._unpark_all(breaker)
+                del self.breakers[self._breaker_key(queued.endpoint)]
         queued.task = None
         self.process_queued()
 
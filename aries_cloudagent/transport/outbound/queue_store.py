@@ -0,0 +1,234 @@
+"""Persistent storage for outbound messages pending delivery."""
+
+import asyncio
+import base64
+import json
+import logging
+import uuid
+from typing import Mapping, Optional, Sequence, Union
+
+from ...core.profile import Profile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageError, StorageNotFoundError
+from ...storage.record import StorageRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BufferedQueueStore:
+    """
+    Base class for stores of queued messages, allowing delivery to resume on restart.
+
+    Writes are buffered and applied in a single transaction once `flush_size`
+    changes are pending or after `flush_interval` seconds, so that the delivery
+    path does not wait on storage. A message which is delivered before the next
+    flush is never written at all. Changes buffered when the process exits
+    abruptly are lost.
+    """
+
+    RECORD_TYPE: str = None
+
+    def __init__(
+        self,
+        profile: Profile,
+        *,
+        flush_interval: float = 0.25,
+        flush_size: int = 100,
+    ):
+        """
+        Initialize a `BufferedQueueStore` instance.
+
+        Args:
+            profile: the profile providing the storage for queued messages
+            flush_interval: the maximum number of seconds to buffer changes
+            flush_size: the number of buffered changes which triggers a flush
+
+        """
+        self._profile = profile
+        self._flush_interval = flush_interval
+        self._flush_size = flush_size
+        # queue_id -> record to be written, or None to be removed
+        self._changes = {}
+        # queue IDs already present in storage, or being written
+        self._stored = set()
+        self._writing = set()
+        self._flush_task: asyncio.Task = None
+        self._flush_now: asyncio.Task = None
+        self._flush_lock = asyncio.Lock()
+        self.total_flushes = 0
+
+    @property
+    def pending_changes(self) -> int:
+        """Accessor for the number of buffered changes."""
+        return len(self._changes)
+
+    @staticmethod
+    def encode_payload(payload: Union[str, bytes]) -> Mapping[str, str]:
+        """Convert a message payload into a JSON-compatible representation."""
+        if isinstance(payload, bytes):
+            return {"payload": base64.b64encode(payload).decode(), "encoding": "base64"}
+        return {"payload": payload, "encoding": "utf-8"}
+
+    @staticmethod
+    def decode_payload(value: Mapping[str, str]) -> Union[str, bytes]:
+        """Restore a message payload from its JSON-compatible representation."""
+        if value.get("encoding") == "base64":
+            return base64.b64decode(value["payload"])
+        return value["payload"]
+
+    def _put(self, queue_id: Optional[str], value: Mapping, tags: Mapping) -> str:
+        """Add or update a record, to be written on the next flush."""
+        queue_id = queue_id or str(uuid.uuid4())
+        self._changes[queue_id] = StorageRecord(
+            self.RECORD_TYPE, json.dumps(value), tags, queue_id
+        )
+        self._schedule_flush()
+        return queue_id
+
+    def remove(self, queue_id: str):
+        """Remove a queued message, to be deleted on the next flush."""
+        if not queue_id:
+            return
+        if queue_id in self._stored or queue_id in self._writing:
+            self._changes[queue_id] = None
+            self._schedule_flush()
+        else:
+            # never written: drop the buffered addition
+            self._changes.pop(queue_id, None)
+
+    def _schedule_flush(self):
+        """Start a flush soon, or immediately if enough changes are buffered."""
+        if len(self._changes) >= self._flush_size:
+            if not self._flush_now or self._flush_now.done():
+                self._flush_now = asyncio.ensure_future(self.flush())
+        elif not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        """Flush buffered changes after the flush interval."""
+        await asyncio.sleep(self._flush_interval)
+        await self.flush()
+
+    async def flush(self):
+        """Write all buffered changes to storage in a single transaction."""
+        async with self._flush_lock:
+            while self._changes:
+                changes = self._changes
+                self._changes = {}
+                self._writing = set(changes)
+                try:
+                    await self._write(changes)
+                except StorageError:
+                    LOGGER.exception("Error persisting %s records", self.RECORD_TYPE)
+                    # keep any changes made in the meantime
+                    changes.update(self._changes)
+                    self._changes = changes
+                    break
+                except asyncio.CancelledError:
+                    changes.update(self._changes)
+                    self._changes = changes
+                    raise
+                finally:
+                    self._writing = set()
+                self.total_flushes += 1
+
+    async def _write(self, changes: Mapping[str, Optional[StorageRecord]]):
+        """Apply a set of changes to storage."""
+        async with self._profile.transaction() as txn:
+            storage = txn.inject(BaseStorage)
+            for queue_id, record in changes.items():
+                if record is None:
+                    try:
+                        await storage.delete_record(
+                            StorageRecord(self.RECORD_TYPE, "", None, queue_id)
+                        )
+                    except StorageNotFoundError:
+                        pass
+                elif queue_id in self._stored:
+                    await storage.update_record(record, record.value, record.tags)
+                else:
+                    await storage.add_record(record)
+            await txn.commit()
+        for queue_id, record in changes.items():
+            if record is None:
+                self._stored.discard(queue_id)
+            else:
+                self._stored.add(queue_id)
+
+    async def _load_records(self) -> Sequence[StorageRecord]:
+        """Load the records left in storage by a previous run."""
+        async with self._profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                self.RECORD_TYPE
+            )
+        self._stored.update(record.id for record in records)
+        return records
+
+    async def close(self):
+        """Stop the scheduled flush and write any buffered changes."""
+        for task in (self._flush_task, self._flush_now):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = self._flush_now = None
+        await self.flush()
+
+
+class OutboundQueueStore(BufferedQueueStore):
+    """Store for encoded outbound messages pending delivery to an endpoint."""
+
+    RECORD_TYPE = "outbound_queue_message"
+
+    def save(
+        self,
+        queue_id: Optional[str],
+        *,
+        endpoint: str,
+        payload: Union[str, bytes],
+        retries: int = None,
+        metadata: dict = None,
+        api_key: str = None,
+    ) -> str:
+        """
+        Add or update a queued message, to be written on the next flush.
+
+        Args:
+            queue_id: the identifier of a previously saved message, or None
+            endpoint: the delivery endpoint
+            payload: the encoded message payload
+            retries: the number of delivery attempts remaining
+            metadata: additional metadata associated with the payload
+            api_key: the API key for the endpoint, if any
+
+        Returns:
+            The identifier of the queued message
+
+        """
+        value = {
+            "endpoint": endpoint,
+            "retries": retries,
+            "metadata": metadata,
+            "api_key": api_key,
+            **self.encode_payload(payload),
+        }
+        return self._put(queue_id, value, {"endpoint": endpoint})
+
+    async def load(self) -> Sequence[Mapping]:
+        """
+        Load the messages left in storage by a previous run.
+
+        Returns:
+            A list of dictionaries with a `queue_id` and the saved properties
+
+        """
+        results = []
+        for record in await self._load_records():
+            value = json.loads(record.value)
+            value["payload"] = self.decode_payload(value)
+            value["queue_id"] = record.id
+            value.pop("encoding", None)
+            results.append(value)
+        return results
@@ -0,0 +1,51 @@
+from asynctest import TestCase as AsyncTestCase
+
+from ..circuit_breaker import EndpointCircuitBreaker
+
+
+class TestEndpointCircuitBreaker(AsyncTestCase):
+    def test_open_after_threshold(self):
+        breaker = EndpointCircuitBreaker(3, 10, 25)
+        assert breaker.closed and breaker.allow(0)
+        assert not breaker.record_failure(0)
+        assert not breaker.record_failure(1)
+        assert breaker.record_failure(2)
+        assert breaker.state == EndpointCircuitBreaker.STATE_OPEN
+        assert breaker.open_until == 12
+        assert not breaker.record_failure(3)  # already open
+        assert breaker.serialize(4) == {
+            "state": "open",
+            "failures": 4,
+            "parked": 0,
+            "probe_in": 8,
+        }
+
+    def test_success_resets_failures(self):
+        breaker = EndpointCircuitBreaker(2, 10, 25)
+        breaker.record_failure(0)
+        assert not breaker.record_success()
+        assert not breaker.record_failure(1)
+        assert breaker.closed
+
+    def test_probe(self):
+        breaker = EndpointCircuitBreaker(1, 10, 25)
+        breaker.record_failure(0)
+        breaker.probe_scheduled = True
+        assert not breaker.allow(5)
+        assert breaker.allow(10)
+        assert breaker.state == EndpointCircuitBreaker.STATE_HALF_OPEN
+        assert not breaker.probe_scheduled
+        assert not breaker.allow(10)  # one probe at a time
+
+        assert breaker.record_failure(11)
+        assert breaker.state == EndpointCircuitBreaker.STATE_OPEN
+        assert breaker.open_until == 31
+        breaker.allow(31)
+        breaker.record_failure(31)
+        assert breaker.backoff == 25  # capped
+        breaker.allow(56)
+
+        assert breaker.record_success()
+        assert breaker.closed
+        assert breaker.backoff == 10
+        assert breaker.serialize(60)["probe_in"] is None
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
@@ -10,6 +11,7 @@ from ...wire_format import BaseWireFormat
 from .. import manager as test_module
 from ..manager import (
     OutboundDeliveryError,
+    OutboundQueueFullError,
     OutboundTransportManager,
     OutboundTransportRegistrationError,
     QueuedOutboundMessage,
@@ -166,6 +168,217 @@ class TestOutboundTransportManager(AsyncTestCase):
             assert queued.retries == test_attempts - 1
             assert queued.state == QueuedOutboundMessage.STATE_PENDING
 
+    async def test_enqueue_max_per_endpoint(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.outbound_queue_max_per_endpoint": 1}
+        )
+        mgr = OutboundTransportManager(profile)
+        mgr.running_transports = {
+            "transport_cls": async_mock.MagicMock(schemes=["http"])
+        }
+        with async_mock.patch.object(mgr, "process_queued") as mock_process:
+            mgr.enqueue_webhook("topic", {}, "http://example")
+            mgr.enqueue_webhook("topic", {}, "http://other")
+            with self.assertRaises(OutboundQueueFullError) as context:
+                mgr.enqueue_webhook("topic", {}, "http://example")
+            assert "is full" in str(context.exception)
+        assert len(mgr.outbound_new) == 2
+
+        mgr._release_queued(mgr.outbound_new[0])
+        assert mgr.endpoint_counts == {"http://other/topic/topic/": 1}
+
+    async def test_persist_restore(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_queue_persist": True,
+                "transport.outbound_queue_flush_interval": 0.01,
+            }
+        )
+
+        def make_transport():
+            transport = async_mock.MagicMock(schemes=["http"], is_external=False)
+            transport.start = async_mock.CoroutineMock()
+            transport.stop = async_mock.CoroutineMock()
+            transport.handle_message = async_mock.CoroutineMock()
+            transport_cls = async_mock.MagicMock(
+                schemes=["http"], return_value=transport
+            )
+            return transport, transport_cls
+
+        transport, transport_cls = make_transport()
+        transport.handle_message.side_effect = KeyError("unreachable")
+        mgr = OutboundTransportManager(profile)
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+
+        with async_mock.patch.object(test_module.LOGGER, "error"):
+            mgr.enqueue_webhook("topic", {"test": 1}, "http://example#key")
+            await asyncio.sleep(0.05)
+        (queued,) = mgr.outbound_buffer
+        assert queued.state == QueuedOutboundMessage.STATE_RETRY
+        assert queued.queue_id
+        await mgr.stop()
+
+        transport, transport_cls = make_transport()
+        mgr = OutboundTransportManager(profile)
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+        await mgr.flush()
+        transport.handle_message.assert_awaited_once_with(
+            profile, '{"test": 1}', "http://example/topic/topic/", None, "key"
+        )
+        assert not mgr.outbound_buffer and not mgr.endpoint_counts
+        await mgr.stop()
+        assert not await mgr.queue_store.load()
+
+    async def test_restore_no_transport(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.outbound_queue_persist": True}
+        )
+        mgr = OutboundTransportManager(profile)
+        mgr.queue_store.save(None, endpoint="xmpp://example", payload="msg")
+        await mgr.queue_store.flush()
+        with async_mock.patch.object(test_module.LOGGER, "warning") as mock_warn:
+            await mgr.restore_queued()
+            mock_warn.assert_called_once()
+        assert not mgr.outbound_new
+        await mgr.queue_store.close()
+        assert not await mgr.queue_store.load()
+
+    async def test_circuit_breaker(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_breaker_threshold": 2,
+                "transport.outbound_breaker_backoff": 0.05,
+            }
+        )
+        profile.notify = async_mock.CoroutineMock()
+        mgr = OutboundTransportManager(profile)
+        transport = async_mock.MagicMock(schemes=["http"], is_external=False)
+        transport.start = async_mock.CoroutineMock()
+        transport.stop = async_mock.CoroutineMock()
+        transport.handle_message = async_mock.CoroutineMock(
+            side_effect=KeyError("unreachable")
+        )
+        mgr.register_class(
+            async_mock.MagicMock(schemes=["http"], return_value=transport),
+            "transport_cls",
+        )
+        await mgr.start()
+        await mgr.task_queue
+
+        with async_mock.patch.object(test_module.LOGGER, "error"):
+            for _ in range(5):
+                mgr.enqueue_webhook("topic", {}, "http://example")
+            await asyncio.sleep(0.01)
+
+            # all failed: the breaker opened on the second failure, then
+            # one message was scheduled as the probe and the rest parked
+            assert transport.handle_message.await_count == 5
+            states = mgr.endpoint_states()
+            assert states["http://example"]["state"] == "open"
+            assert states["http://example"]["parked"] == 3
+            assert (
+                sum(
+                    1
+                    for m in mgr.outbound_buffer
+                    if m.state == QueuedOutboundMessage.STATE_PARKED
+                )
+                == 3
+            )
+
+            # the probe fails, the backoff doubles and the others stay parked
+            await asyncio.sleep(0.06)
+            assert transport.handle_message.await_count == 6
+            assert mgr.breakers["http://example"].backoff == 0.1
+            assert mgr.endpoint_states()["http://example"]["state"] == "open"
+
+        # the next probe succeeds and the parked messages are released
+        transport.handle_message.side_effect = None
+        await asyncio.sleep(0.15)
+        assert transport.handle_message.await_count == 10
+        assert not mgr.breakers
+        # only the message which failed before the breaker opened remains
+        (queued,) = mgr.outbound_buffer
+        assert queued.state == QueuedOutboundMessage.STATE_RETRY
+        assert [call[0][1]["state"] for call in profile.notify.call_args_list] == [
+            "open",
+            "half-open",
+            "open",
+            "half-open",
+            "closed",
+        ]
+        assert profile.notify.call_args[0][0] == test_module.ENDPOINT_STATE_TOPIC
+        await mgr.stop()
+
+    async def test_circuit_breaker_parked_retries(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_breaker_threshold": 1,
+                "transport.outbound_breaker_backoff": 0.02,
+            }
+        )
+        profile.notify = async_mock.CoroutineMock()
+        mock_handle_not_delivered = async_mock.MagicMock()
+        mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
+        transport = async_mock.MagicMock(schemes=["http"], is_external=False)
+        transport.start = async_mock.CoroutineMock()
+        transport.stop = async_mock.CoroutineMock()
+        transport.handle_message = async_mock.CoroutineMock(
+            side_effect=KeyError("unreachable")
+        )
+        mgr.register_class(
+            async_mock.MagicMock(schemes=["http"], return_value=transport),
+            "transport_cls",
+        )
+        await mgr.start()
+        await mgr.task_queue
+
+        with async_mock.patch.object(
+            test_module.LOGGER, "error"
+        ), async_mock.patch.object(test_module.LOGGER, "exception"):
+            mgr.enqueue_webhook("topic", {}, "http://example", max_attempts=3)
+            await asyncio.sleep(0.01)
+            assert mgr.endpoint_states()["http://example"]["state"] == "open"
+            for _ in range(2):
+                await mgr.enqueue_message(
+                    profile,
+                    OutboundMessage(
+                        payload="{}",
+                        enc_payload="{}",
+                        target=ConnectionTarget(endpoint="http://example"),
+                    ),
+                )
+            mgr.outbound_new[-1].retries = 1
+            await asyncio.sleep(0.01)
+            assert mgr.endpoint_states()["http://example"]["parked"] == 2
+
+            # each failed probe counts against the parked messages, and
+            # those without retries remaining are not delivered
+            await asyncio.sleep(0.03)
+            assert mgr.endpoint_states()["http://example"]["parked"] == 2
+            assert not mock_handle_not_delivered.called
+            await asyncio.sleep(0.05)
+            assert mgr.endpoint_states()["http://example"]["parked"] == 0
+            assert mock_handle_not_delivered.call_count == 1
+            assert mock_handle_not_delivered.call_args[0][1].payload == "{}"
+        await mgr.stop()
+
+    async def test_circuit_breaker_disabled(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.outbound_breaker_threshold": 0}
+        )
+        mgr = OutboundTransportManager(profile)
+        mock_queued = async_mock.MagicMock(retries=1, endpoint="http://example")
+        mock_task = async_mock.MagicMock(exc_info=(KeyError, KeyError("nope"), None))
+        with async_mock.patch.object(mgr, "process_queued", async_mock.MagicMock()):
+            for _ in range(5):
+                mgr.finished_deliver(mock_queued, mock_task)
+        assert not mgr.breakers
+        assert mgr.endpoint_states() == {}
+
     async def test_process_done_x(self):
         mock_task = async_mock.MagicMock(
             done=async_mock.MagicMock(return_value=True),
@@ -181,7 +394,7 @@ class TestOutboundTransportManager(AsyncTestCase):
             mgr._process_done(mock_task)
 
     async def test_process_finished_x(self):
-        mock_queued = async_mock.MagicMock(retries=1)
+        mock_queued = async_mock.MagicMock(retries=1, endpoint="http://example")
         mock_task = async_mock.MagicMock(
             exc_info=(KeyError, KeyError("nope"), None),
         )
@@ -204,7 +417,8 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with async_mock.patch.object(
             test_module, "trace_event", async_mock.MagicMock()
@@ -223,15 +437,51 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", async_mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            # sleeps until the retry is due
+            assert 3590 < mock_wait_for.call_args[0][1] <= 3601
+            mock_wait_for.call_args[0][0].close()
+
+    async def test_process_loop_retry_wakeup(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        parked = [
+            async_mock.MagicMock(
+                state=QueuedOutboundMessage.STATE_RETRY,
+                retry_at=test_module.get_timer() + 3600 + i,
+            )
+            for i in range(100)
+        ]
+        for queued in parked:
+            mgr.outbound_buffer.add(queued)
+            mgr.schedule_retry(queued)
+        due = async_mock.MagicMock(
+            state=QueuedOutboundMessage.STATE_RETRY,
+            retry_at=test_module.get_timer() + 0.01,
+        )
+        mgr.outbound_buffer.add(due)
+        mgr.schedule_retry(due)
+
+        with async_mock.patch.object(
+            mgr, "deliver_queued_message", async_mock.MagicMock()
+        ) as mock_deliver, async_mock.patch.object(
+            test_module, "trace_event", async_mock.MagicMock()
+        ):
+            task = asyncio.ensure_future(mgr._process_loop())
+            await asyncio.sleep(0.1)
+            mock_deliver.assert_called_once_with(due)
+            assert due.state == QueuedOutboundMessage.STATE_DELIVER
+            assert len(mgr.outbound_retry) == 100
+            task.cancel()
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
@@ -290,20 +540,24 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_done.append(mock_queued)
 
         await mgr._process_loop()
+        assert not mgr.outbound_buffer
 
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = async_mock.MagicMock(
-            state=QueuedOutboundMessage.STATE_DONE, retries=1
+            state=QueuedOutboundMessage.STATE_DONE,
+            retries=1,
+            endpoint="http://example",
         )
         mock_completed_x = async_mock.MagicMock(exc_info=KeyError("an error occurred"))
 
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
         with async_mock.patch.object(
             test_module.LOGGER, "exception", async_mock.MagicMock()
         ) as mock_logger_exception, async_mock.patch.object(
@@ -0,0 +1,106 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ....core.in_memory import InMemoryProfile
+from ....storage.base import BaseStorage
+from ....storage.error import StorageError
+
+from .. import queue_store as test_module
+from ..queue_store import OutboundQueueStore
+
+
+class TestOutboundQueueStore(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.store = OutboundQueueStore(self.profile, flush_interval=0.01)
+
+    async def stored_records(self):
+        async with self.profile.session() as session:
+            return await session.inject(BaseStorage).find_all_records(
+                OutboundQueueStore.RECORD_TYPE
+            )
+
+    async def test_save_load(self):
+        str_id = self.store.save(
+            None,
+            endpoint="http://example/1",
+            payload='{"a": 1}',
+            retries=3,
+            metadata={"x-header": "val"},
+            api_key="key",
+        )
+        bytes_id = self.store.save(None, endpoint="http://example/2", payload=b"\0enc")
+        assert self.store.pending_changes == 2
+        await self.store.flush()
+        assert self.store.pending_changes == 0
+        assert self.store.total_flushes == 1
+        assert len(await self.stored_records()) == 2
+
+        loaded = {
+            entry["queue_id"]: entry
+            for entry in await OutboundQueueStore(self.profile).load()
+        }
+        assert loaded[str_id] == {
+            "queue_id": str_id,
+            "endpoint": "http://example/1",
+            "payload": '{"a": 1}',
+            "retries": 3,
+            "metadata": {"x-header": "val"},
+            "api_key": "key",
+        }
+        assert loaded[bytes_id]["payload"] == b"\0enc"
+
+    async def test_update_remove(self):
+        queue_id = self.store.save(None, endpoint="http://example", payload="msg")
+        await self.store.flush()
+        assert self.store.save(
+            queue_id, endpoint="http://example", payload="msg", retries=1
+        ) == (queue_id)
+        await self.store.flush()
+        (entry,) = await OutboundQueueStore(self.profile).load()
+        assert entry["retries"] == 1
+
+        self.store.remove(queue_id)
+        self.store.remove(None)
+        await self.store.flush()
+        assert not await self.stored_records()
+
+    async def test_remove_before_flush(self):
+        queue_id = self.store.save(None, endpoint="http://example", payload="msg")
+        self.store.remove(queue_id)
+        assert self.store.pending_changes == 0
+        await self.store.close()
+        assert self.store.total_flushes == 0
+        assert not await self.stored_records()
+
+    async def test_scheduled_flush(self):
+        self.store.save(None, endpoint="http://example", payload="msg")
+        await asyncio.sleep(0.05)
+        assert self.store.total_flushes == 1
+        assert len(await self.stored_records()) == 1
+
+    async def test_flush_size(self):
+        store = OutboundQueueStore(self.profile, flush_interval=3600, flush_size=5)
+        for _ in range(5):
+            store.save(None, endpoint="http://example", payload="msg")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert store.total_flushes == 1
+        assert store.pending_changes == 0
+        await store.close()
+
+    async def test_flush_error_keeps_changes(self):
+        queue_id = self.store.save(None, endpoint="http://example", payload="msg")
+        with async_mock.patch.object(
+            self.store, "_write", async_mock.CoroutineMock()
+        ) as mock_write, async_mock.patch.object(
+            test_module.LOGGER, "exception", async_mock.MagicMock()
+        ) as mock_log:
+            mock_write.side_effect = StorageError()
+            await self.store.flush()
+            mock_log.assert_called_once()
+        assert self.store.pending_changes == 1
+        await self.store.close()
+        (entry,) = await OutboundQueueStore(self.profile).load()
+        assert entry["queue_id"] == queue_id
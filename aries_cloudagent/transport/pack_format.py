@@ -159,6 +159,72 @@ class PackWireFormat(BaseWireFormat):
             message = message_json
         return message
 
+    async def encode_messages(
+        self,
+        session: ProfileSession,
+        messages: Sequence[Tuple[Union[str, bytes], Sequence[str], Sequence[str], str]],
+    ) -> List[Union[str, bytes, WireFormatEncodeError]]:
+        """
+        Encode a group of outgoing messages for transport.
+
+        The messages are packed together with the wallet's batch API, followed
+        by one batch of forward messages for each level of routing keys.
+
+        Args:
+            session: The profile session for providing wallet access
+            messages: A sequence of (message_json, recipient_keys, routing_keys,
+                sender_key) tuples
+
+        Returns:
+            For each message in order, the encoded message or the error raised
+            encoding it
+
+        """
+        results = [message_json for (message_json, *_) in messages]
+        pending = [
+            index
+            for (index, (_, recipient_keys, _, sender_key)) in enumerate(messages)
+            if sender_key and recipient_keys
+        ]
+        if not pending:
+            return results
+
+        wallet = session.inject_or(BaseWallet)
+        if not wallet:
+            raise WireFormatEncodeError("No wallet instance")
+
+        batch = [
+            (messages[index][0], messages[index][1], messages[index][3])
+            for index in pending
+        ]
+        recip_keys = {index: messages[index][1] for index in pending}
+        hop = 0
+        while pending:
+            packed = await wallet.pack_messages(batch)
+            for (index, message) in zip(pending, packed):
+                if isinstance(message, WalletError):
+                    error = WireFormatEncodeError(
+                        "Forward message pack failed" if hop else "Message pack failed"
+                    )
+                    error.__cause__ = message
+                    message = error
+                results[index] = message
+            pending = [
+                index
+                for index in pending
+                if not isinstance(results[index], WireFormatEncodeError)
+                and len(messages[index][2] or ()) > hop
+            ]
+            batch = []
+            for index in pending:
+                router_key = messages[index][2][hop]
+                fwd_json = self.forward_json(recip_keys[index][0], results[index])
+                # Forwards are anon packed
+                recip_keys[index] = [router_key]
+                batch.append((fwd_json, [router_key], None))
+            hop += 1
+        return results
+
     async def pack(
         self,
         session: ProfileSession,
@@ -185,16 +251,37 @@ class PackWireFormat(BaseWireFormat):
         if routing_keys:
             recip_keys = recipient_keys
             for router_key in routing_keys:
-                message = json.loads(message.decode("utf-8"))
-                fwd_msg = Forward(to=recip_keys[0], msg=message)
+                fwd_json = self.forward_json(recip_keys[0], message)
                 # Forwards are anon packed
                 recip_keys = [router_key]
                 try:
-                    message = await wallet.pack_message(fwd_msg.to_json(), recip_keys)
+                    message = await wallet.pack_message(fwd_json, recip_keys)
                 except WalletError as e:
                     raise WireFormatEncodeError("Forward message pack failed") from e
         return message
 
+    @staticmethod
+    def forward_json(to: str, packed: Union[str, bytes]) -> str:
+        """
+        Serialize a forward message wrapping a packed message.
+
+        The packed message is embedded in the forward message as it is, so a
+        large message is not parsed and serialized again for each routing key.
+
+        Args:
+            to: The recipient key of the packed message
+            packed: The packed message
+
+        Returns:
+            The JSON of the forward message
+
+        """
+        if isinstance(packed, bytes):
+            packed = packed.decode("utf-8")
+        fwd_msg = Forward(to=to)
+        header = json.dumps({"@type": fwd_msg._type, "@id": fwd_msg._id, "to": to})
+        return f'{header[:-1]}, "msg": {packed}}}'
+
     def get_recipient_keys(self, message_body: Union[str, bytes]) -> List[str]:
         """
         Get all recipient keys from a wire message.
@@ -6,6 +6,7 @@ from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from ...core.in_memory import InMemoryProfile
 from ...protocols.routing.v1_0.message_types import FORWARD
+from ...protocols.routing.v1_0.messages.forward import Forward
 from ...protocols.didcomm_prefix import DIDCommPrefix
 from ...wallet.base import BaseWallet
 from ...wallet.error import WalletError
@@ -105,14 +106,8 @@ class TestPackWireFormat(AsyncTestCase):
             )
         )
         session = InMemoryProfile.test_session(bind={BaseWallet: mock_wallet})
-        with async_mock.patch.object(
-            test_module, "Forward", async_mock.MagicMock()
-        ) as mock_forward:
-            mock_forward.return_value = async_mock.MagicMock(
-                to_json=async_mock.MagicMock()
-            )
-            with self.assertRaises(WireFormatEncodeError):
-                await serializer.pack(session, None, ["key"], ["key"], ["key"])
+        with self.assertRaises(WireFormatEncodeError):
+            await serializer.pack(session, None, ["key"], ["key"], ["key"])
 
     async def test_unpacked(self):
         serializer = PackWireFormat()
@@ -199,6 +194,103 @@ class TestPackWireFormat(AsyncTestCase):
         assert delivery.recipient_verkey == router_did.verkey
         assert delivery.sender_verkey is None
 
+    async def test_forward_multiple_routing_keys(self):
+        local_did = await self.wallet.create_local_did(
+            method=DIDMethod.SOV, key_type=KeyType.ED25519, seed=self.test_seed
+        )
+        router_did = await self.wallet.create_local_did(
+            method=DIDMethod.SOV, key_type=KeyType.ED25519, seed=self.test_routing_seed
+        )
+        router_did_2 = await self.wallet.create_local_did(
+            method=DIDMethod.SOV, key_type=KeyType.ED25519
+        )
+        serializer = PackWireFormat()
+        message_json = json.dumps(self.test_message)
+
+        packed_json = await serializer.encode_message(
+            self.session,
+            message_json,
+            (local_did.verkey,),
+            (router_did.verkey, router_did_2.verkey),
+            local_did.verkey,
+        )
+
+        # unwrap each forward as the mediators would
+        message_dict, delivery = await serializer.parse_message(
+            self.session, packed_json
+        )
+        assert delivery.recipient_verkey == router_did_2.verkey
+        assert message_dict["@type"] == DIDCommPrefix.qualify_current(FORWARD)
+        assert message_dict["to"] == router_did.verkey
+
+        message_dict, delivery = await serializer.parse_message(
+            self.session, json.dumps(message_dict["msg"])
+        )
+        assert delivery.recipient_verkey == router_did.verkey
+        assert message_dict["to"] == local_did.verkey
+
+        message_dict, delivery = await serializer.parse_message(
+            self.session, json.dumps(message_dict["msg"])
+        )
+        assert delivery.recipient_verkey == local_did.verkey
+        assert delivery.sender_verkey == local_did.verkey
+        assert message_dict == self.test_message
+
+    async def test_encode_messages(self):
+        local_did = await self.wallet.create_local_did(
+            method=DIDMethod.SOV, key_type=KeyType.ED25519, seed=self.test_seed
+        )
+        router_did = await self.wallet.create_local_did(
+            method=DIDMethod.SOV, key_type=KeyType.ED25519, seed=self.test_routing_seed
+        )
+        serializer = PackWireFormat()
+        message_json = json.dumps(self.test_message)
+        recipient_keys = (local_did.verkey,)
+
+        encoded = await serializer.encode_messages(
+            self.session,
+            [
+                (message_json, recipient_keys, (), local_did.verkey),
+                (message_json, None, None, None),
+                (message_json, recipient_keys, (router_did.verkey,), "unknown"),
+                (message_json, recipient_keys, (router_did.verkey,), local_did.verkey),
+            ],
+        )
+        assert encoded[1] == message_json
+        assert isinstance(encoded[2], WireFormatEncodeError)
+
+        message_dict, delivery = await serializer.parse_message(
+            self.session, encoded[0]
+        )
+        assert message_dict == self.test_message
+        assert delivery.recipient_verkey == local_did.verkey
+
+        message_dict, delivery = await serializer.parse_message(
+            self.session, encoded[3]
+        )
+        assert message_dict["@type"] == DIDCommPrefix.qualify_current(FORWARD)
+        assert delivery.recipient_verkey == router_did.verkey
+        message_dict, delivery = await serializer.parse_message(
+            self.session, json.dumps(message_dict["msg"])
+        )
+        assert message_dict == self.test_message
+
+        assert await serializer.encode_messages(self.session, []) == []
+        with self.assertRaises(WireFormatEncodeError):
+            await serializer.encode_messages(
+                InMemoryProfile.test_session(bind={BaseWallet: None}),
+                [(message_json, recipient_keys, (), local_did.verkey)],
+            )
+
+    async def test_forward_json(self):
+        packed = json.dumps({"protected": "PROTECTED", "ciphertext": "CIPHERTEXT"})
+        fwd_json = PackWireFormat.forward_json("KEY", packed.encode("utf-8"))
+
+        fwd = Forward.deserialize(json.loads(fwd_json))
+        assert fwd.to == "KEY"
+        assert fwd.msg == json.loads(packed)
+        assert json.loads(fwd_json)["@type"] == DIDCommPrefix.qualify_current(FORWARD)
+
     async def test_get_recipient_keys(self):
         recip_keys = ["kid1", "kid2", "kid3"]
         enc_message = {
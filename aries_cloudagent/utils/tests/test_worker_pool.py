@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+from asynctest import TestCase as AsyncTestCase
+
+from ...core.in_memory import InMemoryProfile
+
+from ..stats import Collector
+from ..worker_pool import WorkerPool, WorkerPoolBusyError, run_in_worker_pool
+
+
+class TestWorkerPool(AsyncTestCase):
+    def tearDown(self):
+        self.release.set()
+
+    async def setUp(self):
+        self.release = threading.Event()
+
+    def blocking(self, value):
+        self.release.wait(5)
+        return value
+
+    async def test_run(self):
+        collector = Collector()
+        pool = WorkerPool(max_workers=2, collector=collector)
+        self.release.set()
+        assert await pool.run("op", self.blocking, 1) == 1
+        with self.assertRaises(ValueError):
+            await pool.run("bad", int, "a")
+
+        stats = pool.stats
+        assert stats["max_workers"] == 2
+        assert stats["running"] == stats["pending"] == 0
+        assert stats["operations"]["op"]["count"] == 1
+        assert stats["operations"]["op"]["errors"] == 0
+        assert sum(stats["operations"]["op"]["histogram"].values()) == 1
+        assert stats["operations"]["bad"]["errors"] == 1
+        assert collector.results["count"]["WorkerPool.op"] == 1
+        pool.shutdown()
+
+    async def test_pending(self):
+        pool = WorkerPool(max_workers=1)
+        tasks = [
+            asyncio.ensure_future(pool.run("op", self.blocking, n)) for n in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        assert pool.stats["running"] == 1
+        assert pool.stats["pending"] == 2
+        self.release.set()
+        assert await asyncio.gather(*tasks) == [0, 1, 2]
+        assert pool.stats["operations"]["op"]["count"] == 3
+        pool.shutdown()
+
+    async def test_admission_rejected(self):
+        pool = WorkerPool(max_workers=1, max_pending=1, admission_timeout=0)
+        tasks = [
+            asyncio.ensure_future(pool.run("op", self.blocking, n)) for n in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        with self.assertRaises(WorkerPoolBusyError):
+            await pool.run("op", self.blocking, 2)
+        assert pool.stats["rejected"] == 1
+        self.release.set()
+        await asyncio.gather(*tasks)
+        # admitted again once operations complete
+        assert await pool.run("op", self.blocking, 3) == 3
+        pool.shutdown()
+
+    async def test_admission_timeout(self):
+        pool = WorkerPool(max_workers=1, max_pending=0, admission_timeout=0.05)
+        task = asyncio.ensure_future(pool.run("op", self.blocking, 0))
+        await asyncio.sleep(0.01)
+        with self.assertRaises(WorkerPoolBusyError):
+            await pool.run("op", self.blocking, 1)
+        self.release.set()
+        await task
+        pool.shutdown()
+
+    async def test_run_in_worker_pool(self):
+        profile = InMemoryProfile.test_profile()
+        self.release.set()
+        assert await run_in_worker_pool(profile, "op", self.blocking, 1) == 1
+
+        pool = WorkerPool()
+        profile.context.injector.bind_instance(WorkerPool, pool)
+        assert await run_in_worker_pool(profile, "op", self.blocking, 2) == 2
+        assert pool.stats["operations"]["op"]["count"] == 1
+        pool.shutdown()
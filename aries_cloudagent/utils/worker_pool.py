@@ -0,0 +1,222 @@
+"""Worker pool for CPU-bound cryptographic operations."""
+
+import asyncio
+import bisect
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from ..core.error import BaseError
+from ..core.profile import Profile
+
+from .stats import Collector
+
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class WorkerPoolBusyError(BaseError):
+    """The worker pool cannot accept another operation."""
+
+
+class OperationStats:
+    """Latency statistics for one kind of operation."""
+
+    def __init__(self):
+        """Initialize an `OperationStats` instance."""
+        self.count = 0
+        self.errors = 0
+        self.queue_time = 0.0
+        self.run_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, queue_time: float, run_time: float, error: bool):
+        """Record a completed operation."""
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.queue_time += queue_time
+        self.run_time += run_time
+        latency = queue_time + run_time
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def serialize(self) -> dict:
+        """Return the statistics as a dictionary."""
+        buckets = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "queue_time": round(self.queue_time, 3),
+            "run_time": round(self.run_time, 3),
+            "histogram": dict(zip(buckets, self.histogram)),
+        }
+
+
+class WorkerPool:
+    """
+    Dedicated pool of worker threads for CPU-bound cryptographic operations.
+
+    Operations such as credential and presentation creation hold a worker for
+    a long time, so they run apart from the default executor used for other
+    blocking calls. When a limit on pending operations is set, callers beyond
+    it wait for admission, or are rejected once the admission timeout passes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = None,
+        max_pending: int = None,
+        admission_timeout: float = None,
+        collector: Collector = None,
+    ):
+        """
+        Initialize a `WorkerPool` instance.
+
+        Args:
+            max_workers: the number of worker threads, by default the CPU count
+            max_pending: the maximum number of operations waiting for a worker
+            admission_timeout: the number of seconds to wait for admission when
+                the pool is full before rejecting the operation, or None to wait
+            collector: optional collector for operation timing statistics
+
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.admission_timeout = admission_timeout
+        self.collector = collector
+        self.running = 0
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._admission: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Accessor for the executor, created on first use."""
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="acapy-crypto"
+            )
+        return self._executor
+
+    async def _admit(self, operation: str):
+        """Wait for the pool to admit an operation."""
+        if self.max_pending is None:
+            return
+        if not self._admission:
+            self._admission = asyncio.Semaphore(self.max_workers + self.max_pending)
+        if not self._admission.locked():
+            await self._admission.acquire()
+            return
+        if self.admission_timeout == 0:
+            self.rejected += 1
+            raise WorkerPoolBusyError(f"Worker pool is full, rejected {operation}")
+        try:
+            await asyncio.wait_for(
+                self._admission.acquire(), timeout=self.admission_timeout
+            )
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise WorkerPoolBusyError(
+                f"Timed out waiting for the worker pool, rejected {operation}"
+            )
+
+    async def run(self, operation: str, fn: Callable, *args):
+        """
+        Run a function in a worker thread.
+
+        Args:
+            operation: the name of the operation, for statistics
+            fn: the function to call
+            args: the arguments to the function
+
+        Returns:
+            The result of the function
+
+        """
+        await self._admit(operation)
+        submitted = time.perf_counter()
+        state = {"started": None, "abandoned": False}
+
+        def call():
+            with self._lock:
+                if state["abandoned"]:
+                    return None
+                state["started"] = time.perf_counter()
+                self.pending -= 1
+                self.running += 1
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        with self._lock:
+            self.pending += 1
+        error = True
+        try:
+            result = await asyncio.get_event_loop().run_in_executor(self.executor, call)
+            error = False
+            return result
+        finally:
+            if self._admission:
+                self._admission.release()
+            with self._lock:
+                started = state["started"]
+                if started is None:
+                    # the caller is gone before a worker picked up the operation
+                    state["abandoned"] = True
+                    self.pending -= 1
+            if started is not None:
+                elapsed = time.perf_counter() - started
+                if operation not in self._operations:
+                    self._operations[operation] = OperationStats()
+                self._operations[operation].record(started - submitted, elapsed, error)
+                if self.collector:
+                    self.collector.log(f"WorkerPool.{operation}", elapsed)
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the pool statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "running": self.running,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "operations": {
+                operation: stats.serialize()
+                for (operation, stats) in self._operations.items()
+            },
+        }
+
+    def shutdown(self):
+        """Stop the worker threads once the operations in progress complete."""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+async def run_in_worker_pool(profile: Profile, operation: str, fn: Callable, *args):
+    """
+    Run a CPU-bound operation in the profile's worker pool.
+
+    Falls back to the default executor when no worker pool is configured.
+
+    Args:
+        profile: the active profile
+        operation: the name of the operation, for statistics
+        fn: the function to call
+        args: the arguments to the function
+
+    """
+    pool = profile.inject_or(WorkerPool)
+    if pool:
+        return await pool.run(operation, fn, *args)
+    return await asyncio.get_event_loop().run_in_executor(None, fn, *args)
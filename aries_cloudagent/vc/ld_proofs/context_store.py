@@ -0,0 +1,182 @@
+"""Store of JSON-LD contexts available without network access."""
+
+import copy
+import hashlib
+import json
+import logging
+
+from os import path
+from typing import Dict, Optional, Sequence, Tuple
+
+from .constants import (
+    CREDENTIALS_CONTEXT_V1_URL,
+    DID_V1_CONTEXT_URL,
+    SECURITY_CONTEXT_BBS_URL,
+    SECURITY_CONTEXT_V1_URL,
+    SECURITY_CONTEXT_V2_URL,
+    SECURITY_CONTEXT_V3_URL,
+)
+from .error import LinkedDataProofException
+
+LOGGER = logging.getLogger(__name__)
+
+RESOURCES_DIR = path.join(path.dirname(__file__), "resources")
+
+# name of the index file mapping context urls to files in a context directory
+CONTEXT_DIR_INDEX = "index.json"
+
+# contexts shipped with the package, pinned to the sha256 digest of the file
+BUNDLED_CONTEXTS: Dict[str, Tuple[str, str]] = {
+    CREDENTIALS_CONTEXT_V1_URL: (
+        "credentials_v1.jsonld",
+        "00d7dd6d3ad8b920e3e550dd3a3d9090bffcac84cdbf943da6924b3e0a5c8bb8",
+    ),
+    "https://www.w3.org/2018/credentials/examples/v1": (
+        "credentials_examples_v1.jsonld",
+        "1758a6b1b44211ba686c145049a4c42b12cf0f4805b858f3ea5c4c3b7a900359",
+    ),
+    SECURITY_CONTEXT_V1_URL: (
+        "security_v1.jsonld",
+        "e2d146cd556f6fa5f14996c6f1749667d5a14073fa30f0643990068e2c0b1bac",
+    ),
+    SECURITY_CONTEXT_V2_URL: (
+        "security_v2.jsonld",
+        "4cb186bc29c08af6e40c58178c22dd84d542f2871a063afed6e648b47abc3cf6",
+    ),
+    SECURITY_CONTEXT_V3_URL: (
+        "security_v3_unstable.jsonld",
+        "7f3b25ac37785b6e5da026570d95627e3599999ff84db3e824c2c5ce90075bd5",
+    ),
+    SECURITY_CONTEXT_BBS_URL: (
+        "security_bbs_v1.jsonld",
+        "41ee2c6583cf5e807a737a12326477f414437d5c83b8cfe8ee9a6ee9ecea06c1",
+    ),
+    DID_V1_CONTEXT_URL: (
+        "did_v1.jsonld",
+        "62c1054bf404d6dd3a4b26b64f830fd72095f6a26edc4469908c94351352ce5f",
+    ),
+    # imported by the credentials examples context
+    "https://www.w3.org/ns/odrl.jsonld": (
+        "odrl.jsonld",
+        "e028768d8f72dd25d1d27c97d5898f8877447b31f77316a9f3300ad4f301bb0c",
+    ),
+    "https://w3id.org/citizenship/v1": (
+        "citizenship_v1.jsonld",
+        "4caf8d4d3a6a175f5e5ba6b91dc1fdd88a050630930a6478d8e4cb765c565f40",
+    ),
+    "https://w3id.org/vaccination/v1": (
+        "vaccination_v1.jsonld",
+        "54d049b5bf63724ef91636bd50e8f649b82124bf3e7d967cc173a214daca7306",
+    ),
+}
+
+
+class ContextStore:
+    """
+    Store of JSON-LD contexts served from local files.
+
+    The store holds the contexts bundled with the package and those added from
+    context directories. Each context file is read and parsed once, on first
+    use, and the parsed document is kept in memory afterwards.
+
+    A context directory contains an `index.json` file mapping each context url
+    to the name of its file in the directory.
+    """
+
+    def __init__(self, context_dirs: Sequence[str] = None, *, bundled: bool = True):
+        """
+        Initialize a `ContextStore` instance.
+
+        Args:
+            context_dirs: directories of additional contexts
+            bundled: whether to include the contexts bundled with the package
+
+        """
+        self._files: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._documents: Dict[str, dict] = {}
+        if bundled:
+            for url, (file_name, digest) in BUNDLED_CONTEXTS.items():
+                self._files[url] = (path.join(RESOURCES_DIR, file_name), digest)
+        for context_dir in context_dirs or ():
+            self.add_directory(context_dir)
+
+    def add_directory(self, context_dir: str):
+        """Add the contexts listed in the index of a context directory."""
+        index_path = path.join(context_dir, CONTEXT_DIR_INDEX)
+        try:
+            with open(index_path) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError) as err:
+            raise LinkedDataProofException(
+                f"Error reading JSON-LD context index {index_path}: {err}"
+            ) from err
+        if not isinstance(index, dict):
+            raise LinkedDataProofException(
+                f"JSON-LD context index {index_path} must map urls to file names"
+            )
+        for url, file_name in index.items():
+            self.add_file(url, path.join(context_dir, file_name))
+
+    def add_file(self, url: str, file_path: str, digest: str = None):
+        """
+        Add a context file to the store.
+
+        Args:
+            url: the url of the context
+            file_path: the path of the context file
+            digest: optional hex sha256 digest the file contents must match
+
+        """
+        self._files[url] = (file_path, digest)
+        self._documents.pop(url, None)
+
+    def _load(self, url: str) -> dict:
+        """Read, verify and parse a context file."""
+        (file_path, digest) = self._files[url]
+        try:
+            with open(file_path, "rb") as context_file:
+                data = context_file.read()
+        except OSError as err:
+            raise LinkedDataProofException(
+                f"Error reading JSON-LD context {url} from {file_path}: {err}"
+            ) from err
+        if digest and hashlib.sha256(data).hexdigest() != digest:
+            raise LinkedDataProofException(
+                f"JSON-LD context file {file_path} does not match the pinned "
+                f"digest for {url}"
+            )
+        try:
+            document = json.loads(data)
+        except ValueError as err:
+            raise LinkedDataProofException(
+                f"Error parsing JSON-LD context {url} from {file_path}: {err}"
+            ) from err
+        LOGGER.debug("Loaded JSON-LD context %s from %s", url, file_path)
+        return document
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Get a context document from the store.
+
+        Args:
+            url: the url of the context, with or without a fragment
+
+        Returns:
+            A copy of the parsed context document, or None if not in the store
+
+        """
+        url = url.split("#")[0]
+        if url not in self._files:
+            return None
+        if url not in self._documents:
+            self._documents[url] = self._load(url)
+        return copy.deepcopy(self._documents[url])
+
+    def __contains__(self, url: str) -> bool:
+        """Check whether the store holds a context."""
+        return url.split("#")[0] in self._files
+
+    @property
+    def urls(self) -> Sequence[str]:
+        """Accessor for the urls of the contexts in the store."""
+        return list(self._files)
@@ -1,9 +1,9 @@
 """JSON-LD document loader methods."""
 
 import asyncio
-import concurrent.futures
+import functools
 
-from typing import Callable
+from typing import Callable, Optional
 
 from pydid.did_url import DIDUrl
 from pyld.documentloader import requests
@@ -11,16 +11,27 @@ from pyld.documentloader import requests
 from ...cache.base import BaseCache
 from ...core.profile import Profile
 from ...resolver.did_resolver import DIDResolver
+from ...utils.worker_pool import run_in_worker_pool
 
+from .context_store import ContextStore
 from .error import LinkedDataProofException
 
-import nest_asyncio
-
-nest_asyncio.apply()
+# shared by document loaders of profiles without a context store of their own
+DEFAULT_CONTEXT_STORE = ContextStore()
 
 
 class DocumentLoader:
-    """JSON-LD document loader."""
+    """
+    JSON-LD document loader.
+
+    Contexts held in the context store are served from memory and tagged as
+    static, so that pyld keeps the processed contexts for reuse across
+    operations. When offline, no other http(s) document is loaded.
+
+    pyld calls the loader synchronously, so JSON-LD processing must run off the
+    event loop, see `run_jsonld`. Documents not in the context store are then
+    loaded on the event loop while the calling worker thread waits.
+    """
 
     def __init__(self, profile: Profile, cache_ttl: int = 300) -> None:
         """Initialize new DocumentLoader instance.
@@ -34,8 +45,9 @@ class DocumentLoader:
         self.resolver = profile.inject(DIDResolver)
         self.cache = profile.inject_or(BaseCache)
         self.requests_loader = requests.requests_document_loader()
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.cache_ttl = cache_ttl
+        self.context_store = profile.inject_or(ContextStore) or DEFAULT_CONTEXT_STORE
+        self.offline = bool(profile.settings.get("jsonld.offline"))
         self._event_loop = asyncio.get_event_loop()
 
     async def _load_did_document(self, did: str, options: dict):
@@ -55,8 +67,28 @@ class DocumentLoader:
 
         return document
 
-    def _load_http_document(self, url: str, options: dict):
-        document = self.requests_loader(url, options)
+    def _load_stored_context(self, url: str) -> Optional[dict]:
+        context = self.context_store.get(url)
+        if context is None:
+            return None
+        return {
+            "contentType": "application/ld+json",
+            "contextUrl": None,
+            "documentUrl": url,
+            "document": context,
+            # lets pyld cache the resolved context for the life of the process
+            "tag": "static",
+        }
+
+    async def _load_http_document(self, url: str, options: dict):
+        if self.offline:
+            raise LinkedDataProofException(
+                f"Document {url} is not in the JSON-LD context store "
+                "and network loading is disabled"
+            )
+        document = await asyncio.get_event_loop().run_in_executor(
+            None, self.requests_loader, url, options
+        )
 
         return document
 
@@ -68,7 +100,7 @@ class DocumentLoader:
         if url.startswith("did:"):
             document = await self._load_did_document(url, options)
         elif url.startswith("http://") or url.startswith("https://"):
-            document = self._load_http_document(url, options)
+            document = await self._load_http_document(url, options)
         else:
             raise LinkedDataProofException(
                 "Unrecognized url format. Must start with "
@@ -80,11 +112,13 @@ class DocumentLoader:
     async def load_document(self, url: str, options: dict):
         """Load JSON-LD document.
 
-        Method signature conforms to PyLD document loader interface
-
-        Document loading is processed in separate thread to deal with
-        async to sync transformation.
+        Method signature conforms to PyLD document loader interface, as a
+        coroutine.
         """
+        document = self._load_stored_context(url)
+        if document:
+            return document
+
         cache_key = f"json_ld_document_resolver::{url}"
 
         # Try to get from cache
@@ -103,14 +137,48 @@ class DocumentLoader:
 
     def __call__(self, url: str, options: dict):
         """Load JSON-LD Document."""
+        document = self._load_stored_context(url)
+        if document:
+            return document
 
-        loop = self._event_loop
-        coroutine = self.load_document(url, options)
-        document = loop.run_until_complete(coroutine)
+        # asyncio.get_running_loop is not available before python 3.7
+        if asyncio._get_running_loop() is self._event_loop:
+            raise LinkedDataProofException(
+                f"Document {url} cannot be loaded from the event loop thread, "
+                "JSON-LD processing must run through run_jsonld"
+            )
 
-        return document
+        return asyncio.run_coroutine_threadsafe(
+            self.load_document(url, options), self._event_loop
+        ).result()
 
 
 DocumentLoaderMethod = Callable[[str, dict], dict]
 
-__all__ = ["DocumentLoaderMethod", "DocumentLoader"]
+
+async def run_jsonld(loader: DocumentLoaderMethod, fn: Callable, *args, **kwargs):
+    """
+    Run synchronous JSON-LD processing, such as canonicalization, off the event loop.
+
+    Processing using a `DocumentLoader` runs in the crypto worker pool of its
+    profile, other processing in the default executor.
+
+    Args:
+        loader: the document loader used by the processing
+        fn: the function to call
+        args: the positional arguments to the function
+        kwargs: the keyword arguments to the function
+
+    Returns:
+        The result of the function
+
+    """
+    call = functools.partial(fn, *args, **kwargs)
+    if isinstance(loader, DocumentLoader):
+        return await run_in_worker_pool(
+            loader.profile, f"jsonld.{fn.__name__.lstrip('_')}", call
+        )
+    return await asyncio.get_event_loop().run_in_executor(None, call)
+
+
+__all__ = ["DocumentLoaderMethod", "DocumentLoader", "run_jsonld"]
@@ -27,7 +27,7 @@ from ....wallet.util import b64_to_bytes, bytes_to_b64
 from ..crypto import _KeyPair as KeyPair
 from ..error import LinkedDataProofException
 from ..validation_result import ProofResult
-from ..document_loader import DocumentLoaderMethod
+from ..document_loader import DocumentLoaderMethod, run_jsonld
 from ..purposes import _ProofPurpose as ProofPurpose
 
 from .bbs_bls_signature_2020 import BbsBlsSignature2020
@@ -71,6 +71,26 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         """Derive proof for document, return dict with derived document and proof."""
         assert_ursa_bbs_signatures_installed()
 
+        return await run_jsonld(
+            document_loader,
+            self._derive_proof,
+            proof=proof,
+            document=document,
+            reveal_document=reveal_document,
+            document_loader=document_loader,
+            nonce=nonce,
+        )
+
+    def _derive_proof(
+        self,
+        *,
+        proof: dict,
+        document: dict,
+        reveal_document: dict,
+        document_loader: DocumentLoaderMethod,
+        nonce: bytes = None,
+    ) -> DeriveProofResult:
+        """Derive proof for document, synchronously."""
         # Validate that the input proof document has a proof compatible with this suite
         if proof.get("type") not in self.supported_derive_proof_types:
             raise LinkedDataProofException(
@@ -232,6 +252,25 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
     ) -> ProofResult:
         """Verify proof against document and proof purpose."""
         assert_ursa_bbs_signatures_installed()
+
+        return await run_jsonld(
+            document_loader,
+            self._verify_proof,
+            proof=proof,
+            document=document,
+            purpose=purpose,
+            document_loader=document_loader,
+        )
+
+    def _verify_proof(
+        self,
+        *,
+        proof: dict,
+        document: dict,
+        purpose: ProofPurpose,
+        document_loader: DocumentLoaderMethod,
+    ) -> ProofResult:
+        """Verify proof against document and proof purpose, synchronously."""
         try:
             proof["type"] = self.mapped_derived_proof_type
 
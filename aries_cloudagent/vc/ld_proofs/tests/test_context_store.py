@@ -0,0 +1,77 @@
+import json
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from os import path
+from tempfile import TemporaryDirectory
+
+from ....core.in_memory import InMemoryProfile
+from ....resolver.did_resolver import DIDResolver
+
+from ...tests.contexts import CREDENTIALS_V1, SECURITY_V2
+
+from ..constants import CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_V2_URL
+from ..context_store import BUNDLED_CONTEXTS, ContextStore
+from ..document_loader import DocumentLoader
+from ..error import LinkedDataProofException
+
+TEST_CONTEXT_URL = "https://example.com/contexts/test/v1"
+TEST_CONTEXT = {"@context": {"test": "https://example.com/test#"}}
+
+
+class TestContextStore(AsyncTestCase):
+    async def test_bundled(self):
+        store = ContextStore()
+        for url in BUNDLED_CONTEXTS:
+            # verifies the pinned digest of each bundled file
+            assert store.get(url)["@context"]
+        assert store.get(CREDENTIALS_CONTEXT_V1_URL) == CREDENTIALS_V1
+        assert store.get(f"{SECURITY_CONTEXT_V2_URL}#Ed25519Signature2018") == (
+            SECURITY_V2
+        )
+        assert CREDENTIALS_CONTEXT_V1_URL in store
+        assert store.get(TEST_CONTEXT_URL) is None
+
+        # documents returned are copies of the parsed context
+        store.get(CREDENTIALS_CONTEXT_V1_URL)["@context"] = None
+        assert store.get(CREDENTIALS_CONTEXT_V1_URL) == CREDENTIALS_V1
+
+        assert ContextStore(bundled=False).urls == []
+
+    async def test_context_dir(self):
+        with TemporaryDirectory() as context_dir:
+            with open(path.join(context_dir, "index.json"), "w") as index_file:
+                json.dump({TEST_CONTEXT_URL: "test.jsonld"}, index_file)
+            with open(path.join(context_dir, "test.jsonld"), "w") as context_file:
+                json.dump(TEST_CONTEXT, context_file)
+
+            store = ContextStore([context_dir])
+            assert store.get(TEST_CONTEXT_URL) == TEST_CONTEXT
+            assert CREDENTIALS_CONTEXT_V1_URL in store
+
+    async def test_context_dir_x(self):
+        with TemporaryDirectory() as context_dir:
+            with self.assertRaises(LinkedDataProofException):
+                ContextStore([context_dir])
+
+            with open(path.join(context_dir, "index.json"), "w") as index_file:
+                json.dump([TEST_CONTEXT_URL], index_file)
+            with self.assertRaises(LinkedDataProofException):
+                ContextStore([context_dir])
+
+            with open(path.join(context_dir, "index.json"), "w") as index_file:
+                json.dump({TEST_CONTEXT_URL: "missing.jsonld"}, index_file)
+            store = ContextStore([context_dir])
+            with self.assertRaises(LinkedDataProofException):
+                store.get(TEST_CONTEXT_URL)
+
+    async def test_digest_mismatch(self):
+        with TemporaryDirectory() as context_dir:
+            file_path = path.join(context_dir, "test.jsonld")
+            with open(file_path, "w") as context_file:
+                json.dump(TEST_CONTEXT, context_file)
+
+            store = ContextStore(bundled=False)
+            store.add_file(TEST_CONTEXT_URL, file_path, "00" * 32)
+            with self.assertRaises(LinkedDataProofException):
+                store.get(TEST_CONTEXT_URL)
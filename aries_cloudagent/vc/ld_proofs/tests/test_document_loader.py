@@ -0,0 +1,97 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ....core.in_memory import InMemoryProfile
+from ....resolver.did_resolver import DIDResolver
+from ....utils.worker_pool import WorkerPool
+
+from ...tests.contexts import CREDENTIALS_V1
+
+from ..constants import CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_V2_URL
+from ..document_loader import DocumentLoader, run_jsonld
+from ..error import LinkedDataProofException
+
+TEST_DID = "did:example:123"
+TEST_DID_DOCUMENT = {"id": TEST_DID}
+TEST_CONTEXT_URL = "https://example.com/contexts/test/v1"
+TEST_CONTEXT = {"@context": {"test": "https://example.com/test#"}}
+
+
+class TestDocumentLoader(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.resolver = async_mock.MagicMock(
+            resolve=async_mock.CoroutineMock(return_value=TEST_DID_DOCUMENT)
+        )
+        self.profile.context.injector.bind_instance(DIDResolver, self.resolver)
+
+    async def test_load_stored_context(self):
+        loader = DocumentLoader(self.profile)
+        with async_mock.patch.object(
+            loader, "requests_loader", async_mock.MagicMock()
+        ) as requests_loader:
+            document = await loader.load_document(CREDENTIALS_CONTEXT_V1_URL, {})
+            requests_loader.assert_not_called()
+        assert document["document"] == CREDENTIALS_V1
+        assert document["documentUrl"] == CREDENTIALS_CONTEXT_V1_URL
+        assert document["tag"] == "static"
+
+        # stored contexts are also served on the event loop thread
+        assert loader(CREDENTIALS_CONTEXT_V1_URL, {}) == document
+
+    async def test_load_offline(self):
+        self.profile.settings["jsonld.offline"] = True
+        loader = DocumentLoader(self.profile)
+        with async_mock.patch.object(
+            loader, "requests_loader", async_mock.MagicMock()
+        ) as requests_loader:
+            with self.assertRaises(LinkedDataProofException):
+                await loader.load_document(TEST_CONTEXT_URL, {})
+            requests_loader.assert_not_called()
+            await loader.load_document(SECURITY_CONTEXT_V2_URL, {})
+
+    async def test_load_online(self):
+        loader = DocumentLoader(self.profile)
+        with async_mock.patch.object(
+            loader,
+            "requests_loader",
+            async_mock.MagicMock(return_value={"document": TEST_CONTEXT}),
+        ) as requests_loader:
+            document = await loader.load_document(TEST_CONTEXT_URL, {})
+            requests_loader.assert_called_once_with(TEST_CONTEXT_URL, {})
+        assert document == {"document": TEST_CONTEXT}
+
+    async def test_call_from_worker_thread(self):
+        loader = DocumentLoader(self.profile)
+        document = await asyncio.get_event_loop().run_in_executor(
+            None, loader, TEST_DID, {}
+        )
+        assert document["document"] == TEST_DID_DOCUMENT
+        self.resolver.resolve.assert_awaited_once_with(self.profile, TEST_DID)
+
+    async def test_call_on_event_loop_x(self):
+        loader = DocumentLoader(self.profile)
+        with self.assertRaises(LinkedDataProofException):
+            loader(TEST_DID, {})
+        self.resolver.resolve.assert_not_called()
+
+    async def test_run_jsonld(self):
+        loader = DocumentLoader(self.profile)
+
+        def process(url):
+            return loader(url, {})["document"]
+
+        assert await run_jsonld(loader, process, TEST_DID) == TEST_DID_DOCUMENT
+
+        pool = WorkerPool(max_workers=1)
+        self.profile.context.injector.bind_instance(WorkerPool, pool)
+        assert await run_jsonld(loader, process, TEST_DID) == TEST_DID_DOCUMENT
+        assert pool.stats["operations"]["jsonld.process"]["count"] == 1
+        pool.shutdown()
+
+        # other document loaders use the default executor
+        assert await run_jsonld(lambda url, options: {}, process, TEST_DID) == (
+            TEST_DID_DOCUMENT
+        )
@@ -1,5 +1,10 @@
 from .issue import issue as issue_vc
-from .verify import verify_presentation, verify_credential
+from .verify import (
+    verify_presentation,
+    verify_credential,
+    verify_presentations,
+    verify_credentials,
+)
 from .prove import create_presentation, sign_presentation, derive_credential
 from .validation_result import PresentationVerificationResult
 from .models import (
@@ -14,6 +19,8 @@ __all__ = [
     "issue_vc",
     "verify_presentation",
     "verify_credential",
+    "verify_presentations",
+    "verify_credentials",
     "create_presentation",
     "sign_presentation",
     "derive_credential",
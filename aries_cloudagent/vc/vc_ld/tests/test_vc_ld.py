@@ -7,13 +7,21 @@ from ....wallet.key_type import KeyType
 from ....did.did_key import DIDKey
 from ....wallet.in_memory import InMemoryWallet
 from ....core.in_memory import InMemoryProfile
-from ...ld_proofs import Ed25519Signature2018, WalletKeyPair, BbsBlsSignature2020
+from ....resolver.did_resolver import DIDResolver
+from ...ld_proofs import (
+    BbsBlsSignature2020,
+    DocumentLoader,
+    Ed25519Signature2018,
+    WalletKeyPair,
+)
 from ...vc_ld import (
     issue_vc as issue,
     verify_credential,
+    verify_credentials,
     create_presentation,
     sign_presentation,
     verify_presentation,
+    verify_presentations,
     derive_credential,
 )
 from ...ld_proofs.error import LinkedDataProofException
@@ -126,6 +134,52 @@ class TestLinkedDataVerifiableCredential(TestCase):
         assert not result.verified
         assert "invalid structure" in str(result.errors[0])
 
+    async def test_verify_credentials(self):
+        suite = Ed25519Signature2018(
+            key_pair=WalletKeyPair(wallet=self.wallet, key_type=KeyType.ED25519),
+        )
+        invalid = CREDENTIAL_ISSUED.copy()
+        invalid.pop("issuer")
+
+        results = await verify_credentials(
+            credentials=[CREDENTIAL_ISSUED, invalid, CREDENTIAL_ISSUED],
+            suites=[suite],
+            document_loader=custom_document_loader,
+            max_concurrency=2,
+        )
+
+        assert results[0] == CREDENTIAL_VERIFIED
+        assert not results[1].verified
+        assert "invalid structure" in str(results[1].errors[0])
+        assert results[2] == CREDENTIAL_VERIFIED
+
+    async def test_verify_credentials_x_unresolved_verification_method(self):
+        self.profile.context.injector.bind_instance(DIDResolver, async_mock.MagicMock())
+        document_loader = DocumentLoader(self.profile)
+        error = LinkedDataProofException("not found")
+        suite = Ed25519Signature2018(
+            key_pair=WalletKeyPair(wallet=self.wallet, key_type=KeyType.ED25519),
+        )
+
+        with async_mock.patch.object(
+            document_loader,
+            "load_document",
+            async_mock.CoroutineMock(side_effect=error),
+        ) as load_document:
+            results = await verify_credentials(
+                credentials=[CREDENTIAL_ISSUED, CREDENTIAL_ISSUED],
+                suites=[suite],
+                document_loader=document_loader,
+            )
+
+        # resolved once for the batch, credentials not verified
+        load_document.assert_awaited_once_with(
+            CREDENTIAL_ISSUED["proof"]["verificationMethod"], {}
+        )
+        for result in results:
+            assert not result.verified
+            assert result.errors == [error]
+
     @pytest.mark.ursa_bbs_signatures
     async def test_issue_BbsBlsSignature2020(self):
         # Use different key pair and suite for signing and verification
@@ -246,6 +300,24 @@ class TestLinkedDataVerifiableCredential(TestCase):
 
         assert verification_result.verified
 
+    async def test_verify_presentations(self):
+        suite = Ed25519Signature2018(
+            key_pair=WalletKeyPair(wallet=self.wallet, key_type=KeyType.ED25519),
+        )
+        unsigned = PRESENTATION_SIGNED.copy()
+        unsigned.pop("proof")
+
+        results = await verify_presentations(
+            presentations=[PRESENTATION_SIGNED, unsigned],
+            challenge=self.presentation_challenge,
+            suites=[suite],
+            document_loader=custom_document_loader,
+        )
+
+        assert results[0].verified
+        assert not results[1].verified
+        assert 'presentation must contain "proof"' in str(results[1].errors[0])
+
     async def test_verify_presentation_x_no_purpose_challenge(self):
         verification_result = await verify_presentation(
             presentation=PRESENTATION_SIGNED,
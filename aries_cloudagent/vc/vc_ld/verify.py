@@ -1,12 +1,15 @@
 """Verifiable Credential and Presentation verification methods."""
 
 import asyncio
-from typing import List
+import logging
+
+from typing import Awaitable, Callable, Dict, List, Sequence, Set, TypeVar
 from pyld.jsonld import JsonLdProcessor
 
 from ..ld_proofs import (
     LinkedDataProof,
     CredentialIssuancePurpose,
+    DocumentLoader,
     DocumentLoaderMethod,
     ProofPurpose,
     AuthenticationProofPurpose,
@@ -17,6 +20,13 @@ from ..ld_proofs import (
 from .models.credential import VerifiableCredentialSchema
 from .validation_result import PresentationVerificationResult
 
+LOGGER = logging.getLogger(__name__)
+
+# maximum number of documents of a batch verified at the same time
+DEFAULT_BATCH_CONCURRENCY = 16
+
+T = TypeVar("T")
+
 
 async def _verify_credential(
     *,
@@ -183,4 +193,167 @@ async def verify_presentation(
         return PresentationVerificationResult(verified=False, errors=[e])
 
 
-__all__ = ["verify_presentation", "verify_credential"]
+def _verification_methods(document: dict) -> Set[str]:
+    """Get the verification methods of the proofs on a document."""
+    methods = set()
+    for proof in JsonLdProcessor.get_values(document, "proof"):
+        method = proof.get("verificationMethod") if isinstance(proof, dict) else None
+        if isinstance(method, dict):
+            method = method.get("id")
+        if isinstance(method, str):
+            methods.add(method)
+    return methods
+
+
+async def _resolve_verification_methods(
+    document_loader: DocumentLoaderMethod, methods: Set[str]
+) -> Dict[str, Exception]:
+    """
+    Resolve each verification method once, ahead of verification.
+
+    The document loader caches the resolved documents, so that verification of
+    each document of the batch does not resolve them again.
+
+    Returns:
+        The errors of the verification methods that could not be resolved
+
+    """
+    if not isinstance(document_loader, DocumentLoader):
+        return {}
+
+    async def resolve(method: str):
+        try:
+            await document_loader.load_document(method, {})
+        except Exception as err:
+            LOGGER.debug("Could not resolve verification method %s: %s", method, err)
+            return err
+
+    errors = await asyncio.gather(*(resolve(method) for method in methods))
+    return {method: err for (method, err) in zip(methods, errors) if err}
+
+
+async def run_batch(
+    verify: Callable[[int], Awaitable[T]], count: int, max_concurrency: int
+) -> List[T]:
+    """Run `verify(index)` for each item of a batch, with limited concurrency."""
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_BATCH_CONCURRENCY)
+
+    async def run(index: int) -> T:
+        async with semaphore:
+            return await verify(index)
+
+    return await asyncio.gather(*(run(index) for index in range(count)))
+
+
+async def verify_credentials(
+    *,
+    credentials: Sequence[dict],
+    suites: List[LinkedDataProof],
+    document_loader: DocumentLoaderMethod,
+    purpose: ProofPurpose = None,
+    max_concurrency: int = None,
+) -> List[DocumentVerificationResult]:
+    """Verify a batch of credentials.
+
+    The verification methods of the credentials are resolved once for the whole
+    batch, then the credentials are verified concurrently. A credential whose
+    verification methods cannot be resolved fails without being verified.
+
+    Args:
+        credentials (Sequence[dict]): The credentials to verify
+        suites (List[LinkedDataProof]): The signature suites to verify with
+        document_loader (DocumentLoader): Document loader used for resolving of documents
+        purpose (ProofPurpose, optional): Proof purpose to use.
+            Defaults to CredentialIssuancePurpose
+        max_concurrency (int, optional): Maximum number of credentials verified at
+            the same time. Defaults to DEFAULT_BATCH_CONCURRENCY
+
+    Returns:
+        List[DocumentVerificationResult]: The result of the verification of each
+            credential, in order
+
+    """
+    methods = [_verification_methods(credential) for credential in credentials]
+    errors = await _resolve_verification_methods(document_loader, set().union(*methods))
+
+    async def verify(index: int) -> DocumentVerificationResult:
+        credential = credentials[index]
+        if methods[index] and all(method in errors for method in methods[index]):
+            return DocumentVerificationResult(
+                verified=False,
+                document=credential,
+                errors=[errors[method] for method in sorted(methods[index])],
+            )
+        return await verify_credential(
+            credential=credential,
+            suites=suites,
+            document_loader=document_loader,
+            purpose=purpose,
+        )
+
+    return await run_batch(verify, len(credentials), max_concurrency)
+
+
+async def verify_presentations(
+    *,
+    presentations: Sequence[dict],
+    suites: List[LinkedDataProof],
+    document_loader: DocumentLoaderMethod,
+    purpose: ProofPurpose = None,
+    challenge: str = None,
+    domain: str = None,
+    max_concurrency: int = None,
+) -> List[PresentationVerificationResult]:
+    """Verify a batch of presentations.
+
+    The verification methods of the presentations and of the credentials they
+    contain are resolved once for the whole batch, then the presentations are
+    verified concurrently.
+
+    Args:
+        presentations (Sequence[dict]): The presentations to verify
+        suites (List[LinkedDataProof]): The signature suites to verify with
+        document_loader (DocumentLoader): Document loader used for resolving of documents
+        purpose (ProofPurpose, optional): Proof purpose to use.
+            Defaults to AuthenticationProofPurpose
+        challenge (str, optional): The challenge to use for authentication.
+            Required if purpose is not passed, not used if purpose is passed
+        domain (str, optional): Domain to use for the authentication proof purpose.
+            Not used if purpose is passed
+        max_concurrency (int, optional): Maximum number of presentations verified at
+            the same time. Defaults to DEFAULT_BATCH_CONCURRENCY
+
+    Returns:
+        List[PresentationVerificationResult]: The result of the verification of each
+            presentation, in order
+
+    """
+    methods = set()
+    for presentation in presentations:
+        methods.update(_verification_methods(presentation))
+        for credential in JsonLdProcessor.get_values(
+            presentation, "verifiableCredential"
+        ):
+            if isinstance(credential, dict):
+                methods.update(_verification_methods(credential))
+    await _resolve_verification_methods(document_loader, methods)
+
+    async def verify(index: int) -> PresentationVerificationResult:
+        return await verify_presentation(
+            presentation=presentations[index],
+            suites=suites,
+            document_loader=document_loader,
+            purpose=purpose,
+            challenge=challenge,
+            domain=domain,
+        )
+
+    return await run_batch(verify, len(presentations), max_concurrency)
+
+
+__all__ = [
+    "verify_presentation",
+    "verify_credential",
+    "verify_presentations",
+    "verify_credentials",
+]
@@ -1,7 +1,7 @@
 """Wallet base class."""
 
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
@@ -318,6 +318,52 @@ class BaseWallet(ABC):
 
         """
 
+    async def pack_messages(
+        self, messages: Sequence[Tuple[str, Sequence[str], Optional[str]]]
+    ) -> List[Union[bytes, WalletError]]:
+        """
+        Pack a group of messages.
+
+        Args:
+            messages: A sequence of (message, to_verkeys, from_verkey) tuples
+
+        Returns:
+            For each message in order, the packed message or the error raised
+            packing it
+
+        """
+        results = []
+        for (message, to_verkeys, from_verkey) in messages:
+            try:
+                results.append(
+                    await self.pack_message(message, to_verkeys, from_verkey)
+                )
+            except WalletError as err:
+                results.append(err)
+        return results
+
+    async def unpack_messages(
+        self, enc_messages: Sequence[bytes]
+    ) -> List[Union[Tuple[str, str, str], WalletError]]:
+        """
+        Unpack a group of messages.
+
+        Args:
+            enc_messages: The encrypted messages
+
+        Returns:
+            For each message in order, a (message, from_verkey, to_verkey) tuple
+            or the error raised unpacking it
+
+        """
+        results = []
+        for enc_message in enc_messages:
+            try:
+                results.append(await self.unpack_message(enc_message))
+            except WalletError as err:
+                results.append(err)
+        return results
+
     def __repr__(self) -> str:
         """Get a human readable string."""
         return "<{}>".format(self.__class__.__name__)
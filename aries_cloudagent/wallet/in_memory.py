@@ -1,7 +1,7 @@
 """In-memory implementation of BaseWallet interface."""
 
 import asyncio
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from ..core.in_memory import InMemoryProfile
 from ..did.did_key import DIDKey
@@ -536,3 +536,92 @@ class InMemoryWallet(BaseWallet):
         except ValueError as e:
             raise WalletError("Message could not be unpacked: {}".format(str(e)))
         return message, from_verkey, to_verkey
+
+    async def pack_messages(
+        self, messages: Sequence[Tuple[str, Sequence[str], Optional[str]]]
+    ) -> List[Union[bytes, WalletError]]:
+        """
+        Pack a group of messages.
+
+        The messages are packed together in a single executor call.
+
+        Args:
+            messages: A sequence of (message, to_verkeys, from_verkey) tuples
+
+        Returns:
+            For each message in order, the packed message or the error raised
+            packing it
+
+        """
+        results = [None] * len(messages)
+        pending = []
+        for (index, (message, to_verkeys, from_verkey)) in enumerate(messages):
+            try:
+                if message is None:
+                    raise WalletError("Message not provided")
+                keys_bin = [b58_to_bytes(key) for key in to_verkeys]
+                secret = self._get_private_key(from_verkey) if from_verkey else None
+            except ValueError as e:
+                results[index] = WalletError(
+                    "Message could not be packed: {}".format(str(e))
+                )
+            except WalletError as err:
+                results[index] = err
+            else:
+                pending.append((index, message, keys_bin, secret))
+
+        def pack_all() -> List[Union[bytes, WalletError]]:
+            packed = []
+            for (_, message, keys_bin, secret) in pending:
+                try:
+                    packed.append(encode_pack_message(message, keys_bin, secret))
+                except (TypeError, ValueError) as e:
+                    packed.append(
+                        WalletError("Message could not be packed: {}".format(str(e)))
+                    )
+            return packed
+
+        if pending:
+            packed = await asyncio.get_event_loop().run_in_executor(None, pack_all)
+            for ((index, *_), result) in zip(pending, packed):
+                results[index] = result
+        return results
+
+    async def unpack_messages(
+        self, enc_messages: Sequence[bytes]
+    ) -> List[Union[Tuple[str, str, str], WalletError]]:
+        """
+        Unpack a group of messages.
+
+        The messages are unpacked together in a single executor call.
+
+        Args:
+            enc_messages: The encrypted messages
+
+        Returns:
+            For each message in order, a (message, from_verkey, to_verkey) tuple
+            or the error raised unpacking it
+
+        """
+
+        def unpack_all() -> List[Union[Tuple[str, str, str], WalletError]]:
+            results = []
+            for enc_message in enc_messages:
+                if not enc_message:
+                    results.append(WalletError("Message not provided"))
+                    continue
+                try:
+                    results.append(
+                        decode_pack_message(enc_message, self._get_private_key)
+                    )
+                except ValueError as e:
+                    results.append(
+                        WalletError("Message could not be unpacked: {}".format(str(e)))
+                    )
+                except WalletError as err:
+                    results.append(err)
+            return results
+
+        if not enc_messages:
+            return []
+        return await asyncio.get_event_loop().run_in_executor(None, unpack_all)
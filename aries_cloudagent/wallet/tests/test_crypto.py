@@ -6,7 +6,7 @@ from unittest import mock, TestCase
 from ..key_type import KeyType
 from ..error import WalletError
 from ...utils.jwe import JweRecipient
-from ..util import str_to_b64
+from ..util import bytes_to_b58, str_to_b64
 from .. import crypto as test_module
 
 SEED_B64 = "MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDA="
@@ -181,3 +181,26 @@ class TestCrypto(TestCase):
                 [b"message1", b"message2"], b"signature", b"verkey", KeyType.BLS12381G1
             )
         assert "Unsupported key type: bls12381g1" in str(context.exception)
+
+    def test_pack_message_key_caches(self):
+        test_module.clear_key_caches()
+        (sender_pk, sender_sk) = test_module.create_ed25519_keypair()
+        (recip_pk, recip_sk) = test_module.create_ed25519_keypair()
+
+        for _ in range(2):
+            packed = test_module.encode_pack_message("message", [recip_pk], sender_sk)
+            (message, sender_vk, recip_vk) = test_module.decode_pack_message(
+                packed, lambda vk: recip_sk if vk == bytes_to_b58(recip_pk) else None
+            )
+            assert message == "message"
+            assert sender_vk == bytes_to_b58(sender_pk)
+            assert recip_vk == bytes_to_b58(recip_pk)
+
+        # public keys are converted once per party
+        assert test_module.ed25519_pk_to_curve25519.cache_info().misses == 2
+        assert test_module.ed25519_pk_to_curve25519.cache_info().hits
+        # secret key material is not cached
+        assert not hasattr(test_module.ed25519_sk_to_curve25519, "cache_info")
+
+        test_module.clear_key_caches()
+        assert test_module.ed25519_pk_to_curve25519.cache_info().currsize == 0
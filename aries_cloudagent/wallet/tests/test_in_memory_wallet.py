@@ -585,6 +585,47 @@ class TestInMemoryWallet:
         with pytest.raises(WalletError):
             await wallet.unpack_message(None)
 
+    @pytest.mark.asyncio
+    async def test_pack_unpack_messages(self, wallet: InMemoryWallet):
+        await wallet.create_local_did(
+            DIDMethod.SOV, KeyType.ED25519, self.test_seed, self.test_sov_did
+        )
+        await wallet.create_local_did(
+            DIDMethod.SOV, KeyType.ED25519, self.test_target_seed, self.test_target_did
+        )
+
+        packed = await wallet.pack_messages(
+            [
+                (self.test_message, [self.test_ed25519_verkey], None),
+                (None, [self.test_target_verkey], None),
+                (self.test_message, [self.test_target_verkey], "unknown"),
+                (
+                    self.test_message,
+                    [self.test_target_verkey],
+                    self.test_ed25519_verkey,
+                ),
+                (self.test_message, ["0OIl"], None),
+                (self.test_message, [self.test_ed25519_verkey[:-2]], None),
+            ]
+        )
+        assert isinstance(packed[1], WalletError)
+        assert isinstance(packed[2], WalletError)
+        assert isinstance(packed[4], WalletError)
+        assert isinstance(packed[5], WalletError)
+
+        unpacked = await wallet.unpack_messages([packed[0], b"bad", None, packed[3]])
+        assert unpacked[0] == (self.test_message, None, self.test_ed25519_verkey)
+        assert isinstance(unpacked[1], WalletError)
+        assert isinstance(unpacked[2], WalletError)
+        assert unpacked[3] == (
+            self.test_message,
+            self.test_ed25519_verkey,
+            self.test_target_verkey,
+        )
+
+        assert await wallet.pack_messages([]) == []
+        assert await wallet.unpack_messages([]) == []
+
     @pytest.mark.asyncio
     async def test_signature_round_trip(self, wallet: InMemoryWallet):
         key_info = await wallet.create_signing_key(KeyType.ED25519)
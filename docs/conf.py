@@ -46,7 +46,6 @@ autodoc_mock_imports = [
     "unflatten",
     "qrcode",
     "rlp",
-    "nest_asyncio",
 ]
 
 #    "aries_cloudagent.tests.test_conductor",
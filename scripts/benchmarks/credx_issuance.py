@@ -0,0 +1,109 @@
+"""
+Measure the throughput of revocable credential issuance with indy-credx.
+
+Issues credentials concurrently against a single revocation registry in an
+in-memory askar wallet, once for each revocation index block size given, and
+reports the credentials issued per second. Requires aries-askar and indy-credx.
+
+Usage: python scripts/benchmarks/credx_issuance.py [count] [concurrency] [sizes]
+
+where sizes is a comma-separated list of block sizes, such as "1,20,100".
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.indy.credx.holder import IndyCredxHolder  # noqa: E402
+from aries_cloudagent.indy.credx.issuer import IndyCredxIssuer  # noqa: E402
+
+TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
+
+
+async def provision():
+    """Open an in-memory askar profile."""
+    return await AskarProfileManager().provision(
+        InjectionContext(enforce_typing=False),
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+
+
+async def run(count: int, concurrency: int, block_size: int, tails_dir: str) -> float:
+    """Issue `count` credentials and return the number issued per second."""
+    profile = await provision()
+    profile.settings["revocation.index_block_size"] = block_size
+    issuer = IndyCredxIssuer(profile)
+    holder = IndyCredxHolder(await provision())
+
+    (_, schema_json) = await issuer.create_schema(TEST_DID, "bench", "1.0", ["name"])
+    schema = json.loads(schema_json)
+    schema["seqNo"] = 1234
+    (cd_id, cred_def_json) = await issuer.create_and_store_credential_definition(
+        TEST_DID, schema, support_revocation=True
+    )
+    (reg_id, reg_def_json, _) = await issuer.create_and_store_revocation_registry(
+        TEST_DID, cd_id, "CL_ACCUM", f"bench{block_size}", count, tails_dir
+    )
+    tails_path = json.loads(reg_def_json)["value"]["tailsLocation"]
+    cred_offer = json.loads(await issuer.create_credential_offer(cd_id))
+    (cred_req_json, _) = await holder.create_credential_request(
+        cred_offer, json.loads(cred_def_json), TEST_DID
+    )
+    cred_req = json.loads(cred_req_json)
+
+    pending = iter(range(count))
+
+    async def worker():
+        for index in pending:
+            await issuer.create_credential(
+                schema,
+                cred_offer,
+                cred_req,
+                {"name": "NAME"},
+                cred_ex_id=str(index),
+                revoc_reg_id=reg_id,
+                tails_file_path=tails_path,
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await profile.close()
+    return count / elapsed
+
+
+async def main(count: int, concurrency: int, block_sizes):
+    """Compare issuance throughput across block sizes."""
+    logging.disable(logging.ERROR)
+    print(f"{count} credentials, {concurrency} concurrent issuances")
+    with tempfile.TemporaryDirectory() as tails_dir:
+        for block_size in block_sizes:
+            rate = await run(count, concurrency, block_size, tails_dir)
+            print(f"block size {block_size:>4}: {rate:8.1f} credentials/s")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 16,
+            [
+                int(size)
+                for size in (sys.argv[3] if len(sys.argv) > 3 else "1,20,100").split(
+                    ","
+                )
+            ],
+        )
+    )
@@ -0,0 +1,168 @@
+"""
+Measure the throughput of JSON-LD credential signing and verification.
+
+Signs and then verifies credentials concurrently with the Ed25519Signature2018
+and BbsBlsSignature2020 suites, using did:key verification methods and an
+in-memory wallet, and reports the operations per second. The longest delay of
+a timer on the event loop during each run shows how long the loop was blocked.
+BbsBlsSignature2020 requires ursa-bbs-signatures.
+
+Usage: python scripts/benchmarks/jsonld_proofs.py [count] [concurrency]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.did.did_key import DIDKey  # noqa: E402
+from aries_cloudagent.resolver.default.key import KeyDIDResolver  # noqa: E402
+from aries_cloudagent.resolver.did_resolver import DIDResolver  # noqa: E402
+from aries_cloudagent.resolver.did_resolver_registry import (  # noqa: E402
+    DIDResolverRegistry,
+)
+from aries_cloudagent.utils.dependencies import (  # noqa: E402
+    is_ursa_bbs_signatures_module_installed,
+)
+from aries_cloudagent.utils.worker_pool import WorkerPool  # noqa: E402
+from aries_cloudagent.vc.ld_proofs import (  # noqa: E402
+    BbsBlsSignature2020,
+    DocumentLoader,
+    Ed25519Signature2018,
+    WalletKeyPair,
+)
+from aries_cloudagent.vc.ld_proofs.constants import (  # noqa: E402
+    CREDENTIALS_CONTEXT_V1_URL,
+    SECURITY_CONTEXT_BBS_URL,
+)
+from aries_cloudagent.vc.vc_ld import issue_vc, verify_credential  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.key_type import KeyType  # noqa: E402
+
+SUITES = {
+    "Ed25519Signature2018": (Ed25519Signature2018, KeyType.ED25519),
+    "BbsBlsSignature2020": (BbsBlsSignature2020, KeyType.BLS12381G2),
+}
+
+
+def credential(index: int, issuer: str) -> dict:
+    """Create an unsigned credential."""
+    return {
+        "@context": [
+            CREDENTIALS_CONTEXT_V1_URL,
+            "https://www.w3.org/2018/credentials/examples/v1",
+            SECURITY_CONTEXT_BBS_URL,
+        ],
+        "id": f"http://example.edu/credentials/{index}",
+        "issuer": issuer,
+        "type": ["VerifiableCredential", "UniversityDegreeCredential"],
+        "issuanceDate": "2020-03-10T04:24:12.164Z",
+        "credentialSubject": {
+            "id": "did:example:ebfeb1f712ebc6f1c276e12ec21",
+            "degree": {
+                "type": "BachelorDegree",
+                "name": f"Bachelor of Science and Arts {index}",
+            },
+        },
+    }
+
+
+async def run_concurrently(count: int, concurrency: int, operation) -> float:
+    """Run `operation(index)` `count` times and return the operations per second."""
+    pending = iter(range(count))
+
+    async def worker():
+        for index in pending:
+            await operation(index)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return count / (time.perf_counter() - start)
+
+
+async def max_loop_delay(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Measure the longest delay of a periodic timer on the event loop."""
+    delay = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        delay = max(delay, time.perf_counter() - start - interval)
+    return delay
+
+
+async def run(name: str, count: int, concurrency: int):
+    """Sign and verify credentials with a signature suite."""
+    (suite_cls, key_type) = SUITES[name]
+    profile = InMemoryProfile.test_profile(bind={WorkerPool: WorkerPool()})
+    registry = DIDResolverRegistry()
+    registry.register(KeyDIDResolver())
+    profile.context.injector.bind_instance(DIDResolver, DIDResolver(registry))
+    document_loader = DocumentLoader(profile)
+
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        key_info = await wallet.create_signing_key(key_type)
+        key_pair = WalletKeyPair(
+            wallet=wallet, key_type=key_type, public_key_base58=key_info.verkey
+        )
+        did_key = DIDKey.from_public_key_b58(key_info.verkey, key_type)
+        suite = suite_cls(key_pair=key_pair, verification_method=did_key.key_id)
+        verify_suite = suite_cls(
+            key_pair=WalletKeyPair(wallet=wallet, key_type=key_type)
+        )
+        signed = {}
+
+        async def sign(index: int):
+            signed[index] = await issue_vc(
+                credential=credential(index, did_key.did),
+                suite=suite,
+                document_loader=document_loader,
+            )
+
+        async def verify(index: int):
+            result = await verify_credential(
+                credential=signed[index],
+                suites=[verify_suite],
+                document_loader=document_loader,
+            )
+            if not result.verified:
+                raise Exception(f"Verification failed: {result.errors}")
+
+        for (label, operation) in (("sign", sign), ("verify", verify)):
+            stop = asyncio.Event()
+            monitor = asyncio.ensure_future(max_loop_delay(stop))
+            rate = await run_concurrently(count, concurrency, operation)
+            stop.set()
+            delay = await monitor
+            print(
+                f"{name:<22} {label:<7} {rate:8.1f} ops/s, "
+                f"max loop delay {delay * 1000:7.1f} ms"
+            )
+
+    profile.inject(WorkerPool).shutdown()
+
+
+async def main(count: int, concurrency: int):
+    """Run the benchmark for each available signature suite."""
+    logging.disable(logging.ERROR)
+    print(f"{count} credentials, {concurrency} concurrent operations")
+    for name in SUITES:
+        if name == "BbsBlsSignature2020" and not (
+            is_ursa_bbs_signatures_module_installed()
+        ):
+            print(f"{name:<22} skipped: ursa-bbs-signatures not installed")
+            continue
+        await run(name, count, concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+        )
+    )
@@ -0,0 +1,131 @@
+"""
+Measure the throughput of model serialization and deserialization.
+
+Round-trips an agent message, a connection record and a credential exchange
+record through `serialize` and `deserialize`, and reports the round-trips per
+second. Each run compares the current model methods, which reuse cached schema
+instances and dump plans, with creating a new schema instance for each call.
+
+Usage: python scripts/benchmarks/model_serde.py [count]
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from marshmallow import EXCLUDE  # noqa: E402
+
+from aries_cloudagent.connections.models.conn_record import ConnRecord  # noqa: E402
+from aries_cloudagent.messaging.decorators.attach_decorator import (  # noqa: E402
+    AttachDecorator,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.message_types import (  # noqa: E402
+    ATTACHMENT_FORMAT,
+    CRED_20_PROPOSAL,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.cred_format import (  # noqa: E402,E501
+    V20CredFormat,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.cred_proposal import (  # noqa: E402,E501
+    V20CredProposal,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.inner.cred_preview import (  # noqa: E402,E501
+    V20CredAttrSpec,
+    V20CredPreview,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.models.cred_ex_record import (  # noqa: E402,E501
+    V20CredExRecord,
+)
+
+CRED_DEF_ID = "LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1"
+
+
+def cred_proposal() -> V20CredProposal:
+    """Create a credential proposal message."""
+    return V20CredProposal(
+        comment="Hello World",
+        credential_preview=V20CredPreview(
+            attributes=V20CredAttrSpec.list_plain(
+                {"legalName": "Alice", "jurisdictionId": "BC", "incorporationDate": "1"}
+            )
+        ),
+        formats=[
+            V20CredFormat(
+                attach_id="indy",
+                format_=ATTACHMENT_FORMAT[CRED_20_PROPOSAL][
+                    V20CredFormat.Format.INDY.api
+                ],
+            )
+        ],
+        filters_attach=[
+            AttachDecorator.data_base64({"cred_def_id": CRED_DEF_ID}, ident="indy")
+        ],
+    )
+
+
+def models() -> dict:
+    """Create the models to round-trip."""
+    return {
+        "AgentMessage": cred_proposal(),
+        "ConnRecord": ConnRecord(
+            connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            my_did="LjgpST2rjsoxYegQDRm7EL",
+            their_did="55GkHamhTU1ZbTbV2ab9DE",
+            their_label="Bob",
+            their_role=ConnRecord.Role.RESPONDER.rfc160,
+            invitation_key="H3C2AVvLMv6gmMNam3uVAjZpfkcJCwDwnZn6z3wXmqPV",
+            state=ConnRecord.State.COMPLETED.rfc160,
+            accept=ConnRecord.ACCEPT_AUTO,
+            invitation_mode=ConnRecord.INVITATION_MODE_ONCE,
+            alias="Bob",
+        ),
+        "V20CredExRecord": V20CredExRecord(
+            cred_ex_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            thread_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            initiator=V20CredExRecord.INITIATOR_EXTERNAL,
+            role=V20CredExRecord.ROLE_ISSUER,
+            state=V20CredExRecord.STATE_PROPOSAL_RECEIVED,
+            cred_proposal=cred_proposal(),
+        ),
+    }
+
+
+def round_trip(model):
+    """Serialize and deserialize a model with the model methods."""
+    return model.deserialize(model.serialize())
+
+
+def round_trip_new_schema(model):
+    """Serialize and deserialize a model with a new schema for each call."""
+    schema_class = model._get_schema_class()
+    return schema_class(unknown=EXCLUDE).load(schema_class(unknown=EXCLUDE).dump(model))
+
+
+def rate(operation, model, count: int) -> float:
+    """Run `operation(model)` `count` times and return the operations per second."""
+    start = time.perf_counter()
+    for _ in range(count):
+        operation(model)
+    return count / (time.perf_counter() - start)
+
+
+def main(count: int):
+    """Run the benchmark for each model."""
+    print(f"{count} round-trips")
+    for (name, model) in models().items():
+        assert round_trip(model).serialize() == model.serialize()
+        for (label, operation) in (
+            ("cached", round_trip),
+            ("new schema", round_trip_new_schema),
+        ):
+            print(
+                f"{name:<16} {label:<10} {rate(operation, model, count):9.1f} "
+                "round-trips/s"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,86 @@
+"""
+Measure the CPU used by the outbound transport manager with parked retries.
+
+Queues a number of webhooks to an endpoint which always fails, so that every
+message is parked awaiting its retry, then reports the CPU time consumed by the
+process while the retries are parked.
+
+Usage: python scripts/benchmarks/outbound_parked_retries.py [count] [seconds]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.transport.outbound.base import (  # noqa: E402
+    BaseOutboundTransport,
+    OutboundTransportError,
+)
+from aries_cloudagent.transport.outbound.manager import (  # noqa: E402
+    OutboundTransportManager,
+    QueuedOutboundMessage,
+)
+
+
+class FailingTransport(BaseOutboundTransport):
+    """Outbound transport for which every delivery fails."""
+
+    schemes = ("http",)
+    is_external = False
+
+    async def start(self):
+        """Start the transport."""
+
+    async def stop(self):
+        """Stop the transport."""
+
+    async def handle_message(self, profile, payload, endpoint, metadata, api_key):
+        """Fail to deliver a message."""
+        raise OutboundTransportError("Endpoint unavailable")
+
+
+async def main(count: int, seconds: float):
+    """Park `count` retries and measure CPU use over `seconds`."""
+    logging.disable(logging.ERROR)
+    mgr = OutboundTransportManager(InMemoryProfile.test_profile())
+    mgr.register_class(FailingTransport)
+    await mgr.start()
+    await mgr.task_queue
+
+    start = time.perf_counter()
+    for _ in range(count):
+        mgr.enqueue_webhook("topic", {}, "http://unreachable.invalid")
+    while (
+        sum(
+            1
+            for m in mgr.outbound_buffer
+            if m.state == QueuedOutboundMessage.STATE_RETRY
+        )
+        < count
+    ):
+        await asyncio.sleep(0.1)
+    print(f"Parked {count} retries in {time.perf_counter() - start:.2f}s")
+
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu = time.process_time() - cpu_start
+    print(
+        f"CPU time while parked: {cpu:.3f}s over {seconds:.1f}s ({cpu / seconds:.1%})"
+    )
+
+    await mgr.stop(wait=False)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.get_event_loop().run_until_complete(
+        main(
+            int(args[0]) if args else 50000,
+            float(args[1]) if len(args) > 1 else 5.0,
+        )
+    )
@@ -0,0 +1,105 @@
+"""
+Measure the throughput and peak memory of packing forwarded messages.
+
+Packs a message with a large attachment for a recipient behind 0 to 3
+mediators with the in-memory wallet, and reports the messages packed per
+second and the peak memory allocated while packing one message. Each run
+compares the current forward wrapping, which embeds the packed message in the
+forward message as it is, with the previous approach of parsing the packed
+message and serializing it again in a `Forward` model for each routing key.
+
+Usage: python scripts/benchmarks/pack_forward.py [count] [payload_size]
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+import tracemalloc
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.protocols.routing.v1_0.messages.forward import (  # noqa: E402
+    Forward,
+)
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.key_type import KeyType  # noqa: E402
+
+MAX_ROUTING_KEYS = 3
+
+
+class RoundTripWireFormat(PackWireFormat):
+    """Wire format wrapping forward messages with a JSON round-trip."""
+
+    @staticmethod
+    def forward_json(to: str, packed: bytes) -> str:
+        """Parse the packed message and serialize it in a forward message."""
+        return Forward(to=to, msg=json.loads(packed.decode("utf-8"))).to_json()
+
+
+def message(payload_size: int) -> str:
+    """Create a message with an attachment of about `payload_size` bytes."""
+    data = base64.b64encode(os.urandom(payload_size * 3 // 4)).decode("ascii")
+    return json.dumps(
+        {
+            "@type": "https://didcomm.org/basicmessage/1.0/message",
+            "@id": "a6a51c2f-8d4e-4c4e-bd7e-3e2c5b1e0b6d",
+            "content": "attachment",
+            "~attach": [{"@id": "data", "data": {"base64": data}}],
+        }
+    )
+
+
+async def run(wire_format, session, message_json, keys, routing_keys, count):
+    """Pack a message `count` times and measure the rate and peak memory."""
+    start = time.perf_counter()
+    for _ in range(count):
+        await wire_format.pack(session, message_json, keys, routing_keys, keys[0])
+    rate = count / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    await wire_format.pack(session, message_json, keys, routing_keys, keys[0])
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (rate, peak)
+
+
+async def main(count: int, payload_size: int):
+    """Run the benchmark for each number of routing keys."""
+    session = InMemoryProfile.test_session()
+    wallet = session.inject(BaseWallet)
+    keys = [(await wallet.create_signing_key(KeyType.ED25519)).verkey]
+    mediator_keys = [
+        (await wallet.create_signing_key(KeyType.ED25519)).verkey
+        for _ in range(MAX_ROUTING_KEYS)
+    ]
+    message_json = message(payload_size)
+    print(f"{count} messages of {len(message_json) / 2**20:.2f} MiB")
+
+    for hops in range(MAX_ROUTING_KEYS + 1):
+        routing_keys = mediator_keys[:hops]
+        for (label, wire_format) in (
+            ("embedded", PackWireFormat()),
+            ("round-trip", RoundTripWireFormat()),
+        ):
+            (rate, peak) = await run(
+                wire_format, session, message_json, keys, routing_keys, count
+            )
+            print(
+                f"{hops} routing keys {label:<10} {rate:8.1f} msg/s, "
+                f"peak memory {peak / 2**20:7.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 2**20,
+        )
+    )